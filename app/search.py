@@ -15,6 +15,10 @@ st.write('This page allows users to search for thermodynamic data for chemical s
 # search bar
 search = st.text_input('Search for a chemical species or reaction')
 
+# search mode (fuzzy tolerates typos and ranks the results)
+search_mode = st.radio(
+    'Search mode', ['exact', 'similar', 'fuzzy'], horizontal=True)
+
 
 # create two columns for buttons
 col1, col2 = st.columns(2)
@@ -29,7 +33,8 @@ with col1:
         with st.spinner('Searching...'):
             # search for species
             try:
-                st.session_state.search_res = utils.search_species(search)
+                st.session_state.search_res = utils.search_species(
+                    search, search_mode)
             except Exception as e:
                 st.error(f"Error during search: {e}")
 
@@ -44,6 +49,13 @@ if st.session_state.search_res:
     search_res = st.session_state.search_res
     if isinstance(search_res, dict):
         for record_key, record_value in search_res.items():
+            # skip the message
+            if not isinstance(record_value, dict):
+                continue
+            if 'score' in record_value:
+                st.write(
+                    f"Match: {record_value.get('matched-value', '')} "
+                    f"(score: {record_value.get('score')})")
             st.write(f"Databook ID: {record_value.get('databook-id', '')}")
             st.write(f"Databook Name: {record_value.get('databook-name', '')}")
             st.write(f"Table ID: {record_value.get('table-id', '')}")
@@ -6,7 +6,7 @@ tdb = ptdb.init()
 # search for a chemical species
 
 
-def search_species(species):
+def search_species(species, search_mode='exact'):
     try:
         # search terms
         search_terms = [species]
@@ -14,7 +14,7 @@ def search_species(species):
         # column_names = ['Name']
         # start search
         search_res = tdb.search_databook(
-            search_terms, res_format='dict', search_mode='exact')
+            search_terms, res_format='dict', search_mode=search_mode)
 
         return search_res
     except Exception:
@@ -0,0 +1,92 @@
+# import packages/modules
+import os
+import sys
+import statistics
+import subprocess
+import tempfile
+import pyThermoDB as ptdb
+
+# ====================================
+# COLD-START TIME (fresh interpreters)
+# ====================================
+# number of runs per scenario
+RUNS = 10
+
+# NOTE: thermodb file
+# custom reference
+REFERENCE_CONTENT = """
+REFERENCES:
+  CUSTOM-REF-1:
+    DATABOOK-ID: 1
+    TABLES:
+      Vapor-Pressure:
+        TABLE-ID: 1
+        DESCRIPTION:
+          This table provides the vapor pressure (P) in Pa as a function of temperature (T) in K.
+        EQUATIONS:
+          EQ-1:
+            BODY:
+              - parms['C1 | C1 | 1'] = parms['C1 | C1 | 1']/1
+              - parms['C2 | C2 | 1'] = parms['C2 | C2 | 1']/1
+              - res['vapor-pressure | VaPr | Pa'] = math.exp(parms['C1 | C1 | 1'] + parms['C2 | C2 | 1']/args['temperature | T | K'])
+            BODY-INTEGRAL:
+              None
+            BODY-FIRST-DERIVATIVE:
+              None
+            BODY-SECOND-DERIVATIVE:
+              None
+        STRUCTURE:
+          COLUMNS: [No.,Name,Formula,State,C1,C2,Tmin,Tmax,Eq]
+          SYMBOL: [None,None,None,None,C1,C2,Tmin,Tmax,VaPr]
+          UNIT: [None,None,None,None,1,1,K,K,Pa]
+        VALUES:
+          - [1,'methanol','CH3OH','l',82.718,-6904.5,175.47,512.5,1]
+"""
+
+thermodb = ptdb.build_component_thermodb(
+    component_name='methanol',
+    reference_config={
+        'vapor-pressure': {
+            'databook': 'CUSTOM-REF-1',
+            'table': 'Vapor-Pressure',
+        },
+    },
+    custom_reference={'reference': [REFERENCE_CONTENT]},
+)
+tmp_dir = tempfile.mkdtemp()
+thermodb.save('methanol', file_path=tmp_dir)
+thermodb_file = os.path.join(tmp_dir, 'methanol.ptdb')
+
+# NOTE: scenarios
+scenarios = {
+    'import pyThermoDB': "import pyThermoDB",
+    'load thermodb + one equation': (
+        "import pyThermoDB as ptdb\n"
+        f"ptdb.load_thermodb({thermodb_file!r})"
+        ".select('vapor-pressure').cal(T=300.0)"
+    ),
+    'init app (references)': "import pyThermoDB as ptdb\nptdb.init()",
+}
+
+probe = """
+import time
+start = time.perf_counter()
+{code}
+elapsed = time.perf_counter() - start
+import sys
+print(elapsed, 'pandas' in sys.modules, 'pythermodb_settings' in sys.modules)
+"""
+
+for name, code in scenarios.items():
+    times = []
+    for _ in range(RUNS):
+        output = subprocess.run(
+            [sys.executable, '-c', probe.format(code=code)],
+            check=True, capture_output=True, text=True
+        ).stdout.split()[-3:]
+        times.append(float(output[0]))
+
+    print(
+        f"{name:<30} | median: {statistics.median(times) * 1e3:7.1f} ms | "
+        f"pandas: {output[1]:<5} | pythermodb_settings: {output[2]}"
+    )
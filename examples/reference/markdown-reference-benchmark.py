@@ -0,0 +1,44 @@
+# import packages/modules
+import os
+import time
+from pyThermoDB.loader import CustomRef
+
+# ====================================
+# MARKDOWN REFERENCE PARSING TIME
+# ====================================
+# parent directory
+parent_dir = os.path.dirname(os.path.abspath(__file__))
+
+# NOTE: markdown reference (tables are repeated with new names)
+md_file = 'str-ref-1.md'
+md_path = os.path.join(parent_dir, md_file)
+
+with open(md_path, 'r', encoding='utf-8') as f:
+    content = f.read()
+
+# databook header and tables
+head, *tables = content.split('\n### ')
+tables = ['### ' + tb for tb in tables]
+
+# parser
+custom_ref = CustomRef.__new__(CustomRef)
+
+# SECTION: parse time vs number of tables (per table time stays about flat)
+for n in (10, 100, 1000, 5000):
+    body = '\n'.join(
+        tables[i % len(tables)].replace('\n', f'-{i}\n', 1)
+        for i in range(n)
+    )
+    md_content = f"{head}\n{body}"
+
+    start = time.perf_counter()
+    reference = custom_ref.parse_markdown(md_content)
+    elapsed = time.perf_counter() - start
+
+    databook = next(iter(reference['REFERENCES'].values()))
+    print(
+        f"tables: {len(databook['TABLES']):>5} | "
+        f"lines: {md_content.count(chr(10)):>7} | "
+        f"time: {elapsed * 1e3:9.2f} ms | "
+        f"per table: {elapsed / n * 1e6:7.1f} us"
+    )
@@ -0,0 +1,211 @@
+# import packages/modules
+import os
+import sys
+import pickle
+import statistics
+import subprocess
+import tempfile
+import timeit
+import pyThermoDB as ptdb
+
+# ===============================================
+# THERMODB FORMAT (.ptdb / .ptdba) VS PICKLE
+# ===============================================
+# number of loops per measurement
+LOOPS = 200
+# number of thermodbs in the archive
+ARCHIVE_SIZE = 50
+# number of fresh interpreters per cold-start measurement
+RUNS = 10
+
+# NOTE: custom reference
+REFERENCE_CONTENT = """
+REFERENCES:
+  CUSTOM-REF-1:
+    DATABOOK-ID: 1
+    TABLES:
+      General-Data:
+        TABLE-ID: 1
+        DESCRIPTION:
+          This table provides the general data of components.
+        DATA: []
+        STRUCTURE:
+          COLUMNS: [No.,Name,Formula,State,Molecular-Weight,Critical-Temperature,Critical-Pressure,Acentric-Factor]
+          SYMBOL: [None,None,None,None,MW,Tc,Pc,AcFa]
+          UNIT: [None,None,None,None,g/mol,K,MPa,None]
+          CONVERSION: [None,None,None,None,1,1,1,1]
+        VALUES:
+          - [1,'methanol','CH3OH','l',32.04,512.6,8.09,0.565]
+      Vapor-Pressure:
+        TABLE-ID: 2
+        DESCRIPTION:
+          This table provides the vapor pressure (P) in Pa as a function of temperature (T) in K.
+        EQUATIONS:
+          EQ-1:
+            BODY:
+              - parms['C1 | C1 | 1'] = parms['C1 | C1 | 1']/1
+              - parms['C2 | C2 | 1'] = parms['C2 | C2 | 1']/1
+              - res['vapor-pressure | VaPr | Pa'] = math.exp(parms['C1 | C1 | 1'] + parms['C2 | C2 | 1']/args['temperature | T | K'])
+            BODY-INTEGRAL:
+              None
+            BODY-FIRST-DERIVATIVE:
+              None
+            BODY-SECOND-DERIVATIVE:
+              None
+        STRUCTURE:
+          COLUMNS: [No.,Name,Formula,State,C1,C2,Tmin,Tmax,Eq]
+          SYMBOL: [None,None,None,None,C1,C2,Tmin,Tmax,VaPr]
+          UNIT: [None,None,None,None,1,1,K,K,Pa]
+        VALUES:
+          - [1,'methanol','CH3OH','l',82.718,-6904.5,175.47,512.5,1]
+      Ideal-Gas-Heat-Capacity:
+        TABLE-ID: 3
+        DESCRIPTION:
+          This table provides the ideal gas heat capacity (Cp) in J/mol.K as a function of temperature (T) in K.
+        EQUATIONS:
+          EQ-1:
+            BODY:
+              - res['ideal-gas-heat-capacity | Cp_IG | J/mol.K'] = parms['A | A | 1'] + parms['B | B | 1']*args['temperature | T | K'] + parms['C | C | 1']*args['temperature | T | K']**2
+            BODY-INTEGRAL:
+              None
+            BODY-FIRST-DERIVATIVE:
+              None
+            BODY-SECOND-DERIVATIVE:
+              None
+        STRUCTURE:
+          COLUMNS: [No.,Name,Formula,State,A,B,C,Eq]
+          SYMBOL: [None,None,None,None,A,B,C,Cp_IG]
+          UNIT: [None,None,None,None,1,1,1,J/mol.K]
+        VALUES:
+          - [1,'methanol','CH3OH','l',21.15,0.0709,2.587e-5,1]
+"""
+
+thermodb = ptdb.build_component_thermodb(
+    component_name='methanol',
+    reference_config={
+        'general': {
+            'databook': 'CUSTOM-REF-1',
+            'table': 'General-Data',
+        },
+        'vapor-pressure': {
+            'databook': 'CUSTOM-REF-1',
+            'table': 'Vapor-Pressure',
+        },
+        'ideal-gas-heat-capacity': {
+            'databook': 'CUSTOM-REF-1',
+            'table': 'Ideal-Gas-Heat-Capacity',
+        },
+    },
+    custom_reference={'reference': [REFERENCE_CONTENT]},
+)
+
+# NOTE: files
+tmp_dir = tempfile.mkdtemp()
+thermodb.save('methanol', file_path=tmp_dir)
+thermodb_file = os.path.join(tmp_dir, 'methanol.ptdb')
+
+pickle_file = os.path.join(tmp_dir, 'methanol.pkl')
+with open(pickle_file, 'wb') as f:
+    pickle.dump(thermodb, f)
+
+# ! distinct copies, pickle stores a repeated object once
+thermodbs = {
+    f'methanol-{i}': pickle.loads(pickle.dumps(thermodb))
+    for i in range(ARCHIVE_SIZE)
+}
+archive_file = ptdb.save_thermodb_archive(thermodbs, 'components', tmp_dir)
+
+archive_pickle_file = os.path.join(tmp_dir, 'components.pkl')
+with open(archive_pickle_file, 'wb') as f:
+    pickle.dump(thermodbs, f)
+
+
+def _pickle_load(path: str):
+    with open(path, 'rb') as f:
+        return pickle.load(f)
+
+
+def _archive_select(path: str):
+    with ptdb.load_thermodb_archive(path) as archive:
+        return archive['methanol-7'].select('vapor-pressure')
+
+
+# NOTE: scenarios (ptdb, pickle)
+scenarios = {
+    'load (eager)': (
+        lambda: ptdb.load_thermodb(thermodb_file),
+        lambda: _pickle_load(pickle_file),
+    ),
+    'load + select one equation': (
+        lambda: ptdb.load_thermodb(
+            thermodb_file, lazy=True).select('vapor-pressure'),
+        lambda: _pickle_load(pickle_file).select('vapor-pressure'),
+    ),
+    f'one of {ARCHIVE_SIZE} thermodbs': (
+        lambda: _archive_select(archive_file),
+        lambda: _pickle_load(
+            archive_pickle_file)['methanol-7'].select('vapor-pressure'),
+    ),
+}
+
+print(
+    f"{'file size':<30} | ptdb: {os.path.getsize(thermodb_file):>9} B | "
+    f"pickle: {os.path.getsize(pickle_file):>9} B"
+)
+print(
+    f"{'archive size':<30} | ptdb: {os.path.getsize(archive_file):>9} B | "
+    f"pickle: {os.path.getsize(archive_pickle_file):>9} B"
+)
+
+for name, (ptdb_fn, pickle_fn) in scenarios.items():
+    ptdb_time = min(timeit.repeat(ptdb_fn, number=LOOPS, repeat=5)) / LOOPS
+    pickle_time = min(
+        timeit.repeat(pickle_fn, number=LOOPS, repeat=5)) / LOOPS
+
+    print(
+        f"{name:<30} | ptdb: {ptdb_time * 1e6:8.1f} us | "
+        f"pickle: {pickle_time * 1e6:8.1f} us | "
+        f"speedup: {pickle_time / ptdb_time:5.1f}x"
+    )
+
+# ====================================
+# COLD-START TIME (fresh interpreters)
+# ====================================
+cold_scenarios = {
+    'cold load + one equation': (
+        "import pyThermoDB as ptdb\n"
+        f"ptdb.load_thermodb({thermodb_file!r}, lazy=True)"
+        ".select('vapor-pressure').cal(T=300.0)",
+        "import pickle\n"
+        f"with open({pickle_file!r}, 'rb') as f:\n"
+        "    pickle.load(f).select('vapor-pressure').cal(T=300.0)",
+    ),
+}
+
+probe = """
+import time
+start = time.perf_counter()
+{code}
+print(time.perf_counter() - start)
+"""
+
+
+def _cold(code: str) -> float:
+    times = []
+    for _ in range(RUNS):
+        output = subprocess.run(
+            [sys.executable, '-c', probe.format(code=code)],
+            check=True, capture_output=True, text=True
+        ).stdout.split()[-1]
+        times.append(float(output))
+    return statistics.median(times)
+
+
+for name, (ptdb_code, pickle_code) in cold_scenarios.items():
+    ptdb_time, pickle_time = _cold(ptdb_code), _cold(pickle_code)
+
+    print(
+        f"{name:<30} | ptdb: {ptdb_time * 1e3:8.1f} ms | "
+        f"pickle: {pickle_time * 1e3:8.1f} ms | "
+        f"speedup: {pickle_time / ptdb_time:5.1f}x"
+    )
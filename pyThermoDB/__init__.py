@@ -1,36 +1,86 @@
+from typing import TYPE_CHECKING
 from .config import __version__, __author__, __description__
-from .core import (
-    TableEquation,
-    TableMatrixEquation,
-    TableData,
-    TableMatrixData,
-    TableConstants
-)
-from .docs import ThermoDB
-from .builder import CompBuilder
-from .loader import CustomRef
-from .manager import ManageData
-from .app import (
-    init,
-    ref,
-    build_thermodb,
-    load_thermodb,
-)
-from .thermodb import (
-    build_component_thermodb,
-    build_components_thermodb,
-    build_component_thermodb_from_reference,
-    check_and_build_component_thermodb,
-    check_and_build_components_thermodb,
-    build_mixture_thermodb_from_reference,
-    check_and_build_mixture_thermodb,
-    build_constants_thermodb,
-    check_and_build_constants_thermodb,
-    build_constants_thermodb_from_reference,
-    ComponentThermoDB,
-    MixtureThermoDB,
-    ConstantsThermoDB
-)
+from .utils.lazy_import import lazy_exports
+
+if TYPE_CHECKING:
+    from .core import (
+        TableEquation,
+        TableMatrixEquation,
+        StackedEquation,
+        TableData,
+        TableMatrixData,
+        TableConstants
+    )
+    from .docs import ThermoDB
+    from .builder import CompBuilder
+    from .loader import CustomRef
+    from .manager import ManageData
+    from .app import (
+        init,
+        ref,
+        compile_reference,
+        build_thermodb,
+        load_thermodb,
+        save_thermodb_archive,
+        load_thermodb_archive,
+    )
+    from .thermodb import (
+        build_component_thermodb,
+        build_component_thermodbs,
+        build_components_thermodb,
+        build_component_thermodb_from_reference,
+        check_and_build_component_thermodb,
+        check_and_build_components_thermodb,
+        build_mixture_thermodb_from_reference,
+        check_and_build_mixture_thermodb,
+        build_mixture_thermodbs,
+        build_constants_thermodb,
+        check_and_build_constants_thermodb,
+        build_constants_thermodb_from_reference,
+        ComponentThermoDB,
+        MixtureThermoDB,
+        ConstantsThermoDB,
+        ThermoDBBatch
+    )
+
+# NOTE: public api, imported on first access (fast `import pyThermoDB`)
+_EXPORTS = {
+    'TableEquation': '.core',
+    'TableMatrixEquation': '.core',
+    'StackedEquation': '.core',
+    'TableData': '.core',
+    'TableMatrixData': '.core',
+    'TableConstants': '.core',
+    'ThermoDB': '.docs',
+    'CompBuilder': '.builder',
+    'CustomRef': '.loader',
+    'ManageData': '.manager',
+    'init': '.app',
+    'ref': '.app',
+    'compile_reference': '.app',
+    'build_thermodb': '.app',
+    'load_thermodb': '.app',
+    'save_thermodb_archive': '.app',
+    'load_thermodb_archive': '.app',
+    'build_component_thermodb': '.thermodb',
+    'build_component_thermodbs': '.thermodb',
+    'build_components_thermodb': '.thermodb',
+    'build_component_thermodb_from_reference': '.thermodb',
+    'check_and_build_component_thermodb': '.thermodb',
+    'check_and_build_components_thermodb': '.thermodb',
+    'build_mixture_thermodb_from_reference': '.thermodb',
+    'check_and_build_mixture_thermodb': '.thermodb',
+    'build_mixture_thermodbs': '.thermodb',
+    'build_constants_thermodb': '.thermodb',
+    'check_and_build_constants_thermodb': '.thermodb',
+    'build_constants_thermodb_from_reference': '.thermodb',
+    'ComponentThermoDB': '.thermodb',
+    'MixtureThermoDB': '.thermodb',
+    'ConstantsThermoDB': '.thermodb',
+    'ThermoDBBatch': '.thermodb',
+}
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
 
 __all__ = [
     '__version__',
@@ -42,12 +92,17 @@ __all__ = [
     'TableEquation',
     'TableMatrixData',
     'TableMatrixEquation',
+    'StackedEquation',
     'TableConstants',
     'init',
     'ref',
+    'compile_reference',
     'build_thermodb',
     'load_thermodb',
+    'save_thermodb_archive',
+    'load_thermodb_archive',
     'build_component_thermodb',
+    'build_component_thermodbs',
     'build_components_thermodb',
     'ManageData',
     'CustomRef',
@@ -56,10 +111,12 @@ __all__ = [
     'check_and_build_components_thermodb',
     'build_mixture_thermodb_from_reference',
     'check_and_build_mixture_thermodb',
+    'build_mixture_thermodbs',
     'build_constants_thermodb',
     'check_and_build_constants_thermodb',
     'build_constants_thermodb_from_reference',
     'ComponentThermoDB',
     'MixtureThermoDB',
-    'ConstantsThermoDB'
+    'ConstantsThermoDB',
+    'ThermoDBBatch'
 ]
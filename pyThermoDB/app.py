@@ -1,20 +1,22 @@
 # import packages/modules
+from __future__ import annotations
 import logging
 import os
 from typing import (
+    TYPE_CHECKING,
     Optional,
     Dict,
     List,
 )
-from pythermodb_settings.utils import measure_time
 # local
-from .docs import (
-    ThermoDB,
-    TableReference,
-)
-from .builder import CompBuilder
+from .builder import CompBuilder, ThermoDBArchive
+from .builder.compstore import resolve_thermodb_file
 from .loader import CustomRef
-from .models import CustomReference
+from .utils.timing import measure_time
+
+if TYPE_CHECKING:
+    from .docs import ThermoDB, TableReference
+    from .models import CustomReference
 
 
 # NOTE: logger
@@ -65,6 +67,9 @@ def init(
     ```
     '''
     try:
+        # NOTE: deferred import (pandas), not needed to load thermodbs
+        from .docs import ThermoDB
+
         # NOTE: init vars
         # check new custom ref
         check_ref = False
@@ -146,6 +151,9 @@ def ref(
     ```
     '''
     try:
+        # NOTE: deferred import (pandas)
+        from .docs import TableReference
+
         # check new custom ref
         check_ref = False
         if custom_reference:
@@ -164,6 +172,54 @@ def ref(
         raise Exception(f'Building reference failed! {e}')
 
 
+def compile_reference(
+    custom_reference: CustomReference | str,
+) -> str:
+    '''
+    Compile a custom reference to a fast-loading form, the reference is parsed
+    once and `init(custom_reference=...)` loads it from the cache directory
+    until its sources change.
+
+    Parameters
+    ----------
+    custom_reference : CustomReference | str
+        custom reference dict (check `init`) or a reference file path
+
+    Returns
+    -------
+    str
+        compiled reference file path
+
+    Notes
+    ------
+    References are compiled automatically on the first `init`, the cache
+    directory is set by `PYTHERMODB_CACHE_DIR` (default `~/.cache/pythermodb`).
+
+    ### Examples
+
+    ```python
+    ptdb.compile_reference('reference-1.yml')
+    tdb = ptdb.init(custom_reference='reference-1.yml')
+    ```
+    '''
+    try:
+        # NOTE: deferred import (pandas)
+        from .manager import ManageData
+
+        # NOTE: check if string (yml/md file)
+        if isinstance(custom_reference, str):
+            custom_reference = {'reference': [custom_reference]}
+
+        # NOTE: init reference
+        CustomRefC = CustomRef(custom_reference)
+        if not CustomRefC.init_ref():
+            raise Exception("Custom reference is invalid!")
+
+        return ManageData.compile_reference(CustomRefC)
+    except Exception as e:
+        raise Exception(f"Compiling reference failed! {e}")
+
+
 @measure_time
 def build_thermodb(
     thermodb_name: Optional[str] = None,
@@ -199,6 +255,7 @@ def build_thermodb(
 @measure_time
 def load_thermodb(
     thermodb_file: str,
+    lazy: bool = False,
     **kwargs,
 ) -> CompBuilder:
     '''
@@ -207,7 +264,10 @@ def load_thermodb(
     Parameters
     ----------
     thermodb_file : str
-        thermodb filename path
+        thermodb filename path, a missing `name.pkl` resolves to `name.ptdb`
+    lazy : bool, optional
+        if True, properties/functions are decoded the first time they are
+        selected (default is False)
     **kwargs
         Additional keyword arguments.
         - mode : Literal['silent', 'log', 'attach'], optional
@@ -220,10 +280,72 @@ def load_thermodb(
     '''
     try:
         # NOTE: check file exists
+        thermodb_file = resolve_thermodb_file(thermodb_file)
         if not os.path.isfile(thermodb_file):
             raise FileNotFoundError(f"File '{thermodb_file}' does not exist!")
 
         # NOTE: init class
-        return CompBuilder.load(thermodb_file)
+        return CompBuilder.load(thermodb_file, lazy=lazy)
     except Exception as e:
         raise Exception("Loading thermodb failed!, ", e)
+
+
+def save_thermodb_archive(
+    thermodbs: Dict[str, CompBuilder],
+    filename: str,
+    file_path: Optional[str] = None,
+) -> str:
+    '''
+    Save several thermodbs (e.g. one per component) into a single archive
+
+    Parameters
+    ----------
+    thermodbs : Dict[str, CompBuilder]
+        thermodbs by name (e.g. component name)
+    filename : str
+        archive filename, `.ptdba` is added if missing
+    file_path : str, optional
+        directory of the archive (default is None, current directory)
+
+    Returns
+    -------
+    str
+        archive file path
+    '''
+    try:
+        if file_path is not None:
+            filename = os.path.join(file_path, filename)
+        if not filename.endswith('.ptdba'):
+            filename += '.ptdba'
+
+        ThermoDBArchive.write(filename, thermodbs)
+        return filename
+    except Exception as e:
+        raise Exception("Saving thermodb archive failed!, ", e)
+
+
+def load_thermodb_archive(
+    archive_file: str,
+) -> ThermoDBArchive:
+    '''
+    Open a thermodb archive, thermodbs are memory-mapped and loaded lazily
+    on first access (e.g. `archive['methanol'].select('vapor-pressure')`)
+
+    Parameters
+    ----------
+    archive_file : str
+        archive filename path
+
+    Returns
+    -------
+    ThermoDBArchive : object
+        read-only mapping of thermodb names to thermodbs
+    '''
+    try:
+        # NOTE: check file exists
+        if not os.path.isfile(archive_file):
+            raise FileNotFoundError(f"File '{archive_file}' does not exist!")
+
+        return ThermoDBArchive(archive_file)
+    except Exception as e:
+        raise Exception("Loading thermodb archive failed!, ", e)
@@ -1,6 +1,8 @@
 # export
 from .compbuilder import CompBuilder
+from .comparchive import ThermoDBArchive
 
 __all_ = [
     'CompBuilder',
+    'ThermoDBArchive',
 ]
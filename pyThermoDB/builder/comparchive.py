@@ -0,0 +1,189 @@
+# import packages/modules
+import logging
+import json
+import mmap
+import struct
+import zlib
+from typing import Dict, Iterator, List, Mapping
+# local
+from .compbuilder import CompBuilder
+
+# NOTE: logger
+logger = logging.getLogger(__name__)
+
+# NOTE: archive layout
+# magic | version (uint16) | flags (uint16) | directory size (uint64)
+# | zlib-compressed json directory | padding | thermodb files (aligned)
+ARCHIVE_MAGIC = b'PTDBARC\x00'
+ARCHIVE_VERSION = 1
+ARCHIVE_EXTENSION = '.ptdba'
+_PREAMBLE = struct.Struct('<HHQ')
+_ALIGN = 8
+
+
+class ThermoDBArchive(Mapping):
+    '''
+    Single-file archive of many thermodbs (e.g. one per component).
+
+    The archive is memory-mapped, each thermodb is loaded lazily from its
+    slice of the mapping, so `archive['methanol'].select('vapor-pressure')`
+    reads the directory, the thermodb header and the selected item only.
+    Processes opening the same archive share its pages through the OS page
+    cache.
+    '''
+
+    def __init__(self, filename: str):
+        '''
+        Open an archive.
+
+        Parameters
+        ----------
+        filename : str
+            archive file path
+        '''
+        self.filename = filename
+        # NOTE: mapping
+        with open(filename, 'rb') as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        self._view = memoryview(self._mmap)
+
+        try:
+            self._directory = self._read_directory()
+        except Exception:
+            self.close()
+            raise
+
+        # NOTE: opened thermodbs
+        self._thermodbs: Dict[str, CompBuilder] = {}
+
+    def _read_directory(self) -> Dict[str, List[int]]:
+        view = self._view
+        if bytes(view[:len(ARCHIVE_MAGIC)]) != ARCHIVE_MAGIC:
+            raise ValueError(f"'{self.filename}' is not a thermodb archive!")
+
+        start = len(ARCHIVE_MAGIC)
+        version, _, size = _PREAMBLE.unpack_from(view, start)
+        if version > ARCHIVE_VERSION:
+            raise ValueError(
+                f"Thermodb archive version {version} is not supported "
+                f"(supported up to {ARCHIVE_VERSION}), please upgrade pyThermoDB!"
+            )
+
+        start += _PREAMBLE.size
+        directory = json.loads(
+            zlib.decompress(view[start:start + size]).decode('utf-8')
+        )
+        return directory['thermodbs']
+
+    def __getitem__(self, name: str) -> CompBuilder:
+        # check
+        if self._view is None:
+            raise ValueError("thermodb archive is closed")
+
+        thermodb = self._thermodbs.get(name)
+        if thermodb is None:
+            if name not in self._directory:
+                raise KeyError(name)
+            offset, size = self._directory[name]
+            thermodb = CompBuilder.loads(
+                self._view[offset:offset + size],
+                lazy=True
+            )
+            self._thermodbs[name] = thermodb
+        return thermodb
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._directory
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._directory)
+
+    def __len__(self) -> int:
+        return len(self._directory)
+
+    def __reduce__(self):
+        # ! worker processes map the file again instead of copying it
+        return (self.__class__, (self.filename,))
+
+    def __enter__(self) -> 'ThermoDBArchive':
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def close(self) -> None:
+        '''
+        Close the archive mapping.
+
+        Notes
+        -----
+        Thermodbs opened from the archive with items not decoded yet keep
+        the mapping alive, it is then released with them.
+        '''
+        self._thermodbs = {}
+        view = getattr(self, '_view', None)
+        if view is None:
+            return
+        view.release()
+        self._view = None
+        try:
+            self._mmap.close()
+        except BufferError:
+            # slices are still referenced by opened thermodbs
+            logger.debug(
+                f"Archive '{self.filename}' is still in use, "
+                "the mapping is released with its thermodbs."
+            )
+
+    @staticmethod
+    def write(
+        filename: str,
+        thermodbs: Mapping[str, CompBuilder]
+    ) -> None:
+        '''
+        Write thermodbs into an archive.
+
+        Parameters
+        ----------
+        filename : str
+            archive file path
+        thermodbs : Mapping[str, CompBuilder]
+            thermodbs by name (e.g. component name)
+        '''
+        # NOTE: thermodb files
+        payloads = []
+        for name, thermodb in thermodbs.items():
+            # build
+            thermodb.build()
+            payloads.append((str(name), thermodb.dumps()))
+
+        # NOTE: directory offsets depend on the directory size, iterate
+        # until the offsets fit (a second pass is normally enough)
+        size = 0
+        while True:
+            offset = len(ARCHIVE_MAGIC) + _PREAMBLE.size + size
+            directory = {}
+            for name, content in payloads:
+                offset += -offset % _ALIGN
+                directory[name] = [offset, len(content)]
+                offset += len(content)
+
+            directory_ = zlib.compress(
+                json.dumps(
+                    {'thermodbs': directory},
+                    separators=(',', ':')
+                ).encode('utf-8')
+            )
+            if len(directory_) <= size:
+                break
+            size = len(directory_)
+
+        with open(filename, 'wb') as f:
+            f.write(ARCHIVE_MAGIC)
+            f.write(_PREAMBLE.pack(ARCHIVE_VERSION, 0, size))
+            # ! directory padded to the reserved size
+            f.write(directory_.ljust(size, b'\x00'))
+            for name, content in payloads:
+                f.write(b'\x00' * (directory[name][0] - f.tell()))
+                f.write(content)
+
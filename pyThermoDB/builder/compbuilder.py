@@ -10,6 +10,15 @@ from typing import Optional, Union, Literal, ClassVar
 # local
 from .compexporter import CompExporter
 from .comp_tools import CompTools
+from .compstore import (
+    FUNCTION_KINDS,
+    LazyItems,
+    dumps_thermodb,
+    is_thermodb_content,
+    loads_thermodb,
+    resolve_thermodb_file,
+    thermodb_filename
+)
 from ..core import (
     TableEquation,
     TableMatrixEquation,
@@ -20,12 +29,21 @@ from ..core import (
 from ..config import __version__
 from ..models.configs import BuildType
 # ! deps
-from ..config.deps import get_config
+from ..config.deps import AppConfig, config_scope, get_config
 
 # logger
 logger = logging.getLogger(__name__)
 
 
+@functools.lru_cache(maxsize=1024)
+def _parse_property_source(property_source: str) -> tuple[str, ...]:
+    '''
+    Split a property source such as 'nrtl-data | alpha_ij | methanol | ethanol'
+    into trimmed parts, cached as sources are retrieved repeatedly.
+    '''
+    return tuple(part.strip() for part in property_source.split('|'))
+
+
 class CompBuilder(CompExporter):
     """
     Used to build thermodb library, including thermodynamic data, functions, and constants.
@@ -883,8 +901,8 @@ class CompBuilder(CompExporter):
         2- 'nrtl-data | alpha_ij | methanol | ethanol' means that the property is in the nrtl-data source and the name of the property is alpha_ij and the components are methanol and ethanol.
         '''
         try:
-            # split source
-            source = property_source.split('|')
+            # split source (cached)
+            source = _parse_property_source(property_source)
             # num
             source_num = len(source)
 
@@ -892,7 +910,7 @@ class CompBuilder(CompExporter):
             message = message if message is not None else f'Retrieving used for {property_source}!'
 
             # SECTION: property source
-            prop_src = self.select(source[0].strip())
+            prop_src = self.select(source[0])
 
             # SECTION: property name
             # check
@@ -903,7 +921,7 @@ class CompBuilder(CompExporter):
                         f"Invalid source format! {property_source}")
                 # get property
                 prop = prop_src.get_property(
-                    source[1].strip(),
+                    source[1],
                     message=message
                 )
                 # return
@@ -913,14 +931,14 @@ class CompBuilder(CompExporter):
                     raise ValueError(
                         f"Invalid source format! {property_source}")
                 return prop_src.get_constant(
-                    source[1].strip(),
+                    source[1],
                     message=message
                 )
             elif isinstance(prop_src, TableMatrixData):
                 # NOTE: check string format
                 if source_num == 2:
                     # property name full format
-                    prop_name = source[1].strip()
+                    prop_name = source[1]
 
                     # check if the property name is in the format of 'Alpha_i_j'
                     extracted = prop_name.split('_')
@@ -939,11 +957,7 @@ class CompBuilder(CompExporter):
                     return prop
                 elif source_num == 4:
                     # get components
-                    component_names = source[2:]
-                    # trim
-                    component_names = [
-                        name.strip() for name in component_names
-                    ]
+                    component_names = list(source[2:])
                     # check length
                     if len(component_names) != 2:
                         raise ValueError(
@@ -952,7 +966,7 @@ class CompBuilder(CompExporter):
 
                     # NOTE: get property (get_matrix_property method)
                     prop = prop_src.get_matrix_property(
-                        source[1].strip(),
+                        source[1],
                         component_names=component_names,
                         symbol_format=symbol_format,
                         message=message
@@ -966,19 +980,20 @@ class CompBuilder(CompExporter):
         except Exception as e:
             raise Exception("Retrieving failed!, ", e)
 
-    # SECTION: save/load using pickle
+    # SECTION: save/load
     def save(
         self,
         filename: str,
         file_path: Optional[str] = None,
     ) -> bool:
         """
-        Saves the instance to a file using pickle
+        Saves the instance to a file in the versioned thermodb format
 
         Parameters
         ----------
         filename : str
-            filename
+            filename, `.ptdb` is added if missing and replaces a legacy
+            `.pkl` extension (`load` resolves `name.pkl` to `name.ptdb`)
         file_path : str
             file path (default is None)
 
@@ -986,6 +1001,13 @@ class CompBuilder(CompExporter):
         -------
         res : bool
             True if success
+
+        Notes
+        -----
+        The file stores the inputs each property/function was built from
+        (reference tables, equations and component data) instead of the
+        pickled object graph, so it does not depend on the internal layout
+        of the thermodb classes.
         """
         try:
             # check filename
@@ -1006,37 +1028,173 @@ class CompBuilder(CompExporter):
             )
 
             # file name path
-            if not filename.endswith('.pkl'):
-                filename += '.pkl'
+            filename = thermodb_filename(filename)
 
             # save
-            with open(f'{filename}', 'wb') as f:
-                pickle.dump(self, f)
+            with open(filename, 'wb') as f:
+                f.write(self.dumps())
             # res
             return True
         except Exception as e:
             logger.error(f'Saving CompBuilder instance failed!, {e}')
             return False
 
-    # NOTE: load using pickle
+    def dumps(self) -> bytes:
+        '''
+        Encode the instance in the versioned thermodb format
+
+        Returns
+        -------
+        content : bytes
+            content of a thermodb file
+
+        Notes
+        -----
+        The instance is expected to be built (see `build`).
+        '''
+        # NOTE: items (added data and built properties/functions)
+        data = self.list_data()
+        built = {**self.properties, **self.functions}
+        entries = [
+            {
+                'name': name,
+                'value': value,
+                'data': True,
+                'built': name in built
+            }
+            for name, value in data.items()
+        ]
+        entries.extend(
+            {
+                'name': name,
+                'value': value,
+                'data': False,
+                'built': True
+            }
+            for name, value in built.items()
+            if name not in data
+        )
+
+        return dumps_thermodb(self._meta(), entries)
+
+    def _meta(self) -> dict:
+        # NOTE: builder attributes stored in the file header
+        meta = {
+            'thermodb_name': self.__thermodb_name,
+            'message': self.__message,
+            'build_version': self.build_version,
+            'build_type': self._build_type,
+            'component_name': self._component_name,
+            'component_formula': self._component_formula,
+            'component_state': self._component_state,
+        }
+        # ! build date/time/python once they are set
+        for key in ('build_date', 'build_timestamp', 'build_python'):
+            if key in self.__dict__:
+                meta[key] = self.__dict__[key]
+        return meta
+
+    # NOTE: load
     @classmethod
-    def load(cls, filename: str):
+    def load(cls, filename: str, lazy: bool = False):
         """
-        Loads a saved instance from a file using pickle
+        Loads a saved instance from a file
 
         Parameters
         ----------
         filename : str
             filename path
+        lazy : bool
+            if True, properties/functions are decoded the first time they
+            are accessed (default is False)
 
         Returns
         -------
         thermodb : object
             thermodb instance
+
+        Notes
+        -----
+        - In lazy mode, `check_properties`/`check_functions` list the names
+          without decoding, `select`/`retrieve` decode only the selected item.
+        - Files saved with older versions (pickle) are still loaded, always
+          eagerly.
+        - A missing `name.pkl` (or `name`) loads `name.ptdb`, the file
+          `save(name)` writes.
         """
         try:
-            with open(filename, 'rb') as f:
-                return pickle.load(f)
+            with open(resolve_thermodb_file(filename), 'rb') as f:
+                content = f.read()
+        except Exception as e:
+            raise Exception("Loading CompBuilder instance failed!", e)
+
+        return cls.loads(content, lazy=lazy)
+
+    @classmethod
+    def loads(cls, content: bytes | memoryview, lazy: bool = False):
+        """
+        Loads an instance from the content of a thermodb file
+
+        Parameters
+        ----------
+        content : bytes | memoryview
+            file content, a memoryview (e.g. of a mmap) is read without copying
+        lazy : bool
+            if True, properties/functions are decoded the first time they
+            are accessed (default is False)
+
+        Returns
+        -------
+        thermodb : object
+            thermodb instance
+        """
+        try:
+            # NOTE: legacy pickle
+            if not is_thermodb_content(content):
+                return pickle.loads(content)
+
+            meta, entries = loads_thermodb(content, lazy=lazy)
+
+            # NOTE: builder
+            config = AppConfig(
+                build_type=meta.get('build_type'),
+                component_name=meta.get('component_name'),
+                component_formula=meta.get('component_formula'),
+                component_state=meta.get('component_state'),
+            )
+            with config_scope(config):
+                thermodb = cls(
+                    thermodb_name=meta.get('thermodb_name'),
+                    message=meta.get('message')
+                )
+            for key in ('build_date', 'build_timestamp', 'build_python'):
+                if key in meta:
+                    thermodb.__dict__[key] = meta[key]
+
+            # NOTE: items
+            if lazy:
+                data = LazyItems()
+                properties = LazyItems()
+                functions = LazyItems()
+                for entry in entries:
+                    if entry['data']:
+                        data[entry['name']] = entry['value']
+                    if entry['built']:
+                        items = functions if entry['kind'] in FUNCTION_KINDS else properties
+                        items[entry['name']] = entry['value']
+                thermodb.__data = data
+                thermodb._set_items(properties, functions)
+                return thermodb
+
+            for entry in entries:
+                if entry['data']:
+                    thermodb.add_data(entry['name'], entry['value'])
+            thermodb.build()
+            for entry in entries:
+                if entry['built'] and not entry['data']:
+                    thermodb._add(entry['name'], entry['value'])
+
+            return thermodb
         except Exception as e:
             raise Exception("Loading CompBuilder instance failed!", e)
 
@@ -192,6 +192,24 @@ class CompExporter:
         except Exception as e:
             raise Exception("Renaming a property failed!, ", e)
 
+    def _set_items(
+            self,
+            properties: dict,
+            functions: dict
+    ):
+        '''
+        Set properties/functions dictionaries (used when loading a thermodb)
+
+        Parameters
+        ----------
+        properties : dict
+            properties by name
+        functions : dict
+            functions by name
+        '''
+        self.__properties = properties
+        self.__functions = functions
+
     def _clean(self):
         '''
         Clean properties/functions (dictionaries)
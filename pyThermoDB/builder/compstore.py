@@ -0,0 +1,894 @@
+# import packages/modules
+from __future__ import annotations
+import logging
+import io
+import os
+import json
+import struct
+import zlib
+import hashlib
+import math
+from typing import Any, Dict, List, Optional, Tuple
+import numpy as np
+# local
+from ..core import (
+    TableEquation,
+    TableMatrixEquation,
+    TableData,
+    TableMatrixData,
+    TableConstants
+)
+from ..config import __version__
+# ! deps
+from ..config.deps import AppConfig, config_scope
+from ..utils.lazy_import import LazyModule
+
+# NOTE: pandas, imported on first use (dataframes)
+pd = LazyModule('pandas')
+
+# NOTE: logger
+logger = logging.getLogger(__name__)
+
+# NOTE: file layout
+# magic | version (uint16) | flags (uint16) | header size (uint64)
+# | zlib-compressed json header | segments | padding | array section
+# segments: zlib-compressed json of each item and block
+# array section: float64 values | int64 values | raw arrays
+FORMAT_MAGIC = b'PTDBFMT\x00'
+FORMAT_VERSION = 2
+FILE_EXTENSION = '.ptdb'
+_PREAMBLE = struct.Struct('<HHQ')
+# array alignment (bytes)
+_ALIGN = 8
+# trans data keys holding the raw payload
+_TRANS_DATA_KEYS = ('data', 'matrix-data')
+# item kinds registered as functions
+FUNCTION_KINDS = ('equation', 'matrix-equation')
+_PAYLOAD_KEYS = ('header', 'records', 'unit', 'symbol')
+_INT64_MIN, _INT64_MAX = -2**63, 2**63 - 1
+_SCALARS = (bool, int, float, str)
+
+
+def is_thermodb_file(filename: str) -> bool:
+    '''
+    Check whether a file is stored in the versioned thermodb format.
+
+    Parameters
+    ----------
+    filename : str
+        file path
+
+    Returns
+    -------
+    res : bool
+        True if the file starts with the thermodb format magic
+    '''
+    with open(filename, 'rb') as f:
+        return f.read(len(FORMAT_MAGIC)) == FORMAT_MAGIC
+
+
+def is_thermodb_content(content: bytes | memoryview) -> bool:
+    '''
+    Check whether file content is in the versioned thermodb format.
+
+    Parameters
+    ----------
+    content : bytes | memoryview
+        file content
+
+    Returns
+    -------
+    res : bool
+        True if the content starts with the thermodb format magic
+    '''
+    return bytes(content[:len(FORMAT_MAGIC)]) == FORMAT_MAGIC
+
+
+def thermodb_filename(filename: str) -> str:
+    '''
+    Name of the file a thermodb is saved to, the format extension replaces
+    the legacy `.pkl` extension and is added when missing.
+
+    Parameters
+    ----------
+    filename : str
+        file path such as `methanol`, `methanol.pkl` or `methanol.ptdb`
+
+    Returns
+    -------
+    filename : str
+        file path ending with `.ptdb`
+    '''
+    root, ext = os.path.splitext(filename)
+    if ext.lower() == FILE_EXTENSION:
+        return filename
+    if ext.lower() == '.pkl':
+        return root + FILE_EXTENSION
+    return filename + FILE_EXTENSION
+
+
+def resolve_thermodb_file(filename: str) -> str:
+    '''
+    Resolve the file of a saved thermodb, a missing `name.pkl` or `name`
+    resolves to `name.ptdb` written by `CompBuilder.save(name)`.
+
+    Parameters
+    ----------
+    filename : str
+        file path
+
+    Returns
+    -------
+    filename : str
+        existing file path (the given one when nothing else exists)
+    '''
+    if os.path.isfile(filename):
+        return filename
+    saved = thermodb_filename(filename)
+    if os.path.isfile(saved):
+        logger.info(f"Thermodb file '{filename}' resolved to '{saved}'.")
+        return saved
+    return filename
+
+
+class _Writer:
+    '''
+    Encode values into a json header and a contiguous array section.
+
+    Containers are kept as json, numeric columns go to the array section,
+    and blocks (equations, table templates, trans data) are stored once.
+    '''
+
+    def __init__(self):
+        # NOTE: array section
+        self.floats: List[float] = []
+        self.ints: List[int] = []
+        self.chunks: List[bytes] = []
+        self.size = 0
+        self._arrays: Dict[Tuple[str, Tuple[int, ...], bytes], int] = {}
+        # NOTE: pooled blocks
+        self.blocks: List[Any] = []
+        self._block_keys: Dict[str, int] = {}
+
+    def array(self, value: np.ndarray) -> Dict[str, Any]:
+        # ! little-endian, c-contiguous
+        arr = np.ascontiguousarray(value)
+        arr = arr.astype(arr.dtype.newbyteorder('<'), copy=False)
+        raw = arr.tobytes()
+        key = (arr.dtype.str, arr.shape, hashlib.sha1(raw).digest())
+
+        offset = self._arrays.get(key)
+        if offset is None:
+            # pad to alignment
+            pad = -self.size % _ALIGN
+            if pad:
+                self.chunks.append(b'\x00' * pad)
+                self.size += pad
+            offset = self.size
+            self.chunks.append(raw)
+            self.size += len(raw)
+            self._arrays[key] = offset
+
+        return {'$a': [arr.dtype.str, list(arr.shape), offset]}
+
+    def block(self, value: Any) -> Dict[str, Any]:
+        return self._pool(self.pack(value))
+
+    def _pool(self, packed: Any) -> Dict[str, Any]:
+        # ! identical blocks are stored once
+        key = json.dumps(packed, separators=(',', ':'))
+        idx = self._block_keys.get(key)
+        if idx is None:
+            idx = len(self.blocks)
+            self.blocks.append(packed)
+            self._block_keys[key] = idx
+        return {'$b': idx}
+
+    def column(self, values: List[Any]) -> Any:
+        # NOTE: numeric columns as slices of the float/int vectors
+        values = [_scalar(v) for v in values]
+        if values and all(type(v) is float for v in values):
+            self.floats.extend(values)
+            return {'$f': [len(self.floats) - len(values), len(values)]}
+        if values and all(
+            type(v) is int and _INT64_MIN <= v <= _INT64_MAX for v in values
+        ):
+            self.ints.extend(values)
+            return {'$i': [len(self.ints) - len(values), len(values)]}
+        if all(v is None or isinstance(v, _SCALARS) for v in values):
+            # ! plain json, decoded without walking the items
+            return {'$s': values}
+        return [self.pack(v) for v in values]
+
+    def section(self) -> List[bytes]:
+        # NOTE: array section content
+        return [
+            np.asarray(self.floats, dtype='<f8').tobytes(),
+            np.asarray(self.ints, dtype='<i8').tobytes(),
+            *self.chunks
+        ]
+
+    def rows(self, value: List[Any]) -> Optional[Dict[str, Any]]:
+        # NOTE: list of equal-length rows stored column-wise
+        if len(value) < 2 or not all(isinstance(r, list) for r in value):
+            return None
+        width = len(value[0])
+        if width == 0 or any(len(r) != width for r in value):
+            return None
+        columns = [
+            self.column([r[j] for r in value])
+            for j in range(width)
+        ]
+        return {'$rows': [len(value), columns]}
+
+    def frame(self, value: pd.DataFrame) -> Dict[str, Any]:
+        columns = []
+        for j in range(value.shape[1]):
+            col = value.iloc[:, j]
+            if isinstance(col.dtype, np.dtype) and col.dtype.kind in 'biuf':
+                columns.append([str(col.dtype), self.array(col.to_numpy())])
+            else:
+                columns.append([str(col.dtype), self.column(col.tolist())])
+
+        # ! default index is not stored
+        index = value.index
+        if isinstance(index, pd.RangeIndex) and index.start == 0 and index.step == 1:
+            index_ = None
+        else:
+            index_ = self.pack([_scalar(v) for v in index.tolist()])
+
+        return {
+            '$df': {
+                'columns': self.pack([_scalar(c) for c in value.columns]),
+                'index': index_,
+                'data': columns,
+            }
+        }
+
+    def trans(self, value: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        # NOTE: trans data repeats its raw payload, keep the payload only
+        data_key = next((k for k in _TRANS_DATA_KEYS if k in value), None)
+        if data_key is None:
+            return None
+        if _trans_data(value[data_key], data_key) != value:
+            return None
+        return {'$trans': [data_key, self.pack(value[data_key])]}
+
+    def pack(self, value: Any) -> Any:
+        value = _scalar(value)
+
+        if value is None or isinstance(value, _SCALARS):
+            return value
+
+        if isinstance(value, np.ndarray):
+            if value.dtype.kind in 'biufc':
+                return {'$nd': self.array(value)}
+            return {'$ndo': [list(value.shape), self.pack(value.ravel().tolist())]}
+
+        # ! dataframes exist only once pandas is imported
+        if pd.loaded and isinstance(value, pd.DataFrame):
+            return self.frame(value)
+
+        if isinstance(value, tuple):
+            return {'$tuple': [self.pack(v) for v in value]}
+
+        if isinstance(value, list):
+            packed = self.rows(value)
+            if packed is not None:
+                return packed
+            return self.column(value)
+
+        if isinstance(value, dict):
+            trans = self.trans(value)
+            if trans is not None:
+                return self._pool(trans)
+            if all(isinstance(k, str) and not k.startswith('$') for k in value):
+                return {k: self.pack(v) for k, v in value.items()}
+            return {'$map': [[self.pack(k), self.pack(v)] for k, v in value.items()]}
+
+        raise TypeError(f"Unsupported value type: {type(value)}")
+
+
+class _Reader:
+    '''
+    Decode values written by `_Writer`.
+
+    Segments (items and blocks) are decompressed on first use, so a single
+    item can be decoded without reading the rest of the file.
+    '''
+
+    def __init__(
+        self,
+        content: bytes | memoryview,
+        header: Dict[str, Any],
+        body_start: int
+    ):
+        self.content = content
+        self.header = header
+        self.body_start = body_start
+        # NOTE: parsed block segments
+        self._blocks: Dict[int, Any] = {}
+
+        # NOTE: array section
+        arrays = header['arrays']
+        start = body_start + header['segments_size']
+        start += -start % _ALIGN
+        self.floats_start = start
+        self.ints_start = start + 8 * arrays['floats']
+        self.arrays_start = self.ints_start + 8 * arrays['ints']
+
+    def segment(self, ref: Any) -> Any:
+        offset, size = ref
+        start = self.body_start + offset
+        return json.loads(
+            zlib.decompress(self.content[start:start + size]).decode('utf-8')
+        )
+
+    def block(self, idx: int) -> Any:
+        packed = self._blocks.get(idx)
+        if packed is None:
+            packed = self.segment(self.header['blocks'][idx])
+            self._blocks[idx] = packed
+        return packed
+
+    def item(self, idx: int) -> Any:
+        return self.segment(self.header['index'][idx]['item'])
+
+    def array(self, ref: List[Any]) -> np.ndarray:
+        dtype, shape, offset = ref
+        arr = np.frombuffer(
+            self.content,
+            dtype=np.dtype(dtype),
+            count=math.prod(shape),
+            offset=self.arrays_start + offset
+        )
+        # ! own the memory, loaded objects stay writable
+        return arr.reshape(shape).copy()
+
+    def column(self, value: Any) -> List[Any]:
+        if isinstance(value, dict):
+            if '$f' in value:
+                start, n = value['$f']
+                return np.frombuffer(
+                    self.content, dtype='<f8', count=n,
+                    offset=self.floats_start + 8 * start
+                ).tolist()
+            if '$i' in value:
+                start, n = value['$i']
+                return np.frombuffer(
+                    self.content, dtype='<i8', count=n,
+                    offset=self.ints_start + 8 * start
+                ).tolist()
+            if '$s' in value:
+                return list(value['$s'])
+        return [self.unpack(v) for v in value]
+
+    def unpack(self, value: Any) -> Any:
+        if isinstance(value, list):
+            return [self.unpack(v) for v in value]
+
+        if not isinstance(value, dict):
+            return value
+
+        if len(value) == 1:
+            tag, body = next(iter(value.items()))
+            if tag == '$b':
+                # ! decoded per reference, loaded objects share no state
+                return self.unpack(self.block(body))
+            if tag in ('$f', '$i', '$s'):
+                return self.column(value)
+            if tag == '$nd':
+                return self.array(body['$a'])
+            if tag == '$ndo':
+                shape, items = body
+                return np.array(self.unpack(items), dtype=object).reshape(shape)
+            if tag == '$rows':
+                n, columns = body
+                columns = [self.column(c) for c in columns]
+                return list(map(list, zip(*columns))) if columns else [[] for _ in range(n)]
+            if tag == '$df':
+                return self.frame(body)
+            if tag == '$tuple':
+                return tuple(self.unpack(v) for v in body)
+            if tag == '$trans':
+                data_key, payload = body
+                return _trans_data(self.unpack(payload), data_key)
+            if tag == '$map':
+                return {self.unpack(k): self.unpack(v) for k, v in body}
+
+        return {k: self.unpack(v) for k, v in value.items()}
+
+    def frame(self, body: Dict[str, Any]) -> pd.DataFrame:
+        data = {}
+        dtypes = {}
+        for j, (dtype, col) in enumerate(body['data']):
+            if isinstance(col, dict) and '$a' in col:
+                data[j] = self.array(col['$a'])
+            else:
+                data[j] = self.column(col)
+                dtypes[j] = dtype
+
+        index = body['index']
+        df = pd.DataFrame(
+            data,
+            index=None if index is None else self.unpack(index)
+        )
+
+        # NOTE: restore dtypes pandas does not infer from lists
+        for j, dtype in dtypes.items():
+            if str(df.dtypes[j]) != dtype:
+                try:
+                    df[j] = df[j].astype(dtype)
+                except Exception:
+                    df[j] = df[j].astype(object)
+
+        df.columns = self.unpack(body['columns'])
+        return df
+
+
+def _scalar(value: Any) -> Any:
+    # NOTE: numpy scalars as python values, pandas missing values as None
+    if pd.loaded and (value is pd.NA or value is pd.NaT):
+        return None
+    if isinstance(value, np.generic) and not isinstance(value, (np.str_, np.bytes_)):
+        return value.item()
+    return value
+
+
+def _trans_data(payload: Any, data_key: str) -> Optional[Dict[str, Any]]:
+    # NOTE: same layout as TransData.trans/TransMatrixData.trans
+    if not isinstance(payload, dict):
+        return None
+    if not all(isinstance(payload.get(k), list) for k in _PAYLOAD_KEYS):
+        return None
+
+    data = {}
+    for x, y, z, w in zip(
+        payload['header'], payload['records'], payload['unit'], payload['symbol']
+    ):
+        data[str(x)] = {"value": y, "unit": z, "symbol": w}
+    data[data_key] = payload
+    return data
+
+
+def _private(obj: Any, cls: type, name: str) -> Any:
+    # NOTE: name-mangled attribute of a core class
+    attr = f'_{cls.__name__}__{name}'
+    state = vars(obj)
+    # ! a renamed attribute must not be written as None
+    if attr not in state:
+        raise AttributeError(
+            f"{cls.__name__} has no attribute {attr}, "
+            f"the thermodb encoder needs an update"
+        )
+    return state[attr]
+
+
+# SECTION: item encoders
+def _encode_item(writer: _Writer, value: Any) -> Dict[str, Any]:
+    '''
+    Encode a thermodb item by its constructor inputs and public state.
+    '''
+    # NOTE: matrix classes first (no common base)
+    if isinstance(value, TableMatrixEquation):
+        item = {
+            'kind': 'matrix-equation',
+            'databook_name': writer.pack(value.databook_name),
+            'table_name': writer.pack(value.table_name),
+            'equations': writer.block(value.equations),
+            'matrix_table': writer.block(value.matrix_table),
+            'trans_data_pack': writer.pack(value.trans_data_pack),
+            'trans_data': writer.pack(value.trans_data),
+            'eq_set': bool(value.body),
+        }
+    elif isinstance(value, TableMatrixData):
+        item = {
+            'kind': 'matrix-data',
+            'databook_name': writer.pack(value.databook_name),
+            'table_name': writer.pack(value.table_name),
+            'table_data': writer.block(value.table_data),
+            'matrix_table': writer.block(value.matrix_table),
+            'trans_data_pack': writer.pack(value.trans_data_pack),
+            'prop_data_pack': writer.pack(value.prop_data_pack),
+            'trans_data': writer.pack(value.trans_data),
+            'prop_data': writer.pack(value.prop_data),
+            'matrix_elements': writer.pack(value.matrix_elements),
+            'mixture_id': writer.pack(value.mixture_id),
+            'mixture_ids': writer.pack(value.mixture_ids),
+        }
+    elif isinstance(value, TableEquation):
+        item = {
+            'kind': 'equation',
+            'include_data': value.include_data,
+            'databook_name': writer.pack(value.databook_name),
+            'table_name': writer.pack(value.table_name),
+            'equations': writer.block(value.equations),
+            'table_values': writer.block(
+                _private(value, TableEquation, 'table_values')),
+            'table_structure': writer.block(
+                _private(value, TableEquation, 'table_structure')),
+            'trans_data': writer.pack(value.trans_data),
+            'eq_set': value.eq_id != -1,
+        }
+    elif isinstance(value, TableData):
+        trans_data = value.trans_data
+        # ! prop data is trans data without the raw payload
+        derived = {k: v for k, v in trans_data.items() if k != 'data'}
+        item = {
+            'kind': 'data',
+            'include_data': value.include_data,
+            'databook_name': writer.pack(value.databook_name),
+            'table_name': writer.pack(value.table_name),
+            'table_data': writer.block(value.table_data),
+            'table_values': writer.block(
+                _private(value, TableData, 'table_values')),
+            'table_structure': writer.block(
+                _private(value, TableData, 'table_structure')),
+            'trans_data': writer.pack(trans_data),
+            'prop_data': None if value.prop_data == derived else writer.pack(value.prop_data),
+        }
+    elif isinstance(value, TableConstants):
+        item = {
+            'kind': 'constants',
+            'databook_name': writer.pack(value.databook_name),
+            'table_name': writer.pack(value.table_name),
+            'table_data': writer.block(value.table_data),
+            'table_values': writer.block(value.table_values),
+            'table_structure': writer.block(value.table_structure),
+        }
+    elif isinstance(value, dict):
+        item = {
+            'kind': 'dict',
+            'value': writer.pack(value),
+        }
+    else:
+        raise TypeError(f"Unsupported thermodb item type: {type(value)}")
+
+    return item
+
+
+def _decode_item(reader: _Reader, item: Dict[str, Any]) -> Any:
+    '''
+    Rebuild a thermodb item by replaying its construction.
+    '''
+    kind = item['kind']
+    u = reader.unpack
+
+    if kind == 'equation':
+        with config_scope(AppConfig(include_data=item['include_data'])):
+            value = TableEquation(
+                u(item['databook_name']),
+                u(item['table_name']),
+                u(item['equations']),
+                table_values=u(item['table_values']),
+                table_structure=u(item['table_structure'])
+            )
+        value.trans_data = u(item['trans_data'])
+        if item['eq_set']:
+            value.eqSet()
+        return value
+
+    if kind == 'data':
+        with config_scope(AppConfig(include_data=item['include_data'])):
+            value = TableData(
+                u(item['databook_name']),
+                u(item['table_name']),
+                u(item['table_data']),
+                table_values=u(item['table_values']),
+                table_structure=u(item['table_structure'])
+            )
+        value.trans_data = u(item['trans_data'])
+        value.prop_data = value.trans_data if item['prop_data'] is None else u(
+            item['prop_data'])
+        return value
+
+    if kind == 'constants':
+        return TableConstants(
+            u(item['databook_name']),
+            u(item['table_name']),
+            u(item['table_data']),
+            table_values=u(item['table_values']),
+            table_structure=u(item['table_structure'])
+        )
+
+    if kind == 'matrix-data':
+        value = TableMatrixData(
+            databook_name=u(item['databook_name']),
+            table_name=u(item['table_name']),
+            table_data=u(item['table_data']),
+            matrix_table=u(item['matrix_table'])
+        )
+        value.trans_data_pack = u(item['trans_data_pack'])
+        value.prop_data_pack = u(item['prop_data_pack'])
+        value.trans_data = u(item['trans_data'])
+        value.prop_data = u(item['prop_data'])
+        value.matrix_elements = u(item['matrix_elements'])
+        value.mixture_id = u(item['mixture_id'])
+        value.mixture_ids = u(item['mixture_ids'])
+        return value
+
+    if kind == 'matrix-equation':
+        value = TableMatrixEquation(
+            u(item['databook_name']),
+            u(item['table_name']),
+            u(item['equations']),
+            matrix_table=u(item['matrix_table'])
+        )
+        value.trans_data_pack = u(item['trans_data_pack'])
+        value.trans_data = u(item['trans_data'])
+        if item['eq_set']:
+            value.eqSet()
+        return value
+
+    if kind == 'dict':
+        return u(item['value'])
+
+    raise ValueError(f"Unknown thermodb item kind: {kind}")
+
+
+# SECTION: lazy items
+class PendingItem:
+    '''
+    Thermodb item decoded from its file segment on first access.
+    '''
+    __slots__ = ('kind', '_reader', '_idx', '_value')
+
+    def __init__(self, reader: _Reader, idx: int, kind: str):
+        self.kind = kind
+        self._reader: Optional[_Reader] = reader
+        self._idx = idx
+        self._value: Any = None
+
+    @property
+    def loaded(self) -> bool:
+        return self._reader is None
+
+    def load(self) -> Any:
+        # NOTE: decoded once, later calls return the same object
+        if self._reader is not None:
+            self._value = _decode_item(
+                self._reader, self._reader.item(self._idx))
+            self._reader = None
+        return self._value
+
+    def __repr__(self) -> str:
+        return f"<PendingItem kind={self.kind!r} loaded={self.loaded}>"
+
+
+class LazyItems(dict):
+    '''
+    Dictionary of thermodb items, values are materialized on first read.
+
+    Names (keys) are listed without decoding any item.
+    '''
+
+    def __getitem__(self, key):
+        value = super().__getitem__(key)
+        if isinstance(value, PendingItem):
+            value = value.load()
+            super().__setitem__(key, value)
+        return value
+
+    def __iter__(self):
+        # ! overriding __iter__ makes dict(...)/{**...} go through __getitem__
+        return super().__iter__()
+
+    def __eq__(self, other):
+        return dict(self.items()) == other
+
+    def __ne__(self, other):
+        return not self == other
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def get(self, key, default=None):
+        return self[key] if key in self else default
+
+    def values(self):
+        return [self[key] for key in self]
+
+    def items(self):
+        return [(key, self[key]) for key in self]
+
+    def pop(self, key, *default):
+        if key in self:
+            value = self[key]
+            super().pop(key)
+            return value
+        return super().pop(key, *default)
+
+    def copy(self):
+        return LazyItems(super().items())
+
+    def pending(self) -> List[str]:
+        '''Names of the items not decoded yet.'''
+        return [
+            key for key, value in super().items()
+            if isinstance(value, PendingItem) and not value.loaded
+        ]
+
+
+# SECTION: read/write
+def write_thermodb(
+    filename: str,
+    meta: Dict[str, Any],
+    entries: List[Dict[str, Any]]
+) -> None:
+    '''
+    Write a thermodb file.
+
+    Parameters
+    ----------
+    filename : str
+        file path
+    meta : dict
+        thermodb metadata (json-compatible)
+    entries : list[dict]
+        items as `{'name', 'value', 'data', 'built'}`
+    '''
+    content = dumps_thermodb(meta, entries)
+    with open(filename, 'wb') as f:
+        f.write(content)
+
+
+def dumps_thermodb(
+    meta: Dict[str, Any],
+    entries: List[Dict[str, Any]]
+) -> bytes:
+    '''
+    Encode a thermodb in the thermodb file format.
+
+    Parameters
+    ----------
+    meta : dict
+        thermodb metadata (json-compatible)
+    entries : list[dict]
+        items as `{'name', 'value', 'data', 'built'}`, where `data` and
+        `built` flag whether the item belongs to the added data and the
+        built properties/functions.
+
+    Returns
+    -------
+    content : bytes
+        file content
+    '''
+    writer = _Writer()
+    items = [_encode_item(writer, entry['value']) for entry in entries]
+
+    # NOTE: segments, offsets are relative to the end of the header
+    segments: List[bytes] = []
+    segments_size = 0
+
+    def segment(packed: Any) -> List[int]:
+        nonlocal segments_size
+        raw = zlib.compress(
+            json.dumps(packed, separators=(',', ':')).encode('utf-8')
+        )
+        ref = [segments_size, len(raw)]
+        segments.append(raw)
+        segments_size += len(raw)
+        return ref
+
+    blocks = [segment(block) for block in writer.blocks]
+    index = [
+        {
+            'name': entry['name'],
+            'kind': item['kind'],
+            'data': entry['data'],
+            'built': entry['built'],
+            'item': segment(item),
+        }
+        for entry, item in zip(entries, items)
+    ]
+
+    header = {
+        'format_version': FORMAT_VERSION,
+        'package_version': __version__,
+        'meta': meta,
+        'index': index,
+        'blocks': blocks,
+        'segments_size': segments_size,
+        'arrays': {
+            'floats': len(writer.floats),
+            'ints': len(writer.ints),
+            'size': writer.size,
+        },
+    }
+    header_ = zlib.compress(
+        json.dumps(header, separators=(',', ':')).encode('utf-8')
+    )
+
+    f = io.BytesIO()
+    f.write(FORMAT_MAGIC)
+    f.write(_PREAMBLE.pack(FORMAT_VERSION, 0, len(header_)))
+    f.write(header_)
+    for raw in segments:
+        f.write(raw)
+    # ! array section is aligned
+    f.write(b'\x00' * (-f.tell() % _ALIGN))
+    for chunk in writer.section():
+        f.write(chunk)
+    return f.getvalue()
+
+
+def read_thermodb(
+    filename: str,
+    lazy: bool = False
+) -> Tuple[Dict[str, Any], List[Dict[str, Any]]]:
+    '''
+    Read a thermodb file.
+
+    Parameters
+    ----------
+    filename : str
+        file path
+    lazy : bool
+        if True, items are returned as `PendingItem` (default is False)
+
+    Returns
+    -------
+    meta : dict
+        thermodb metadata
+    entries : list[dict]
+        items as `{'name', 'kind', 'value', 'data', 'built'}`
+    '''
+    with open(filename, 'rb') as f:
+        return loads_thermodb(f.read(), lazy=lazy)
+
+
+def loads_thermodb(
+    content: bytes | memoryview,
+    lazy: bool = False
+) -> Tuple[Dict[str, Any], List[Dict[str, Any]]]:
+    '''
+    Read a thermodb from the content of a thermodb file.
+
+    Parameters
+    ----------
+    content : bytes | memoryview
+        file content, a memoryview (e.g. of a mmap) is read without copying
+    lazy : bool
+        if True, items are returned as `PendingItem` (default is False)
+
+    Returns
+    -------
+    meta : dict
+        thermodb metadata
+    entries : list[dict]
+        items as `{'name', 'kind', 'value', 'data', 'built'}`
+    '''
+    # NOTE: preamble
+    if not is_thermodb_content(content):
+        raise ValueError("Content is not in the thermodb format!")
+    start = len(FORMAT_MAGIC)
+    version, _, header_size = _PREAMBLE.unpack_from(content, start)
+    if version > FORMAT_VERSION:
+        raise ValueError(
+            f"Thermodb format version {version} is not supported "
+            f"(supported up to {FORMAT_VERSION}), please upgrade pyThermoDB!"
+        )
+    if version < FORMAT_VERSION:
+        raise ValueError(
+            f"Thermodb format version {version} is not supported, "
+            f"please save the thermodb again!"
+        )
+
+    # NOTE: header
+    start += _PREAMBLE.size
+    header = json.loads(
+        zlib.decompress(content[start:start + header_size]).decode('utf-8')
+    )
+    reader = _Reader(content, header, start + header_size)
+
+    entries = []
+    for idx, info in enumerate(header['index']):
+        value = PendingItem(reader, idx, info['kind'])
+        entries.append({
+            'name': info['name'],
+            'kind': info['kind'],
+            'value': value if lazy else value.load(),
+            'data': info['data'],
+            'built': info['built'],
+        })
+
+    return header['meta'], entries
@@ -1,9 +1,14 @@
 # import libs
-from typing import Literal, Optional
+from typing import Literal, Optional, Callable, Iterator, TypeVar
 from dataclasses import dataclass
+from contextlib import contextmanager
+from contextvars import ContextVar, Token, copy_context
+from functools import wraps
 # locals
 from ..models.configs import BuildType
 
+F = TypeVar('F', bound=Callable)
+
 
 @dataclass
 class AppConfig:
@@ -20,17 +25,45 @@ class AppConfig:
 
 
 # this is like get_settings() in FastAPI
-_current_config: AppConfig | None = None
+# NOTE: context-local, each thread/asyncio task sees its own config
+_current_config: ContextVar[AppConfig | None] = ContextVar(
+    'pythermodb_config',
+    default=None
+)
+
 
+def set_config(cfg: AppConfig) -> Token:
+    # ! set config of the current context
+    return _current_config.set(cfg)
 
-def set_config(cfg: AppConfig) -> None:
-    # ! set global config
-    global _current_config
-    _current_config = cfg
+
+def reset_config(token: Token) -> None:
+    # ! restore the config before the matching set_config
+    _current_config.reset(token)
 
 
 def get_config() -> AppConfig:
-    if _current_config is None:
+    cfg = _current_config.get()
+    if cfg is None:
         # default config if not set
         return AppConfig()
-    return _current_config
+    return cfg
+
+
+@contextmanager
+def config_scope(cfg: AppConfig) -> Iterator[AppConfig]:
+    # ! config only visible inside the with block
+    token = set_config(cfg)
+    try:
+        yield cfg
+    finally:
+        reset_config(token)
+
+
+def isolated_config(func: F) -> F:
+    # ! run func in a copy of the current context, so the config it sets
+    # does not leak to the caller or to concurrent builds
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        return copy_context().run(func, *args, **kwargs)
+    return wrapper  # type: ignore[return-value]
@@ -3,6 +3,7 @@ from .tabledata import TableData
 from .tableequation import TableEquation
 from .tablematrixdata import TableMatrixData
 from .tablematrixequation import TableMatrixEquation
+from .stacked_equation import StackedEquation
 from .tableconstants import TableConstants
 from .table_util import TableUtil
 
@@ -11,6 +12,7 @@ __all__ = [
     'TableEquation',
     'TableMatrixData',
     'TableMatrixEquation',
+    'StackedEquation',
     'TableConstants',
     'TableUtil',
 ]
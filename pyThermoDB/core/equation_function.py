@@ -0,0 +1,128 @@
+# import packages/modules
+import ast
+import builtins
+from types import FunctionType
+from typing import Any, Dict, Literal, Tuple
+
+# NOTE: how an equation body uses parms
+# - read: parms are only read (parms[...]), the bound values are passed as
+#   they are
+# - assign: items are rebound (e.g. unit conversion), a dict copy is passed
+# - mutate: anything else, items may be changed in place (augmented/nested
+#   assignment, del, parms methods, aliases of parms or its items), arrays
+#   are copied too
+ParmsAccess = Literal['read', 'assign', 'mutate']
+
+
+def _parms_access(tree: ast.Module) -> ParmsAccess:
+    # NOTE: parent of each node
+    parents: Dict[ast.AST, ast.AST] = {}
+    for node in ast.walk(tree):
+        for child in ast.iter_child_nodes(node):
+            parents[child] = node
+
+    access: ParmsAccess = 'read'
+    for node in ast.walk(tree):
+        if not (isinstance(node, ast.Name) and node.id == 'parms'):
+            continue
+
+        # ! parms used as a whole (rebound, aliased, passed, parms.update(...))
+        item = parents.get(node)
+        if not (
+            isinstance(node.ctx, ast.Load) and
+            isinstance(item, ast.Subscript) and
+            item.value is node
+        ):
+            return 'mutate'
+
+        # NOTE: parms[...] read
+        if isinstance(item.ctx, ast.Load):
+            # ! item changed in place (parms[...][...] = ..., parms[...].fill())
+            value: ast.AST = item
+            parent = parents.get(value)
+            while (
+                isinstance(parent, ast.Subscript) and
+                parent.value is value and
+                isinstance(parent.ctx, ast.Load)
+            ):
+                value, parent = parent, parents.get(parent)
+            if isinstance(parent, ast.Attribute) or (
+                isinstance(parent, ast.Subscript) and parent.value is value
+            ):
+                return 'mutate'
+            # ! item bound to a name (a = parms[...]; a += 1)
+            while isinstance(
+                parent, (ast.Tuple, ast.List, ast.Starred, ast.IfExp, ast.BoolOp)
+            ):
+                value, parent = parent, parents.get(parent)
+            if isinstance(
+                parent, (ast.Assign, ast.AnnAssign, ast.NamedExpr)
+            ) and parent.value is value:
+                return 'mutate'
+            if isinstance(parent, (ast.For, ast.comprehension)) and (
+                parent.iter is value
+            ):
+                return 'mutate'
+            if isinstance(parent, ast.withitem) and (
+                parent.context_expr is value
+            ):
+                return 'mutate'
+            continue
+
+        # NOTE: parms[...] = ... (rebound items), del parms[...]
+        if isinstance(item.ctx, ast.Del) or isinstance(
+            parents.get(item), ast.AugAssign
+        ):
+            return 'mutate'
+        access = 'assign'
+
+    return access
+
+
+def compile_equation_function(
+    body: str,
+    filename: str,
+    namespace: Dict[str, Any]
+) -> Tuple[FunctionType, ParmsAccess]:
+    '''
+    Compile an equation body into a function `f(args, parms) -> res`.
+
+    Parameters
+    ----------
+    body : str
+        equation body, statements setting `res` from `args` and `parms`
+    filename : str
+        filename shown in tracebacks
+    namespace : dict
+        global names of the body (e.g. math, np)
+
+    Returns
+    -------
+    fn : FunctionType
+        equation function, the body variables are function locals
+    parms_access : str
+        how the body uses parms (read, assign or mutate)
+    '''
+    tree = ast.parse(body, filename=filename, mode='exec')
+    access = _parms_access(tree)
+
+    # NOTE: def __equation__(args, parms): <body>; return res
+    module = ast.parse("def __equation__(args, parms):\n    return res\n")
+    fn_def = module.body[0]
+    fn_def.body[:0] = tree.body  # type: ignore
+    ast.fix_missing_locations(module)
+
+    scope = {'__builtins__': builtins, **namespace}
+    exec(compile(module, filename, 'exec'), scope)
+    return scope['__equation__'], access
+
+
+def call_parms(parms: Dict[str, Any], access: ParmsAccess) -> Dict[str, Any]:
+    '''Parameters passed to an equation function (copied only if needed).'''
+    if access == 'read':
+        return parms
+    if access == 'assign':
+        return dict(parms)
+    return {
+        k: v.copy() if hasattr(v, 'copy') else v for k, v in parms.items()
+    }
@@ -0,0 +1,204 @@
+# import packages/modules
+from __future__ import annotations
+import numpy as np
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple, Union
+
+if TYPE_CHECKING:
+    from .tablematrixdata import TableMatrixData
+
+
+class MatrixTensor:
+    '''
+    Matrix table compiled once into a component index and a dense
+    (properties x n x n) float tensor, lookups are pure indexing.
+
+    Notes
+    -----
+    - cells not defined in the table are NaN, empty values (None/NaN) are -1
+    - `order` holds the table row which wrote a cell (-1 not written), the
+      last row wins as in the table scan
+    - binary-pair (Mixture) tables also have conditional cells, written only
+      when a third component (the mixture partner) is selected, e.g. the
+      diagonal of a component which differs per mixture
+    '''
+
+    __slots__ = (
+        'pair',
+        'index',
+        'properties',
+        'values',
+        'order',
+        'conditional',
+        'errors',
+        'row_names',
+        'row_mixtures',
+        'row_labels',
+        'lower_index',
+        'columns',
+        'cells',
+        'row_values',
+        'column_info',
+    )
+
+    def __init__(self, pair: bool):
+        self.pair = pair
+        # component name -> tensor index
+        self.index: Dict[str, int] = {}
+        # property name (lower case) -> tensor index
+        self.properties: Dict[str, int] = {}
+        # (properties x n x n)
+        self.values = np.empty((0, 0, 0))
+        self.order = np.empty((0, 0, 0), dtype=np.int64)
+        # per property: source, target, partner, row, value arrays
+        self.conditional: List[Tuple[np.ndarray, ...]] = []
+        # ! properties which could not be compiled (raised on lookup)
+        self.errors: Dict[int, Exception] = {}
+        # NOTE: data rows (matrix_rows filters)
+        # lower-case name id of each row
+        self.row_names = np.empty(0, dtype=np.int64)
+        # mixture components (tensor index) of each row, -1 not a pair
+        self.row_mixtures = np.empty((0, 2), dtype=np.int64)
+        # label columns (Name, Formula, State) of each row
+        self.row_labels: List[Dict[str, Any]] = []
+        self.lower_index: Dict[str, int] = {}
+        self.columns: List[str] = []
+        # NOTE: single-pair lookups (ij)
+        # mixture key (None: square table) -> name -> (row, column)
+        self.cells: Dict[Optional[str], Dict[str, Tuple[int, int]]] = {}
+        # per property: (rows x columns) values
+        self.row_values: Dict[int, np.ndarray] = {}
+        # per property: (position, symbol, unit) of each column
+        self.column_info: Dict[int, List[Tuple[int, str, str]]] = {}
+
+    def component_ids(self, components: List[str]) -> np.ndarray:
+        '''Tensor index of components (-1 not in the table).'''
+        index = self.index
+        return np.array([index.get(c, -1) for c in components], dtype=np.int64)
+
+    def has_rows(self, components: List[str], ids: np.ndarray) -> bool:
+        '''Whether any table row belongs to the selected components.'''
+        # NOTE: component rows (case-insensitive)
+        selected = np.zeros(len(self.lower_index), dtype=bool)
+        for c in components:
+            lower_id = self.lower_index.get(c.lower())
+            if lower_id is not None:
+                selected[lower_id] = True
+        rows = selected[self.row_names]
+
+        if self.pair:
+            # ! rows of the selected component pairs only
+            known = np.zeros(len(self.index) + 1, dtype=bool)
+            known[ids[ids >= 0]] = True
+            rows &= known[self.row_mixtures].all(axis=1)
+        return bool(rows.any())
+
+    def matrix(self, p: int, ids: np.ndarray) -> np.ndarray:
+        '''
+        (m x m) matrix of a property for the selected components, cells not
+        defined in the table are 0.
+        '''
+        # check
+        error = self.errors.get(p)
+        if error is not None:
+            raise error
+
+        res = np.zeros((len(ids), len(ids)))
+        known = np.flatnonzero(ids >= 0)
+        k = ids[known]
+        cell = np.ix_(k, k)
+        values = self.values[p][cell]
+
+        # NOTE: conditional cells of the selected partners
+        source, target, partner, row, value = self.conditional[p]
+        if len(source) > 0:
+            local = np.full(len(self.index), -1, dtype=np.int64)
+            local[k] = np.arange(len(k))
+            selected = (
+                (local[source] >= 0) &
+                (local[target] >= 0) &
+                (local[partner] >= 0)
+            )
+            if selected.any():
+                i = local[source[selected]]
+                j = local[target[selected]]
+                row, value = row[selected], value[selected]
+                # ! last row wins, rows are in table order
+                later = row > self.order[p][cell][i, j]
+                values[i[later], j[later]] = value[later]
+
+        res[np.ix_(known, known)] = np.where(np.isnan(values), 0.0, values)
+        return res
+
+    def row_label(
+        self,
+        component: str,
+        ids: np.ndarray
+    ) -> Optional[Dict[str, Any]]:
+        '''Label columns of the first table row of a selected component.'''
+        lower_id = self.lower_index.get(component.lower())
+        if lower_id is None:
+            return None
+
+        known = np.zeros(len(self.index) + 1, dtype=bool)
+        known[ids[ids >= 0]] = True
+        for r in np.flatnonzero(self.row_names == lower_id):
+            if self.pair and not known[self.row_mixtures[r]].all():
+                continue
+            if str(self.row_labels[r]['Name']).strip() == component:
+                return self.row_labels[r]
+        return None
+
+
+class MatrixAccessor:
+    '''
+    Reusable handle of a matrix property bound to a matrix data table, see
+    `TableMatrixData.accessor`.
+
+    The property string is parsed and looked up on the first call, later
+    calls return the bound value (ij) or a copy of the bound matrix (mat)
+    until the matrix table of the data is replaced.
+    '''
+
+    __slots__ = ('data', 'property', 'component_names', '_table', '_value')
+
+    def __init__(
+        self,
+        data: TableMatrixData,
+        property: str,
+        component_names: Optional[List[str]] = None
+    ):
+        self.data = data
+        self.property = property
+        self.component_names = (
+            None if component_names is None else list(component_names)
+        )
+        # NOTE: bound matrix table and value
+        self._table: Any = None
+        self._value: Any = None
+
+    def __repr__(self) -> str:
+        if self.component_names is None:
+            return f"MatrixAccessor({self.property!r})"
+        return f"MatrixAccessor({self.property!r}, {self.component_names!r})"
+
+    def _bind(self):
+        '''Look up the property value in the matrix table.'''
+        table = self.data.matrix_table
+        if self.component_names is None:
+            value: Any = float(self.data.ij(self.property)['value'])
+        else:
+            value = self.data.mat(self.property, self.component_names)
+            # ! read-only, returned as copies
+            value.setflags(write=False)
+        self._table, self._value = table, value
+
+    def __call__(self) -> Union[float, np.ndarray]:
+        '''Value (ij) or (n x n) matrix (mat) of the property.'''
+        # NOTE: rebind on a new matrix table
+        if self._value is None or self.data.matrix_table is not self._table:
+            self._bind()
+
+        value = self._value
+        if isinstance(value, np.ndarray):
+            return value.copy()
+        return value
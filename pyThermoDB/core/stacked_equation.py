@@ -0,0 +1,183 @@
+# import packages/modules
+from __future__ import annotations
+import logging
+import numpy as np
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Sequence, Union
+# local
+from ..handlers import (
+    TableEquationBodyError,
+    TableEquationCalculationError,
+    TableEquationDefinitionError,
+)
+from ..utils import numpy_math
+from .tableequation import TableEquation
+from .equation_function import compile_equation_function, call_parms
+
+if TYPE_CHECKING:
+    from ..builder import CompBuilder
+
+# NOTE: logger
+logger = logging.getLogger(__name__)
+
+
+class StackedEquation:
+    '''
+    One table equation evaluated for N components at once.
+
+    The components share the equation body (same table and equation id) and
+    differ only in parameters, which are packed into an (N x P) array so
+    that the body runs once with numpy broadcasting over components and
+    arguments. Parameters are packed once, on construction.
+
+    Examples
+    --------
+    >>> Cp_IG = StackedEquation([methanol, ethanol], 'ideal-gas-heat-capacity')
+    >>> Cp_IG.evaluate(T=np.linspace(300, 500, 21)).shape
+    (2, 21)
+    '''
+
+    def __init__(
+        self,
+        equations: Sequence[Union[TableEquation, CompBuilder]],
+        property_name: Optional[str] = None
+    ):
+        '''
+        Initialize the stacked equation.
+
+        Parameters
+        ----------
+        equations : list[TableEquation | CompBuilder]
+            equations of the components, or thermodbs of the components when
+            `property_name` is given
+        property_name : str, optional
+            property (equation) name selected from each thermodb
+        '''
+        # NOTE: select equations from thermodbs
+        if property_name is not None:
+            equations = [item.select(property_name) for item in equations]
+
+        # check
+        if len(equations) == 0:
+            raise ValueError("At least one equation is required!")
+
+        for eq in equations:
+            if not isinstance(eq, TableEquation):
+                raise TypeError(
+                    f"TableEquation expected, got {type(eq).__name__}")
+
+        # NOTE: shared body
+        first = equations[0]
+        for eq in equations[1:]:
+            if eq.eq_id != first.eq_id or eq.body != first.body:
+                raise TableEquationDefinitionError(
+                    "Stacked equations must share the same equation id and body",
+                    context={
+                        'table_name': eq.table_name,
+                        'eq_id': eq.eq_id,
+                        'expected_eq_id': first.eq_id,
+                    },
+                )
+
+        if first.body is None or first.body == 'None':
+            raise TableEquationBodyError(
+                "Equation body not defined",
+                context={'table_name': first.table_name, 'eq_id': first.eq_id},
+            )
+
+        # set
+        self.equations: List[TableEquation] = list(equations)
+        self.body: str = first.body
+
+        # NOTE: pack parms (N x P)
+        parms_list = [eq._get_parms() for eq in self.equations]
+        self.parms_names: List[str] = list(parms_list[0].keys())
+        for eq, parms in zip(self.equations, parms_list):
+            if set(parms.keys()) != set(self.parms_names):
+                raise TableEquationDefinitionError(
+                    "Stacked equations must share the same parameters",
+                    context={
+                        'table_name': eq.table_name,
+                        'parms': list(parms.keys()),
+                        'expected_parms': self.parms_names,
+                    },
+                )
+        self.parms: np.ndarray = np.array(
+            [[parms[name] for name in self.parms_names] for parms in parms_list],
+            dtype=float
+        ).reshape(len(self.equations), len(self.parms_names))
+        # ! read-only, `evaluate` passes column views to bodies without a copy
+        self.parms.setflags(write=False)
+
+        # NOTE: equation function over arrays
+        self._function, self._parms_access = compile_equation_function(
+            self.body,
+            f"<{first.databook_name}::{first.table_name}::EQ-{first.eq_id}>",
+            {'math': numpy_math, 'np': np}
+        )
+
+    def __len__(self) -> int:
+        return len(self.equations)
+
+    @property
+    def metadata(self) -> MappingProxyType:
+        '''Metadata of the equation result (shared by all components).'''
+        return self.equations[0].metadata
+
+    def evaluate(self, **args) -> np.ndarray:
+        '''
+        Evaluate the equation for all components.
+
+        Parameters
+        ----------
+        args : dict
+            variable names and values (scalars, lists or numpy arrays which
+            are broadcast together), shared by all components
+
+        Returns
+        -------
+        res : np.ndarray
+            calculation results with shape (N, *shape of args), e.g. (N, M)
+            for M temperatures
+
+        Notes
+        -----
+        Bodies which cannot be evaluated over arrays (e.g. branching on
+        argument values) are evaluated per component.
+        '''
+        # NOTE: args over trailing axes, components over the first axis
+        _args: Dict[str, Any] = {
+            k: np.asarray(v, dtype=float) for k, v in args.items()
+        }
+        shape = np.broadcast_shapes(*(v.shape for v in _args.values()))
+        n = len(self.equations)
+
+        # parms columns (N, 1, ..., 1)
+        column_shape = (n,) + (1,) * len(shape)
+        parms = {
+            name: self.parms[:, i].reshape(column_shape)
+            for i, name in enumerate(self.parms_names)
+        }
+
+        try:
+            res = np.asarray(
+                self._function(_args, call_parms(parms, self._parms_access)),
+                dtype=float
+            )
+            return np.broadcast_to(res, (n,) + shape).copy()
+        except (TypeError, ValueError) as e:
+            # ! body is not vectorizable, evaluate per component
+            logger.debug(
+                f"Stacked evaluation failed for {self.equations[0].table_name}, "
+                f"falling back to per-component evaluation: {e}"
+            )
+        except Exception as e:
+            raise TableEquationCalculationError(
+                "Stacked calculation error",
+                context={
+                    'table_name': self.equations[0].table_name,
+                    'eq_id': self.equations[0].eq_id,
+                },
+            ) from e
+
+        return np.stack([eq.evaluate_many(**_args) for eq in self.equations])
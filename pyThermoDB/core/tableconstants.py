@@ -1,10 +1,9 @@
+from __future__ import annotations
 import ast
 import json
 import logging
 from typing import Any, Dict, List, Literal, Optional
 
-import pandas as pd
-
 from ..handlers import (
     TableColumnError,
     TableConstantsError,
@@ -12,7 +11,10 @@ from ..handlers import (
     TableValidationError,
 )
 from ..models import ConstantResult, PropertyMatch
+from ..utils.lazy_import import LazyModule
 
+# NOTE: pandas, imported on first use (dataframes)
+pd = LazyModule('pandas')
 
 logger = logging.getLogger(__name__)
 
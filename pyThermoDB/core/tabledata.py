@@ -1,7 +1,7 @@
 # import packages/modules
+from __future__ import annotations
 import logging
-import pandas as pd
-from typing import Optional, List, Dict, Any, Literal, cast
+from typing import Optional, List, Dict, Any, Literal, Tuple, cast
 # local imports
 from ..models import DataResult, PropertyMatch
 from ..handlers import (
@@ -16,6 +16,10 @@ from ..handlers import (
 from .table_util import TableUtil
 # ! deps
 from ..config.deps import get_config
+from ..utils.lazy_import import LazyModule
+
+# NOTE: pandas, imported on first use (dataframes)
+pd = LazyModule('pandas')
 
 # logger
 logger = logging.getLogger(__name__)
@@ -25,6 +29,10 @@ class TableData:
     # vars
     __trans_data = {}
     __prop_data = {}
+    # NOTE: prop_data index (names, symbols, keys, fields), see _property_index
+    _prop_index: Optional[
+        Tuple[Dict[str, str], Dict[str, str], List[str], List[str]]
+    ] = None
 
     def __init__(
         self,
@@ -92,6 +100,7 @@ class TableData:
 
     @property
     def prop_data(self):
+        '''Property data of the component, set (not changed in place) to update the lookup index.'''
         return self.__prop_data
 
     @prop_data.setter
@@ -101,6 +110,8 @@ class TableData:
         self.__prop_data = {
             key: value for key, value in value.items() if key != exclude_key
         }
+        # NOTE: name/symbol index
+        self._prop_index = self._build_property_index(self.__prop_data)
 
     @property
     def table_values(self):
@@ -303,63 +314,47 @@ class TableData:
         data_dict : DataResult
             property result dict
         '''
-        # ! get data for a selected component
-        # dataframe
-        df = pd.DataFrame(self.prop_data)
+        # NOTE: name/symbol index
+        names, symbols, keys, fields = self._property_index()
 
-        get_data = None
         # choose a column
         if isinstance(property, str):
-            # df = df[property_name]
-            # look up prop_data dict
-            # ! case insensitive
-            prop_data_keys_ = [key.lower() for key in self.prop_data.keys()]
-
             # NOTE: property lower
             property_ = property.lower().strip()
 
-            # check key exists
-            if property_ in prop_data_keys_:
-                # loop through prop_data dict
-                for key, value in self.prop_data.items():
-                    # check key
-                    if property_ == key.lower():
-                        # value found
-                        get_data = self.prop_data[key]
-                        # property name
-                        property = key
-                        break
-                # get_data = self.prop_data[property]
-            else:
-                # NOTE: symbol
-                # check symbol value in each item
-                for key, value in self.prop_data.items():
-                    # check if property is in the symbol
-                    # ! case insensitive
-                    if property_ == str(value['symbol']).lower().strip():
-                        # value found
-                        get_data = self.prop_data[key]
-                        # property name
-                        property = key
-                        break
+            # ! case insensitive, names first then symbols
+            key = names.get(property_)
+            if key is None:
+                key = symbols.get(property_)
 
             # ! check if property found
-            if get_data is None:
+            if key is None:
                 raise TableLookupError(
                     f"Property '{property}' not found!",
                     databook_name=self.databook_name,
                     table_name=self.table_name,
                     context={"property": property},
                 )
-            # series
-            sr = pd.Series(get_data, dtype='str')
-            # print(type(sr))
+            # property name
+            property = key
+
+            # values as strings, missing values (None) are NaN
+            data = {
+                k: self._missing_value(v, str(v))
+                for k, v in self.prop_data[key].items()
+            }
 
         elif isinstance(property, int):
-            # get column index
-            column_index = df.columns[property-1]
-            sr = df.loc[:, column_index]
-            # print(type(sr))
+            # get column
+            key = keys[property-1]
+            # ! fields missing in the column are NaN (table view)
+            column = self.prop_data[key]
+            data = {}
+            for field in fields:
+                value = column.get(field)
+                data[field] = self._missing_value(value, value)
+            # property name
+            property = key
 
         else:
             raise TableValidationError(
@@ -370,14 +365,8 @@ class TableData:
             )
 
         # convert to dict
-        data_dict = self._build_data_result(sr)
-        # print(data_dict, type(data_dict))
-
-        # property name
-        if isinstance(property, str):
-            data_dict['property_name'] = property
-        else:
-            data_dict['property_name'] = df.columns[property-1]
+        data_dict = self._build_data_result(data)
+        data_dict['property_name'] = property
 
         # update message
         if message:
@@ -459,7 +448,7 @@ class TableData:
             )
 
         # convert to dict
-        data_dict = self._build_data_result(sr)
+        data_dict = self._build_data_result(sr.to_dict())
         # print(data_dict, type(data_dict))
 
         # property name
@@ -634,11 +623,57 @@ class TableData:
                 search_mode=search_mode,
             )
 
-    def _build_data_result(self, sr: pd.Series) -> DataResult:
+    @staticmethod
+    def _build_property_index(
+        prop_data: Dict[str, Any]
+    ) -> Tuple[Dict[str, str], Dict[str, str], List[str], List[str]]:
+        """
+        Build the lookup index of prop_data: lower-case names and symbols
+        (first match wins as in the table scan), keys in column order and
+        the fields of all columns.
+        """
+        names: Dict[str, str] = {}
+        symbols: Dict[str, str] = {}
+        fields: Dict[str, None] = {}
+        for key, value in prop_data.items():
+            names.setdefault(key.lower(), key)
+            if isinstance(value, dict):
+                symbols.setdefault(str(value.get('symbol')).lower().strip(), key)
+                fields.update(dict.fromkeys(value))
+        return names, symbols, list(prop_data), list(fields)
+
+    def _property_index(
+        self
+    ) -> Tuple[Dict[str, str], Dict[str, str], List[str], List[str]]:
+        """
+        Get the lookup index of prop_data (built for tables restored without
+        an index).
+
+        Notes
+        -----
+        The index is built when prop_data is set, changing prop_data in
+        place is not supported (set `prop_data` again instead).
+        """
+        index = self._prop_index
+        if index is None:
+            index = self._build_property_index(self.prop_data)
+            self._prop_index = index
+        return index
+
+    @staticmethod
+    def _missing_value(value: Any, default: Any) -> Any:
+        """
+        NaN for missing values (None/NaN) as in the dataframe view, default
+        otherwise.
+        """
+        if value is None or (isinstance(value, float) and value != value):
+            return float('nan')
+        return default
+
+    def _build_data_result(self, sr_dict: Dict[str, Any]) -> DataResult:
         """
-        Build a typed DataResult payload from a pandas Series.
+        Build a typed DataResult payload from a property dict.
         """
-        sr_dict = cast(Dict[str, Any], sr.to_dict())
         return DataResult(
             property_name=cast(Optional[str], sr_dict.get('property_name')),
             symbol=cast(Optional[str], sr_dict.get('symbol')),
@@ -1,10 +1,11 @@
 # import packages/modules
+from __future__ import annotations
 import logging
-import pandas as pd
 import numpy as np
 import math
 import json
-from typing import Literal, Optional, List, Dict, Any
+from types import CodeType, FunctionType, MappingProxyType
+from typing import Literal, Optional, List, Dict, Any, Tuple
 # local
 from ..models import EquationResult, PropertyMatch, EquationRangeResult
 from ..handlers import (
@@ -19,11 +20,20 @@ from ..handlers import (
     TableEquationStructureError,
     TableEquationSymbolError,
 )
-from ..utils import format_eq_data, is_number
+from ..utils import format_eq_data, is_number, numpy_math
 from ..models.tables import TableEquationBlock
 from .table_util import TableUtil
+from .equation_function import (
+    ParmsAccess,
+    compile_equation_function,
+    call_parms
+)
 # ! deps
 from ..config.deps import get_config
+from ..utils.lazy_import import LazyModule
+
+# NOTE: pandas, imported on first use (dataframes)
+pd = LazyModule('pandas')
 
 # NOTE: logger
 logger = logging.getLogger(__name__)
@@ -44,10 +54,20 @@ class TableEquation:
     __trans_data = {}
     __prop_equation = {}
     __parms_values = {}
+    # whether parms values are resolved for the current trans_data
+    _parms_bound: bool = False
     # custom integral
     _custom_integral = {}
     # selected equation id
     eq_id: int = -1
+    # compiled equation bodies (code objects keyed by body source)
+    _compiled_bodies: Dict[str, CodeType]
+    _cache_hits: int = 0
+    _cache_misses: int = 0
+    # equation functions for `evaluate` (keyed by body source)
+    _functions: Dict[str, Tuple[FunctionType, ParmsAccess]]
+    # result metadata of the selected equation
+    _metadata: Optional[MappingProxyType] = None
 
     def __init__(
         self,
@@ -106,6 +126,29 @@ class TableEquation:
             )
             self.__table_values = None
 
+        # NOTE: compiled equation bodies (per instance)
+        self._compiled_bodies = {}
+        self._functions = {}
+        self._cache_hits = 0
+        self._cache_misses = 0
+
+    def __getstate__(self):
+        # ! code objects are not picklable, compiled bodies are rebuilt on load
+        state = self.__dict__.copy()
+        state.pop('_compiled_bodies', None)
+        state.pop('_functions', None)
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        # reset compiled bodies
+        self._compiled_bodies = {}
+        self._functions = {}
+        self._cache_hits = 0
+        self._cache_misses = 0
+        # recompile equation bodies
+        self.compile_bodies()
+
     def _context(self, **context):
         base_context = {
             "databook_name": self.databook_name,
@@ -122,6 +165,8 @@ class TableEquation:
     def trans_data(self, value):
         self.__trans_data = {}
         self.__trans_data = value
+        # ! invalidate resolved parms values
+        self._parms_bound = False
 
     @property
     def prop_equation(self):
@@ -129,7 +174,8 @@ class TableEquation:
 
     @property
     def parms_values(self):
-        return self.__parms_values
+        # ! read-only view
+        return MappingProxyType(self.__parms_values)
 
     @property
     def custom_integral(self):
@@ -771,7 +817,7 @@ class TableEquation:
             eq_info.update(eq_src)
 
             # build parms dict
-            _parms = self.load_parms_v2()
+            _parms = self._get_parms()
             # execute equation
             # res
             res = None
@@ -831,13 +877,197 @@ class TableEquation:
             return 'dict'
         elif isinstance(value, list):
             return 'list'
-        elif isinstance(value, pd.DataFrame):
+        elif pd.loaded and isinstance(value, pd.DataFrame):
             return 'DataFrame'
         elif isinstance(value, np.ndarray):
             return 'ndarray'
         else:
             return type(value).__name__
 
+    def cal_batch(
+        self,
+        message: str = '',
+        decimal_accuracy: Optional[int] = None,
+        **args
+    ) -> EquationResult:
+        '''
+        Execute a function over arrays of arguments (vectorized)
+
+        Parameters
+        ----------
+        message : str
+            message to be printed
+        decimal_accuracy : int, optional
+            decimal accuracy (default is None, no rounding)
+        args : dict
+            a dictionary contains variable names and values (scalars, lists
+            or numpy arrays which are broadcast together)
+
+        Returns
+        -------
+        eq_data : EquationResult
+            calculation result, the value is a numpy array with the broadcast
+            shape of args
+
+        Examples
+        --------
+        >>> T = np.linspace(300, 500, 100000)
+        >>> res = cal_batch(message=f'{comp1} Vapor Pressure', T=T)
+        >>> print(res['value'])
+        '''
+        try:
+            # equation info
+            eq_info = {
+                **self.eq_info(),
+                'databook_name': self.databook_name,
+                'table_name': self.table_name,
+            }
+
+            # NOTE: check body
+            if self.body is None or self.body == 'None':
+                raise TableEquationBodyError(
+                    "Equation body not defined",
+                    context=self._context(eq_id=self.eq_id),
+                )
+
+            # build parms dict
+            _parms = self._get_parms()
+
+            # NOTE: convert args to arrays
+            _args = {
+                k: np.asarray(v, dtype=float) for k, v in args.items()
+            }
+
+            # NOTE: execute equation over arrays
+            res = self.eqExeBatch(self.body, _parms, _args)
+
+            # round
+            if decimal_accuracy is not None:
+                res = np.round(res, decimal_accuracy)
+
+            # format data
+            eq_data = format_eq_data(res, eq_info, message or 'No message')
+
+            # res
+            return eq_data
+        except TableEquationBodyError:
+            raise
+        except Exception as e:
+            logger.error(f'Batch calculation error {e}!')
+            raise TableEquationCalculationError(
+                "Batch calculation error",
+                context=self._context(eq_id=self.eq_id),
+            ) from e
+
+    @property
+    def metadata(self) -> MappingProxyType:
+        '''
+        Metadata of the equation result (name, symbol, unit, databook and
+        table name), computed once per selected equation.
+        '''
+        if self._metadata is None:
+            self._metadata = MappingProxyType({
+                **self.eq_info(),
+                'databook_name': self.databook_name,
+                'table_name': self.table_name,
+            })
+        return self._metadata
+
+    def _function(self, body: str) -> Tuple[FunctionType, ParmsAccess]:
+        '''Get the equation function of a body (compiled on a miss).'''
+        function = self._functions.get(body)
+        if function is None:
+            # check body
+            if body is None or body == 'None':
+                raise TableEquationBodyError(
+                    "Equation body not defined",
+                    context=self._context(eq_id=self.eq_id),
+                )
+            try:
+                function = compile_equation_function(
+                    body,
+                    f"<{self.databook_name}::{self.table_name}::EQ-{self.eq_id}>",
+                    {'math': math}
+                )
+            except SyntaxError as e:
+                raise TableEquationBodyError(
+                    "Compiling equation body failed",
+                    context=self._context(eq_id=self.eq_id, body=body),
+                ) from e
+            self._functions[body] = function
+        return function
+
+    def evaluate(self, **args) -> float:
+        '''
+        Evaluate the equation and return the value only, the fast path for
+        solvers (no rounding and no result formatting).
+
+        Parameters
+        ----------
+        args : dict
+            variable names and values such as T=300
+
+        Returns
+        -------
+        value : float
+            calculation result, `metadata` describes it
+
+        Examples
+        --------
+        >>> VaPr = eq.evaluate(T=300.0)
+        >>> eq.metadata['unit']
+        'Pa'
+        '''
+        fn, access = self._function(self.body)
+        # ! parms are resolved once per trans_data
+        if not self._parms_bound:
+            self.bind_parms()
+
+        try:
+            if access == 'read':
+                return fn(args, self.__parms_values)
+            return fn(args, call_parms(self.__parms_values, access))
+        except Exception as e:
+            raise TableEquationCalculationError(
+                "Calculation error",
+                context=self._context(eq_id=self.eq_id, args=args),
+            ) from e
+
+    def evaluate_many(self, **args) -> np.ndarray:
+        '''
+        Evaluate the equation over arrays of arguments and return the values
+        only (`cal_batch` without result formatting).
+
+        Parameters
+        ----------
+        args : dict
+            variable names and values (scalars, lists or numpy arrays which
+            are broadcast together)
+
+        Returns
+        -------
+        values : np.ndarray
+            calculation results with the broadcast shape of args
+        '''
+        # NOTE: check body
+        if self.body is None or self.body == 'None':
+            raise TableEquationBodyError(
+                "Equation body not defined",
+                context=self._context(eq_id=self.eq_id),
+            )
+
+        try:
+            return self.eqExeBatch(
+                self.body,
+                self._get_parms(),
+                {k: np.asarray(v, dtype=float) for k, v in args.items()}
+            )
+        except Exception as e:
+            raise TableEquationCalculationError(
+                "Batch calculation error",
+                context=self._context(eq_id=self.eq_id),
+            ) from e
+
     def cal_range(
         self,
         variable_id: str,
@@ -928,22 +1158,22 @@ class TableEquation:
                 'message': message or 'No message'
             }
 
-            # NOTE: loop over range values
-            for var_value in variable_range_values:
-                # build args
-                calc_args = args.copy()
-                calc_args[variable_symbol] = var_value
-
-                # perform calculation
-                res_ = self.cal(
-                    message=message,
-                    decimal_accuracy=decimal_accuracy,
-                    **calc_args
-                )
+            # NOTE: build args
+            calc_args = args.copy()
+            calc_args[variable_symbol] = np.asarray(
+                variable_range_values, dtype=float
+            )
+
+            # NOTE: vectorized calculation over range values
+            res_ = self.cal_batch(
+                message=message,
+                decimal_accuracy=decimal_accuracy,
+                **calc_args
+            )
 
-                # store result
-                res['x'].append(var_value)
-                res['y'].append(res_['value'])
+            # store result
+            res['x'] = list(variable_range_values)
+            res['y'] = res_['value'].tolist()
 
             # set name, unit, symbol
             res['unit'] = res_['unit']
@@ -987,7 +1217,7 @@ class TableEquation:
         '''
         try:
             # build parms dict
-            _parms = self.load_parms_v2()
+            _parms = self._get_parms()
             # execute equation
             res = self.eqExe(
                 body=self.body_integral,
@@ -1039,7 +1269,7 @@ class TableEquation:
                 )
 
             # build parms dict
-            _parms = self.load_parms_v2()
+            _parms = self._get_parms()
 
             # check
             if len(self._custom_integral) > 0:
@@ -1088,7 +1318,7 @@ class TableEquation:
                 print('The first derivative not defined!')
 
             # build parms dict
-            _parms = self.load_parms_v2()
+            _parms = self._get_parms()
 
             # execute equation
             res = self.eqExe(
@@ -1129,7 +1359,7 @@ class TableEquation:
                 print('The second derivative not defined!')
 
             # build parms dict
-            _parms = self.load_parms_v2()
+            _parms = self._get_parms()
             # execute equation
             res = self.eqExe(self.body_second_derivative, _parms, args=args)
             return res
@@ -1210,6 +1440,30 @@ class TableEquation:
                 context=self._context(eq_id=self.eq_id),
             ) from e
 
+    def bind_parms(self) -> MappingProxyType:
+        '''
+        Resolve parameter values once for the component bound through
+        `trans_data`, the resolved values are reused by every calculation
+        until `trans_data` is set again.
+
+        Returns
+        -------
+        parms_values : MappingProxyType
+            read-only parameter values
+        '''
+        self.__parms_values = self.load_parms_v2()
+        self._parms_bound = True
+        return MappingProxyType(self.__parms_values)
+
+    def _get_parms(self) -> Dict[str, float]:
+        '''
+        Get a copy of the resolved parameter values (equation bodies may
+        rescale parms in place).
+        '''
+        if not self._parms_bound:
+            self.bind_parms()
+        return dict(self.__parms_values)
+
     def equation_body(self):
         '''
         Display equation body
@@ -1597,9 +1851,100 @@ class TableEquation:
             'CUSTOM-INTEGRAL': self._custom_integral
         }
 
-        # check params
-        if len(self.parms) > 0:
-            self.__parms_values = self.load_parms_v2()
+        # NOTE: result metadata (computed on first use)
+        self._metadata = None
+
+        # NOTE: resolve params values once
+        self.bind_parms()
+
+        # NOTE: compile equation bodies once
+        self.compile_bodies()
+
+    def compile_bodies(self) -> Dict[str, CodeType]:
+        '''
+        Compile all equation bodies (main, integral, first/second derivative
+        and custom integrals) into reusable code objects.
+
+        Returns
+        -------
+        compiled_bodies : dict
+            compiled code objects keyed by body source
+        '''
+        # reset
+        self._compiled_bodies = {}
+
+        # equation bodies
+        bodies = [
+            self.body,
+            self.body_integral,
+            self.body_first_derivative,
+            self.body_second_derivative,
+        ]
+
+        # custom integrals
+        if isinstance(self._custom_integral, dict):
+            for _body_lines in self._custom_integral.values():
+                if isinstance(_body_lines, list):
+                    bodies.append(";".join(_body_lines))
+
+        # compile
+        for body in bodies:
+            if body is None or body == 'None' or body == '':
+                continue
+            self._compile_body(body)
+
+        return self._compiled_bodies
+
+    def _compile_body(self, body: str) -> CodeType:
+        '''Compile an equation body and store it in the cache.'''
+        try:
+            code = compile(
+                body,
+                f"<{self.databook_name}::{self.table_name}::EQ-{self.eq_id}>",
+                'exec'
+            )
+        except SyntaxError as e:
+            raise TableEquationBodyError(
+                "Compiling equation body failed",
+                context=self._context(eq_id=self.eq_id, body=body),
+            ) from e
+
+        # store
+        self._compiled_bodies[body] = code
+        return code
+
+    def _get_code(self, body: str) -> CodeType:
+        '''Get the compiled code of an equation body (compiled on a miss).'''
+        code = self._compiled_bodies.get(body)
+        if code is None:
+            # compile once
+            self._cache_misses += 1
+            return self._compile_body(body)
+
+        self._cache_hits += 1
+        return code
+
+    def cache_info(self) -> Dict[str, int]:
+        '''
+        Get compiled equation cache statistics.
+
+        Returns
+        -------
+        info : dict
+            hits, misses and size of the compiled equation cache
+        '''
+        return {
+            'hits': self._cache_hits,
+            'misses': self._cache_misses,
+            'size': len(self._compiled_bodies),
+        }
+
+    def cache_clear(self) -> None:
+        '''Clear compiled equation bodies and reset cache statistics.'''
+        self._compiled_bodies = {}
+        self._functions = {}
+        self._cache_hits = 0
+        self._cache_misses = 0
 
     def eqExe(self, body, parms, args):
         '''
@@ -1624,15 +1969,83 @@ class TableEquation:
             print('Function body not defined!')
             return None
 
+        # NOTE: compiled body
+        code = self._get_code(body)
+
         # Define a namespace dictionary for eval
         namespace = {'args': args, "parms": parms}
         # Import math module within the function
         namespace['math'] = math
-        # Execute the body within the namespace
-        exec(body, namespace)
+        # Execute the compiled body within the namespace
+        exec(code, namespace)
         # Return the result
         return namespace['res']
 
+    def eqExeBatch(
+        self,
+        body: str,
+        parms: Dict[str, float],
+        args: Dict[str, np.ndarray]
+    ) -> np.ndarray:
+        '''
+        Execute the function body over whole arrays, `math.*` calls are
+        mapped to numpy ufuncs.
+
+        Parameters
+        ----------
+        body : str
+            function body
+        parms : dict
+            parameters
+        args : dict
+            args as numpy arrays (broadcastable)
+
+        Returns
+        -------
+        res : np.ndarray
+            calculation result with the broadcast shape of args
+
+        Notes
+        -----
+        Bodies which cannot be evaluated over arrays (e.g. branching on
+        argument values) are evaluated point by point.
+        '''
+        # NOTE: broadcast shape of args
+        shape = np.broadcast_shapes(*(np.shape(v) for v in args.values()))
+
+        # NOTE: compiled body
+        code = self._get_code(body)
+
+        try:
+            # Define a namespace dictionary for eval
+            namespace = {
+                'args': args,
+                "parms": dict(parms),
+                'math': numpy_math,
+                'np': np
+            }
+            # Execute the compiled body within the namespace
+            exec(code, namespace)
+            # result
+            res = np.asarray(namespace['res'], dtype=float)
+        except (TypeError, ValueError) as e:
+            # ! body is not vectorizable, evaluate point by point
+            logger.debug(
+                f"Vectorized evaluation failed for {self.table_name}, "
+                f"falling back to point-wise evaluation: {e}"
+            )
+            # broadcast args
+            keys = list(args.keys())
+            arrays = np.broadcast_arrays(*args.values())
+            # init
+            res = np.empty(shape, dtype=float)
+            # iterate
+            for idx in np.ndindex(*shape):
+                point = {k: float(a[idx]) for k, a in zip(keys, arrays)}
+                res[idx] = self.eqExe(body, dict(parms), point)
+
+        return np.broadcast_to(res, shape).copy()
+
     def to_dict(self):
         '''
         Convert equation to dict
@@ -1,11 +1,10 @@
 # import libs
+from __future__ import annotations
 import logging
 import re
-import pandas as pd
 import numpy as np
-from typing import Optional, Any, Literal, Dict, List
+from typing import TYPE_CHECKING, Optional, Any, Literal, Dict, List, Tuple
 from warnings import warn
-from pythermodb_settings.models import ComponentKey, Component
 # local
 from ..handlers import (
     TableMatrixDataConversionError,
@@ -18,7 +17,14 @@ from ..handlers import (
     TableMatrixDataStructureError,
 )
 from ..models import DataResultType, DataResult
+from ..utils.lazy_import import LazyModule
+from .matrix_tensor import MatrixTensor, MatrixAccessor
 
+if TYPE_CHECKING:
+    from pythermodb_settings.models import ComponentKey, Component
+
+# NOTE: pandas, imported on first use (dataframes)
+pd = LazyModule('pandas')
 
 # NOTE: logger
 logger = logging.getLogger(__name__)
@@ -45,6 +51,10 @@ class TableMatrixData:
     mixture_id: Optional[str] = None
     # mixture idx
     mixture_ids: Optional[List[str]] = None
+    # matrix table (dataframe)
+    _matrix_table = None
+    # compiled matrix table (dense parameter tensor)
+    _tensor: Optional[MatrixTensor] = None
 
     def __init__(
         self,
@@ -95,6 +105,28 @@ class TableMatrixData:
         base_context.update(context)
         return base_context
 
+    def __getstate__(self):
+        # ! the compiled matrix table is rebuilt on first lookup
+        state = self.__dict__.copy()
+        state.pop('_tensor', None)
+        return state
+
+    def __setstate__(self, state):
+        # ! older pickles store matrix_table as a plain attribute
+        if 'matrix_table' in state:
+            state['_matrix_table'] = state.pop('matrix_table')
+        self.__dict__.update(state)
+
+    @property
+    def matrix_table(self):
+        return self._matrix_table
+
+    @matrix_table.setter
+    def matrix_table(self, value):
+        self._matrix_table = value
+        # ! invalidate the compiled matrix table
+        self._tensor = None
+
     @property
     def trans_data_pack(self):
         return self.__trans_data_pack
@@ -1197,6 +1229,65 @@ class TableMatrixData:
                 context=self._context(property=property),
             ) from e
 
+    def _ij_from_tensor(
+        self,
+        property: str,
+        component_names: list[str],
+        symbol_format: str,
+        message: str,
+        mixture_name: str,
+    ) -> Optional[DataResult]:
+        '''
+        Get a component pair property from the compiled matrix table, None if
+        the lookup needs the table scan (`get_matrix_property`).
+        '''
+        # check
+        if (
+            self.matrix_mode != 'VALUES' or
+            not isinstance(self.matrix_table, pd.DataFrame) or
+            len(component_names) != 2 or
+            symbol_format.lower() not in ('alphabetic', 'numeric')
+        ):
+            return None
+
+        tensor = self._matrix_tensor()
+        p = tensor.properties.get(property.split('_')[0].lower())
+        if p is None or p in tensor.errors or p not in tensor.column_info:
+            return None
+
+        # NOTE: component cells of the table (or mixture)
+        cells = tensor.cells.get(
+            self._mixture_key(mixture_name) if tensor.pair else None
+        )
+        comp1, comp2 = component_names
+        if cells is None or comp1 not in cells or comp2 not in cells:
+            return None
+
+        column_info = tensor.column_info[p]
+        if len(column_info) != len(cells):
+            return None
+
+        row, k1 = cells[comp1]
+        _, k2 = cells[comp2]
+        position, symbol, unit = column_info[k2]
+
+        # set symbol
+        if symbol_format.lower() == 'alphabetic':
+            property_symbol = f"{symbol}_{comp1}_{comp2}"
+        else:
+            property_symbol = f"{symbol}_{k1 + 1}_{k2 + 1}"
+
+        res: DataResult = {
+            "property_name": property.split('_')[0],
+            "symbol": property_symbol,
+            "unit": unit,
+            "value": float(tensor.row_values[p][row, position]),
+            "message": message if message else "No message",
+            "databook_name": self.databook_name,
+            "table_name": self.table_name
+        }
+        return res
+
     def get_matrix_property(
         self,
         property: str,
@@ -1277,6 +1368,21 @@ class TableMatrixData:
                 context=self._context(component_key=component_key),
             )
 
+        # NOTE: compiled matrix table (indexing)
+        if isinstance(property, str) and property.endswith('_i_j'):
+            matrix_property = self._ij_from_tensor(
+                property=property,
+                component_names=component_names,
+                symbol_format=symbol_format,
+                message=message,
+                mixture_name=(
+                    mixture_name if mixture_name is not None
+                    else " | ".join(component_names)
+                )
+            )
+            if matrix_property is not None:
+                return matrix_property
+
         # >> selected column
         selected_column = component_key
 
@@ -1925,19 +2031,6 @@ class TableMatrixData:
             return float(-1)
         return float(value)
 
-    @staticmethod
-    def _matrix_dict(
-        components: list[str],
-    ) -> Dict[str, str | float | int]:
-        '''
-        Initialize a component-wise matrix dictionary.
-        '''
-        return {
-            f"{component_i} | {component_j}": 0
-            for component_i in components
-            for component_j in components
-        }
-
     @staticmethod
     def _component_key_columns(
         component_key: ComponentKey,
@@ -1980,7 +2073,8 @@ class TableMatrixData:
     def _matrix_component_labels(
         self,
         components: list[str],
-        matrix_rows: pd.DataFrame,
+        tensor: MatrixTensor,
+        component_ids: np.ndarray,
         component_key: ComponentKey,
     ) -> dict[str, str]:
         '''
@@ -1990,7 +2084,7 @@ class TableMatrixData:
         missing_columns = [
             column
             for column in required_columns
-            if column not in matrix_rows.columns
+            if column not in tensor.columns
         ]
         if len(missing_columns) > 0:
             raise TableMatrixDataStructureError(
@@ -1999,21 +2093,16 @@ class TableMatrixData:
                 context=self._context(component_key=component_key),
             )
 
-        component_rows = {}
-        for _, row in matrix_rows.iterrows():
-            component_name = str(row['Name']).strip()
-            if component_name not in component_rows:
-                component_rows[component_name] = row.to_dict()
-
         labels = {}
         for component_name in components:
-            if component_name not in component_rows:
+            row = tensor.row_label(component_name, component_ids)
+            if row is None:
                 raise TableMatrixDataLookupError(
                     f"Component '{component_name}' row not found",
                     context=self._context(component_name=component_name),
                 )
             labels[component_name] = self._component_label(
-                component_rows[component_name],
+                row,
                 component_key,
             )
 
@@ -2036,20 +2125,6 @@ class TableMatrixData:
             for j, component_j in enumerate(components)
         }
 
-    @staticmethod
-    def _matrix_property_columns(
-        property_name: str,
-        matrix_columns: list[str],
-    ) -> list[str]:
-        '''
-        Get matrix columns that belong to a property name.
-        '''
-        return [
-            column
-            for column in matrix_columns
-            if str(column).split('_')[0].lower() == property_name.lower()
-        ]
-
     def _matrix_table_source(self) -> pd.DataFrame:
         '''
         Get the stored matrix table as a DataFrame.
@@ -2062,9 +2137,35 @@ class TableMatrixData:
             )
         return matrix_table_source.copy()
 
-    def _matrix_table_component_order(self) -> list[str]:
+    @staticmethod
+    def _mixture_key(mixture_name: str) -> str:
+        '''
+        Mixture key of a single-pair lookup (sorted, case-sensitive).
+        '''
+        parts = [item.strip() for item in str(mixture_name).split('|')]
+        parts.sort()
+        return ' | '.join(parts)
+
+    def _matrix_tensor(self) -> MatrixTensor:
         '''
-        Get component order from a full square matrix table.
+        Get the compiled matrix table (compiled on first use).
+        '''
+        tensor = self._tensor
+        if tensor is None:
+            tensor = self._compile_matrix_tensor()
+            self._tensor = tensor
+        return tensor
+
+    def _compile_matrix_tensor(self) -> MatrixTensor:
+        '''
+        Compile the matrix table into a component index and a dense
+        (properties x n x n) tensor.
+
+        Notes
+        -----
+        The table scan follows the matrix lookups: square tables map column
+        `X_i_k` of a component row to the k-th component of the table, pair
+        tables (Mixture column) to the k-th component of the row mixture.
         '''
         matrix_table = self._matrix_table_source()
         matrix_table = matrix_table.drop(
@@ -2074,100 +2175,228 @@ class TableMatrixData:
                 if column in matrix_table.columns
             ]
         )
+        columns = list(matrix_table.columns)
+        if 'Name' not in columns:
+            raise TableMatrixDataStructureError(
+                "Component column 'Name' not found",
+                context=self._context(component_key='Name'),
+            )
 
-        return [
-            str(item).strip()
-            for item in list(matrix_table['Name'])
-            if self._is_component_row(item)
-        ]
-
-    def _fill_pair_matrix(
-        self,
-        mat_ij: np.ndarray,
-        mat_ij_dict: Dict[str, str | float | int],
-        matrix_rows: pd.DataFrame,
-        property_columns: list[str],
-        component_ids: Dict[str, int],
-    ) -> None:
-        '''
-        Fill matrix values from a binary-pair encoded matrix table.
-        '''
-        for _, row in matrix_rows.iterrows():
-            source_component = str(row['Name']).strip()
-            if source_component not in component_ids:
+        tensor = MatrixTensor(pair='Mixture' in columns)
+        tensor.columns = columns
+
+        # SECTION: property columns (X_i_k -> k-1), by column name prefix
+        property_columns: Dict[str, List[Tuple[int, str, int]]] = {}
+        # all columns of a property name (single-pair lookups)
+        property_positions: Dict[str, List[int]] = {}
+        for position, column in enumerate(columns):
+            parts = str(column).split('_')
+            property_positions.setdefault(
+                parts[0].upper(), []).append(position)
+            # ! columns without a component suffix leave the matrix empty
+            property_columns.setdefault(parts[0].lower(), [])
+            try:
+                target_id = int(parts[-1]) - 1
+            except ValueError:
                 continue
+            property_columns.setdefault(parts[0].lower(), []).append(
+                (target_id, column, position)
+            )
+        tensor.properties = {
+            name: p for p, name in enumerate(property_columns)
+        }
 
-            source_id = component_ids[source_component]
-            mixture_components = [
-                item.strip()
-                for item in str(row['Mixture']).split('|')
-            ]
+        # SECTION: component rows
+        records = [
+            record
+            for record in matrix_table.to_dict(orient='records')
+            if self._is_component_row(record['Name'])
+        ]
+        names = [str(record['Name']).strip() for record in records]
+
+        index = tensor.index
+        for name in names:
+            index.setdefault(name, len(index))
+
+        # mixture components of each row
+        mixtures: List[List[str]] = []
+        if tensor.pair:
+            for record in records:
+                mixture = [
+                    item.strip() for item in str(record['Mixture']).split('|')
+                ]
+                mixtures.append(mixture)
+                for item in mixture:
+                    if item != '':
+                        index.setdefault(item, len(index))
+
+        # row filters
+        for name in names:
+            tensor.lower_index.setdefault(
+                name.lower(), len(tensor.lower_index))
+        tensor.row_names = np.array(
+            [tensor.lower_index[name.lower()] for name in names],
+            dtype=np.int64
+        )
+        row_mixtures = np.full((len(records), 2), -1, dtype=np.int64)
+        for r, mixture in enumerate(mixtures):
+            # ! only binary mixtures match a component pair
+            pair = [item for item in mixture if item != '']
+            if len(pair) == 2 and pair[0].lower() != pair[1].lower():
+                row_mixtures[r] = [index[pair[0]], index[pair[1]]]
+        tensor.row_mixtures = row_mixtures
+        tensor.row_labels = [
+            {
+                column: record[column]
+                for column in ('Name', 'Formula', 'State')
+                if column in record
+            }
+            for record in records
+        ]
 
-            for property_column in property_columns:
-                try:
-                    target_local_id = int(
-                        str(property_column).split('_')[-1]
-                    ) - 1
-                except ValueError:
-                    continue
+        # SECTION: dense tensor
+        n = len(index)
+        P = len(tensor.properties)
+        tensor.values = np.full((P, n, n), np.nan)
+        tensor.order = np.full((P, n, n), -1, dtype=np.int64)
+
+        for name, p in tensor.properties.items():
+            values, order = tensor.values[p], tensor.order[p]
+            conditional = []
+            try:
+                # row values (single-pair lookups)
+                row_values = np.full((len(records), len(columns)), np.nan)
+
+                for r, record in enumerate(records):
+                    source_id = index[names[r]]
+                    if tensor.pair:
+                        targets = mixtures[r]
+                        partners = {int(i) for i in row_mixtures[r] if i >= 0}
+                        if len(partners) != 2:
+                            continue
+                    else:
+                        targets = names
 
-                if target_local_id >= len(mixture_components):
-                    continue
+                    for target_id, column, position in property_columns[name]:
+                        value = self._matrix_value(record[column])
+                        row_values[r, position] = value
 
-                target_component = mixture_components[target_local_id]
-                if target_component not in component_ids:
-                    continue
+                        if target_id >= len(targets):
+                            continue
+                        target = targets[target_id]
+                        if target not in index:
+                            continue
+                        target_id_ = index[target]
+
+                        # NOTE: cells of other mixtures need the partner
+                        partner = (
+                            partners - {source_id, target_id_}
+                            if tensor.pair else set()
+                        )
+                        if partner:
+                            conditional.append(
+                                (source_id, target_id_, partner.pop(), r, value)
+                            )
+                        else:
+                            values[source_id, target_id_] = value
+                            order[source_id, target_id_] = r
+
+                tensor.row_values[p] = row_values
+            except Exception as e:
+                # ! raised when the property is looked up
+                tensor.errors[p] = e
+
+            tensor.conditional.append(tuple(
+                np.array([item[i] for item in conditional],
+                         dtype=float if i == 4 else np.int64)
+                for i in range(5)
+            ))
+
+            # NOTE: column symbol and unit (header rows)
+            positions = property_positions.get(name.upper(), [])
+            if len(matrix_table) >= 2:
+                tensor.column_info[p] = [
+                    (
+                        position,
+                        str(matrix_table.iloc[0, position]).split('_')[0],
+                        str(matrix_table.iloc[1, position]),
+                    )
+                    for position in positions
+                ]
+            # ! single-pair lookups need columns X_i_1 ... X_i_K in order
+            if [
+                str(columns[position]).split('_')[-1] for position in positions
+            ] != [str(k + 1) for k in range(len(positions))]:
+                tensor.column_info.pop(p, None)
 
-                target_id = component_ids[target_component]
-                property_value = self._matrix_value(row[property_column])
+        # SECTION: single-pair cells (component -> row, column)
+        tensor.cells = self._matrix_tensor_cells(names, mixtures, records)
 
-                mat_ij[source_id][target_id] = property_value
-                mat_ij_dict[
-                    f"{source_component} | {target_component}"
-                ] = property_value
+        return tensor
 
-    def _fill_square_matrix(
+    def _matrix_tensor_cells(
         self,
-        mat_ij: np.ndarray,
-        mat_ij_dict: Dict[str, str | float | int],
-        matrix_rows: pd.DataFrame,
-        property_columns: list[str],
-        component_ids: Dict[str, int],
-    ) -> None:
+        names: List[str],
+        mixtures: List[List[str]],
+        records: List[Dict[str, Any]],
+    ) -> Dict[Optional[str], Dict[str, Tuple[int, int]]]:
         '''
-        Fill matrix values from a full square matrix table.
-        '''
-        table_component_order = self._matrix_table_component_order()
-
-        for _, row in matrix_rows.iterrows():
-            source_component = str(row['Name']).strip()
-            if source_component not in component_ids:
-                continue
-
-            source_id = component_ids[source_component]
-
-            for property_column in property_columns:
-                try:
-                    target_id = int(
-                        str(property_column).split('_')[-1]
-                    ) - 1
-                except ValueError:
-                    continue
+        Single-pair lookup cells of the compiled matrix table.
 
-                if target_id >= len(table_component_order):
-                    continue
-
-                target_component = table_component_order[target_id]
-                if target_component not in component_ids:
-                    continue
-
-                target_output_id = component_ids[target_component]
-                property_value = self._matrix_value(row[property_column])
+        Notes
+        -----
+        Only unambiguous tables (or mixtures) are compiled, each component
+        has one row, its column is its position in the table (or in the row
+        mixture) and names match exactly, other lookups use the table scan.
+        '''
+        def unambiguous(group: List[str]) -> bool:
+            # ! lookups match names as case-insensitive regex prefixes
+            if any(
+                len(name) <= 1 or name == 'None' or
+                any(c in '.^$*+?{}[]\\|()' for c in name)
+                for name in group
+            ):
+                return False
+            lower = sorted(name.lower() for name in group)
+            return all(
+                not b.startswith(a) for a, b in zip(lower, lower[1:])
+            )
 
-                mat_ij[source_id][target_output_id] = property_value
-                mat_ij_dict[
-                    f"{source_component} | {target_component}"
-                ] = property_value
+        cells: Dict[Optional[str], Dict[str, Tuple[int, int]]] = {}
+        raw_names = [record['Name'] for record in records]
+
+        if len(mixtures) == 0:
+            # NOTE: square table
+            if raw_names == names and unambiguous(names):
+                cells[None] = {name: (r, r) for r, name in enumerate(names)}
+            return cells
+
+        # NOTE: pair table, rows grouped by mixture
+        groups: Dict[str, List[int]] = {}
+        for r, record in enumerate(records):
+            groups.setdefault(
+                self._mixture_key(record['Mixture']), []).append(r)
+
+        for key, rows in groups.items():
+            # ! duplicated rows are dropped by the lookup
+            unique_rows = []
+            seen = []
+            for r in rows:
+                if records[r] not in seen:
+                    seen.append(records[r])
+                    unique_rows.append(r)
+
+            group = [names[r] for r in unique_rows]
+            if (
+                [raw_names[r] for r in unique_rows] == group and
+                all(mixtures[r] == group for r in unique_rows) and
+                unambiguous(group)
+            ):
+                cells[key] = {
+                    name: (r, k) for k, (r, name) in enumerate(
+                        zip(unique_rows, group))
+                }
+        return cells
 
     def mat(
         self,
@@ -2230,66 +2459,34 @@ class TableMatrixData:
 
             # component strip
             components = [name.strip() for name in component_names]
-            component_ids = self.get_component_ids(components)
+            self.get_component_ids(components)
 
-            # NOTE: matrix data
-            mat_ij = np.zeros((component_num, component_num))
+            # NOTE: compiled matrix table
+            tensor = self._matrix_tensor()
+            component_ids = tensor.component_ids(components)
 
-            # matrix data dict
-            mat_ij_dict = self._matrix_dict(components)
-
-            matrix_rows = self.get_matrix_rows(components)
-
-            if len(matrix_rows) == 0:
+            if not tensor.has_rows(components, component_ids):
                 raise TableMatrixDataLookupError(
                     "No matrix rows found for component names",
                     context=self._context(component_names=component_names),
                 )
 
-            matrix_columns = list(matrix_rows.columns)
-            property_columns = self._matrix_property_columns(
-                property_name,
-                matrix_columns,
-            )
-
-            if len(property_columns) == 0:
+            # NOTE: matrix data (indexing)
+            p = tensor.properties.get(property_name.lower())
+            if p is None:
                 logger.warning(
                     f"Property name '{property_name}' not found in matrix table columns!"
                 )
-                mat_ij[:, :] = -1
-                for key in mat_ij_dict:
-                    mat_ij_dict[key] = -1
-            elif 'Mixture' in matrix_columns:
-                self._fill_pair_matrix(
-                    mat_ij=mat_ij,
-                    mat_ij_dict=mat_ij_dict,
-                    matrix_rows=matrix_rows,
-                    property_columns=property_columns,
-                    component_ids=component_ids,
-                )
+                mat_ij = np.full((component_num, component_num), -1.0)
             else:
-                self._fill_square_matrix(
-                    mat_ij=mat_ij,
-                    mat_ij_dict=mat_ij_dict,
-                    matrix_rows=matrix_rows,
-                    property_columns=property_columns,
-                    component_ids=component_ids,
-                )
-
-            # NOTE: check
-            if (
-                mat_ij is None or
-                mat_ij_dict is None
-            ):
-                # log
-                logger.error("Matrix data is None!")
-                return {}
+                mat_ij = tensor.matrix(p, component_ids)
 
             # NOTE: return
             if symbol_format == 'alphabetic':
                 component_labels = self._matrix_component_labels(
                     components,
-                    matrix_rows,
+                    tensor,
+                    component_ids,
                     component_key,
                 )
                 mat_ij_dict = self._matrix_result_dict(
@@ -2316,6 +2513,46 @@ class TableMatrixData:
                 ),
             ) from e
 
+    def accessor(
+        self,
+        property: str,
+        component_names: Optional[List[str]] = None,
+    ) -> MatrixAccessor:
+        '''
+        Get a reusable handle of a matrix property, the property string is
+        parsed and looked up once and each call returns the value directly.
+
+        Parameters
+        ----------
+        property : str
+            property of a component pair such as `Alpha_ethanol_methanol` or
+            `Alpha | ethanol | methanol` (ij), or property name such as
+            `Alpha` when component_names are given (mat)
+        component_names : list[str], optional
+            component names such as ['ethanol', 'methanol'], the handle then
+            returns the (n x n) matrix
+
+        Returns
+        -------
+        MatrixAccessor
+            bound handle, call it to get the float value (ij) or the matrix
+            (np.ndarray)
+
+        Examples
+        --------
+        >>> alpha = nrtl_data.accessor('Alpha | methanol | ethanol')
+        >>> alpha()
+        0.3
+        >>> tau = nrtl_data.accessor('tau', ['methanol', 'ethanol'])
+        >>> tau().shape
+        (2, 2)
+
+        Notes
+        -----
+        - the handle is rebound when the matrix table is replaced
+        '''
+        return MatrixAccessor(self, property, component_names)
+
     def matX(
         self,
         property_name: str,
@@ -2353,6 +2590,9 @@ class TableMatrixData:
                     context=self._context(components=components),
                 )
 
+            # NOTE: deferred import (pythermodb_settings)
+            from pythermodb_settings.models import Component
+
             if not all(isinstance(component, Component) for component in components):
                 raise TableMatrixDataFormatError(
                     "All components must be Component instances",
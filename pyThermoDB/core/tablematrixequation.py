@@ -1,11 +1,26 @@
 # import packages/modules
-import pandas as pd
+from __future__ import annotations
+import logging
 import math
 import numpy as np
-from typing import Literal
+from types import CodeType, FunctionType, MappingProxyType
+from typing import Literal, Dict, Optional, Tuple
 # local
+from ..handlers import TableEquationBodyError
 from ..models import EquationResult
-from ..utils import format_eq_data
+from ..utils import format_eq_data, numpy_math
+from ..utils.lazy_import import LazyModule
+from .equation_function import (
+    ParmsAccess,
+    compile_equation_function,
+    call_parms
+)
+
+# NOTE: pandas, imported on first use (dataframes)
+pd = LazyModule('pandas')
+
+# NOTE: logger
+logger = logging.getLogger(__name__)
 
 
 class TableMatrixEquation:
@@ -27,6 +42,19 @@ class TableMatrixEquation:
     _custom_integral = {}
     # bulk data
     __trans_data_pack = {}
+    # compiled equation bodies (code objects keyed by body source)
+    _compiled_bodies: Dict[str, CodeType]
+    _cache_hits: int = 0
+    _cache_misses: int = 0
+    # parms matrices cache (key: component order)
+    _parms_cache: Dict[tuple, Dict[str, np.ndarray]]
+    _matrix_table = None
+    # equation functions for `evaluate` (keyed by body source, vectorized)
+    _functions: Dict[Tuple[str, bool], Tuple[FunctionType, ParmsAccess]]
+    # parms matrices bound for `evaluate` (current component order)
+    _eval_parms: Optional[Dict[str, np.ndarray]] = None
+    # result metadata of the equation
+    _metadata: Optional[MappingProxyType] = None
 
     def __init__(
         self,
@@ -55,6 +83,36 @@ class TableMatrixEquation:
         self.equations = equations  # * from reference yml
         self.matrix_table = matrix_table  # * from csv
 
+        # NOTE: compiled equation bodies (per instance)
+        self._compiled_bodies = {}
+        self._functions = {}
+        self._cache_hits = 0
+        self._cache_misses = 0
+
+    def __getstate__(self):
+        # ! code objects are not picklable, compiled bodies are rebuilt on load
+        state = self.__dict__.copy()
+        state.pop('_compiled_bodies', None)
+        state.pop('_parms_cache', None)
+        state.pop('_functions', None)
+        state.pop('_eval_parms', None)
+        return state
+
+    def __setstate__(self, state):
+        # ! older pickles store matrix_table as a plain attribute
+        if 'matrix_table' in state:
+            state['_matrix_table'] = state.pop('matrix_table')
+        self.__dict__.update(state)
+        # reset parms matrices cache
+        self._parms_cache = {}
+        # reset compiled bodies
+        self._compiled_bodies = {}
+        self._functions = {}
+        self._cache_hits = 0
+        self._cache_misses = 0
+        # recompile equation bodies
+        self.compile_bodies()
+
     @property
     def trans_data_pack(self):
         return self.__trans_data_pack
@@ -62,6 +120,20 @@ class TableMatrixEquation:
     @trans_data_pack.setter
     def trans_data_pack(self, value):
         self.__trans_data_pack = value
+        # ! invalidate cached parms matrices
+        self._parms_cache = {}
+        self._eval_parms = None
+
+    @property
+    def matrix_table(self):
+        return self._matrix_table
+
+    @matrix_table.setter
+    def matrix_table(self, value):
+        self._matrix_table = value
+        # ! invalidate cached parms matrices
+        self._parms_cache = {}
+        self._eval_parms = None
 
     @property
     def trans_data(self):
@@ -76,6 +148,14 @@ class TableMatrixEquation:
     def prop_equation(self):
         return self.__prop_equation
 
+    def _context(self, **context):
+        base_context = {
+            "databook_name": self.databook_name,
+            "table_name": self.table_name,
+        }
+        base_context.update(context)
+        return base_context
+
     @property
     def parms_values(self):
         return self.__parms_values
@@ -235,55 +315,35 @@ class TableMatrixEquation:
                 res = np.round(res, decimal_accuracy)
 
                 # SECTION
-                # element no
-                element_no = len(self.matrix_elements)
-
-                # extract from res
-                for i in range(element_no):
-                    for j in range(element_no):
-                        # key
-                        key = f'{self.matrix_elements[i].strip()} | {self.matrix_elements[j].strip()}'
-                        # value
-                        value = res[i][j]
-                        # set
-                        res_comp[key] = value
+                # element labels
+                elements = [item.strip() for item in self.matrix_elements]
+                # element index
+                element_idx = list(range(len(elements)))
 
-                # SECTION
                 # check
                 if len(filter_elements) != 0:
-                    # check at least 2 elements
-                    if len(filter_elements) < 2:
-                        raise Exception('At least 2 elements required!')
-
-                    # init
-                    res_comp_filtered = {}
+                    # filtered element index
+                    element_idx = self._filter_index(filter_elements)
 
-                    # filter
-                    filtered_elements_no = len(filter_elements)
+                    # filtered matrix (index arrays)
+                    res_filtered = res[np.ix_(element_idx, element_idx)]
 
+                # SECTION
+                # ! labels are only built for alphabetic output
+                if output_format == 'alphabetic':
                     # init
-                    res_filtered = np.zeros(
-                        filtered_elements_no*filtered_elements_no)
-                    k = 0
-
+                    res_comp = {}
                     # extract from res
-                    for element_1 in filter_elements:
-                        for element_2 in filter_elements:
+                    for i in element_idx:
+                        for j in element_idx:
                             # key
-                            key_ = f'{element_1.strip()} | {element_2.strip()}'
-                            # value
-                            value = res_comp[key_]
+                            key = f'{elements[i]} | {elements[j]}'
                             # set
-                            res_comp_filtered[key_] = value
-                            # set filtered value
-                            res_filtered[k] = value
+                            res_comp[key] = res[i][j]
 
-                            # increment
-                            k += 1
-
-                    # reshape
-                    res_filtered = np.array(res_filtered).reshape(
-                        filtered_elements_no, filtered_elements_no)
+                    # check
+                    if res_filtered is not None:
+                        res_comp_filtered = res_comp
 
             # SECTION
             # set message
@@ -303,9 +363,241 @@ class TableMatrixEquation:
             eq_data = format_eq_data(res_, eq_info, message or 'No message', )
 
             return eq_data
+        except TableEquationBodyError:
+            raise
         except Exception as e:
             raise Exception('Calculation failed!, ', e)
 
+    @property
+    def metadata(self) -> MappingProxyType:
+        '''
+        Metadata of the equation result (name, symbol, unit, databook and
+        table name), computed once per equation.
+        '''
+        if self._metadata is None:
+            self._metadata = MappingProxyType({
+                **self.eq_info(),
+                'databook_name': self.databook_name,
+                'table_name': self.table_name,
+            })
+        return self._metadata
+
+    def _filter_index(self, filter_elements: list) -> list[int]:
+        '''Index of the filtered elements in `matrix_elements`.'''
+        # check at least 2 elements
+        if len(filter_elements) < 2:
+            raise Exception('At least 2 elements required!')
+
+        # element labels
+        elements = [item.strip() for item in self.matrix_elements]
+
+        element_idx = []
+        for element in filter_elements:
+            if element.strip() not in elements:
+                raise Exception(f'Element {element} not found!')
+            element_idx.append(elements.index(element.strip()))
+        return element_idx
+
+    def _function(
+        self,
+        body: str,
+        vectorized: bool = False
+    ) -> Tuple[FunctionType, ParmsAccess]:
+        '''
+        Get the equation function of a body (compiled on a miss), vectorized
+        functions map `math.*` calls to numpy ufuncs.
+        '''
+        function = self._functions.get((body, vectorized))
+        if function is None:
+            # check body
+            if body is None or body == 'None' or body == '':
+                raise TableEquationBodyError(
+                    "Equation body not defined",
+                    context=self._context(),
+                )
+            try:
+                function = compile_equation_function(
+                    body,
+                    f"<{self.databook_name}::{self.table_name}>",
+                    {'np': np, 'math': numpy_math if vectorized else math}
+                )
+            except SyntaxError as e:
+                raise TableEquationBodyError(
+                    "Compiling equation body failed",
+                    context=self._context(body=body),
+                ) from e
+            self._functions[(body, vectorized)] = function
+        return function
+
+    def _bound_parms(self) -> Dict[str, np.ndarray]:
+        '''Parms matrices of the current component order (not copied).'''
+        parms = self._eval_parms
+        if parms is None:
+            # NOTE: checks components and fills the parms matrices cache
+            self.load_parms()
+            parms = self._parms_cache[tuple(self.matrix_elements)]
+            self._eval_parms = parms
+        return parms
+
+    def evaluate(self, **args) -> np.ndarray:
+        '''
+        Evaluate the equation and return the (n x n) matrix only, the fast
+        path for solvers (no rounding, filtering or result formatting).
+
+        Parameters
+        ----------
+        args : dict
+            a dictionary contains variable names and values such as T=300
+
+        Returns
+        -------
+        res : np.ndarray
+            calculation result in the order of `matrix_elements`, `metadata`
+            describes it
+
+        Examples
+        --------
+        >>> tau_ij = eq.evaluate(T=298.15)
+        '''
+        try:
+            fn, access = self._function(self.body)
+            parms = self._bound_parms()
+            if access == 'read':
+                return fn(args, parms)
+            return fn(args, call_parms(parms, access))
+        except TableEquationBodyError:
+            raise
+        except Exception as e:
+            raise Exception('Evaluation failed!, ', e)
+
+    def evaluate_many(self, **args) -> np.ndarray:
+        '''
+        Evaluate the equation over arrays of arguments (e.g. temperatures)
+        and return the matrices only.
+
+        Parameters
+        ----------
+        args : dict
+            variable names and values (scalars, lists or numpy arrays which
+            are broadcast together)
+
+        Returns
+        -------
+        res : np.ndarray
+            contiguous calculation results with shape (*shape of args, n, n),
+            e.g. (nT, n, n)
+
+        Notes
+        -----
+        The body runs once with args over the leading axes and the parms
+        matrices over the last two axes, bodies which cannot be evaluated
+        over arrays (e.g. branching on argument values) are evaluated point
+        by point.
+        '''
+        try:
+            # check
+            if not args:
+                return self.evaluate()
+
+            # NOTE: args as arrays
+            _args = {k: np.asarray(v, dtype=float) for k, v in args.items()}
+            shape = np.broadcast_shapes(*(v.shape for v in _args.values()))
+
+            parms = self._bound_parms()
+            n = len(self.matrix_elements)
+            fn, access = self._function(self.body, vectorized=True)
+
+            try:
+                # ! trailing (1, 1) axes broadcast against the parms matrices
+                res = fn(
+                    {k: v.reshape(v.shape + (1, 1)) for k, v in _args.items()},
+                    call_parms(parms, access)
+                )
+                return np.broadcast_to(
+                    np.asarray(res, dtype=float), shape + (n, n)
+                ).copy()
+            except (TypeError, ValueError) as e:
+                # ! body is not vectorizable, evaluate point by point
+                logger.debug(
+                    f"Vectorized evaluation failed for {self.table_name}, "
+                    f"falling back to point-wise evaluation: {e}"
+                )
+
+            # point-wise
+            names = list(_args.keys())
+            arrays = np.broadcast_arrays(*_args.values())
+            res = np.empty(shape + (n, n), dtype=float)
+            for idx in np.ndindex(*shape):
+                res[idx] = self.evaluate(
+                    **{k: float(a[idx]) for k, a in zip(names, arrays)}
+                )
+            return res
+        except TableEquationBodyError:
+            raise
+        except Exception as e:
+            raise Exception('Evaluation failed!, ', e)
+
+    def cal_batch(
+        self,
+        message: str = '',
+        decimal_accuracy: Optional[int] = None,
+        filter_elements: list = [],
+        **args
+    ) -> EquationResult:
+        '''
+        Execute a function over arrays of arguments (vectorized)
+
+        Parameters
+        ----------
+        message : str
+            message to be printed
+        decimal_accuracy : int, optional
+            decimal accuracy (default is None, no rounding)
+        filter_elements : list[str], optional
+            list of elements to be calculated (default is all elements)
+        args : dict
+            a dictionary contains variable names and values (scalars, lists
+            or numpy arrays which are broadcast together)
+
+        Returns
+        -------
+        eq_data : EquationResult
+            calculation result, the value is a numpy array with shape
+            (*shape of args, n, n)
+
+        Examples
+        --------
+        >>> T = np.linspace(300, 400, 200)
+        >>> res = cal_batch(message='NRTL tau', T=T)
+        >>> res['value'].shape
+        (200, 3, 3)
+        '''
+        try:
+            # equation info
+            eq_info = {
+                **self.eq_info(),
+                'databook_name': self.databook_name,
+                'table_name': self.table_name,
+            }
+
+            # NOTE: execute equation over arrays
+            res = self.evaluate_many(**args)
+
+            # NOTE: filtered matrices (index arrays over the last two axes)
+            if len(filter_elements) != 0:
+                idx = np.asarray(self._filter_index(filter_elements))
+                res = res[..., idx[:, None], idx]
+
+            # round
+            if decimal_accuracy is not None:
+                res = np.round(res, decimal_accuracy)
+
+            return format_eq_data(res, eq_info, message or 'No message')
+        except TableEquationBodyError:
+            raise
+        except Exception as e:
+            raise Exception('Batch calculation failed!, ', e)
+
     def cal_integral(self, **args):
         '''
         Calculate integral
@@ -380,6 +672,8 @@ class TableMatrixEquation:
             # execute equation
             res = self.eqExe(_body, _parms, args=args)
             return res
+        except TableEquationBodyError:
+            raise
         except Exception as e:
             raise Exception('Loading custom integral failed!, ', e)
 
@@ -413,6 +707,8 @@ class TableMatrixEquation:
             # execute equation
             res = self.eqExe(self.body_first_derivative, _parms, args=args)
             return res
+        except TableEquationBodyError:
+            raise
         except Exception as e:
             raise Exception("Derivation calculation failed!, ", e)
 
@@ -446,6 +742,8 @@ class TableMatrixEquation:
             # execute equation
             res = self.eqExe(self.body_second_derivative, _parms, args=args)
             return res
+        except TableEquationBodyError:
+            raise
         except Exception as e:
             raise Exception('Derivation calculation failed!, ', e)
 
@@ -565,6 +863,12 @@ class TableMatrixEquation:
         '''
         Load parms values and store in a dict,
         These parameters are constant values defined in an equation.
+
+        Notes
+        -----
+        Parameter matrices are built once per component order and cached on
+        the object, the cache is cleared when `trans_data_pack` or
+        `matrix_table` is set.
         '''
         try:
             # trans data (taken from csv)
@@ -589,199 +893,159 @@ class TableMatrixEquation:
             if component_no == 1:
                 raise Exception('Only one component found!')
 
-            # check
-            if not isinstance(self.matrix_table, pd.DataFrame):
-                raise Exception('Matrix table not found!')
-
-            # ! matrix table info
-            matrix_table_columns, matrix_table_data_symbol, matrix_table_data_unit = self.get_matrix_table_info()
+            # NOTE: cached parms matrices
+            cache_key = tuple(component_names)
+            parms_matrix_list = self._parms_cache.get(cache_key)
+
+            if parms_matrix_list is None:
+                # build
+                parms_matrix_list = self._build_parms_matrices(
+                    component_names
+                )
+                # ! read-only, `evaluate` passes them to bodies without a copy
+                for value in parms_matrix_list.values():
+                    value.setflags(write=False)
+                # save
+                self._parms_cache[cache_key] = parms_matrix_list
+
+            # res (copies, equation bodies may update parms in place)
+            return {
+                key: value.copy() for key, value in parms_matrix_list.items()
+            }
+        except Exception as e:
+            raise Exception("Loading equation parameters failed!, ", e)
 
-            # ! component names in the matrix_table
-            matrix_table_data_component_names, matrix_table_data_component_names_idx, matrix_table_data_component_names_no = self.get_component_info()
+    def _build_parms_matrices(
+            self,
+            component_names: list[str]
+    ) -> Dict[str, np.ndarray]:
+        '''
+        Build parms matrices (such as A_i_j, B_i_j) for the given components
+        from the matrix table.
 
-            # TODO: check component in matrix-table
-            for component in component_names:
-                if component not in matrix_table_data_component_names:
-                    raise Exception('Component not found!')
+        Parameters
+        ----------
+        component_names : list[str]
+            component names
 
-            # check component name id
-            component_names_dict = {}
-            for i, name in matrix_table_data_component_names_idx.items():
-                if name in component_names:
-                    component_names_dict[i] = name
+        Returns
+        -------
+        parms_matrix_list : dict
+            parms matrices, key: parms name, value: parms matrix (2d array)
+        '''
+        # component no
+        component_no = len(component_names)
 
-            component_names_idx = list(component_names_dict.keys())
-            component_names_idx = [int(item) for item in component_names_idx]
+        # check
+        if not isinstance(self.matrix_table, pd.DataFrame):
+            raise Exception('Matrix table not found!')
 
-            # check
-            if component_no > matrix_table_data_component_names_no:
-                raise Exception("Check component number!")
-
-            # get parms symbols
-            parms_name, parms_name_clean = self.get_params_symbols('_i_j')
-
-            # ! parms column index in the dataframe
-            # params column index
-            # parms_col_index = []
-            # looping through
-            # for item in matrix_table_columns:
-            #     if item.split('_')[0] in parms_name_clean:
-            #         parms_col_index.append(
-            #             matrix_table_columns.index(item))
-
-            parms_col_index = []
-            # looping through clean parms names
-            for item in parms_name_clean:
-                # build parms symbol
-                # create regex
-                # regex = re.compile(re.escape(item) + '_')
-                # create str pattern
-                str_pattern = item + '_'
-
-                for matrix_table_column in matrix_table_columns:
-                    # check
-                    # * method 1: using regex
-                    # if regex.search(matrix_table_column):
-                    #     # get index
-                    #     index = matrix_table_columns.index(matrix_table_column)
-                    #     # save
-                    #     parms_col_index.append(index)
-
-                    # * method 2: using startswith
-                    if matrix_table_column.startswith(str_pattern):
-                        # get index
-                        index = matrix_table_columns.index(matrix_table_column)
-                        # save
-                        parms_col_index.append(index)
-
-            # create matrix
-            parms_matrix_list = {}
-            # component data
-            matrix_table_component_data = {}
-            # parms data
-            matrix_table_component_parms_data = {}
-            # looping through matrix table data
-            for i, (component_key, component) in enumerate(matrix_table_data_component_names_idx.items()):
-                # component data
-                _data_get = self.matrix_table[self.matrix_table['Name'].str.match(
-                    component, case=False, na=False)]
+        # ! matrix table info
+        matrix_table_columns, matrix_table_data_symbol, matrix_table_data_unit = self.get_matrix_table_info()
 
-                # set
-                _row_index = int(_data_get.index[0])
-                _data = _data_get.to_dict(orient='records')[0]
+        # ! component names in the matrix_table
+        matrix_table_data_component_names, matrix_table_data_component_names_idx, matrix_table_data_component_names_no = self.get_component_info()
 
-                # update
-                _data['row_index'] = _row_index
+        # TODO: check component in matrix-table
+        for component in component_names:
+            if component not in matrix_table_data_component_names:
+                raise Exception('Component not found!')
 
+        # check
+        if component_no > matrix_table_data_component_names_no:
+            raise Exception("Check component number!")
+
+        # NOTE: selected component index (matrix table order)
+        component_names_idx = [
+            int(i) for i, name in matrix_table_data_component_names_idx.items()
+            if name in component_names
+        ]
+
+        # get parms symbols
+        parms_name, parms_name_clean = self.get_params_symbols('_i_j')
+
+        # ! parms column index in the dataframe
+        parms_col_index = []
+        # looping through clean parms names
+        for item in parms_name_clean:
+            # create str pattern
+            str_pattern = item + '_'
+
+            for index, matrix_table_column in enumerate(matrix_table_columns):
+                if matrix_table_column.startswith(str_pattern):
+                    # save
+                    parms_col_index.append(index)
+
+        # NOTE: column index for each (parms name, component index)
+        # columns are assigned to components cyclically (A_i_1, A_i_2, ...)
+        parms_col_map = {}
+        for jj, item in enumerate(parms_col_index):
+            # key
+            _parms_name = str(matrix_table_columns[item]).split("_")[0]
+            parms_col_map[(
+                _parms_name,
+                jj % matrix_table_data_component_names_no
+            )] = item
+
+        # NOTE: row index of the selected components
+        name_col = self.matrix_table['Name']
+        # normalized names (first match)
+        name_rows = {}
+        for row_index, name in enumerate(name_col):
+            if isinstance(name, str):
+                name_rows.setdefault(name.strip().lower(), row_index)
+
+        component_rows = []
+        for j in component_names_idx:
+            # component
+            _component = matrix_table_data_component_names_idx[str(j)]
+            # row
+            _row = name_rows.get(str(_component).strip().lower())
+
+            # ! fall back to pattern match
+            if _row is None:
+                _data_get = self.matrix_table[name_col.str.match(
+                    _component, case=False, na=False)]
                 # check
-                if len(_data) == 0:
+                if len(_data_get) == 0:
                     raise Exception('Component data not found!')
+                _row = self.matrix_table.index.get_loc(_data_get.index[0])
 
-                # component parms data
-                matrix_table_component_parms_data[component] = {}
-                # looping through self.parms
-                # rename _data keys
-                # * method 1:
-                for key, value in _data.items():
-                    # find parms
-                    for item in parms_name_clean:
-                        _find_key = str(key).find(item+'_i')
-                        # check
-                        if _find_key != -1:
-                            # new key
-                            _new_key = str(key).replace('i', str(i+1))
-                            # log
-                            # print("method 1: ", _new_key, value, component)
-
-                            # set value
-                            # matrix_table_component_parms_data[component][str(
-                            #     _new_key)] = float(value)
-
-                # * method 2:
-                # find parms from matrix column index
-                # set
-                jj = 0
-                for item in parms_col_index:
-                    # check
-                    if jj > matrix_table_data_component_names_no-1:
-                        jj = 0
-                    # lopping through data
-                    for ii, (key, value) in enumerate(_data.items()):
-                        # check
-                        if ii == item:
-                            # print(ii, item, jj)
-                            # new key
-                            _new_key = str(key).split(
-                                "_")[0]+"_"+f"{i+1}"+"_"+f"{jj+1}"
-
-                            # set unit
-                            _unit = float(
-                                matrix_table_data_unit[ii] or 1)
-
-                            # log
-                            # print("method 2: ", _new_key, value, component)
-                            # set value
-                            matrix_table_component_parms_data[component][_new_key] = float(
-                                value)/_unit
-                            # reset
-                            jj = jj+1
-
-                matrix_table_component_data[component] = _data
-
-            # looping through parms group
-            for i in range(len(parms_name_clean)):
-
-                # parms key (such as A_i_j)
-                _parms_name = parms_name_clean[i]
-                _parms_key = f'{_parms_name}_i_j'
-
-                # 2d array
-                # _2d_array = np.zeros(
-                #     (component_no, component_no))
-
-                # 2d list
-                _2d_list = []
-
-                # looping through component
-                for j in range(matrix_table_data_component_names_no):
+            component_rows.append(_row)
 
-                    # check
-                    if j in component_names_idx:
-                        # check component exists in
-                        _component = matrix_table_data_component_names_idx[str(
-                            j)]
-
-                        # get component data
-                        _data = matrix_table_component_data[_component]
-
-                        # get component parms data
-                        _parms_data = matrix_table_component_parms_data[_component]
-
-                        # looping through component
-                        for k in range(matrix_table_data_component_names_no):
-                            # set key
-                            _key = f'{_parms_name}_{j+1}_{k+1}'
-
-                            # check
-                            if k in component_names_idx:
-                                # fill 2d array
-                                # _2d_array[j, k] = float(_parms_data[_key])
-                                _2d_list.append(float(_parms_data[_key]))
-
-                # reshape list
-                _2d_array = np.array(_2d_list).reshape(
-                    component_no, component_no)
-                # save parms matrix
-                parms_matrix_list[_parms_key] = _2d_array
-
-            # log
-            # print("A_i_j: ", parms_matrix_list['A_i_j'])
-            # print("B_i_j: ", parms_matrix_list['B_i_j'])
+        # NOTE: matrix table values
+        table_values = self.matrix_table.to_numpy()
 
-            # res
-            return parms_matrix_list
-        except Exception as e:
-            raise Exception("Loading equation parameters failed!, ", e)
+        # create matrix
+        parms_matrix_list = {}
+
+        # looping through parms group
+        for _parms_name in parms_name_clean:
+            # parms key (such as A_i_j)
+            _parms_key = f'{_parms_name}_i_j'
+
+            # columns for the selected components
+            _cols = [
+                parms_col_map[(_parms_name, k)] for k in component_names_idx
+            ]
+
+            # units
+            _units = np.array(
+                [float(matrix_table_data_unit[c] or 1) for c in _cols]
+            )
+
+            # 2d array
+            _2d_array = np.asarray(
+                table_values[np.ix_(component_rows, _cols)],
+                dtype=float
+            ) / _units
+
+            # save parms matrix
+            parms_matrix_list[_parms_key] = _2d_array.reshape(
+                component_no, component_no
+            )
+
+        return parms_matrix_list
 
     def equation_body(self):
         '''
@@ -889,6 +1153,9 @@ class TableMatrixEquation:
         # load equation
         eq_summary = self.eq_structure(Eq_data)
 
+        # NOTE: result metadata (computed on first use)
+        self._metadata = None
+
         # extract data
         _body = eq_summary['body']
         self.body = ';'.join(_body)
@@ -956,6 +1223,85 @@ class TableMatrixEquation:
         if len(self.parms) > 0:
             self.__parms_values = self.load_parms()
 
+        # NOTE: compile equation bodies once
+        self.compile_bodies()
+
+    def compile_bodies(self) -> Dict[str, CodeType]:
+        '''
+        Compile all equation bodies (main, integral, first/second derivative
+        and custom integrals) into reusable code objects.
+
+        Returns
+        -------
+        compiled_bodies : dict
+            compiled code objects keyed by body source
+        '''
+        # reset
+        self._compiled_bodies = {}
+        self._functions = {}
+
+        # equation bodies
+        bodies = [
+            self.body,
+            self.body_integral,
+            self.body_first_derivative,
+            self.body_second_derivative,
+        ]
+
+        # custom integrals
+        if isinstance(self._custom_integral, dict):
+            for _body_lines in self._custom_integral.values():
+                if isinstance(_body_lines, list):
+                    bodies.append(";".join(_body_lines))
+
+        # compile
+        for body in bodies:
+            if body is None or body == 'None' or body == '':
+                continue
+            self._compile_body(body)
+
+        return self._compiled_bodies
+
+    def _compile_body(self, body: str) -> CodeType:
+        '''Compile an equation body and store it in the cache.'''
+        try:
+            code = compile(
+                body,
+                f"<{self.databook_name}::{self.table_name}>",
+                'exec'
+            )
+        except SyntaxError as e:
+            raise TableEquationBodyError(
+                "Compiling equation body failed",
+                context=self._context(body=body),
+            ) from e
+
+        # store
+        self._compiled_bodies[body] = code
+        return code
+
+    def cache_info(self) -> Dict[str, int]:
+        '''
+        Get compiled equation cache statistics.
+
+        Returns
+        -------
+        info : dict
+            hits, misses and size of the compiled equation cache
+        '''
+        return {
+            'hits': self._cache_hits,
+            'misses': self._cache_misses,
+            'size': len(self._compiled_bodies),
+        }
+
+    def cache_clear(self) -> None:
+        '''Clear compiled equation bodies and reset cache statistics.'''
+        self._compiled_bodies = {}
+        self._functions = {}
+        self._cache_hits = 0
+        self._cache_misses = 0
+
     def eqExe(
             self,
             body,
@@ -984,15 +1330,26 @@ class TableMatrixEquation:
             raise Exception('Function body not defined!')
 
         try:
+            # NOTE: compiled body
+            code = self._compiled_bodies.get(body)
+            if code is None:
+                # compile once
+                self._cache_misses += 1
+                code = self._compile_body(body)
+            else:
+                self._cache_hits += 1
+
             # Define a namespace dictionary for eval
             namespace = {'args': args, "parms": parms}
             # Import math module and numpy (np) lib within the function
             namespace['np'] = np
             namespace['math'] = math
-            # Execute the body within the namespace
-            exec(body, namespace)
+            # Execute the compiled body within the namespace
+            exec(code, namespace)
             # Return the result
             return namespace['res']
+        except TableEquationBodyError:
+            raise
         except Exception as e:
             raise Exception("Calculation failed!, ", e)
 
@@ -3,12 +3,16 @@ import logging
 import os
 import pandas as pd
 from typing import (
+    Callable,
+    Dict,
+    List,
     Optional,
-    Literal
+    Literal,
+    Tuple
 )
 import glob
 # local
-from ..manager import ManageData
+from ..manager import ManageData, table_cache, ComponentIndex
 from ..data import TableTypes
 from ..models import PayLoadType, DataBookTableTypes
 from ..loader import CustomRef
@@ -125,247 +129,389 @@ class TableReference(ManageData):
         -------
         pandas DataFrame
             pandas DataFrame
+
+        Notes
+        -----
+        Loaded tables are kept in the process-wide `table_cache` keyed by
+        (databook, table, source fingerprint), the returned dataframe is a
+        view of the cached one.
         """
         try:
             # init vars
-            file_data = None
-            file_item_data = None
-            file_path = None
+            file_name = None
 
             # NOTE:
             # table
             tb: DataBookTableTypes = self.get_table(databook_id-1, table_id-1)
-            # table type
-            tb_type = tb['table_type']
 
             # table name
             table_name = tb['table']
             # table file
             file_name = table_name + '.csv'
 
-            # check table exists in local or external references
-            reference_local_no = self.reference_local_no
+            # SECTION: cached table
+            key, loader = self._table_source(databook_id, tb, file_name)
 
-            # SECTION: table file path
-            # local
-            if databook_id <= reference_local_no:
-                # set file path
-                file_path = os.path.join(self.path, file_name)
-            else:
-                # check
-                if self.custom_ref is None:
-                    raise ValueError('No custom reference provided')
+            # check
+            if key is None:
+                return loader()
+
+            return table_cache.get(key, loader)
+        except FileNotFoundError:
+            raise FileNotFoundError(
+                f"File {file_name} not found in {self.path}")
+        except Exception as e:
+            raise Exception(f"Table loading error {e}")
 
-                # NOTE: load external path
-                path_external = self.load_external_csv(self.custom_ref)
+    def table_index(
+        self,
+        databook_id: int,
+        table_id: int,
+        columns: Tuple[str, ...]
+    ) -> Optional[Dict[Tuple[str, ...], List[int]]]:
+        """
+        Get the lookup index of a table over the given columns.
 
-                # SECTION: check if the file exists in the external paths
-                file_path = None
-                # check
-                if len(path_external) > 0:
-                    # check csv paths
-                    # csv file names
-                    file_names = [
-                        os.path.basename(path) for path in path_external
-                    ]
-                    # check csv file
-                    for item in file_names:
-                        if item == file_name:
-                            file_path = path_external[file_names.index(item)]
-                            break
-
-                # SECTION: load values from custom reference (if exists in the yml/md file)
-                # ! check both yml and md files
-                if tb_type and file_path is None:
-                    # load table data
-                    table_data = self.retrieve_data(
-                        tb, tb_type)
-
-                    # NOTE: load structure
-                    table_structure = tb.get('table_structure', None)
-
-                    # check
-                    if table_structure is None:
-                        raise Exception(
-                            f"Table data is None for {file_name}.")
+        Parameters
+        ----------
+        databook_id : int
+            databook id (non-zero-based id)
+        table_id : int
+            table id (non-zero-based id)
+        columns : tuple[str, ...]
+            column names such as ('Name',) or ('Formula', 'State')
 
-                    # NOTE: table structure
-                    columns = table_structure.get('COLUMNS', None)
-                    symbol = table_structure.get('SYMBOL', None)
-                    unit = table_structure.get('UNIT', None)
+        Returns
+        -------
+        index : dict | None
+            lower-cased column values mapped to row positions, None if the
+            table cannot be indexed over the columns
+        """
+        try:
+            # table
+            tb: DataBookTableTypes = self.get_table(databook_id-1, table_id-1)
+            # table file
+            file_name = tb['table'] + '.csv'
 
-                    # SECTION: used by matrix data
-                    # NOTE: table_values
-                    values = tb.get('table_values', None)
-                    # NOTE: table_items
-                    items = tb.get('table_items', None)
+            # NOTE: cached table
+            key, loader = self._table_source(databook_id, tb, file_name)
 
-                    # NOTE: load values
-                    if tb_type == TableTypes.DATA.value:
-                        # ! data & matrix data
+            # check
+            if key is None:
+                return table_cache.build_index(loader(), columns)
 
-                        # check
-                        if values is None:
-                            raise Exception(
-                                f"Table data is None for {file_name}.")
+            return table_cache.index(key, loader, columns)
+        except Exception as e:
+            logger.debug(f"table index error {e}")
+            return None
 
-                        # NOTE: add to file data
-                        file_data = []
-                        # ! add to dataframe header
-                        # file_data.append(columns)
-                        file_data.append(symbol)
-                        file_data.append(unit)
-                        file_data.extend(values)
+    def _table_source(
+        self,
+        databook_id: int,
+        tb: DataBookTableTypes,
+        file_name: str
+    ) -> Tuple[Optional[tuple], Callable[[], pd.DataFrame]]:
+        """
+        Get the table cache key and loader.
 
-                    elif tb_type == TableTypes.CONSTANTS.value:
-                        # ! constants
+        Parameters
+        ----------
+        databook_id : int
+            databook id (non-zero-based id)
+        tb : DataBookTableTypes
+            table
+        file_name : str
+            csv file name
 
-                        # check
-                        if values is None:
-                            raise Exception(
-                                f"Table data is None for {file_name}.")
+        Returns
+        -------
+        key : tuple | None
+            (databook, table, source fingerprint), None if the source has no fingerprint
+        loader : Callable
+            function to build the table dataframe
+        """
+        # SECTION: table file path
+        file_path = self.table_file_path(databook_id, file_name)
+
+        # loader
+        def loader() -> pd.DataFrame:
+            return self._build_table(tb, file_name, file_path)
+
+        # NOTE: source fingerprint
+        if file_path is not None:
+            source = table_cache.file_key(file_path)
+        elif self.reference_key is not None:
+            source = ('reference', self.reference_key)
+        else:
+            return None, loader
 
-                        # NOTE: add to file data
-                        file_data = []
-                        # ! add to dataframe header
-                        # file_data.append(columns)
-                        # file_data.append(symbol)
-                        # file_data.append(unit)
-                        file_data.extend(values)
+        return (self.databook[databook_id-1], tb['table'], source), loader
 
-                    elif tb_type == TableTypes.MATRIX_DATA.value:
-                        # ! matrix data
+    def table_file_path(
+        self,
+        databook_id: int,
+        file_name: str
+    ) -> Optional[str]:
+        """
+        Find the csv file path of a table in the app directory or external reference.
 
-                        # NOTE: values or items
-                        # check
-                        if values is None:
-                            # check items
-                            if items is None:
-                                # ! raise exception as no values or items
-                                raise Exception(
-                                    f"Table data is None for {file_name}.")
+        Parameters
+        ----------
+        databook_id : int
+            databook id (non-zero-based id)
+        file_name : str
+            csv file name
 
-                        # NOTE: matrix data
-                        matrix_data = tb.get('matrix_data', None)
-                        # check
-                        if matrix_data is None:
-                            raise Exception(
-                                f"Table data is None for {file_name}.")
-
-                        # matrix symbol
-                        # >> check types
-                        if isinstance(matrix_data, dict):
-                            matrix_symbol = matrix_data.get(
-                                'MATRIX-SYMBOL',
-                                None
-                            )
-                        elif isinstance(matrix_data, list):
-                            # set
-                            matrix_symbol = [item for item in matrix_data]
-                        else:
-                            logger.warning(
-                                f"Matrix data format is not recognized for {file_name}.")
-                            raise Exception(
-                                f"Table data is None for {file_name}."
-                            )
+        Returns
+        -------
+        file_path : str | None
+            csv file path, None if the table is defined in the yml/md reference
+        """
+        # check table exists in local or external references
+        reference_local_no = self.reference_local_no
+
+        # local
+        if databook_id <= reference_local_no:
+            return os.path.join(self.path, file_name)
+
+        # check
+        if self.custom_ref is None:
+            raise ValueError('No custom reference provided')
+
+        # NOTE: load external path
+        path_external = self.load_external_csv(self.custom_ref)
+
+        # SECTION: check if the file exists in the external paths
+        if len(path_external) > 0:
+            # check csv paths
+            # csv file names
+            file_names = [
+                os.path.basename(path) for path in path_external
+            ]
+            # check csv file
+            for item in file_names:
+                if item == file_name:
+                    return path_external[file_names.index(item)]
+
+        return None
+
+    def _build_table(
+        self,
+        tb: DataBookTableTypes,
+        file_name: str,
+        file_path: Optional[str]
+    ) -> pd.DataFrame:
+        """
+        Build the table dataframe from the csv file or the yml/md reference values.
 
-                        # check
-                        if matrix_symbol is None:
-                            raise Exception(
-                                f"Table data is None for {file_name}.")
-
-                        # SECTION: values
-                        if values and isinstance(values, list):
-                            # # size of matrix symbols
-                            # component_idx_len = len(values) - 2
-
-                            # # ! No., Name, Formula are necessary for matrix data
-                            # header_ = ['None', 'None', 'None']
-                            # component_idx = [str(i) for i in range(
-                            #     1, component_idx_len+1)]*matrix_symbol_len
-
-                            # # updated header
-                            # header_ = header_ + component_idx
-
-                            # # updated values
-                            # values_ = [header_, *values]
-                            # NOTE: check columns contains Mixture
-                            # >> check columns
-                            if not columns:
-                                logger.warning(
-                                    f"Columns are not defined for {file_name}.")
-                                raise Exception(
-                                    f"Table data is None for {file_name}."
-                                )
-
-                            # check if any column is mixture
-                            if any(col.lower() == 'mixture' for col in columns):
-                                # loop through values
-                                for i in range(len(values)):
-                                    # mixture name
-                                    mixture_name = values[i][1]
-
-                                    # split mixture name
-                                    mixture_name = mixture_name.split('|')
-                                    # check
-                                    if len(mixture_name) != 2:
-                                        raise Exception(
-                                            f"Table data is None for {file_name}.")
-                                    # strip keys
-                                    mixture_name = [i.strip()
-                                                    for i in mixture_name]
-                                    # std key format
-                                    mixture_name = f"{mixture_name[0]} | {mixture_name[1]}"
-                                    # update values
-                                    values[i][1] = mixture_name
-
-                            values_ = [*values]
-
-                            # NOTE: add to file data
-                            file_data = []
-                            # ! add to dataframe header
-                            # file_data.append(columns)
-                            file_data.append(symbol)
-                            file_data.append(unit)
-                            file_data.extend(values_)
-
-                    elif tb_type == TableTypes.EQUATIONS.value:
-                        # ! equations
+        Parameters
+        ----------
+        tb : DataBookTableTypes
+            table
+        file_name : str
+            csv file name
+        file_path : str | None
+            csv file path
 
-                        # check
-                        if values is None:
-                            raise Exception(
-                                f"Table data is None for {file_name}.")
+        Returns
+        -------
+        pandas DataFrame
+            pandas DataFrame
+        """
+        # init vars
+        file_data = None
+        file_item_data = None
+        columns = None
+
+        # table type
+        tb_type = tb['table_type']
+
+        # SECTION: load values from custom reference (if exists in the yml/md file)
+        # ! check both yml and md files
+        if tb_type and file_path is None:
+            # load table data
+            table_data = self.retrieve_data(
+                tb, tb_type)
 
-                        # NOTE: make file data
-                        file_data = []
-                        # ! add to dataframe header
-                        # file_data.append(columns)
-                        file_data.append(symbol)
-                        file_data.append(unit)
-                        file_data.extend(values)
+            # NOTE: load structure
+            table_structure = tb.get('table_structure', None)
 
-            # SECTION
             # check
-            if file_path is not None:
-                # create dataframe
-                return pd.read_csv(file_path)
-            elif file_data is not None and file_item_data is None:
-                # create dataframe
-                return pd.DataFrame(file_data, columns=columns)
-            elif file_item_data is not None and file_data is None:
-                # create dataframe
-                # return df_dict
+            if table_structure is None:
                 raise Exception(
                     f"Table data is None for {file_name}.")
-            else:
-                raise Exception(f"{file_name} does not exist.")
 
-        except FileNotFoundError:
-            raise FileNotFoundError(
-                f"File {file_name} not found in {self.path}")
-        except Exception as e:
-            raise Exception(f"Table loading error {e}")
+            # NOTE: table structure
+            columns = table_structure.get('COLUMNS', None)
+            symbol = table_structure.get('SYMBOL', None)
+            unit = table_structure.get('UNIT', None)
+
+            # SECTION: used by matrix data
+            # NOTE: table_values
+            values = tb.get('table_values', None)
+            # NOTE: table_items
+            items = tb.get('table_items', None)
+
+            # NOTE: load values
+            if tb_type == TableTypes.DATA.value:
+                # ! data & matrix data
+
+                # check
+                if values is None:
+                    raise Exception(
+                        f"Table data is None for {file_name}.")
+
+                # NOTE: add to file data
+                file_data = []
+                # ! add to dataframe header
+                # file_data.append(columns)
+                file_data.append(symbol)
+                file_data.append(unit)
+                file_data.extend(values)
+
+            elif tb_type == TableTypes.CONSTANTS.value:
+                # ! constants
+
+                # check
+                if values is None:
+                    raise Exception(
+                        f"Table data is None for {file_name}.")
+
+                # NOTE: add to file data
+                file_data = []
+                # ! add to dataframe header
+                # file_data.append(columns)
+                # file_data.append(symbol)
+                # file_data.append(unit)
+                file_data.extend(values)
+
+            elif tb_type == TableTypes.MATRIX_DATA.value:
+                # ! matrix data
+
+                # NOTE: values or items
+                # check
+                if values is None:
+                    # check items
+                    if items is None:
+                        # ! raise exception as no values or items
+                        raise Exception(
+                            f"Table data is None for {file_name}.")
+
+                # NOTE: matrix data
+                matrix_data = tb.get('matrix_data', None)
+                # check
+                if matrix_data is None:
+                    raise Exception(
+                        f"Table data is None for {file_name}.")
+
+                # matrix symbol
+                # >> check types
+                if isinstance(matrix_data, dict):
+                    matrix_symbol = matrix_data.get(
+                        'MATRIX-SYMBOL',
+                        None
+                    )
+                elif isinstance(matrix_data, list):
+                    # set
+                    matrix_symbol = [item for item in matrix_data]
+                else:
+                    logger.warning(
+                        f"Matrix data format is not recognized for {file_name}.")
+                    raise Exception(
+                        f"Table data is None for {file_name}."
+                    )
+
+                # check
+                if matrix_symbol is None:
+                    raise Exception(
+                        f"Table data is None for {file_name}.")
+
+                # SECTION: values
+                if values and isinstance(values, list):
+                    # # size of matrix symbols
+                    # component_idx_len = len(values) - 2
+
+                    # # ! No., Name, Formula are necessary for matrix data
+                    # header_ = ['None', 'None', 'None']
+                    # component_idx = [str(i) for i in range(
+                    #     1, component_idx_len+1)]*matrix_symbol_len
+
+                    # # updated header
+                    # header_ = header_ + component_idx
+
+                    # # updated values
+                    # values_ = [header_, *values]
+                    # NOTE: check columns contains Mixture
+                    # >> check columns
+                    if not columns:
+                        logger.warning(
+                            f"Columns are not defined for {file_name}.")
+                        raise Exception(
+                            f"Table data is None for {file_name}."
+                        )
+
+                    # check if any column is mixture
+                    if any(col.lower() == 'mixture' for col in columns):
+                        # loop through values
+                        for i in range(len(values)):
+                            # mixture name
+                            mixture_name = values[i][1]
+
+                            # split mixture name
+                            mixture_name = mixture_name.split('|')
+                            # check
+                            if len(mixture_name) != 2:
+                                raise Exception(
+                                    f"Table data is None for {file_name}.")
+                            # strip keys
+                            mixture_name = [i.strip()
+                                            for i in mixture_name]
+                            # std key format
+                            mixture_name = f"{mixture_name[0]} | {mixture_name[1]}"
+                            # update values
+                            values[i][1] = mixture_name
+
+                    values_ = [*values]
+
+                    # NOTE: add to file data
+                    file_data = []
+                    # ! add to dataframe header
+                    # file_data.append(columns)
+                    file_data.append(symbol)
+                    file_data.append(unit)
+                    file_data.extend(values_)
+
+            elif tb_type == TableTypes.EQUATIONS.value:
+                # ! equations
+
+                # check
+                if values is None:
+                    raise Exception(
+                        f"Table data is None for {file_name}.")
+
+                # NOTE: make file data
+                file_data = []
+                # ! add to dataframe header
+                # file_data.append(columns)
+                file_data.append(symbol)
+                file_data.append(unit)
+                file_data.extend(values)
+
+        # SECTION
+        # check
+        if file_path is not None:
+            # create dataframe
+            return pd.read_csv(file_path)
+        elif file_data is not None and file_item_data is None:
+            # create dataframe
+            return pd.DataFrame(file_data, columns=columns)
+        elif file_item_data is not None and file_data is None:
+            # create dataframe
+            # return df_dict
+            raise Exception(
+                f"Table data is None for {file_name}.")
+        else:
+            raise Exception(f"{file_name} does not exist.")
 
     # NOTE: search tables
     def search_tables(
@@ -488,59 +634,70 @@ class TableReference(ManageData):
                 df_info = df.iloc[:2, :]
 
                 # SECTION: filter
-                if (
-                    isinstance(column_name, str) and
-                    query is False
-                ):  # ! search by column name
-                    # NOTE: check query
-                    # create filter
-                    # check lookup
-                    if not isinstance(lookup, str):
-                        raise ValueError(
-                            f"Lookup value must be a string for {databook_id} and {table_id}."
-                        )
+                # NOTE: lookup index (name, formula, name/formula + state)
+                df_filter = self._search_table_index(
+                    databook_id=databook_id,
+                    table_id=table_id,
+                    df=df,
+                    column_name=column_name,
+                    lookup=lookup,
+                    query=query
+                )
 
-                    df_filter = df[
-                        df[column_name].str.lower() == lookup.lower()
-                    ]
-                elif (
-                    isinstance(column_name, str) and
-                    query is True
-                ):  # ! search by query
-                    # NOTE: check query
-                    # create filter
-                    df_filter = df.query(column_name, engine='python')
-
-                elif (
-                    isinstance(column_name, list) and
-                    isinstance(lookup, list) and
-                    query is False
-                ):  # ! search by list of column names
-                    # NOTE: check column names
-                    if len(column_name) != len(lookup):
-                        raise ValueError(
-                            f"Column name and lookup must have the same length for {databook_id} and {table_id}."
-                        )
+                if df_filter is None:
+                    if (
+                        isinstance(column_name, str) and
+                        query is False
+                    ):  # ! search by column name
+                        # NOTE: check query
+                        # create filter
+                        # check lookup
+                        if not isinstance(lookup, str):
+                            raise ValueError(
+                                f"Lookup value must be a string for {databook_id} and {table_id}."
+                            )
 
-                    # SECTION: use query
-                    # use query
-                    _query = []
+                        df_filter = df[
+                            df[column_name].str.lower() == lookup.lower()
+                        ]
+                    elif (
+                        isinstance(column_name, str) and
+                        query is True
+                    ):  # ! search by query
+                        # NOTE: check query
+                        # create filter
+                        df_filter = df.query(column_name, engine='python')
+
+                    elif (
+                        isinstance(column_name, list) and
+                        isinstance(lookup, list) and
+                        query is False
+                    ):  # ! search by list of column names
+                        # NOTE: check column names
+                        if len(column_name) != len(lookup):
+                            raise ValueError(
+                                f"Column name and lookup must have the same length for {databook_id} and {table_id}."
+                            )
 
-                    # iterate through column names
-                    for i in range(len(column_name)):
-                        _query.append(
-                            f'{column_name[i]}.str.lower() == "{str(lookup[i]).lower()}"'
-                        )
+                        # SECTION: use query
+                        # use query
+                        _query = []
 
-                    # make query
-                    _query_set = ' and '.join(_query)
+                        # iterate through column names
+                        for i in range(len(column_name)):
+                            _query.append(
+                                f'{column_name[i]}.str.lower() == "{str(lookup[i]).lower()}"'
+                            )
 
-                    # NOTE: query
-                    df_filter = df.query(_query_set, engine='python')
-                else:
-                    raise ValueError(
-                        f"Column name and lookup formats are not valid for {databook_id} and {table_id}."
-                    )
+                        # make query
+                        _query_set = ' and '.join(_query)
+
+                        # NOTE: query
+                        df_filter = df.query(_query_set, engine='python')
+                    else:
+                        raise ValueError(
+                            f"Column name and lookup formats are not valid for {databook_id} and {table_id}."
+                        )
 
                 # SECTION: combine dfs
                 result = pd.concat([df_info, df_filter])
@@ -556,6 +713,66 @@ class TableReference(ManageData):
         except Exception as e:
             raise Exception(f"Searching table error {e}")
 
+    def _search_table_index(
+        self,
+        databook_id: int,
+        table_id: int,
+        df: pd.DataFrame,
+        column_name: str | list,
+        lookup: str | list[str],
+        query: bool
+    ) -> Optional[pd.DataFrame]:
+        """
+        Filter table rows through the table lookup index.
+
+        Parameters
+        ----------
+        databook_id : int
+            databook id
+        table_id : int
+            table id
+        df : pandas DataFrame
+            loaded table
+        column_name : str | list
+            column name
+        lookup : str | list[str]
+            value to look up for
+        query : bool
+            query method flag
+
+        Returns
+        -------
+        result : pandas DataFrame | None
+            filtered rows, None if the search is not supported by the index
+        """
+        # NOTE: check search mode
+        if query is True:
+            return None
+
+        if isinstance(column_name, str) and isinstance(lookup, str):
+            columns = (column_name,)
+            key = (lookup.lower(),)
+        elif (
+            isinstance(column_name, list) and
+            isinstance(lookup, list) and
+            len(column_name) == len(lookup) and
+            len(column_name) > 0 and
+            all(isinstance(col, str) for col in column_name)
+        ):
+            columns = tuple(column_name)
+            key = tuple(str(item).lower() for item in lookup)
+        else:
+            return None
+
+        # NOTE: index
+        index = self.table_index(databook_id, table_id, columns)
+
+        # check
+        if index is None:
+            return None
+
+        return df.iloc[index.get(key, [])]
+
     # NOTE: search matrix tables
     def search_matrix_table(
         self,
@@ -872,7 +1089,9 @@ class TableReference(ManageData):
         self,
         search_terms: list[str],
         search_mode: str,
-        column_names: list[str] = ['Name', 'Formula']
+        column_names: list[str] = ['Name', 'Formula'],
+        top_k: int = 10,
+        min_score: float = 0.3
     ) -> list[dict]:
         """
         Search a component in all databooks
@@ -883,9 +1102,55 @@ class TableReference(ManageData):
             the list of column names (default: ['Name', 'Formula'])
         search_terms : list[str]
             search terms for instance a component name or formula
+        search_mode : str
+            'exact', 'similar' (substring) or 'fuzzy' (trigram similarity)
+        top_k : int, optional
+            maximum number of matched values in fuzzy mode (default: 10)
+        min_score : float, optional
+            minimum similarity score in fuzzy mode (default: 0.3)
+
+        Notes
+        -----
+        Searches over the `Name`, `Formula`, `State` and `Synonyms` columns use
+        the component index (see `component_index`), which also covers custom
+        references.
 
+        In fuzzy mode, synonyms are always searched and the records are ranked
+        by `score`, each with the `matched-value` and `matched-column`.
         """
         try:
+            # NOTE: fuzzy search
+            if search_mode == 'fuzzy':
+                return self.__fuzzy_search_component(
+                    search_terms,
+                    column_names,
+                    top_k,
+                    min_score
+                )
+
+            # NOTE: component index
+            if all(col in ComponentIndex.columns for col in column_names):
+                # capitalize the search terms
+                search_terms_ = [term.upper() for term in search_terms]
+
+                return [
+                    {
+                        'search-mode': search_mode,
+                        'search-terms': ', '.join(search_terms_),
+                        'databook-id': tb['databook_id'],
+                        'databook-name': tb['databook'],
+                        'table-id': tb['table_id'],
+                        'table-name': tb['table'],
+                        'table-description': tb['description'],
+                        'data-type': tb['data_type'],
+                    }
+                    for tb in self.component_index().search(
+                        search_terms,
+                        search_mode,
+                        column_names
+                    )
+                ]
+
             # data path
             directory = self.path
 
@@ -1010,6 +1275,63 @@ class TableReference(ManageData):
         except Exception as e:
             raise Exception(f'Searching component error {e}')
 
+    # NOTE: component index
+    def component_index(self) -> ComponentIndex:
+        """
+        Get the component index of all databooks (local and custom references).
+
+        Returns
+        -------
+        ComponentIndex
+            component index, built once per set of sources and persisted in
+            the cache directory
+        """
+        return ComponentIndex.load(self)
+
+    # NOTE: fuzzy component search
+    def __fuzzy_search_component(
+        self,
+        search_terms: list[str],
+        column_names: list[str],
+        top_k: int,
+        min_score: float
+    ) -> list[dict]:
+        """Rank the component records by trigram similarity."""
+        # NOTE: searched columns
+        columns = [
+            col for col in column_names if col in ComponentIndex.fuzzy_columns
+        ]
+        if 'Synonyms' not in columns:
+            columns.append('Synonyms')
+
+        # capitalize the search terms
+        search_terms_ = [term.upper() for term in search_terms]
+
+        # res
+        results = []
+        for match in self.component_index().fuzzy_search(
+            search_terms,
+            column_names=columns,
+            top_k=top_k,
+            min_score=min_score
+        ):
+            for tb in match['tables']:
+                results.append({
+                    'search-mode': 'fuzzy',
+                    'search-terms': ', '.join(search_terms_),
+                    'databook-id': tb['databook_id'],
+                    'databook-name': tb['databook'],
+                    'table-id': tb['table_id'],
+                    'table-name': tb['table'],
+                    'table-description': tb['description'],
+                    'data-type': tb['data_type'],
+                    'score': match['score'],
+                    'matched-value': match['value'],
+                    'matched-column': match['column'],
+                })
+
+        return results
+
     # NOTE: list all components
     def list_all_components(
         self,
@@ -1031,6 +1353,24 @@ class TableReference(ManageData):
             # component info
             components_info = []
 
+            # NOTE: component index
+            if column_name in ComponentIndex.columns:
+                for tb, component in self.component_index().components(column_name):
+                    # add to list
+                    components.extend(component)
+
+                    # component info
+                    components_info.append({
+                        "component": component,
+                        "databook": tb['databook'],
+                        "database_id": tb['databook_id'],
+                        "table_name": tb['table'],
+                        "table_id": tb['table_id'],
+                        "data_type": tb['data_type']
+                    })
+
+                return components, components_info
+
             # data path
             directory = self.path
 
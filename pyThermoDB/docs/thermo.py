@@ -4065,7 +4065,9 @@ class ThermoDB(ManageData):
         self,
         search_terms: list[str],
         search_mode: str,
-        column_names: list[str] = ['Name', 'Formula']
+        column_names: list[str] = ['Name', 'Formula'],
+        top_k: int = 10,
+        min_score: float = 0.3
     ) -> list[dict[str, str]]:
         """
         Search a term through all databook for instance a component name
@@ -4074,10 +4076,14 @@ class ThermoDB(ManageData):
         ----------
         search_terms : list[str]
             search terms as list, e.g. ['Carbon dioxide','CO2']
-        search_mode : Literal['exact', 'similar']
-            search mode, 'exact' or 'similar'
+        search_mode : Literal['exact', 'similar', 'fuzzy']
+            search mode, 'exact', 'similar' or 'fuzzy'
         column_names : list[str]
             column names to search, e.g. ['Name', 'Formula']
+        top_k : int
+            maximum number of matched values in fuzzy mode
+        min_score : float
+            minimum similarity score in fuzzy mode
 
         Returns
         -------
@@ -4091,7 +4097,12 @@ class ThermoDB(ManageData):
 
             # search
             res = TableReferenceC.search_component(
-                search_terms, search_mode, column_names=column_names)
+                search_terms,
+                search_mode,
+                column_names=column_names,
+                top_k=top_k,
+                min_score=min_score
+            )
 
             return res
 
@@ -4106,8 +4117,10 @@ class ThermoDB(ManageData):
                 'list', 'dataframe', 'json', 'dict'
             ] = 'dict',
             search_mode: Literal[
-                'exact', 'similar'
-            ] = 'exact'
+                'exact', 'similar', 'fuzzy'
+            ] = 'exact',
+            top_k: int = 10,
+            min_score: float = 0.3
     ) -> ComponentSearch:
         """
         Search a term through all databook for instance a component name
@@ -4120,20 +4133,32 @@ class ThermoDB(ManageData):
             column names to search, e.g. ['Name', 'Formula']
         res_format : Literal['list', 'dataframe', 'json', 'dict']
             result format, 'list', 'dataframe', 'json' or 'dict'
-        search_mode : Literal['exact', 'similar']
-            search mode, 'exact' or 'similar'
+        search_mode : Literal['exact', 'similar', 'fuzzy']
+            search mode, 'exact', 'similar' (substring) or 'fuzzy' (typo
+            tolerant, ranked by trigram similarity of names, formulas and
+            synonyms)
+        top_k : int
+            maximum number of matched values in fuzzy mode (default: 10)
+        min_score : float
+            minimum similarity score in [0, 1] in fuzzy mode (default: 0.3)
 
         Returns
         -------
         ComponentSearchResult
             search results
+
+        Examples
+        --------
+        >>> tdb.search_databook(['methanl'], search_mode='fuzzy', top_k=3)
         """
         try:
             # call async function
             res = self.__search_databook(
                 search_terms,
                 search_mode,
-                column_names
+                column_names,
+                top_k,
+                min_score
             )
 
             # check
@@ -3,8 +3,14 @@ import logging
 import os
 import yaml
 import re
-import ast
-from typing import Literal, List
+from typing import Iterable, Literal, List
+# local
+from .lazyref import outline_references
+from .markdownref import (
+    MarkdownReferenceError,
+    parse_markdown_reference,
+    parse_markdown_table
+)
 
 # NOTE: logger
 logger = logging.getLogger(__name__)
@@ -209,10 +215,15 @@ class CustomRef:
             logger.error(f"updating reference failed! {e}")
             return False
 
-    def load_ref(self) -> dict:
+    def load_ref(self, lazy: bool = False) -> dict:
         '''
         Load reference
 
+        Parameters
+        ----------
+        lazy : bool, optional
+            if True, yml tables are parsed on first access (default is False)
+
         Returns
         -------
         ref : dict
@@ -228,7 +239,7 @@ class CustomRef:
                 for i in range(0, len(self.yml_files)):
                     with open(self.yml_files[i], 'r') as f:
                         # load data
-                        temp_data = yaml.load(f, Loader=yaml.FullLoader)
+                        temp_data = self.load_yml(f.read(), lazy=lazy)
                         # check
                         if temp_data is None:
                             raise Exception(
@@ -278,10 +289,7 @@ class CustomRef:
                         if content_format == 'yml':
                             # ! yml
                             # load data
-                            temp_data = yaml.load(
-                                content,
-                                Loader=yaml.FullLoader
-                            )
+                            temp_data = self.load_yml(content, lazy=lazy)
 
                             # check
                             if temp_data is None:
@@ -301,9 +309,36 @@ class CustomRef:
 
             # res
             return data
+        except MarkdownReferenceError:
+            raise
         except Exception as e:
             raise Exception(f"loading reference failed! {e}")
 
+    @staticmethod
+    def load_yml(content: str, lazy: bool = False) -> dict:
+        '''
+        Load a yml reference
+
+        Parameters
+        ----------
+        content : str
+            yml content
+        lazy : bool, optional
+            if True, tables are parsed on first access (default is False)
+
+        Returns
+        -------
+        ref : dict
+            reference
+        '''
+        # NOTE: outline (tables parsed on first access)
+        if lazy:
+            reference = outline_references(content)
+            if reference is not None:
+                return reference
+
+        return yaml.load(content, Loader=yaml.FullLoader)
+
     def load_symbols(self) -> dict:
         '''
         Load symbols
@@ -336,276 +371,49 @@ class CustomRef:
         except Exception as e:
             raise Exception(f"loading symbols failed! {e}")
 
-    def parse_markdown(self, content: str) -> dict:
+    def parse_markdown(self, content: str | Iterable[str]) -> dict:
         """
         Parse a structured markdown content and extract information.
 
         Parameters
         ----------
-        content : str
-            The markdown content to parse.
+        content : str | Iterable[str]
+            The markdown content to parse (or its lines, e.g. an open file).
 
         Returns
         -------
         dict
             Dictionary containing all the extracted information.
+
+        Notes
+        -----
+        The content is read in a single pass, tables are parsed as soon as
+        they end (see `iter_markdown_reference`) and errors report the line
+        number.
         """
         try:
-            # Initialize the result dictionary
-            databook_data = {}
-            result = {}
-
-            # databook name
-            databook_name_match = re.findall(r'## (.*?)(?:\n|$)', content)
-            if databook_name_match:
-                databook_name_ = databook_name_match[0].strip()
-                databook_data[databook_name_] = {}
-
-            # Extract DATABOOK-ID
-            databook_match = re.search(r'DATABOOK-ID: (.*?)(?:\n|$)', content)
-            if databook_match:
-                result['DATABOOK-ID'] = databook_match.group(1).strip()
-
-            # Find all tables through ### table-name
-            table_matches = re.findall(r'### (.*?)(?:\n|$)', content)
-            if table_matches:
-                result['TABLES'] = {}
-                for i, table_name in enumerate(table_matches):
-                    # Determine the start and end of the table content
-                    start_pattern = rf'### {table_name}.*?\n'
-                    if i + 1 < len(table_matches):
-                        end_pattern = rf'### {table_matches[i + 1]}'
-                    else:
-                        end_pattern = r'\Z'
-
-                    table_content_match = re.search(
-                        rf'{start_pattern}(.*?)(?={end_pattern})',
-                        content,
-                        re.DOTALL
-                    )
-
-                    if table_content_match:
-                        table_data = self.parse_markdown_table(
-                            table_content_match.group(0))
-                        # result['TABLES'].append({table_name: table_data})
-                        result['TABLES'][table_name] = table_data
-
-            # update
-            databook_data[databook_name_].update(result)
-            # reference
-            reference = {'REFERENCES': databook_data}
-
-            return reference
+            return parse_markdown_reference(content)
+        except MarkdownReferenceError:
+            # ! typed error with the line number
+            raise
         except Exception as e:
             raise Exception(f"Parsing markdown failed! {e}")
 
-    def parse_markdown_table(self, content: str):
+    def parse_markdown_table(self, content: str) -> dict:
         """
         Parse a structured markdown content and extract information.
 
         Parameters
         ----------
         content : str
-            The markdown content to parse.
+            The markdown content of a table to parse.
 
         Returns
         -------
         dict
             Dictionary containing all the extracted information.
         """
-        # Initialize the result dictionary
-        result = {}
-
-        # SECTION: TABLE-ID
-        table_match = re.search(r'TABLE-ID: (.*?)(?:\n|$)', content)
-        if table_match:
-            result['TABLE-ID'] = table_match.group(1).strip()
-
-        # SECTION: DESCRIPTION
-        desc_match = re.search(r'DESCRIPTION: (.*?)(?:\n|$)', content)
-        if desc_match:
-            result['DESCRIPTION'] = desc_match.group(1).strip()
-
-        # SECTION: DATA
-        data_match = re.search(r'DATA: \[(.*?)\]', content, re.DOTALL)
-        if data_match:
-            data_str = data_match.group(1).strip()
-            if data_str:
-                try:
-                    result['DATA'] = ast.literal_eval(f"[{data_str}]")
-                except Exception:
-                    result['DATA'] = data_str
-            else:
-                result['DATA'] = []
-
-        # Extract MATRIX-SYMBOL
-        matrix_match = re.search(
-            r'MATRIX-SYMBOL:\s*\n(.*?)(?:\n\w+:|$)', content, re.DOTALL
-        )
-        if matrix_match:
-            matrix_content = matrix_match.group(1).strip()
-            matrix_items = re.findall(r'- (.*?)(?:\n|$)', matrix_content)
-            result['MATRIX-SYMBOL'] = [item.strip() for item in matrix_items]
-
-        # SECTION: EQUATIONS
-        equations = {}
-        eq_pattern = r'EQUATIONS:\s*\n(.*?)(?:\n\w+:|$)'
-        eq_section = re.search(eq_pattern, content, re.DOTALL)
-        if eq_section:
-            eq_content = eq_section.group(1)
-            eq_pattern = r'- (EQ-\d+):\s*\n(.*?)(?=\n- EQ-\d+:|\n\w+:|$)'
-            eq_blocks = re.findall(eq_pattern, eq_content, re.DOTALL)
-
-            # Debug output to verify equation blocks found
-            # print(f"Found {len(eq_blocks)} equation blocks")
-
-            for eq_id, eq_block in eq_blocks:
-                equation = {}
-
-                # Extract parts like BODY, BODY-INTEGRAL, etc.
-                parts_pattern = (
-                    r'  - (\w+(?:-\w+)*):\s*\n(.*?)(?=  - \w+(?:-\w+)*:|\Z)'
-                )
-                parts = re.findall(parts_pattern, eq_block + '  - ', re.DOTALL)
-
-                for part_name, part_content in parts:
-                    # Extract content items from the part content
-                    content_items = re.findall(
-                        r'- (.*?)(?:\n|$)', part_content)
-                    if content_items:
-                        equation[part_name] = [
-                            item.strip().rstrip('-').strip()
-                            for item in content_items
-                        ]
-                    else:
-                        # Ensure empty lists for missing content
-                        equation[part_name] = 'None'
-
-                equations[eq_id] = equation
-
-            result['EQUATIONS'] = equations
-
-        # SECTION: STRUCTURE
-        structure = {}
-        struct_pattern = r'STRUCTURE:\s*\n(.*?)(?:\n\w+:|$)'
-        struct_section = re.search(struct_pattern, content, re.DOTALL)
-        if struct_section:
-            struct_content = struct_section.group(1)
-
-            # Extract parts like COLUMNS, SYMBOL, etc.
-            struct_parts = re.findall(r'- (\w+):\s*\[(.*?)\]', struct_content)
-
-            for part_name, part_content in struct_parts:
-                try:
-                    items = [item.strip() for item in part_content.split(',')]
-                    structure[part_name] = items
-                except Exception:
-                    structure[part_name] = part_content
-
-            result['STRUCTURE'] = structure
-
-        # SECTION: VALUES
-        values = []
-        values_pattern = r'VALUES:\s*\n(.*?)(?:\n\w+:|$)'
-        values_section = re.search(values_pattern, content, re.DOTALL)
-        if values_section:
-            values_content = values_section.group(1)
-            value_rows = re.findall(r'- \[(.*?)\]', values_content)
-
-            for row in value_rows:
-                # NOTE: replace double quotes with single quotes
-                # row = row.replace('"', "'")
-                # NOTE: remove quotes from left and right
-                row = row.strip().strip('"')
-                # NOTE: remove quotes from left and right
-                row = row.strip().strip("'")
-
-                try:
-                    # Use a regex to split on commas but not on commas inside single or double quotes
-                    items = []
-                    # Split by commas that are not within single or
-                    # double quotes
-                    # pattern = r',\s*(?=(?:[^\'"]*(\'|")[^\'"]*\1)*[^\']*$)'
-                    pattern = r"""
-                        (                             # Capture group
-                            "(?:[^"\\]|\\.)*"         # Double-quoted string, allowing escaped quotes
-                            |                         # OR
-                            '(?:[^'\\]|\\.)*'         # Single-quoted string, allowing escaped quotes
-                            |                         # OR
-                            [^,\[\]\s]+               # Unquoted tokens (numbers, identifiers)
-                        )
-                    """
-
-                    # split the row
-                    # parts = re.split(pattern, row)
-                    parts = re.findall(pattern, row, re.VERBOSE)
-
-                    # loop through the parts
-                    for part in parts:
-                        # remove quotes from left and right
-                        part = part.strip().strip('"').strip("'")
-                        # check if part is empty
-                        if part == '':
-                            continue
-
-                        items.append(part)
-                    values.append(items)
-                except Exception:
-                    values.append(row)
-
-            result['VALUES'] = values
-
-        # SECTION: ITEMS
-        items_match = re.search(
-            r'ITEMS:\s*\n(.*?)(?:\n\w+:|$)', content, re.DOTALL
-        )
-        if items_match:
-            items_content = items_match.group(1).strip()
-            items = []
-            # Updated regex to capture all elements starting with - item:
-            item_pattern = (
-                # Match any item names starting with "- "
-                r'- ([\|\w\d\s]+):\s*\n'
-                # Match content containing list elements with square brackets
-                r'((?:\s*- \[.*?\]\s*\n)+)'
-            )
-            item_blocks = re.findall(
-                item_pattern,
-                items_content,
-                re.DOTALL
-            )
-
-            for item_name, item_content in item_blocks:
-                item_values = re.findall(r'- \[(.*?)\]', item_content)
-                _item_res = [
-                    [value.strip() for value in row.split(',')]
-                    for row in item_values
-                ]
-
-                # item name
-                item_name = str(item_name).strip()
-
-                # append
-                items.append({
-                    item_name: _item_res
-                })
-
-            result['ITEMS'] = items
-
-        # SECTION: EXTERNAL-REFERENCES
-        external_references = []
-        ext_ref_pattern = r'EXTERNAL-REFERENCES:\s*\n(.*?)(?:\n\w+:|$)'
-        ext_ref_section = re.search(ext_ref_pattern, content, re.DOTALL)
-        if ext_ref_section:
-            ext_ref_content = ext_ref_section.group(1)
-            external_references = re.findall(
-                r'- (.*?)(?:\n|$)', ext_ref_content)
-
-            result['EXTERNAL-REFERENCES'] = [
-                ref.strip() for ref in external_references
-            ]
-
-        return result
+        return parse_markdown_table(content)
 
     def content_manager(
             self,
@@ -0,0 +1,350 @@
+# import packages/modules
+import logging
+import re
+import threading
+from functools import partial
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Tuple
+)
+import yaml
+
+# NOTE: logger
+logger = logging.getLogger(__name__)
+
+# NOTE: table fields read from the outline (no table parsing)
+OUTLINE_FIELDS = ('TABLE-ID', 'DESCRIPTION')
+
+# NOTE: key line, `key:` or `key: value`
+_KEY_LINE = re.compile(
+    r'''^('[^']*'|"[^"]*"|[^\s#'"\-\[\]{}?][^#]*?)\s*:(?:\s+(.*))?$'''
+)
+# NOTE: anchors/aliases may cross tables, these sources are parsed at once
+_ANCHOR = re.compile(
+    r'(?:^|[\s\[{,])[&*][A-Za-z_][\w\-]*(?=[\s,\]}]|$)', re.MULTILINE
+)
+
+# ! lazy items may be shared across threads (process-wide reference cache)
+_lock = threading.RLock()
+
+
+class LazyDict(dict):
+    '''
+    Dict completed by a loader on first access.
+
+    The cheap fields are set up front; a key listed in `keys` but not yet
+    set, iterating, comparing or copying the dict runs the loader once and
+    the dict then holds the loaded items (in the loaded order).
+    '''
+    __slots__ = ('_keys', '_loader', 'source')
+
+    def __init__(
+        self,
+        fields: Dict[str, Any],
+        keys: List[Any],
+        loader: Callable[[], Dict[str, Any]],
+        source: Any = None
+    ):
+        '''
+        Initialize a lazy dict.
+
+        Parameters
+        ----------
+        fields : dict
+            items available without loading
+        keys : list
+            keys of the loaded dict
+        loader : Callable
+            function returning the loaded dict
+        source : Any, optional
+            source the loader reads (e.g. yaml text of a table)
+        '''
+        super().__init__(fields)
+        self._keys = keys
+        self._loader = loader
+        self.source = source
+
+    @property
+    def pending(self) -> bool:
+        '''Whether the dict is not loaded yet.'''
+        return self._loader is not None
+
+    def fields(self) -> Dict[Any, Any]:
+        '''Items set so far, as a plain dict (without loading).'''
+        # ! dict.copy goes through the overridden keys() of subclasses
+        return dict(dict.items(self))
+
+    def pending_keys(self) -> List[Any]:
+        '''Keys of the dict, without loading it.'''
+        return list(self._keys) if self.pending else list(dict.keys(self))
+
+    def load(self) -> 'LazyDict':
+        '''Run the loader (once).'''
+        if self._loader is not None:
+            with _lock:
+                if self._loader is not None:
+                    loaded = self._loader()
+                    dict.clear(self)
+                    dict.update(self, loaded)
+                    self._loader = None
+                    self.source = None
+        return self
+
+    def _missing(self, key: Any) -> bool:
+        # ! load only for keys set by the loader
+        return (
+            self._loader is not None and
+            not dict.__contains__(self, key) and
+            key in self._keys
+        )
+
+    def __getitem__(self, key):
+        if self._missing(key):
+            self.load()
+        return dict.__getitem__(self, key)
+
+    def get(self, key, default=None):
+        if self._missing(key):
+            self.load()
+        return dict.get(self, key, default)
+
+    def __contains__(self, key) -> bool:
+        if self._loader is not None:
+            return key in self._keys
+        return dict.__contains__(self, key)
+
+    def __eq__(self, other) -> bool:
+        # ! dict comparison reads the items of both dicts directly
+        if isinstance(other, LazyDict):
+            other.load()
+        return dict.__eq__(self.load(), other)
+
+    def __ne__(self, other) -> bool:
+        return not self == other
+
+    __hash__ = None  # type: ignore
+
+    def __reduce__(self):
+        # ! pickled/copied as a plain dict
+        return (dict, (self.load().fields(),))
+
+
+def _loading(name: str):
+    method = getattr(dict, name)
+
+    def wrapper(self, *args, **kwargs):
+        self.load()
+        return method(self, *args, **kwargs)
+
+    wrapper.__name__ = name
+    wrapper.__doc__ = method.__doc__
+    return wrapper
+
+
+for _name in (
+    '__iter__', '__len__', '__repr__', '__or__',
+    '__setitem__', '__delitem__', 'keys', 'items', 'values', 'copy',
+    'pop', 'popitem', 'setdefault', 'update', 'clear',
+):
+    setattr(LazyDict, _name, _loading(_name))
+
+
+def load_yaml_table(source: str) -> Dict[str, Any]:
+    '''
+    Parse the yaml text of a single table (`name:` line and its block).
+
+    Parameters
+    ----------
+    source : str
+        yaml text of the table
+
+    Returns
+    -------
+    table : dict
+        table data
+    '''
+    data = yaml.load(source, Loader=yaml.FullLoader)
+    return next(iter(data.values()))
+
+
+def lazy_table(
+    source: str,
+    keys: List[Any],
+    fields: Dict[str, Any]
+) -> LazyDict:
+    '''
+    Table of a reference parsed on first access.
+
+    Parameters
+    ----------
+    source : str
+        yaml text of the table
+    keys : list
+        table keys (e.g. TABLE-ID, DESCRIPTION, STRUCTURE, VALUES)
+    fields : dict
+        outline fields (`OUTLINE_FIELDS`)
+
+    Returns
+    -------
+    table : LazyDict
+        lazy table
+    '''
+    return LazyDict(
+        fields,
+        keys,
+        partial(load_yaml_table, source),
+        source=source
+    )
+
+
+class _Unsupported(Exception):
+    '''Layout not handled by the outline, the source is parsed at once.'''
+
+
+def _key(line: str) -> Tuple[Any, Optional[str]]:
+    # NOTE: key (as parsed by yaml, e.g. quoted or numeric) and inline value
+    match = _KEY_LINE.match(line)
+    if match is None:
+        raise _Unsupported(line)
+    key = next(iter(
+        yaml.load(f"{match.group(1)}:", Loader=yaml.FullLoader)
+    ))
+    value = match.group(2)
+    return key, (value.strip() or None) if value is not None else None
+
+
+def _blocks(
+    lines: List[str],
+    indents: List[int],
+    start: int,
+    end: int
+) -> List[Tuple[str, int, int]]:
+    '''
+    Split lines [start, end) into the blocks of its keys, i.e. key lines at
+    the indent of the first line with the lines below them.
+    '''
+    # NOTE: first significant line
+    rows = [i for i in range(start, end) if indents[i] >= 0]
+    if not rows:
+        return []
+
+    indent = indents[rows[0]]
+    blocks: List[Tuple[str, int, int]] = []
+    for i in rows:
+        line = lines[i]
+        if indents[i] > indent:
+            continue
+        if indents[i] < indent:
+            raise _Unsupported(line)
+        # ! compact sequences belong to the previous key
+        if line[indent] == '-':
+            if not blocks:
+                raise _Unsupported(line)
+            continue
+        if blocks:
+            blocks[-1] = (blocks[-1][0], blocks[-1][1], i)
+        blocks.append((line[indent:].rstrip(), i, end))
+
+    return blocks
+
+
+def _load_block(lines: List[str], start: int, end: int) -> Dict[str, Any]:
+    return yaml.load(''.join(lines[start:end]), Loader=yaml.FullLoader)
+
+
+def outline_references(content: str) -> Optional[Dict[str, Any]]:
+    '''
+    Read a yaml reference with lazily parsed tables.
+
+    Databooks and their fields are parsed, each table is split out of the
+    text by indentation and parsed the first time one of its items (other
+    than the outline fields) is used.
+
+    Parameters
+    ----------
+    content : str
+        yaml reference content (`REFERENCES: databook: TABLES: ...`)
+
+    Returns
+    -------
+    reference : dict | None
+        reference with lazy tables, None if the layout is not handled by
+        the outline (the content is then parsed at once)
+    '''
+    try:
+        # NOTE: anchors, tags and documents markers
+        if _ANCHOR.search(content) or '!!' in content:
+            return None
+
+        lines = content.splitlines(keepends=True)
+        # indent of significant lines (-1 for blank/comment lines)
+        indents = []
+        for line in lines:
+            text = line.lstrip(' ')
+            if not text.strip() or text.startswith('#'):
+                indents.append(-1)
+            elif text.startswith('\t') or line.startswith(('---', '...')):
+                raise _Unsupported(line)
+            else:
+                indents.append(len(line) - len(text))
+
+        # SECTION: REFERENCES
+        top = _blocks(lines, indents, 0, len(lines))
+        if len(top) != 1 or indents[top[0][1]] != 0:
+            return None
+        key, value = _key(top[0][0])
+        if key != 'REFERENCES' or value is not None:
+            return None
+
+        references: Dict[str, Any] = {}
+        _, start, end = top[0]
+
+        # SECTION: databooks
+        for db_line, db_start, db_end in _blocks(lines, indents, start + 1, end):
+            databook, value = _key(db_line)
+            if value is not None:
+                raise _Unsupported(db_line)
+
+            databook_data: Dict[str, Any] = {}
+            for line, i, j in _blocks(lines, indents, db_start + 1, db_end):
+                key, value = _key(line)
+
+                # NOTE: databook fields
+                if key != 'TABLES':
+                    databook_data.update(_load_block(lines, i, j))
+                    continue
+                if value is not None:
+                    raise _Unsupported(line)
+
+                # SECTION: tables
+                tables: Dict[str, Any] = {}
+                for tb_line, tb_start, tb_end in _blocks(lines, indents, i + 1, j):
+                    table, value = _key(tb_line)
+                    if value is not None:
+                        raise _Unsupported(tb_line)
+
+                    keys, fields = [], {}
+                    table_blocks = _blocks(lines, indents, tb_start + 1, tb_end)
+                    if not table_blocks:
+                        raise _Unsupported(tb_line)
+                    for f_line, f_start, f_end in table_blocks:
+                        field, _ = _key(f_line)
+                        keys.append(field)
+                        if field in OUTLINE_FIELDS:
+                            fields.update(_load_block(lines, f_start, f_end))
+
+                    tables[table] = lazy_table(
+                        ''.join(lines[tb_start:tb_end]), keys, fields)
+
+                databook_data[key] = tables
+
+            references[databook] = databook_data
+
+        return {'REFERENCES': references}
+    except _Unsupported as e:
+        logger.debug(f"reference outline not supported: {e}")
+        return None
@@ -0,0 +1,386 @@
+# import packages/modules
+import logging
+import re
+import ast
+import gc
+from contextlib import contextmanager
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple
+)
+
+# NOTE: logger
+logger = logging.getLogger(__name__)
+
+# NOTE: line patterns
+# top-level key line, e.g. `TABLE-ID: 1`, `VALUES:`
+_KEY_LINE = re.compile(r'([A-Za-z_][\w-]*):(.*)')
+# equation header, e.g. `- EQ-1:`
+_EQ_LINE = re.compile(r'- (EQ-\d+):\s*')
+# equation part header, e.g. `  - BODY:`
+_PART_LINE = re.compile(r' {2,}- (\w+(?:-\w+)*):\s*')
+
+# NOTE: section patterns (applied once per section)
+_STRUCTURE_ITEM = re.compile(r'- (\w+):\s*\[(.*?)\]')
+_VALUES_ROW = re.compile(r'- \[(.*?)\]')
+_VALUES_ITEM = re.compile(
+    r"""
+        (                             # Capture group
+            "(?:[^"\\]|\\.)*"         # Double-quoted string, allowing escaped quotes
+            |                         # OR
+            '(?:[^'\\]|\\.)*'         # Single-quoted string, allowing escaped quotes
+            |                         # OR
+            [^,\[\]\s]+               # Unquoted tokens (numbers, identifiers)
+        )
+    """,
+    re.VERBOSE
+)
+_ITEMS_BLOCK = re.compile(
+    # Match any item names starting with "- "
+    r'- ([\|\w\d\s]+):\s*\n'
+    # Match content containing list elements with square brackets
+    r'((?:\s*- \[.*?\]\s*\n)+)',
+    re.DOTALL
+)
+
+# NOTE: table keys in output order
+TABLE_KEYS = (
+    'TABLE-ID',
+    'DESCRIPTION',
+    'DATA',
+    'MATRIX-SYMBOL',
+    'EQUATIONS',
+    'STRUCTURE',
+    'VALUES',
+    'ITEMS',
+    'EXTERNAL-REFERENCES',
+)
+
+# NOTE: keys read as other keys (as by the former regex parser)
+_KEY_ALIASES = {
+    'MATRIX-DATA': 'DATA',
+    'MATRIX-EQUATIONS': 'EQUATIONS',
+}
+
+
+class MarkdownReferenceError(ValueError):
+    '''Invalid markdown reference, the message starts with the line number.'''
+
+    def __init__(self, line: int, message: str):
+        super().__init__(f"line {line}: {message}")
+        self.line = line
+
+
+@contextmanager
+def _gc_paused() -> Iterator[None]:
+    '''Pause the cyclic garbage collector (restored on exit).'''
+    # NOTE: parsing allocates many small acyclic containers, collections
+    # walking the growing result make the parse time superlinear
+    enabled = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if enabled:
+            gc.enable()
+
+
+# SECTION: section parsers
+def _list_items(lines: List[str]) -> List[str]:
+    # NOTE: text after the first `- ` of each line
+    items = []
+    for line in lines:
+        i = line.find('- ')
+        if i >= 0:
+            items.append(line[i + 2:].strip())
+    return items
+
+
+def _parse_data(inline: str, lines: List[str]) -> Optional[Any]:
+    # NOTE: `DATA: [...]`, the list may span lines
+    if not inline.startswith(' ['):
+        return None
+    text = '\n'.join([inline[2:], *lines])
+    end = text.find(']')
+    if end < 0:
+        return None
+
+    data_str = text[:end].strip()
+    if not data_str:
+        return []
+    try:
+        return ast.literal_eval(f"[{data_str}]")
+    except Exception:
+        return data_str
+
+
+def _parse_equations(lines: List[str]) -> Dict[str, Dict[str, Any]]:
+    equations: Dict[str, Dict[str, Any]] = {}
+    equation: Optional[Dict[str, Any]] = None
+    part: Optional[List[str]] = None
+
+    for line in lines:
+        # NOTE: equation header
+        match = _EQ_LINE.fullmatch(line)
+        if match:
+            equation = equations[match.group(1)] = {}
+            part = None
+            continue
+        if equation is None:
+            continue
+
+        # NOTE: part header (BODY, BODY-INTEGRAL, ...)
+        match = _PART_LINE.fullmatch(line)
+        if match:
+            part = equation[match.group(1)] = []
+            continue
+
+        # NOTE: part item
+        if part is not None:
+            i = line.find('- ')
+            if i >= 0:
+                part.append(line[i + 2:].strip().rstrip('-').strip())
+
+    # ! parts without items
+    for equation in equations.values():
+        for name, items in equation.items():
+            if not items:
+                equation[name] = 'None'
+
+    return equations
+
+
+def _parse_structure(lines: List[str]) -> Dict[str, List[str]]:
+    return {
+        name: [item.strip() for item in items.split(',')]
+        for name, items in _STRUCTURE_ITEM.findall('\n'.join(lines))
+    }
+
+
+def _parse_values(lines: List[str]) -> List[List[str]]:
+    values = []
+    for row in _VALUES_ROW.findall('\n'.join(lines)):
+        # NOTE: remove quotes from left and right
+        row = row.strip().strip('"')
+        row = row.strip().strip("'")
+
+        items = []
+        for part in _VALUES_ITEM.findall(row):
+            # remove quotes from left and right
+            part = part.strip().strip('"').strip("'")
+            if part == '':
+                continue
+            items.append(part)
+        values.append(items)
+    return values
+
+
+def _parse_items(lines: List[str]) -> List[Dict[str, List[List[str]]]]:
+    items = []
+    for item_name, item_content in _ITEMS_BLOCK.findall('\n'.join(lines) + '\n'):
+        rows = _VALUES_ROW.findall(item_content)
+        items.append({
+            str(item_name).strip(): [
+                [value.strip() for value in row.split(',')] for row in rows
+            ]
+        })
+    return items
+
+
+def _parse_section(key: str, inline: str, lines: List[str]) -> Optional[Any]:
+    '''Parse a table section, None if the section is not set.'''
+    if key in ('TABLE-ID', 'DESCRIPTION'):
+        # ! `KEY: value`
+        return inline.strip() if inline.startswith(' ') else None
+    if key == 'DATA':
+        return _parse_data(inline, lines)
+
+    # ! block sections, `KEY:` followed by a list
+    if inline.strip():
+        return None
+    if key in ('MATRIX-SYMBOL', 'EXTERNAL-REFERENCES'):
+        return _list_items(lines)
+    if key == 'EQUATIONS':
+        return _parse_equations(lines)
+    if key == 'STRUCTURE':
+        return _parse_structure(lines)
+    if key == 'VALUES':
+        return _parse_values(lines)
+    if key == 'ITEMS':
+        return _parse_items(lines)
+    return None
+
+
+def _build_table(
+    name: str,
+    sections: List[Tuple[str, str, List[str], int]]
+) -> Dict[str, Any]:
+    table: Dict[str, Any] = {}
+    for key, inline, lines, line_no in sections:
+        # NOTE: first set section wins
+        if key in table:
+            continue
+        try:
+            value = _parse_section(key, inline, lines)
+        except Exception as e:
+            raise MarkdownReferenceError(
+                line_no, f"{key} of table '{name}' is invalid! {e}"
+            ) from e
+        if value is not None:
+            table[key] = value
+
+    return {key: table[key] for key in TABLE_KEYS if key in table}
+
+
+# SECTION: tokenizer
+def iter_markdown_reference(
+    content: str | Iterable[str]
+) -> Iterator[Tuple[str, Any, Any]]:
+    '''
+    Parse a markdown reference in a single pass.
+
+    Parameters
+    ----------
+    content : str | Iterable[str]
+        markdown content or lines (e.g. an open file)
+
+    Yields
+    ------
+    event : tuple
+        `('DATABOOK', name, None)`, `('DATABOOK-ID', value, None)` and
+        `('TABLE', name, table)` as soon as a table ends
+
+    Raises
+    ------
+    MarkdownReferenceError
+        invalid reference, with the line number
+    '''
+    lines = content.split('\n') if isinstance(content, str) else content
+
+    databook: Optional[str] = None
+    databook_id_set = False
+    # current table
+    table: Optional[str] = None
+    sections: List[Tuple[str, str, List[str], int]] = []
+    # current section lines
+    section: Optional[List[str]] = None
+
+    line_no = 0
+    for line_no, line in enumerate(lines, start=1):
+        line = line.rstrip('\n').rstrip('\r')
+
+        # NOTE: headings
+        if line.startswith('#'):
+            section = None
+            heading = line.lstrip('#')
+            level = len(line) - len(heading)
+            if not heading.startswith(' '):
+                continue
+
+            # ! a heading ends the current table
+            if level >= 2 and table is not None:
+                yield 'TABLE', table, _build_table(table, sections)
+                table = None
+
+            if level == 2:
+                # only the first databook is read
+                if databook is None:
+                    databook = heading.strip()
+                    yield 'DATABOOK', databook, None
+            elif level >= 3:
+                if databook is None:
+                    raise MarkdownReferenceError(
+                        line_no,
+                        "table heading before the databook heading (## name)!"
+                    )
+                table, sections = heading[1:], []
+            continue
+
+        # NOTE: key lines
+        match = _KEY_LINE.fullmatch(line)
+        if match:
+            key, inline = match.groups()
+            key = _KEY_ALIASES.get(key, key)
+            if key == 'DATABOOK-ID' and not databook_id_set:
+                if inline.startswith(' '):
+                    databook_id_set = True
+                    yield 'DATABOOK-ID', inline.strip(), None
+            if table is None:
+                section = None
+                continue
+            section = []
+            sections.append((key, inline, section, line_no))
+            continue
+
+        # NOTE: section lines
+        if section is not None:
+            section.append(line)
+
+    # NOTE: last table
+    if table is not None:
+        yield 'TABLE', table, _build_table(table, sections)
+
+    if databook is None:
+        raise MarkdownReferenceError(
+            line_no or 1, "databook heading (## name) not found!")
+
+
+def parse_markdown_reference(content: str | Iterable[str]) -> Dict[str, Any]:
+    '''
+    Parse a markdown reference.
+
+    Parameters
+    ----------
+    content : str | Iterable[str]
+        markdown content or lines (e.g. an open file)
+
+    Returns
+    -------
+    reference : dict
+        `{'REFERENCES': {databook: {'DATABOOK-ID': ..., 'TABLES': {...}}}}`
+    '''
+    databook = None
+    databook_data: Dict[str, Any] = {}
+    tables: Dict[str, Any] = {}
+
+    with _gc_paused():
+        for kind, name, table in iter_markdown_reference(content):
+            if kind == 'DATABOOK':
+                databook = name
+            elif kind == 'DATABOOK-ID':
+                databook_data['DATABOOK-ID'] = name
+            else:
+                tables[name] = table
+
+    if tables:
+        databook_data['TABLES'] = tables
+
+    return {'REFERENCES': {databook: databook_data}}
+
+
+def parse_markdown_table(content: str | Iterable[str]) -> Dict[str, Any]:
+    '''
+    Parse the content of a single markdown table (below its heading).
+
+    Parameters
+    ----------
+    content : str | Iterable[str]
+        table content or lines
+
+    Returns
+    -------
+    table : dict
+        table data (TABLE-ID, DESCRIPTION, EQUATIONS, STRUCTURE, VALUES, ...)
+    '''
+    lines = content.split('\n') if isinstance(content, str) else content
+    table = None
+    for kind, _, table in iter_markdown_reference(
+        ['## table', '### table', *lines]
+    ):
+        pass
+    return table or {}
@@ -1,5 +1,9 @@
 # export
 from .managedata import ManageData
+from .reference_cache import ReferenceCache, reference_cache, cache_dir
+from .table_cache import TableCache, table_cache
+from .component_index import ComponentIndex
+from .compiled_reference import CompiledReference
 from .main import (
     parse_equation_body,
     parse_equation_body_with_table_structure
@@ -7,6 +11,13 @@ from .main import (
 
 __all__ = [
     'ManageData',
+    'ReferenceCache',
+    'reference_cache',
+    'cache_dir',
+    'TableCache',
+    'table_cache',
+    'ComponentIndex',
+    'CompiledReference',
     'parse_equation_body',
     'parse_equation_body_with_table_structure'
 ]
@@ -0,0 +1,364 @@
+# import packages/modules
+import logging
+import os
+import sys
+import marshal
+import struct
+import hashlib
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Optional
+)
+# local
+from ..config import __version__
+from ..loader import CustomRef
+from ..loader.lazyref import LazyDict, lazy_table
+from .reference_cache import reference_cache, cache_dir
+
+# NOTE: logger
+logger = logging.getLogger(__name__)
+
+
+class CompiledReference:
+    '''
+    Compiled (pre-parsed) references persisted in the cache directory.
+
+    The normalized reference state (references, symbols, descriptions and
+    databook bulk with formatted equations) is stored in marshal format,
+    keyed by a hash of the source contents, so a custom reference is parsed
+    once and loaded in milliseconds afterwards. Any change of a source gives
+    a new key and the reference is parsed again. Tables not parsed yet are
+    stored as their source text and stay lazy once loaded.
+
+    Only references read from files are compiled automatically, in-memory
+    contents are compiled by `compile_reference`. The cache directory keeps
+    the `max_files` most recently used compiled references.
+    '''
+    # compiled format version
+    version = 2
+    # compiled references kept in the cache directory
+    max_files = 64
+    # lazy item marker
+    lazy_tag = 'ptdb:lazy'
+    # file header, magic | version (uint16) | source digest (sha256)
+    magic = b'PTDBREF\x00'
+    _header = struct.Struct('<H32s')
+
+    @classmethod
+    def source_digest(
+        cls,
+        custom_ref: CustomRef
+    ) -> Optional[bytes]:
+        '''
+        Hash of the reference sources (local and custom).
+
+        Parameters
+        ----------
+        custom_ref : CustomRef
+            custom reference object
+
+        Returns
+        -------
+        digest : bytes | None
+            sha256 digest, None if a source cannot be read
+        '''
+        try:
+            # config dir
+            config_path = os.path.abspath(
+                os.path.join(os.path.dirname(__file__), '..', 'config')
+            )
+
+            # ! parsing may change between releases and python versions
+            h = hashlib.sha256(
+                f"{cls.version}:{__version__}:{sys.version_info[:2]}".encode(
+                    'utf-8')
+            )
+
+            # NOTE: source files
+            files = [
+                os.path.join(config_path, 'reference.yml'),
+                os.path.join(config_path, 'symbols.yml'),
+                *custom_ref.yml_files,
+                *custom_ref.md_files,
+                *(custom_ref.symbols_files or []),
+            ]
+            for f in files:
+                with open(f, 'rb') as src:
+                    h.update(hashlib.sha256(src.read()).digest())
+
+            # NOTE: in-memory contents
+            for c in (custom_ref.contents or []):
+                h.update(reference_cache.content_key(c)[1].encode('utf-8'))
+
+            return h.digest()
+        except Exception as e:
+            # ! missing sources are reported by the loaders
+            logger.debug(f"compiled reference digest error: {e}")
+            return None
+
+    @staticmethod
+    def compiled_path(digest: bytes) -> Optional[str]:
+        '''Path of the compiled reference of the given sources.'''
+        directory = cache_dir()
+        if directory is None:
+            return None
+        return os.path.join(directory, f"reference-{digest.hex()[:32]}.ref")
+
+    @classmethod
+    def prune(cls, directory: str) -> None:
+        '''
+        Remove the least recently used compiled references beyond
+        `max_files`.
+
+        Parameters
+        ----------
+        directory : str
+            cache directory
+        '''
+        files = []
+        for entry in os.scandir(directory):
+            if entry.name.startswith('reference-') and entry.name.endswith('.ref'):
+                try:
+                    files.append((entry.stat().st_mtime_ns, entry.path))
+                except OSError:
+                    continue
+
+        # ! oldest first
+        files.sort()
+        for _, path in files[:max(len(files) - cls.max_files, 0)]:
+            try:
+                os.remove(path)
+            except OSError as e:
+                logger.debug(f"compiled reference pruning error: {e}")
+
+    @classmethod
+    def _pack(cls, item: Any) -> Any:
+        # NOTE: lazy items as (tag, fields, keys, source)
+        if isinstance(item, LazyDict):
+            if item.pending:
+                return (
+                    cls.lazy_tag, item.fields(), item.pending_keys(), item.source
+                )
+            return item.fields()
+        return item
+
+    @classmethod
+    def _is_packed(cls, item: Any) -> bool:
+        return (
+            isinstance(item, tuple) and len(item) == 4 and
+            item[0] == cls.lazy_tag
+        )
+
+    @classmethod
+    def pack_state(cls, state: Dict[str, Any]) -> Dict[str, Any]:
+        '''
+        Convert a reference state to builtin types (lazy tables and records).
+
+        Parameters
+        ----------
+        state : dict
+            reference state
+
+        Returns
+        -------
+        state : dict
+            packed reference state
+        '''
+        state = dict(state)
+
+        # NOTE: reference tables
+        reference = state.get('reference')
+        if isinstance(reference, dict) and 'REFERENCES' in reference:
+            state['reference'] = {
+                **reference,
+                'REFERENCES': {
+                    db: {
+                        **db_data,
+                        'TABLES': {
+                            tb: cls._pack(tb_data)
+                            for tb, tb_data in db_data['TABLES'].items()
+                        }
+                    } if isinstance(db_data, dict) and 'TABLES' in db_data
+                    else db_data
+                    for db, db_data in reference['REFERENCES'].items()
+                }
+            }
+
+        # NOTE: databook bulk records
+        if 'databook_bulk' in state:
+            state['databook_bulk'] = {
+                db: [cls._pack(tb) for tb in tables]
+                for db, tables in state['databook_bulk'].items()
+            }
+
+        return state
+
+    @classmethod
+    def unpack_state(
+        cls,
+        state: Dict[str, Any],
+        table_record: Callable[[str, LazyDict], Any]
+    ) -> Dict[str, Any]:
+        '''
+        Restore the lazy tables and records of a packed reference state.
+
+        Parameters
+        ----------
+        state : dict
+            packed reference state
+        table_record : Callable
+            function building the databook bulk record of a lazy table
+
+        Returns
+        -------
+        state : dict
+            reference state
+        '''
+        references = state.get('reference', {}).get('REFERENCES', {})
+
+        # NOTE: reference tables
+        for db_data in references.values():
+            if not isinstance(db_data, dict):
+                continue
+            tables = db_data.get('TABLES')
+            for tb, tb_data in (tables or {}).items():
+                if cls._is_packed(tb_data):
+                    _, fields, keys, source = tb_data
+                    tables[tb] = lazy_table(source, keys, fields)
+
+        # NOTE: databook bulk records
+        for db, records in state.get('databook_bulk', {}).items():
+            for i, record in enumerate(records):
+                if cls._is_packed(record):
+                    table = record[1]['table']
+                    records[i] = table_record(
+                        table, references[db]['TABLES'][table])
+
+        return state
+
+    # SECTION: persistence
+    @classmethod
+    def write(
+        cls,
+        file_path: str,
+        digest: bytes,
+        state: Dict[str, Any]
+    ) -> None:
+        '''
+        Save a compiled reference.
+
+        Parameters
+        ----------
+        file_path : str
+            file path
+        digest : bytes
+            source digest
+        state : dict
+            reference state
+        '''
+        # NOTE: serialize first, unsupported values raise before writing
+        content = marshal.dumps(cls.pack_state(state))
+
+        os.makedirs(os.path.dirname(file_path), exist_ok=True)
+        # ! write then rename, readers never see a partial file
+        tmp_path = f"{file_path}.{os.getpid()}.tmp"
+        with open(tmp_path, 'wb') as f:
+            f.write(cls.magic)
+            f.write(cls._header.pack(cls.version, digest))
+            f.write(content)
+        os.replace(tmp_path, file_path)
+
+        # NOTE: bounded cache directory
+        cls.prune(os.path.dirname(file_path))
+
+    @classmethod
+    def read(
+        cls,
+        file_path: str,
+        digest: bytes
+    ) -> Dict[str, Any]:
+        '''
+        Load a compiled reference.
+
+        Parameters
+        ----------
+        file_path : str
+            file path
+        digest : bytes
+            expected source digest
+
+        Returns
+        -------
+        state : dict
+            reference state
+        '''
+        with open(file_path, 'rb') as f:
+            content = f.read()
+
+        # NOTE: header
+        start = len(cls.magic)
+        if content[:start] != cls.magic:
+            raise ValueError(f"'{file_path}' is not a compiled reference!")
+        version, digest_ = cls._header.unpack_from(content, start)
+        if version != cls.version or digest_ != digest:
+            raise ValueError(f"'{file_path}' is outdated!")
+
+        return marshal.loads(content[start + cls._header.size:])
+
+    @classmethod
+    def load(
+        cls,
+        custom_ref: CustomRef,
+        parser: Callable[[], Dict[str, Any]],
+        table_record: Callable[[str, LazyDict], Any],
+        persist: Optional[bool] = None
+    ) -> Dict[str, Any]:
+        '''
+        Get the reference state from the compiled file, parse it on a miss.
+
+        Parameters
+        ----------
+        custom_ref : CustomRef
+            custom reference object
+        parser : Callable
+            function parsing the reference state
+        table_record : Callable
+            function building the databook bulk record of a lazy table
+        persist : bool, optional
+            save the parsed state to the cache directory (default is None,
+            only references read from files, not in-memory contents)
+
+        Returns
+        -------
+        state : dict
+            reference state
+        '''
+        # NOTE: compiled file
+        digest = cls.source_digest(custom_ref)
+        file_path = cls.compiled_path(digest) if digest is not None else None
+
+        if file_path is not None and os.path.exists(file_path):
+            try:
+                state = cls.unpack_state(
+                    cls.read(file_path, digest), table_record)
+                # ! recently used (pruning order)
+                os.utime(file_path)
+                return state
+            except Exception as e:
+                logger.debug(f"compiled reference file error: {e}")
+
+        # NOTE: parse
+        state = parser()
+
+        # save
+        if persist is None:
+            persist = not custom_ref.contents
+        if persist and file_path is not None:
+            try:
+                cls.write(file_path, digest, state)
+            except Exception as e:
+                logger.debug(f"compiled reference saving error: {e}")
+
+        return state
@@ -0,0 +1,502 @@
+# import packages/modules
+import logging
+import os
+import json
+import hashlib
+import heapq
+import re
+from typing import (
+    Any,
+    Dict,
+    List,
+    Optional,
+    Set,
+    Tuple
+)
+# local
+from .reference_cache import reference_cache, cache_dir
+
+# NOTE: logger
+logger = logging.getLogger(__name__)
+
+
+class ComponentIndex:
+    '''
+    Inverted index of components over all databook tables.
+
+    Upper-cased values of the `Name`, `Formula`, `State` and `Synonyms`
+    columns are mapped to the tables (and rows) containing them, so component
+    searches do not need to read and scan every table. A trigram index of the
+    names, formulas and synonyms is built on the first fuzzy search.
+    '''
+    # index version (persisted files)
+    version = 2
+    # indexed columns
+    columns = ('Name', 'Formula', 'State', 'Synonyms')
+    # fuzzy search columns
+    fuzzy_columns = ('Name', 'Formula', 'Synonyms')
+
+    def __init__(
+        self,
+        tables: List[Dict[str, Any]]
+    ):
+        '''
+        Initialize the component index.
+
+        Parameters
+        ----------
+        tables : list[dict]
+            table records (databook, table info and raw values of the indexed columns)
+        '''
+        self.tables = tables
+        # NOTE: postings, column -> value -> table index -> rows
+        self.postings: Dict[str, Dict[str, Dict[int, List[int]]]] = {}
+        # NOTE: display value of each (column, value)
+        self.labels: Dict[Tuple[str, str], str] = {}
+        # NOTE: trigram index (built on first fuzzy search)
+        self._grams: Optional[Dict[str, List[int]]] = None
+        self._terms: List[Tuple[str, str]] = []
+        self._term_sizes: List[int] = []
+
+        for i, tb in enumerate(tables):
+            for col, values in tb['values'].items():
+                col_postings = self.postings.setdefault(col, {})
+                for row, value in enumerate(values):
+                    key = str(value).upper()
+                    col_postings.setdefault(
+                        key, {}
+                    ).setdefault(i, []).append(row)
+                    self.labels.setdefault((col, key), str(value))
+
+    # SECTION: build
+    @classmethod
+    def from_table_reference(cls, table_ref: Any) -> 'ComponentIndex':
+        '''
+        Build the index by loading every table of a table reference.
+
+        Parameters
+        ----------
+        table_ref : TableReference
+            table reference
+
+        Returns
+        -------
+        index : ComponentIndex
+            component index
+        '''
+        tables = []
+
+        for i, db in enumerate(table_ref.databook):
+            for j, tb in enumerate(table_ref.databook_bulk[db]):
+                # NOTE: load table
+                try:
+                    df = table_ref.load_table(i + 1, j + 1)
+                except Exception as e:
+                    logger.debug(f"component index skips {tb['table']}: {e}")
+                    continue
+
+                # NOTE: indexed columns
+                columns = df.columns.tolist()
+                values = {
+                    col: df[col].tolist() for col in cls.columns if col in columns
+                }
+                if len(columns) < 2 or not values:
+                    continue
+
+                tables.append({
+                    'databook': db,
+                    'databook_id': table_ref.get_databook_id(db, res_format='int'),
+                    'table': tb['table'],
+                    'table_id': tb['table_id'],
+                    'data_type': table_ref.get_table_type(i + 1, j + 1),
+                    'description': tb['description'],
+                    'values': values,
+                })
+
+        return cls(tables)
+
+    @classmethod
+    def load(
+        cls,
+        table_ref: Any,
+        persist: bool = True
+    ) -> 'ComponentIndex':
+        '''
+        Get the component index of a table reference, built once per set of sources.
+
+        Parameters
+        ----------
+        table_ref : TableReference
+            table reference
+        persist : bool, optional
+            load/save the index from/to the cache directory (default is True)
+
+        Returns
+        -------
+        index : ComponentIndex
+            component index
+        '''
+        # NOTE: source fingerprint
+        key = cls.sources_key(table_ref)
+
+        # check
+        if key is None:
+            return cls.from_table_reference(table_ref)
+
+        def loader() -> 'ComponentIndex':
+            # file
+            file_path = cls.index_path(key) if persist else None
+
+            # NOTE: persisted index
+            if file_path is not None and os.path.exists(file_path):
+                try:
+                    return cls.read(file_path)
+                except Exception as e:
+                    logger.debug(f"component index file error: {e}")
+
+            # NOTE: build
+            index = cls.from_table_reference(table_ref)
+
+            # save
+            if file_path is not None:
+                try:
+                    index.write(file_path)
+                except Exception as e:
+                    logger.debug(f"component index saving error: {e}")
+
+            return index
+
+        return reference_cache.get(('component-index', key), loader)
+
+    @staticmethod
+    def sources_key(table_ref: Any) -> Optional[tuple]:
+        '''
+        Fingerprint of the index sources (references and csv files).
+
+        Parameters
+        ----------
+        table_ref : TableReference
+            table reference
+
+        Returns
+        -------
+        key : tuple | None
+            sources fingerprint, None if a source cannot be fingerprinted
+        '''
+        try:
+            # check
+            if table_ref.reference_key is None:
+                return None
+
+            # NOTE: csv files (local and external)
+            csv_files = sorted(
+                os.path.join(table_ref.path, f)
+                for f in os.listdir(table_ref.path) if f.endswith('.csv')
+            )
+            if table_ref.custom_ref is not None:
+                csv_files.extend(table_ref.custom_ref.csv_paths)
+
+            return (
+                table_ref.reference_key,
+                tuple(reference_cache.file_key(f) for f in csv_files)
+            )
+        except Exception as e:
+            logger.debug(f"component index key error: {e}")
+            return None
+
+    @classmethod
+    def index_path(cls, key: tuple) -> Optional[str]:
+        '''Path of the persisted index of the given sources.'''
+        directory = cache_dir()
+        if directory is None:
+            return None
+        digest = hashlib.sha256(
+            f"{cls.version}:{key!r}".encode('utf-8')
+        ).hexdigest()[:32]
+        return os.path.join(directory, f"component-index-{digest}.json")
+
+    # SECTION: persistence
+    def write(self, file_path: str) -> None:
+        '''
+        Save the index to a json file.
+
+        Parameters
+        ----------
+        file_path : str
+            file path
+        '''
+        os.makedirs(os.path.dirname(file_path), exist_ok=True)
+        # ! write then rename, readers never see a partial file
+        tmp_path = f"{file_path}.{os.getpid()}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(
+                {'version': self.version, 'tables': self.tables},
+                f,
+                default=str
+            )
+        os.replace(tmp_path, file_path)
+
+    @classmethod
+    def read(cls, file_path: str) -> 'ComponentIndex':
+        '''
+        Load the index from a json file.
+
+        Parameters
+        ----------
+        file_path : str
+            file path
+
+        Returns
+        -------
+        index : ComponentIndex
+            component index
+        '''
+        with open(file_path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+
+        # check
+        if data.get('version') != cls.version:
+            raise ValueError("component index version mismatch")
+
+        return cls(data['tables'])
+
+    # SECTION: search
+    def search(
+        self,
+        search_terms: List[str],
+        search_mode: str,
+        column_names: List[str]
+    ) -> List[Dict[str, Any]]:
+        '''
+        Find the tables containing the search terms.
+
+        Parameters
+        ----------
+        search_terms : list[str]
+            search terms, e.g. ['Carbon dioxide'] or ['Carbon dioxide', 'CO2']
+        search_mode : str
+            'exact' or 'similar' (substring)
+        column_names : list[str]
+            column names to search, e.g. ['Name', 'Formula']
+
+        Returns
+        -------
+        tables : list[dict]
+            table records containing the search terms
+        '''
+        # check
+        if search_mode not in ('exact', 'similar'):
+            raise ValueError(f"Invalid search mode: {search_mode}")
+
+        # capitalize the search terms
+        terms = [term.upper() for term in search_terms]
+
+        # NOTE: matched rows of each (column, term), table index -> rows
+        hits: Dict[Tuple[str, str], Dict[int, Set[int]]] = {}
+
+        def rows(col: str, term: str, i: int) -> Set[int]:
+            if (col, term) not in hits:
+                hits[(col, term)] = self._matches(col, term, search_mode)
+            return hits[(col, term)].get(i, set())
+
+        # NOTE: matched table indexes
+        matched: Set[int] = set()
+
+        for i, tb in enumerate(self.tables):
+            # existing columns
+            existing = [col for col in column_names if col in tb['values']]
+            # check
+            if not existing:
+                continue
+
+            # NOTE: single term, any column
+            if len(terms) == 1:
+                if any(rows(col, terms[0], i) for col in existing):
+                    matched.add(i)
+            # NOTE: one term per column
+            elif len(existing) < 2:
+                if rows(existing[0], terms[0], i):
+                    matched.add(i)
+            elif search_mode == 'similar':
+                if (
+                    rows(existing[0], terms[0], i) or
+                    rows(existing[1], terms[1], i)
+                ):
+                    matched.add(i)
+            else:
+                if rows(existing[0], terms[0], i) & rows(existing[1], terms[1], i):
+                    matched.add(i)
+
+        return [self.tables[i] for i in sorted(matched)]
+
+    def fuzzy_search(
+        self,
+        search_terms: List[str],
+        column_names: Optional[List[str]] = None,
+        top_k: int = 10,
+        min_score: float = 0.3
+    ) -> List[Dict[str, Any]]:
+        '''
+        Rank indexed values by trigram similarity to the search terms.
+
+        Parameters
+        ----------
+        search_terms : list[str]
+            search terms, e.g. ['methanl']
+        column_names : list[str], optional
+            column names to search (default is Name, Formula and Synonyms)
+        top_k : int, optional
+            maximum number of matched values (default is 10)
+        min_score : float, optional
+            minimum similarity score in [0, 1] (default is 0.3)
+
+        Returns
+        -------
+        matches : list[dict]
+            matched values ranked by score, each with `score`, `column`,
+            `value` and the records of the `tables` containing it
+
+        Notes
+        -----
+        The score is the Jaccard similarity of the word trigrams (as in
+        PostgreSQL pg_trgm), so typos and partial names still match.
+        '''
+        # check
+        if column_names is None:
+            column_names = list(self.fuzzy_columns)
+        columns = set(column_names)
+
+        # NOTE: trigram index
+        grams = self._trigram_index()
+
+        # NOTE: best score of each term id
+        scores: Dict[int, float] = {}
+        for search_term in search_terms:
+            query = self.trigrams(search_term)
+            # check
+            if not query:
+                continue
+
+            # shared trigrams
+            shared: Dict[int, int] = {}
+            for gram in query:
+                for term_id in grams.get(gram, ()):
+                    shared[term_id] = shared.get(term_id, 0) + 1
+
+            for term_id, n in shared.items():
+                # column filter
+                if self._terms[term_id][0] not in columns:
+                    continue
+                # similarity
+                score = n / (len(query) + self._term_sizes[term_id] - n)
+                if score >= min_score and score > scores.get(term_id, 0.0):
+                    scores[term_id] = score
+
+        # NOTE: top-k
+        best = heapq.nlargest(
+            top_k,
+            scores.items(),
+            key=lambda item: (item[1], -item[0])
+        )
+
+        # res
+        matches = []
+        for term_id, score in best:
+            col, key = self._terms[term_id]
+            matches.append({
+                'score': round(score, 4),
+                'column': col,
+                'value': self.labels[(col, key)],
+                'tables': [
+                    self.tables[i] for i in sorted(self.postings[col][key])
+                ],
+            })
+
+        return matches
+
+    @staticmethod
+    def trigrams(value: str) -> Set[str]:
+        '''
+        Word trigrams of a value (lower-cased, padded as in pg_trgm).
+
+        Parameters
+        ----------
+        value : str
+            value
+
+        Returns
+        -------
+        trigrams : set[str]
+            trigrams
+        '''
+        grams: Set[str] = set()
+        for word in re.findall(r'[0-9a-z]+', str(value).lower()):
+            word = f"  {word} "
+            grams.update(word[i:i + 3] for i in range(len(word) - 2))
+        return grams
+
+    def _trigram_index(self) -> Dict[str, List[int]]:
+        '''Build the trigram -> term ids index once.'''
+        if self._grams is None:
+            grams: Dict[str, List[int]] = {}
+            terms: List[Tuple[str, str]] = []
+            sizes: List[int] = []
+            for col in self.fuzzy_columns:
+                for key in self.postings.get(col, {}):
+                    value_grams = self.trigrams(key)
+                    # check
+                    if not value_grams:
+                        continue
+                    for gram in value_grams:
+                        grams.setdefault(gram, []).append(len(terms))
+                    terms.append((col, key))
+                    sizes.append(len(value_grams))
+            # ! publish terms before the index (concurrent searches)
+            self._terms, self._term_sizes = terms, sizes
+            self._grams = grams
+        return self._grams
+
+    def components(
+        self,
+        column_name: str = 'Name'
+    ) -> List[Tuple[Dict[str, Any], List[Any]]]:
+        '''
+        List the column values of every indexed table.
+
+        Parameters
+        ----------
+        column_name : str
+            column name (default is 'Name')
+
+        Returns
+        -------
+        components : list[tuple]
+            (table record, column values) of each table containing the column
+        '''
+        return [
+            (tb, tb['values'][column_name])
+            for tb in self.tables if column_name in tb['values']
+        ]
+
+    def _matches(
+        self,
+        column: str,
+        term: str,
+        search_mode: str
+    ) -> Dict[int, Set[int]]:
+        '''Rows matching a (normalized) term in a column, by table index.'''
+        col_postings = self.postings.get(column, {})
+
+        # exact
+        if search_mode == 'exact':
+            return {
+                i: set(rows) for i, rows in col_postings.get(term, {}).items()
+            }
+
+        # similar (substring)
+        res: Dict[int, Set[int]] = {}
+        for value, tables in col_postings.items():
+            if term in value:
+                for i, rows in tables.items():
+                    res.setdefault(i, set()).update(rows)
+        return res
@@ -20,7 +20,10 @@ import re
 from ..data import TableTypes
 from ..models import DataBookTableTypes
 from ..loader import CustomRef
+from ..loader.lazyref import LazyDict
 from ..utils import is_str_number
+from .reference_cache import reference_cache
+from .compiled_reference import CompiledReference
 
 # NOTE: logger
 logger = logging.getLogger(__name__)
@@ -43,6 +46,8 @@ class ManageData():
     __symbols = {}
     # description
     __description = {}
+    # reference cache key
+    __reference_key = None
 
     def __init__(
             self,
@@ -50,6 +55,51 @@ class ManageData():
     ):
         # external reference
         self.custom_ref = custom_ref
+
+        # NOTE: parsed references are shared through the process-wide cache
+        key = self.reference_cache_key(custom_ref)
+        self.__reference_key = key
+        if key is None:
+            state = self._load_reference_state(custom_ref)
+        else:
+            state = reference_cache.get(
+                key,
+                lambda: self._load_compiled_reference_state(custom_ref)
+            )
+
+        # load reference
+        self.__reference = state['reference']
+        self.__reference_local_no = state['reference_local_no']
+
+        # symbols
+        self.__symbols = state['symbols']
+
+        # description
+        self.__description = state['descriptions']
+
+        # databook bulk
+        self.__databook_bulk = state['databook_bulk']
+
+        # databook
+        self.__databook = list(self.__databook_bulk.keys())
+
+    def _load_reference_state(
+            self,
+            custom_ref: Optional[CustomRef]
+    ) -> Dict[str, Any]:
+        '''
+        Parse the reference, symbols, descriptions and databook bulk.
+
+        Parameters
+        ----------
+        custom_ref : CustomRef | None
+            custom reference object
+
+        Returns
+        -------
+        state : dict
+            parsed reference state
+        '''
         # load reference
         self.__reference = self.load_reference(custom_ref)
 
@@ -62,13 +112,149 @@ class ManageData():
         # databook bulk
         self.__databook_bulk = self.get_databook_bulk()
 
-        # databook
-        self.__databook = list(self.__databook_bulk.keys())
+        return {
+            'reference': self.__reference,
+            'reference_local_no': self.__reference_local_no,
+            'symbols': self.__symbols,
+            'descriptions': self.__description,
+            'databook_bulk': self.__databook_bulk,
+        }
+
+    def _load_compiled_reference_state(
+            self,
+            custom_ref: Optional[CustomRef]
+    ) -> Dict[str, Any]:
+        '''
+        Load the custom reference state from its compiled file, the
+        reference is parsed (and compiled) when its sources changed.
+
+        Parameters
+        ----------
+        custom_ref : CustomRef | None
+            custom reference object
+
+        Returns
+        -------
+        state : dict
+            parsed reference state
+        '''
+        # NOTE: the local reference is fast to parse
+        if not custom_ref:
+            return self._load_reference_state(custom_ref)
+
+        return CompiledReference.load(
+            custom_ref,
+            lambda: self._load_reference_state(custom_ref),
+            self._lazy_table_record
+        )
+
+    @staticmethod
+    def compile_reference(custom_ref: CustomRef) -> str:
+        '''
+        Compile a custom reference, i.e. parse it once and save the
+        normalized reference state to the cache directory.
+
+        Parameters
+        ----------
+        custom_ref : CustomRef
+            custom reference object (initialized)
+
+        Returns
+        -------
+        file_path : str
+            compiled reference file path
+
+        Notes
+        -----
+        Compiled references are loaded automatically by `ManageData` (and so
+        `init`) as long as the sources are unchanged.
+        '''
+        # NOTE: compiled file
+        digest = CompiledReference.source_digest(custom_ref)
+        if digest is None:
+            raise Exception("Reference sources cannot be read!")
+        file_path = CompiledReference.compiled_path(digest)
+        if file_path is None:
+            raise Exception(
+                "Cache directory is disabled (`PYTHERMODB_CACHE_DIR`)!")
+
+        # NOTE: parse (or reuse the parsed state)
+        manage_data = ManageData(custom_ref=custom_ref)
+
+        # save
+        if not os.path.exists(file_path):
+            CompiledReference.write(file_path, digest, {
+                'reference': manage_data.__reference,
+                'reference_local_no': manage_data.__reference_local_no,
+                'symbols': manage_data.__symbols,
+                'descriptions': manage_data.__description,
+                'databook_bulk': manage_data.__databook_bulk,
+            })
+
+        return file_path
+
+    @staticmethod
+    def reference_cache_key(
+            custom_ref: Optional[CustomRef]
+    ) -> Optional[tuple]:
+        '''
+        Build the reference cache key from the source fingerprints.
+
+        Parameters
+        ----------
+        custom_ref : CustomRef | None
+            custom reference object
+
+        Returns
+        -------
+        key : tuple | None
+            cache key, None if a source cannot be fingerprinted
+        '''
+        try:
+            # config dir
+            config_path = os.path.abspath(
+                os.path.join(os.path.dirname(__file__), '..', 'config')
+            )
+
+            # NOTE: local reference and symbols
+            key: list = [
+                reference_cache.file_key(
+                    os.path.join(config_path, 'reference.yml')),
+                reference_cache.file_key(
+                    os.path.join(config_path, 'symbols.yml')),
+            ]
+
+            # NOTE: custom reference sources
+            if custom_ref:
+                key.append(tuple(
+                    reference_cache.file_key(f) for f in custom_ref.yml_files
+                ))
+                key.append(tuple(
+                    reference_cache.file_key(f) for f in custom_ref.md_files
+                ))
+                key.append(tuple(
+                    reference_cache.content_key(c)
+                    for c in (custom_ref.contents or [])
+                ))
+                key.append(tuple(
+                    reference_cache.file_key(f)
+                    for f in (custom_ref.symbols_files or [])
+                ))
+
+            return tuple(key)
+        except Exception as e:
+            # ! missing sources are reported by the loaders
+            logger.debug(f"reference cache key error: {e}")
+            return None
 
     @property
     def reference(self):
         return self.__reference
 
+    @property
+    def reference_key(self):
+        return self.__reference_key
+
     @property
     def reference_local_no(self):
         return self.__reference_local_no
@@ -149,7 +335,8 @@ class ManageData():
             # check custom reference
             if custom_ref:
                 # get data
-                custom_reference = custom_ref.load_ref()
+                # ! tables are parsed on first access
+                custom_reference = custom_ref.load_ref(lazy=True)
                 # merge data
                 reference['REFERENCES'].update(custom_reference)
 
@@ -494,183 +681,15 @@ class ManageData():
                         )
                         continue
 
-                    # NOTE: table data keys
-                    table_data_keys: List[str] = list(table_data.keys())
-
-                    # NOTE: description
-                    description = table_data.get('DESCRIPTION', None)
-
-                    # NOTE: table id
-                    table_id = table_data.get('TABLE-ID', -1)
-
-                    # NOTE: table values
-                    table_values = table_data.get('VALUES', None)
-
-                    # NOTE: table structure
-                    table_structure = table_data.get('STRUCTURE', None)
+                    # NOTE: lazy tables are parsed on first access
+                    if isinstance(table_data, LazyDict) and table_data.pending:
+                        record = self._lazy_table_record(table, table_data)
+                    else:
+                        record = self._table_record(table, table_data)
 
-                    # NOTE: table reference
-                    external_references = table_data.get(
-                        'EXTERNAL-REFERENCES',
-                        None
-                    )
-
-                    # SECTION: reference indicators
-                    # ? DATA,
-                    # ? EQUATIONS,
-                    # ? MATRIX-DATA OR MATRIX-SYMBOL,
-                    # ? MATRIX-EQUATIONS
-                    # ! check EQUATIONS exists
-                    if 'EQUATIONS' in table_data_keys:
-                        # eq
-                        _eq = []
-                        for _, eq_data in table_data['EQUATIONS'].items():
-                            # save
-                            _eq.append(eq_data)
-
-                        # NOTE: parse equations
-                        _eq_formatted = self.__eq_formatter(_eq)
-
-                        # save
-                        tables.append({
-                            'table_id': table_id,
-                            'table': table,
-                            'description': description,
-                            'equations': _eq_formatted,
-                            'data': None,
-                            'matrix_equations': None,
-                            'matrix_data': None,
-                            'table_type': TableTypes.EQUATIONS.value,
-                            'table_values': table_values,
-                            'table_structure': table_structure,
-                            'external_references': external_references
-                        })
-                        # reset
-                        _eq = []
-                    # ! check MATRIX-EQUATION
-                    elif 'MATRIX-EQUATIONS' in table_data_keys:
-                        # eq
-                        _eq = []
-                        for _, eq_data in table_data['MATRIX-EQUATIONS'].items():
-                            # save
-                            _eq.append(eq_data)
-
-                        # save
-                        tables.append({
-                            'table_id': table_id,
-                            'table': table,
-                            'description': description,
-                            'equations': None,
-                            'data': None,
-                            'matrix_equations': _eq,
-                            'matrix_data': None,
-                            'table_type': TableTypes.MATRIX_EQUATIONS.value,
-                            'table_values': table_values,
-                            'table_structure': table_structure,
-                            'external_references': external_references
-                        })
-                        # reset
-                        _eq = []
-                    # ! check DATA
-                    elif 'DATA' in table_data_keys:
-                        # data
-                        data = table_data.get('DATA', [])
-
-                        # REVIEW: generate table structure
-                        table_structure = data if table_structure is None else table_structure
-                        # set
-                        if isinstance(data, list):
-                            # check data
-                            if len(data) == 0:
-                                data = table_structure
-
-                        # save
-                        tables.append({
-                            'table_id': table_id,
-                            'table': table,
-                            'description': description,
-                            'equations': None,
-                            'data': data,
-                            'matrix_equations': None,
-                            'matrix_data': None,
-                            'table_type': TableTypes.DATA.value,
-                            'table_values': table_values,
-                            'table_structure': table_structure,
-                            'external_references': external_references
-                        })
-                    # ! check MATRIX-DATA
-                    elif (
-                        ('MATRIX-DATA' in table_data_keys) or
-                        ('MATRIX-SYMBOL' in table_data_keys)
-                    ):
-                        # matrix-data (data)
-                        # NOTE: matrix-data
-                        # including COLUMNS, SYMBOL, UNIT, CONVERSION, MATRIX-SYMBOL
-                        matrix_data = table_data.get('MATRIX-DATA', {})
-
-                        # NOTE: matrix-symbol
-                        matrix_symbol = table_data.get('MATRIX-SYMBOL', None)
-
-                        # embedded symbol
-                        if matrix_symbol:
-                            matrix_data['MATRIX-SYMBOL'] = matrix_symbol
-
-                        # NOTE: table items
-                        table_items = table_data.get('ITEMS', None)
-
-                        # embedded symbol
-                        if table_items:
-                            matrix_data['ITEMS'] = table_items
-
-                        # NOTE: table structure
-                        if table_structure is not None:
-                            # update
-                            for k, v in table_structure.items():
-                                # update
-                                matrix_data[k] = v
-
-                        # save
-                        tables.append({
-                            'table_id': table_id,
-                            'table': table,
-                            'description': description,
-                            'equations': None,
-                            'data': None,
-                            'matrix_equations': None,
-                            'matrix_data': matrix_data,
-                            'table_type': TableTypes.MATRIX_DATA.value,
-                            'table_values': table_values,
-                            'table_structure': table_structure,
-                            'table_items': table_items,
-                            'external_references': external_references
-                        })
-                    elif 'CONSTANTS' in table_data_keys:
-                        # constants
-                        constants = table_data.get('CONSTANTS', [])
-
-                        # REVIEW: generate table structure
-                        table_structure = constants if table_structure is None else table_structure
-                        # set
-                        if isinstance(constants, list):
-                            # check data
-                            if len(constants) == 0:
-                                constants = table_structure
-
-                        # save
-                        tables.append({
-                            'table_id': table_id,
-                            'table': table,
-                            'description': description,
-                            'equations': None,
-                            'data': None,
-                            'matrix_equations': None,
-                            'matrix_data': None,
-                            'constants': constants,
-                            'table_type': TableTypes.CONSTANTS.value,
-                            'table_values': table_values,
-                            'table_structure': table_structure,
-                            'external_references': external_references
-                        })
+                    # save
+                    if record is not None:
+                        tables.append(record)
 
                 # NOTE: save tables to databook list
                 databook_list[databook] = tables
@@ -680,6 +699,268 @@ class ManageData():
         except Exception as e:
             raise Exception(f"databook loading error! {e}")
 
+    def _table_record(
+            self,
+            table: str,
+            table_data: Dict[str, Any]
+    ) -> Optional[DataBookTableTypes]:
+        '''
+        Build the databook bulk record of a table.
+
+        Parameters
+        ----------
+        table : str
+            table name
+        table_data : dict
+            table data (DESCRIPTION, TABLE-ID, EQUATIONS, DATA, ...)
+
+        Returns
+        -------
+        record : DataBookTableTypes | None
+            table record, None if the table type is unknown
+        '''
+        # NOTE: table data keys
+        table_data_keys: List[str] = list(table_data.keys())
+
+        # NOTE: description
+        description = table_data.get('DESCRIPTION', None)
+
+        # NOTE: table id
+        table_id = table_data.get('TABLE-ID', -1)
+
+        # NOTE: table values
+        table_values = table_data.get('VALUES', None)
+
+        # NOTE: table structure
+        table_structure = table_data.get('STRUCTURE', None)
+
+        # NOTE: table reference
+        external_references = table_data.get(
+            'EXTERNAL-REFERENCES',
+            None
+        )
+
+        # SECTION: reference indicators
+        # ? DATA,
+        # ? EQUATIONS,
+        # ? MATRIX-DATA OR MATRIX-SYMBOL,
+        # ? MATRIX-EQUATIONS
+        # ! check EQUATIONS exists
+        if 'EQUATIONS' in table_data_keys:
+            # eq
+            _eq = []
+            for _, eq_data in table_data['EQUATIONS'].items():
+                # save
+                _eq.append(eq_data)
+
+            # NOTE: parse equations
+            _eq_formatted = self.__eq_formatter(_eq)
+
+            # save
+            return {
+                'table_id': table_id,
+                'table': table,
+                'description': description,
+                'equations': _eq_formatted,
+                'data': None,
+                'matrix_equations': None,
+                'matrix_data': None,
+                'table_type': TableTypes.EQUATIONS.value,
+                'table_values': table_values,
+                'table_structure': table_structure,
+                'external_references': external_references
+            }
+        # ! check MATRIX-EQUATION
+        elif 'MATRIX-EQUATIONS' in table_data_keys:
+            # eq
+            _eq = []
+            for _, eq_data in table_data['MATRIX-EQUATIONS'].items():
+                # save
+                _eq.append(eq_data)
+
+            # save
+            return {
+                'table_id': table_id,
+                'table': table,
+                'description': description,
+                'equations': None,
+                'data': None,
+                'matrix_equations': _eq,
+                'matrix_data': None,
+                'table_type': TableTypes.MATRIX_EQUATIONS.value,
+                'table_values': table_values,
+                'table_structure': table_structure,
+                'external_references': external_references
+            }
+        # ! check DATA
+        elif 'DATA' in table_data_keys:
+            # data
+            data = table_data.get('DATA', [])
+
+            # REVIEW: generate table structure
+            table_structure = data if table_structure is None else table_structure
+            # set
+            if isinstance(data, list):
+                # check data
+                if len(data) == 0:
+                    data = table_structure
+
+            # save
+            return {
+                'table_id': table_id,
+                'table': table,
+                'description': description,
+                'equations': None,
+                'data': data,
+                'matrix_equations': None,
+                'matrix_data': None,
+                'table_type': TableTypes.DATA.value,
+                'table_values': table_values,
+                'table_structure': table_structure,
+                'external_references': external_references
+            }
+        # ! check MATRIX-DATA
+        elif (
+            ('MATRIX-DATA' in table_data_keys) or
+            ('MATRIX-SYMBOL' in table_data_keys)
+        ):
+            # matrix-data (data)
+            # NOTE: matrix-data
+            # including COLUMNS, SYMBOL, UNIT, CONVERSION, MATRIX-SYMBOL
+            matrix_data = table_data.get('MATRIX-DATA', {})
+
+            # NOTE: matrix-symbol
+            matrix_symbol = table_data.get('MATRIX-SYMBOL', None)
+
+            # embedded symbol
+            if matrix_symbol:
+                matrix_data['MATRIX-SYMBOL'] = matrix_symbol
+
+            # NOTE: table items
+            table_items = table_data.get('ITEMS', None)
+
+            # embedded symbol
+            if table_items:
+                matrix_data['ITEMS'] = table_items
+
+            # NOTE: table structure
+            if table_structure is not None:
+                # update
+                for k, v in table_structure.items():
+                    # update
+                    matrix_data[k] = v
+
+            # save
+            return {
+                'table_id': table_id,
+                'table': table,
+                'description': description,
+                'equations': None,
+                'data': None,
+                'matrix_equations': None,
+                'matrix_data': matrix_data,
+                'table_type': TableTypes.MATRIX_DATA.value,
+                'table_values': table_values,
+                'table_structure': table_structure,
+                'table_items': table_items,
+                'external_references': external_references
+            }
+        elif 'CONSTANTS' in table_data_keys:
+            # constants
+            constants = table_data.get('CONSTANTS', [])
+
+            # REVIEW: generate table structure
+            table_structure = constants if table_structure is None else table_structure
+            # set
+            if isinstance(constants, list):
+                # check data
+                if len(constants) == 0:
+                    constants = table_structure
+
+            # save
+            return {
+                'table_id': table_id,
+                'table': table,
+                'description': description,
+                'equations': None,
+                'data': None,
+                'matrix_equations': None,
+                'matrix_data': None,
+                'constants': constants,
+                'table_type': TableTypes.CONSTANTS.value,
+                'table_values': table_values,
+                'table_structure': table_structure,
+                'external_references': external_references
+            }
+
+        # ! no table type
+        return None
+
+    def _lazy_table_record(
+            self,
+            table: str,
+            table_data: LazyDict
+    ) -> Optional[DataBookTableTypes]:
+        '''
+        Build the databook bulk record of a table not parsed yet, the table
+        name, id, description and type are set and the other items are
+        built on first access.
+
+        Parameters
+        ----------
+        table : str
+            table name
+        table_data : LazyDict
+            lazy table data
+
+        Returns
+        -------
+        record : DataBookTableTypes | None
+            table record, None if the table type is unknown
+        '''
+        # NOTE: table type (same order as `_table_record`)
+        table_data_keys = table_data.pending_keys()
+        if 'EQUATIONS' in table_data_keys:
+            table_type = TableTypes.EQUATIONS.value
+        elif 'MATRIX-EQUATIONS' in table_data_keys:
+            table_type = TableTypes.MATRIX_EQUATIONS.value
+        elif 'DATA' in table_data_keys:
+            table_type = TableTypes.DATA.value
+        elif (
+            ('MATRIX-DATA' in table_data_keys) or
+            ('MATRIX-SYMBOL' in table_data_keys)
+        ):
+            table_type = TableTypes.MATRIX_DATA.value
+        elif 'CONSTANTS' in table_data_keys:
+            table_type = TableTypes.CONSTANTS.value
+        else:
+            return None
+
+        # NOTE: record fields, other table types are None
+        fields: Dict[str, Any] = {
+            'table_id': table_data.get('TABLE-ID', -1),
+            'table': table,
+            'description': table_data.get('DESCRIPTION', None),
+        }
+        keys = list(fields) + ['equations', 'data',
+                               'matrix_equations', 'matrix_data']
+        for key in keys[3:]:
+            if key != table_type:
+                fields[key] = None
+        if table_type == TableTypes.CONSTANTS.value:
+            keys.append('constants')
+        keys += ['table_type', 'table_values', 'table_structure']
+        if table_type == TableTypes.MATRIX_DATA.value:
+            keys.append('table_items')
+        keys.append('external_references')
+        fields['table_type'] = table_type
+
+        return LazyDict(
+            fields,
+            keys,
+            lambda: self._table_record(table, table_data)
+        )  # type: ignore
+
     # NOTE: get databooks
     def get_databooks(self) -> tuple[list[str], pd.DataFrame, str]:
         '''
@@ -828,8 +1109,10 @@ class ManageData():
             # check table and equations
             for i, tb in enumerate(_dbs):
                 # check
+                # NOTE: table type is set without parsing lazy tables
+                table_type = tb.get('table_type', None)
                 # ! equation
-                if tb['equations'] is not None:
+                if table_type == TableTypes.EQUATIONS.value:
                     tables.append(
                         [
                             tb['table'],
@@ -838,18 +1121,18 @@ class ManageData():
                         ]
                     )
                 # ! data
-                elif tb['data'] is not None:
+                elif table_type == TableTypes.DATA.value:
                     tables.append([tb['table'], "data", f"[{i+1}]"])
                 # ! matrix-data
-                elif tb['matrix_data'] is not None:
+                elif table_type == TableTypes.MATRIX_DATA.value:
                     tables.append(
                         [tb['table'], "matrix-data", f"[{i+1}]"])
                 # ! matrix-equation
-                elif tb['matrix_equations'] is not None:
+                elif table_type == TableTypes.MATRIX_EQUATIONS.value:
                     tables.append(
                         [tb['table'], "matrix-equation", f"[{i+1}]"])
                 # ! constants
-                elif tb.get('constants', None) is not None:
+                elif table_type == TableTypes.CONSTANTS.value:
                     tables.append(
                         [tb['table'], "constants", f"[{i+1}]"])
                 else:
@@ -0,0 +1,249 @@
+# import packages/modules
+import logging
+import os
+import json
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Hashable,
+    Optional,
+    Tuple,
+    TypeVar
+)
+
+# NOTE: logger
+logger = logging.getLogger(__name__)
+
+T = TypeVar('T')
+
+
+def cache_dir() -> Optional[str]:
+    '''
+    Directory of the persisted (on-disk) caches.
+
+    Returns
+    -------
+    path : str | None
+        `PYTHERMODB_CACHE_DIR` if set (an empty value disables persistence),
+        otherwise `~/.cache/pythermodb`
+    '''
+    path = os.environ.get('PYTHERMODB_CACHE_DIR')
+    if path is None:
+        return os.path.join(os.path.expanduser('~'), '.cache', 'pythermodb')
+    return path or None
+
+
+class ReferenceCache:
+    '''
+    Process-wide LRU cache of parsed references.
+
+    Entries are keyed by source fingerprints, i.e. file path + modification
+    time + size for files and a content hash for in-memory references, so an
+    edited source is parsed again on the next access. Loaders run outside the
+    lock, concurrent misses of the same key wait for a single load.
+    '''
+
+    def __init__(self, maxsize: int = 32):
+        '''
+        Initialize the reference cache.
+
+        Parameters
+        ----------
+        maxsize : int, optional
+            maximum number of cached entries (default is 32), 0 disables caching
+        '''
+        self.maxsize = maxsize
+        # entries
+        self._entries: OrderedDict[Hashable, Any] = OrderedDict()
+        # lock
+        self._lock = threading.RLock()
+        # keys being loaded (event, loading thread)
+        self._loading: Dict[Hashable, Tuple[threading.Event, int]] = {}
+        # stats
+        self._hits = 0
+        self._misses = 0
+
+    @staticmethod
+    def file_key(path: str) -> tuple:
+        '''
+        Fingerprint of a file as (path, mtime, size).
+
+        Parameters
+        ----------
+        path : str
+            file path
+
+        Returns
+        -------
+        key : tuple
+            file fingerprint
+        '''
+        # abs path
+        path = os.path.abspath(path)
+        # stat
+        st = os.stat(path)
+        return ('file', path, st.st_mtime_ns, st.st_size)
+
+    @staticmethod
+    def content_key(content: str | dict) -> tuple:
+        '''
+        Fingerprint of an in-memory reference content (sha256).
+
+        Parameters
+        ----------
+        content : str | dict
+            reference content
+
+        Returns
+        -------
+        key : tuple
+            content fingerprint
+        '''
+        # NOTE: serialize dict content
+        if isinstance(content, dict):
+            try:
+                content = json.dumps(content, sort_keys=True, default=str)
+            except TypeError:
+                content = repr(content)
+
+        # hash
+        digest = hashlib.sha256(str(content).encode('utf-8')).hexdigest()
+        return ('content', digest)
+
+    def get(
+        self,
+        key: Hashable,
+        loader: Callable[[], T]
+    ) -> T:
+        '''
+        Get a cached entry, the loader is called on a miss.
+
+        Parameters
+        ----------
+        key : Hashable
+            entry key (built from source fingerprints)
+        loader : Callable
+            function to load the entry
+
+        Returns
+        -------
+        value : Any
+            cached or loaded entry
+        '''
+        while True:
+            with self._lock:
+                # NOTE: hit
+                if key in self._entries:
+                    self._entries.move_to_end(key)
+                    self._hits += 1
+                    return self._entries[key]
+
+                # NOTE: miss, load unless another thread is loading the key
+                loading = self._loading.get(key)
+                if loading is None or loading[1] == threading.get_ident():
+                    event = threading.Event()
+                    self._loading[key] = (event, threading.get_ident())
+                    self._misses += 1
+                    break
+
+            # ! wait, then hit (or load if the other load was not stored)
+            loading[0].wait()
+
+        # NOTE: load outside the lock
+        try:
+            value = loader()
+
+            # store
+            with self._lock:
+                if self.maxsize > 0:
+                    self._store(key, value)
+
+            return value
+        finally:
+            with self._lock:
+                if self._loading.get(key, (None,))[0] is event:
+                    del self._loading[key]
+            event.set()
+
+    def _store(self, key: Hashable, value: Any) -> None:
+        '''Store an entry and evict the least recently used ones.'''
+        self._entries[key] = value
+        # ! evict least recently used entries
+        while len(self._entries) > self.maxsize:
+            self._discard(next(iter(self._entries)))
+
+    def _discard(self, key: Hashable) -> None:
+        '''Remove an entry.'''
+        del self._entries[key]
+
+    def invalidate(self, path: Optional[str] = None) -> int:
+        '''
+        Invalidate cached entries.
+
+        Parameters
+        ----------
+        path : str, optional
+            drop only entries built from this file (default is None, drop all)
+
+        Returns
+        -------
+        removed : int
+            number of removed entries
+        '''
+        with self._lock:
+            # NOTE: drop all or entries depending on the file
+            if path is None:
+                keys = list(self._entries)
+            else:
+                path = os.path.abspath(path)
+                keys = [
+                    k for k in self._entries if self._depends_on(k, path)
+                ]
+
+            for k in keys:
+                self._discard(k)
+
+            return len(keys)
+
+    def clear(self) -> None:
+        '''Clear all entries and reset statistics.'''
+        with self._lock:
+            for k in list(self._entries):
+                self._discard(k)
+            self._hits = 0
+            self._misses = 0
+
+    def cache_info(self) -> Dict[str, int]:
+        '''
+        Get cache statistics.
+
+        Returns
+        -------
+        info : dict
+            hits, misses, size and maxsize of the cache
+        '''
+        with self._lock:
+            return {
+                'hits': self._hits,
+                'misses': self._misses,
+                'size': len(self._entries),
+                'maxsize': self.maxsize,
+            }
+
+    @classmethod
+    def _depends_on(cls, key: Any, path: str) -> bool:
+        '''Check whether a (nested) key contains the file fingerprint.'''
+        if isinstance(key, tuple):
+            # file fingerprint
+            if len(key) == 4 and key[0] == 'file':
+                return key[1] == path
+            return any(cls._depends_on(k, path) for k in key)
+        return False
+
+
+# NOTE: process-wide reference cache
+reference_cache = ReferenceCache()
@@ -0,0 +1,236 @@
+# import packages/modules
+import logging
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Hashable,
+    List,
+    Optional,
+    Tuple
+)
+import pandas as pd
+# local
+from .reference_cache import ReferenceCache
+
+# NOTE: logger
+logger = logging.getLogger(__name__)
+
+# NOTE: copy-on-write is always on from pandas 3 (the option is deprecated)
+_PANDAS_3 = int(pd.__version__.split('.')[0]) >= 3
+
+
+def _copy_on_write() -> bool:
+    '''Whether shallow copies are isolated from the cached frame.'''
+    if _PANDAS_3:
+        return True
+    # ! pandas 2.x opt-in (True, False or 'warn')
+    return pd.options.mode.copy_on_write is True
+
+
+class TableCache(ReferenceCache):
+    '''
+    Process-wide LRU cache of loaded tables (pandas DataFrames).
+
+    Entries are keyed by (databook, table, source fingerprint) and bounded by
+    both the number of entries and the memory used by the cached frames.
+    Callers always receive a copy of the cached frame, shallow under
+    copy-on-write (pandas 3, or pandas 2 with `mode.copy_on_write`) and deep
+    otherwise, so mutating the returned frame never changes the cache.
+    '''
+
+    def __init__(
+        self,
+        maxsize: int = 128,
+        max_bytes: int = 256 * 1024 * 1024
+    ):
+        '''
+        Initialize the table cache.
+
+        Parameters
+        ----------
+        maxsize : int, optional
+            maximum number of cached tables (default is 128), 0 disables caching
+        max_bytes : int, optional
+            maximum memory used by the cached tables (default is 256 MB)
+        '''
+        super().__init__(maxsize=maxsize)
+        self.max_bytes = max_bytes
+        # memory used by each entry
+        self._sizes: Dict[Hashable, int] = {}
+        self._bytes = 0
+        # lookup indexes of each entry
+        self._indexes: Dict[Hashable, Dict[Tuple[str, ...], Any]] = {}
+
+    def get(
+        self,
+        key: Hashable,
+        loader: Callable[[], pd.DataFrame]
+    ) -> pd.DataFrame:
+        '''
+        Get a copy of a cached table, the loader is called on a miss.
+
+        Parameters
+        ----------
+        key : Hashable
+            entry key (databook, table, source fingerprint)
+        loader : Callable
+            function to load the table
+
+        Returns
+        -------
+        df : pandas.DataFrame
+            copy of the cached table (see `view`)
+        '''
+        return self.view(super().get(key, loader))
+
+    def index(
+        self,
+        key: Hashable,
+        loader: Callable[[], pd.DataFrame],
+        columns: Tuple[str, ...]
+    ) -> Optional[Dict[Tuple[str, ...], List[int]]]:
+        '''
+        Get the lookup index of a cached table, built once per column set.
+
+        Parameters
+        ----------
+        key : Hashable
+            entry key (databook, table, source fingerprint)
+        loader : Callable
+            function to load the table
+        columns : tuple[str, ...]
+            indexed column names
+
+        Returns
+        -------
+        index : dict | None
+            lower-cased column values mapped to row positions, None if the
+            columns cannot be indexed
+        '''
+        # NOTE: cached table (loaded outside the lock)
+        df = super().get(key, loader)
+
+        with self._lock:
+            # NOTE: indexes of the entry
+            indexes = self._indexes.get(key)
+            if indexes is None:
+                indexes = {}
+                # ! indexes live as long as the cached table
+                if key in self._entries:
+                    self._indexes[key] = indexes
+
+            # build
+            if columns not in indexes:
+                indexes[columns] = self.build_index(df, columns)
+
+            return indexes[columns]
+
+    @staticmethod
+    def build_index(
+        df: pd.DataFrame,
+        columns: Tuple[str, ...]
+    ) -> Optional[Dict[Tuple[str, ...], List[int]]]:
+        '''
+        Build a lookup index of a table.
+
+        Parameters
+        ----------
+        df : pandas.DataFrame
+            table
+        columns : tuple[str, ...]
+            indexed column names
+
+        Returns
+        -------
+        index : dict | None
+            lower-cased column values mapped to row positions, None if a
+            column is missing or does not hold strings
+        '''
+        # NOTE: only string columns are indexed
+        for col in columns:
+            if col not in df.columns:
+                return None
+            if not (
+                df[col].dtype == object or
+                pd.api.types.is_string_dtype(df[col].dtype)
+            ):
+                return None
+
+        # NOTE: normalized values -> row positions
+        index: Dict[Tuple[str, ...], List[int]] = {}
+        values = zip(*(df[col].tolist() for col in columns))
+        for pos, row in enumerate(values):
+            # ! rows with missing values never match a lookup
+            if not all(isinstance(v, str) for v in row):
+                continue
+            index.setdefault(
+                tuple(v.lower() for v in row), []
+            ).append(pos)
+
+        return index
+
+    @staticmethod
+    def view(df: pd.DataFrame) -> pd.DataFrame:
+        '''
+        Make a copy of a cached table which does not write through to it.
+
+        Parameters
+        ----------
+        df : pandas.DataFrame
+            cached table
+
+        Returns
+        -------
+        df : pandas.DataFrame
+            shallow copy under copy-on-write, otherwise a deep copy
+        '''
+        if _copy_on_write():
+            return df.copy(deep=False)
+        return df.copy()
+
+    def _store(self, key: Hashable, value: Any) -> None:
+        '''Store a table and evict the least recently used ones.'''
+        # memory
+        nbytes = int(value.memory_usage(deep=True).sum())
+
+        # ! tables above the memory cap are not cached
+        if nbytes > self.max_bytes:
+            logger.debug(f"table {key} is too large to be cached.")
+            return
+
+        self._entries[key] = value
+        self._sizes[key] = nbytes
+        self._bytes += nbytes
+
+        # NOTE: evict least recently used tables
+        while (
+            len(self._entries) > self.maxsize or
+            self._bytes > self.max_bytes
+        ):
+            self._discard(next(iter(self._entries)))
+
+    def _discard(self, key: Hashable) -> None:
+        '''Remove a table.'''
+        del self._entries[key]
+        self._bytes -= self._sizes.pop(key, 0)
+        self._indexes.pop(key, None)
+
+    def cache_info(self) -> Dict[str, int]:
+        '''
+        Get cache statistics.
+
+        Returns
+        -------
+        info : dict
+            hits, misses, size, maxsize, bytes and max_bytes of the cache
+        '''
+        with self._lock:
+            info = super().cache_info()
+            info['bytes'] = self._bytes
+            info['max_bytes'] = self.max_bytes
+            return info
+
+
+# NOTE: process-wide table cache
+table_cache = TableCache()
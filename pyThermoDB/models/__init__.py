@@ -1,27 +1,59 @@
-from .ref import (
-    DataBookTableTypes,
-    PayLoadType,
-    DataResultType,
-    MatrixDataType,
-    DataResult,
-    ConstantResult,
-    EquationResult,
-    EquationRangeResult
-)
+from typing import TYPE_CHECKING
+from ..utils.lazy_import import lazy_exports
 
-from .references import (
-    Component,
-    ComponentReferenceThermoDB,
-    ReferenceThermoDB,
-    CustomReference,
-    ReferencesThermoDB,
-    MixtureReferenceThermoDB
-)
-from .property import PropertyMatch
-from .configs import ComponentConfig
-from .rules import ComponentRule
-from .conditions import Pressure, Temperature
-from .eq import EquationDefinition
+if TYPE_CHECKING:
+    from .ref import (
+        DataBookTableTypes,
+        PayLoadType,
+        DataResultType,
+        MatrixDataType,
+        DataResult,
+        ConstantResult,
+        EquationResult,
+        EquationRangeResult,
+    )
+    from .references import (
+        Component,
+        ComponentReferenceThermoDB,
+        ReferenceThermoDB,
+        CustomReference,
+        ReferencesThermoDB,
+        MixtureReferenceThermoDB,
+    )
+    from .property import PropertyMatch
+    from .configs import ComponentConfig
+    from .rules import ComponentRule
+    from .conditions import (
+        Pressure,
+        Temperature,
+    )
+    from .eq import EquationDefinition
+
+# NOTE: exports, imported on first access
+_EXPORTS = {
+    'DataBookTableTypes': '.ref',
+    'PayLoadType': '.ref',
+    'DataResultType': '.ref',
+    'MatrixDataType': '.ref',
+    'DataResult': '.ref',
+    'ConstantResult': '.ref',
+    'EquationResult': '.ref',
+    'EquationRangeResult': '.ref',
+    'Component': '.references',
+    'ComponentReferenceThermoDB': '.references',
+    'ReferenceThermoDB': '.references',
+    'CustomReference': '.references',
+    'ReferencesThermoDB': '.references',
+    'MixtureReferenceThermoDB': '.references',
+    'PropertyMatch': '.property',
+    'ComponentConfig': '.configs',
+    'ComponentRule': '.rules',
+    'Pressure': '.conditions',
+    'Temperature': '.conditions',
+    'EquationDefinition': '.eq',
+}
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
 
 __all__ = [
     'DataBookTableTypes',
@@ -1,20 +1,47 @@
-from .config import ReferenceConfig
-from .content import ReferenceContent, load_custom_reference
-from .databook import ThermoDatabook
-from .reference import ThermoReference
-from .checker import ReferenceChecker
-from .main import (
-    check_custom_reference,
-    load_reference_from_str,
-    extract_reference_from_str,
-    load_default_symbols
-)
-from .reference_mapper import (
-    constants_reference_mapper,
-    component_reference_mapper,
-    mixture_reference_mapper
-)
-from .symbols_controller import SymbolController
+from typing import TYPE_CHECKING
+from ..utils.lazy_import import lazy_exports
+
+if TYPE_CHECKING:
+    from .config import ReferenceConfig
+    from .content import (
+        ReferenceContent,
+        load_custom_reference,
+    )
+    from .databook import ThermoDatabook
+    from .reference import ThermoReference
+    from .checker import ReferenceChecker
+    from .main import (
+        check_custom_reference,
+        load_reference_from_str,
+        extract_reference_from_str,
+        load_default_symbols,
+    )
+    from .reference_mapper import (
+        constants_reference_mapper,
+        component_reference_mapper,
+        mixture_reference_mapper,
+    )
+    from .symbols_controller import SymbolController
+
+# NOTE: exports, imported on first access
+_EXPORTS = {
+    'ReferenceConfig': '.config',
+    'ReferenceContent': '.content',
+    'load_custom_reference': '.content',
+    'ThermoDatabook': '.databook',
+    'ThermoReference': '.reference',
+    'ReferenceChecker': '.checker',
+    'check_custom_reference': '.main',
+    'load_reference_from_str': '.main',
+    'extract_reference_from_str': '.main',
+    'load_default_symbols': '.main',
+    'constants_reference_mapper': '.reference_mapper',
+    'component_reference_mapper': '.reference_mapper',
+    'mixture_reference_mapper': '.reference_mapper',
+    'SymbolController': '.symbols_controller',
+}
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
 
 __all__ = [
     "ReferenceConfig",
@@ -3,6 +3,7 @@ import logging
 import os
 import time
 from collections.abc import Mapping
+from concurrent.futures import ProcessPoolExecutor
 from typing import (
     Optional,
     Dict,
@@ -27,6 +28,7 @@ from pythermodb_settings.utils import measure_time
 # local
 from .app import init, build_thermodb
 from .docs.thermo import ThermoProperty
+from .docs.tableref import TableReference
 from .core import (
     TableConstants,
     TableData,
@@ -51,7 +53,7 @@ from .utils import (
 from .builder import CompBuilder
 from .config import DEFAULT_COMPONENT_STATES
 # ! deps
-from .config.deps import set_config, AppConfig
+from .config.deps import set_config, isolated_config, config_scope, AppConfig
 
 # NOTE: logger
 logger = logging.getLogger(__name__)
@@ -155,6 +157,7 @@ class ConstantsThermoDB(BaseModel):
 
 
 @measure_time
+@isolated_config
 def build_component_thermodb(
     component_name: str,
     reference_config: Union[
@@ -197,7 +200,7 @@ def build_component_thermodb(
     thermodb_save : Optional[bool], optional
         Whether to save the built thermodb to a file, by default False
     thermodb_save_path : Optional[str], optional
-        Path to save the built thermodb file, by default None. If None, it will save to the current directory with the name `{thermodb_name}.pkl`.
+        Path to save the built thermodb file, by default None. If None, it will save to the current directory with the name `{thermodb_name}.ptdb`.
     include_data : bool
         Whether to include data tables in the built thermodb, by default True
     **kwargs
@@ -476,10 +479,420 @@ def build_component_thermodb(
     except Exception as e:
         raise Exception(f"Building {component_name} thermodb failed! {e}")
 
+# SECTION: build thermodb for multiple components (batch)
+
+
+class ThermoDBBatch(dict):
+    '''
+    Thermodbs of a batch build by name (in input order), names which failed
+    to build are left out and reported in `errors`.
+
+    Attributes
+    ----------
+    errors : Dict[str, str]
+        error message of each name which failed to build (in input order)
+    '''
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.errors: Dict[str, str] = {}
+
+    @classmethod
+    def collect(
+        cls,
+        names: List[str],
+        results: List[tuple[Optional[CompBuilder], Optional[str]]]
+    ) -> 'ThermoDBBatch':
+        '''Collect (thermodb, error) results of a batch build.'''
+        batch = cls()
+        for name, (thermodb_, error) in zip(names, results):
+            # check
+            if thermodb_ is None:
+                logger.error(f"Building {name} thermodb failed! {error}")
+                batch.errors[name] = str(error)
+                continue
+            # save
+            batch[name] = thermodb_
+        return batch
+
+
+class _ComponentBatchContext:
+    '''
+    Shared context of a batch component build, the reference is parsed once
+    and each referenced table is checked and indexed once.
+    '''
+
+    def __init__(
+        self,
+        reference_config: Union[
+            Dict[str, Dict[str, str]],
+            str
+        ],
+        custom_reference: Optional[CustomReference] = None,
+        component_key: Literal['Name', 'Formula'] = 'Name',
+        reference_config_default_check: Optional[bool] = True,
+        thermodb_save: Optional[bool] = False,
+        thermodb_save_path: Optional[str] = None,
+        include_data: bool = True,
+    ):
+        # NOTE: reference_config check
+        if not isinstance(reference_config, (dict, str)):
+            raise TypeError("property must be a dictionary or a string")
+
+        # NOTE: reference_config default check
+        if reference_config_default_check is None:
+            reference_config_default_check = True
+
+        # NOTE: parse reference config once
+        if isinstance(reference_config, str):
+            # ! init ReferenceConfig
+            ReferenceConfig_ = ReferenceConfig()
+            # convert to dict
+            self.reference_config_parsed = \
+                ReferenceConfig_.set_reference_config(
+                    reference_config
+                )
+        else:
+            self.reference_config_parsed = None
+
+        # set
+        self.reference_config = reference_config
+        self.reference_config_default_check = reference_config_default_check
+        self.component_key = component_key
+        self.thermodb_save = thermodb_save
+        self.thermodb_save_path = thermodb_save_path
+        self.include_data = include_data
+
+        # NOTE: init thermodb once
+        self.thermodb = init(
+            custom_reference=custom_reference
+        )
+
+        # NOTE: table reference (shares the loaded tables)
+        self.table_ref = TableReference(custom_ref=self.thermodb.custom_ref)
+
+        # NOTE: databook list
+        databook_list = self.thermodb.list_databooks(res_format='list')
+        if not isinstance(databook_list, list):
+            raise TypeError("Databook list must be a list")
+        self.databook_list = databook_list
+
+        # NOTE: set column name based on key
+        self.column_name = 'Name' if component_key == 'Name' else 'Formula'
+
+        # NOTE: resolved tables (databook, table) -> lookup index | None
+        self.table_lookup: Dict[tuple, Any] = {}
+        # tables of each databook
+        self.databook_tables: Dict[str, List[str]] = {}
+
+    def resolve_table(self, databook_: str, table_: str) -> Any:
+        '''Check the table once, return its lookup index (False if unavailable).'''
+        key_ = (databook_, table_)
+        if key_ in self.table_lookup:
+            return self.table_lookup[key_]
+
+        # >> check databook exists
+        if is_databook_available(databook_, self.databook_list) is False:
+            logger.warning(
+                f"Databook '{databook_}' is not found in the databook list."
+            )
+            self.table_lookup[key_] = False
+            return False
+
+        # NOTE: tables
+        if databook_ not in self.databook_tables:
+            table_dict_ = self.thermodb.list_tables(
+                databook=databook_,
+                res_format='dict'
+            )
+            # check
+            if not isinstance(table_dict_, dict):
+                raise TypeError("Table list must be a list")
+            self.databook_tables[databook_] = list(table_dict_.values())
+
+        # >> check table
+        if is_table_available(table_, self.databook_tables[databook_]) is False:
+            logger.warning(
+                f"Table '{table_}' is not found in the databook '{databook_}'."
+            )
+            self.table_lookup[key_] = False
+            return False
+
+        # NOTE: table index (data and equation tables)
+        _, _, db_rid = self.thermodb.find_databook(databook_)
+        tb_id, _ = self.thermodb.find_table(databook_, table_)
+        index_ = self.table_ref.table_index(
+            db_rid + 1,
+            tb_id + 1,
+            (self.column_name,)
+        )
+
+        self.table_lookup[key_] = index_
+        return index_
+
+    def build(self, component_name: str) -> CompBuilder:
+        '''Build the thermodb of a component.'''
+        # LINK: set config for the component
+        cfg = AppConfig(
+            include_data=self.include_data,
+            build_type='single',
+            component_name=component_name if self.component_key == 'Name' else None,
+            component_formula=component_name if self.component_key == 'Formula' else None,
+            component_state=None,
+        )
+        # ! set config
+        set_config(cfg)
+
+        # NOTE: component reference config
+        if self.reference_config_parsed is not None:
+            component_reference_config = look_up_component_reference_config(
+                component_id=component_name,
+                reference_config=self.reference_config_parsed,
+                reference_config_default_check=self.reference_config_default_check
+            )
+        else:
+            component_reference_config = self.reference_config
+
+        # NOTE: build properties
+        props = {}
+        for prop_name, prop_idx in component_reference_config.items():
+            # property name
+            prop_name = prop_name.strip()
+
+            # ! databook and table
+            databook_ = prop_idx.get('databook', None)
+            table_ = prop_idx.get('table', None)
+            if databook_ is None or table_ is None:
+                logger.warning(
+                    f"Databook/table for property '{prop_name}' is not specified."
+                )
+                continue
+
+            # NOTE: check table
+            index_ = self.resolve_table(databook_, table_)
+            if index_ is False:
+                continue
+
+            # NOTE: check component
+            if index_ is not None:
+                # ! indexed lookup
+                if (component_name.lower(),) not in index_:
+                    continue
+            else:
+                component_checker_ = self.thermodb.check_component(
+                    component_name=component_name,
+                    databook=databook_,
+                    table=table_,
+                    column_name=self.column_name,
+                    res_format='dict'
+                )
+                # check
+                if not isinstance(component_checker_, dict):
+                    raise TypeError("Component checker must be a dictionary")
+                if not component_checker_['availability']:
+                    continue
+
+            # NOTE: build thermodb items
+            props[prop_name] = self.thermodb.build_thermo_property(
+                component_names=[component_name],
+                databook=databook_,
+                table=table_,
+                column_name=self.column_name,
+                query=False
+            )
+
+        # NOTE: check if props is empty
+        if len(props) == 0:
+            raise ValueError(
+                f"No properties were built for component '{component_name}'. Thermodb will not be created."
+            )
+
+        # SECTION: build component thermodb
+        prop_names_list = ', '.join(list(component_reference_config.keys()))
+        message = f"Thermodb including {prop_names_list} for component: {component_name}"
+
+        # ! init thermodb
+        thermodb_comp = build_thermodb(
+            thermodb_name=component_name,
+            message=message
+        )
+
+        # NOTE: add items to thermodb
+        for prop_name, prop_value in props.items():
+            thermodb_comp.add_data(
+                prop_name,
+                prop_value
+            )
+
+        # NOTE: build and save
+        if self.thermodb_save:
+            # check path
+            thermodb_save_path = check_file_path(
+                file_path=self.thermodb_save_path,
+                default_path=None,
+                create_dir=True
+            )
+            # save
+            thermodb_comp.save(
+                filename=component_name,
+                file_path=thermodb_save_path
+            )
+        else:
+            thermodb_comp.build()
+
+        return thermodb_comp
+
+
+# NOTE: batch context of a worker process
+_worker_context: Optional[_ComponentBatchContext] = None
+
+
+def _init_component_batch_worker(context_kwargs: Dict[str, Any]) -> None:
+    '''Create the batch context once per worker process.'''
+    global _worker_context
+    _worker_context = _ComponentBatchContext(**context_kwargs)
+
+
+def _build_component_batch_task(
+    component_name: str
+) -> tuple[Optional[CompBuilder], Optional[str]]:
+    '''Build a component thermodb in a worker process, return (thermodb, error).'''
+    try:
+        if _worker_context is None:
+            raise RuntimeError("Worker context is not initialized.")
+        return _worker_context.build(component_name), None
+    except Exception as e:
+        return None, str(e)
+
+
+@measure_time
+@isolated_config
+def build_component_thermodbs(
+    components: List[str],
+    reference_config: Union[
+        Dict[str, Dict[str, str]],
+        str
+    ],
+    custom_reference: Optional[
+        CustomReference
+    ] = None,
+    component_key: Literal['Name', 'Formula'] = 'Name',
+    reference_config_default_check: Optional[bool] = True,
+    thermodb_save: Optional[bool] = False,
+    thermodb_save_path: Optional[str] = None,
+    include_data: bool = True,
+    workers: Optional[int] = None,
+    **kwargs
+) -> ThermoDBBatch:
+    '''
+    Build thermodynamic databooks (thermodb) for many components sharing one loaded reference.
+
+    Parameters
+    ----------
+    components : List[str]
+        Names (or formulas) of the components to build thermodynamic databooks for.
+    reference_config : Dict[str, Dict[str, Any]] | str
+        Dictionary containing properties of the components to be included in the thermodynamic databooks.
+    custom_reference : Optional[CustomReference], optional
+        Custom reference dictionary for external references, by default None
+    component_key : Literal['Name', 'Formula'], optional
+        Key to identify the components in the reference content, by default 'Name'
+    reference_config_default_check : Optional[bool], optional
+        Whether to perform default checks on the reference configuration, by default True
+    thermodb_save : Optional[bool], optional
+        Whether to save the built thermodbs to files, by default False
+    thermodb_save_path : Optional[str], optional
+        Path to save the built thermodb files, by default None (current directory).
+    include_data : bool
+        Whether to include data tables in the built thermodbs, by default True
+    workers : Optional[int], optional
+        Number of worker processes, by default None (build in the current process).
+    **kwargs
+        Additional keyword arguments.
+        - mode : Literal['silent', 'log', 'attach'], optional
+            Mode for time measurement logging. Default is 'log'.
+
+    Returns
+    -------
+    ThermoDBBatch
+        CompBuilder object of each component (in input order), the error of
+        each component which failed to build is in `errors`
+
+    Notes
+    -----
+    1- The reference is parsed once, each referenced table is loaded and indexed once and the component rows of all components are resolved through the table index, so building many thermodbs costs about one reference load.
+
+    2- With `workers`, components are built in a process pool where each worker parses the reference once and every task carries its own build configuration.
+
+    3- A component which fails to build (e.g. no available property) is left out of the result and its error is reported in `errors` (and logged), the rest of the batch is still built.
+
+    Examples
+    --------
+    ```python
+    thermodbs = build_component_thermodbs(
+        components=['carbon dioxide', 'methanol'],
+        reference_config=reference_config,
+        custom_reference=custom_reference,
+        workers=4,
+    )
+    thermodbs['methanol'].check_properties()
+    thermodbs.errors  # e.g. {'argon': 'No properties were built ...'}
+    ```
+    '''
+    try:
+        # NOTE: check inputs
+        if not isinstance(components, list):
+            raise TypeError("components must be a list")
+        if not all(isinstance(c, str) for c in components):
+            raise TypeError("All component names must be strings")
+        if workers is not None and (
+            not isinstance(workers, int) or workers < 1
+        ):
+            raise ValueError("workers must be a positive integer")
+
+        # NOTE: context settings
+        context_kwargs = {
+            'reference_config': reference_config,
+            'custom_reference': custom_reference,
+            'component_key': component_key,
+            'reference_config_default_check': reference_config_default_check,
+            'thermodb_save': thermodb_save,
+            'thermodb_save_path': thermodb_save_path,
+            'include_data': include_data,
+        }
+
+        # SECTION: build thermodbs
+        if workers is None or workers == 1 or len(components) <= 1:
+            # NOTE: current process
+            context = _ComponentBatchContext(**context_kwargs)
+
+            results = []
+            for component_name in components:
+                try:
+                    results.append((context.build(component_name), None))
+                except Exception as e:
+                    results.append((None, str(e)))
+        else:
+            # NOTE: process pool (input order is kept by map)
+            with ProcessPoolExecutor(
+                max_workers=min(workers, len(components)),
+                initializer=_init_component_batch_worker,
+                initargs=(context_kwargs,)
+            ) as executor:
+                results = list(
+                    executor.map(_build_component_batch_task, components)
+                )
+
+        # SECTION: collect results
+        return ThermoDBBatch.collect(components, results)
+    except Exception as e:
+        raise Exception(f"Building component thermodbs failed! {e}")
+
 # SECTION: check and build thermodb for single component
 
 
 @measure_time
+@isolated_config
 def check_and_build_component_thermodb(
     component: Component,
     reference_config: Union[
@@ -526,7 +939,7 @@ def check_and_build_component_thermodb(
     thermodb_save : Optional[bool], optional
         Whether to save the built thermodb to a file, by default False
     thermodb_save_path : Optional[str], optional
-        Path to save the built thermodb file, by default None. If None, it will save to the current directory with the name `{thermodb_name}.pkl`.
+        Path to save the built thermodb file, by default None. If None, it will save to the current directory with the name `{thermodb_name}.ptdb`.
     verbose : Optional[bool], optional
         Whether to print verbose logs, by default False
     include_data : bool
@@ -1035,7 +1448,7 @@ def build_components_thermodb(
     thermodb_save : Optional[bool], optional
         Whether to save the built thermodb to a file, by default False
     thermodb_save_path : Optional[str], optional
-        Path to save the built thermodb file, by default None. If None, it will save to the current directory with the name `{thermodb_name}.pkl`.
+        Path to save the built thermodb file, by default None. If None, it will save to the current directory with the name `{thermodb_name}.ptdb`.
     **kwargs
         Additional keyword arguments.
         - mode : Literal['silent', 'log', 'attach'], optional
@@ -1337,7 +1750,7 @@ def check_and_build_components_thermodb(
     thermodb_save : Optional[bool], optional
         Whether to save the built thermodb to a file, by default False
     thermodb_save_path : Optional[str], optional
-        Path to save the built thermodb file, by default None. If None, it will save to the current directory with the name `{thermodb_name}.pkl`.
+        Path to save the built thermodb file, by default None. If None, it will save to the current directory with the name `{thermodb_name}.ptdb`.
     **kwargs
         Additional keyword arguments.
         - ignore_state_props: Optional[List[str]]
@@ -1788,7 +2201,7 @@ def check_and_build_mixture_thermodb(
     thermodb_save : Optional[bool], optional
         Whether to save the built thermodb to a file, by default False
     thermodb_save_path : Optional[str], optional
-        Path to save the built thermodb file, by default None. If None, it will save to the current directory with the name `{thermodb_name}.pkl`.
+        Path to save the built thermodb file, by default None. If None, it will save to the current directory with the name `{thermodb_name}.ptdb`.
     verbose : bool, optional
         Whether to enable verbose logging, by default False
     **kwargs
@@ -2326,10 +2739,191 @@ def check_and_build_mixture_thermodb(
     except Exception as e:
         raise Exception(f"Building {component_names} thermodb failed! {e}")
 
+# SECTION: build thermodb for multiple mixtures (batch)
+
+
+def _init_mixture_batch_worker(
+    custom_reference: Optional[CustomReference]
+) -> None:
+    '''Parse the reference once per worker process (reference cache).'''
+    init(custom_reference=custom_reference)
+
+
+def _build_mixture_batch_task(
+    task: tuple[List[Component], Dict[str, Any]]
+) -> tuple[Optional[CompBuilder], Optional[str]]:
+    '''Build a mixture thermodb, return (thermodb, error).'''
+    components, build_kwargs = task
+    try:
+        # LINK: config of the task
+        with config_scope(AppConfig(build_type='mixture')):
+            thermodb_mix = check_and_build_mixture_thermodb(
+                components=components,
+                **build_kwargs
+            )
+        # check
+        if thermodb_mix is None:
+            raise ValueError("No properties were built for the mixture.")
+        return thermodb_mix, None
+    except Exception as e:
+        return None, str(e)
+
+
+@measure_time
+@isolated_config
+def build_mixture_thermodbs(
+    mixtures: List[List[Component]],
+    reference_config: Union[
+        Dict[str, Dict[str, str]],
+        Dict[str, ComponentConfig],
+        str
+    ],
+    custom_reference: Optional[CustomReference] = None,
+    component_key: Literal[
+        'Name-State', 'Formula-State'
+    ] = 'Name-State',
+    mixture_key: Literal[
+        'Name', 'Formula'
+    ] = 'Name',
+    column_name: Optional[str] = None,
+    delimiter: str = '|',
+    reference_config_default_check: Optional[bool] = True,
+    thermodb_save: Optional[bool] = False,
+    thermodb_save_path: Optional[str] = None,
+    workers: Optional[int] = None,
+    **kwargs
+) -> ThermoDBBatch:
+    '''
+    Check and build `multi-component mixture` thermodynamic databooks (thermodb) for many mixtures, see `check_and_build_mixture_thermodb`.
+
+    Parameters
+    ----------
+    mixtures : List[List[Component]]
+        Components of each mixture, e.g. [[methanol, ethanol], [methanol, water]].
+    reference_config : Union[Dict[str, Dict[str, str]], str, Dict[str, ComponentConfig]]
+        Dictionary containing properties of the mixtures to be included in the thermodynamic databooks.
+    custom_reference : Optional[CustomReference], optional
+        Custom reference dictionary for external references, by default None
+    component_key : Literal['Name-State', 'Formula-State'], optional
+        Key to identify the component in the reference content, by default 'Name-State'
+    mixture_key : Literal['Name', 'Formula'], optional
+        Key to identify the components in the mixture, by default 'Name'
+    column_name : Optional[str], optional
+        Column name to identify the mixture in the table, by default None ('Mixture')
+    delimiter : str, optional
+        Delimiter to separate component names/formulas in the mixture, by default '|'
+    reference_config_default_check : Optional[bool], optional
+        Whether to perform default checks on the reference configuration, by default True
+    thermodb_save : Optional[bool], optional
+        Whether to save the built thermodbs to files, by default False
+    thermodb_save_path : Optional[str], optional
+        Path to save the built thermodb files, by default None (current directory).
+    workers : Optional[int], optional
+        Number of worker processes, by default None (build in the current process).
+    **kwargs
+        Additional keyword arguments.
+        - ignore_state_props: Optional[List[str]]
+            List of property names to ignore state during the build. By default, None.
+        - ignore_state_all_props: Optional[bool]
+            Whether to ignore state for all properties during the build. By default, False.
+        - mode : Literal['silent', 'log', 'attach'], optional
+            Mode for time measurement logging. Default is 'log'.
+
+    Returns
+    -------
+    ThermoDBBatch
+        CompBuilder object of each mixture by mixture name such as `methanol | ethanol` (in input order), the error of each mixture which failed to build is in `errors`
+
+    Notes
+    -----
+    1- The reference is parsed once per process (reference cache) and shared by the builds.
+
+    2- With `workers`, mixtures are built in a process pool where each worker parses the reference once and every task carries its own build configuration.
+
+    3- A mixture which fails to build (e.g. no matching mixture rows) is left out of the result and its error is reported in `errors` (and logged), the rest of the batch is still built.
+
+    4- Each thermodb is named (and saved) by its mixture name.
+
+    Examples
+    --------
+    ```python
+    thermodbs = build_mixture_thermodbs(
+        mixtures=[[methanol, ethanol], [methanol, methane]],
+        reference_config=reference_config,
+        custom_reference=custom_reference,
+        workers=2,
+    )
+    thermodbs['methanol | ethanol'].check_properties()
+    ```
+    '''
+    try:
+        # NOTE: check inputs
+        if not isinstance(mixtures, list):
+            raise TypeError("mixtures must be a list")
+        if not all(
+            isinstance(m, list) and all(isinstance(c, Component) for c in m)
+            for m in mixtures
+        ):
+            raise TypeError("Each mixture must be a list of Component objects")
+        if workers is not None and (
+            not isinstance(workers, int) or workers < 1
+        ):
+            raise ValueError("workers must be a positive integer")
+
+        # NOTE: mixture names
+        mixture_names = [
+            ' | '.join(c.name.strip() for c in m) for m in mixtures
+        ]
+
+        # NOTE: build settings of each mixture
+        tasks = [
+            (
+                components,
+                {
+                    'reference_config': reference_config,
+                    'custom_reference': custom_reference,
+                    'component_key': component_key,
+                    'mixture_key': mixture_key,
+                    'column_name': column_name,
+                    'delimiter': delimiter,
+                    'thermodb_name': mixture_name,
+                    'reference_config_default_check': reference_config_default_check,
+                    'thermodb_save': thermodb_save,
+                    'thermodb_save_path': thermodb_save_path,
+                    'ignore_state_props': kwargs.get('ignore_state_props'),
+                    'ignore_state_all_props': kwargs.get(
+                        'ignore_state_all_props', False),
+                    'mode': 'silent',
+                }
+            )
+            for components, mixture_name in zip(mixtures, mixture_names)
+        ]
+
+        # SECTION: build thermodbs
+        if workers is None or workers == 1 or len(mixtures) <= 1:
+            # NOTE: current process
+            results = [_build_mixture_batch_task(task) for task in tasks]
+        else:
+            # NOTE: process pool (input order is kept by map)
+            with ProcessPoolExecutor(
+                max_workers=min(workers, len(mixtures)),
+                initializer=_init_mixture_batch_worker,
+                initargs=(custom_reference,)
+            ) as executor:
+                results = list(
+                    executor.map(_build_mixture_batch_task, tasks)
+                )
+
+        # SECTION: collect results
+        return ThermoDBBatch.collect(mixture_names, results)
+    except Exception as e:
+        raise Exception(f"Building mixture thermodbs failed! {e}")
+
 # SECTION: build constant thermodb
 
 
 @measure_time
+@isolated_config
 def build_constants_thermodb(
     reference_config: Union[Mapping[str, Any], str],
     custom_reference: Optional[CustomReference] = None,
@@ -2703,6 +3297,7 @@ def check_and_build_constants_thermodb(
 
 
 @measure_time
+@isolated_config
 def build_component_thermodb_from_reference(
     component_name: str,
     component_formula: str,
@@ -2747,7 +3342,7 @@ def build_component_thermodb_from_reference(
     thermodb_save : Optional[bool], optional
         Whether to save the built thermodb to a file, by default False
     thermodb_save_path : Optional[str], optional
-        Path to save the built thermodb file, by default None. If None, it will save to the current directory with the name `{thermodb_name}.pkl`.
+        Path to save the built thermodb file, by default None. If None, it will save to the current directory with the name `{thermodb_name}.ptdb`.
     verbose : bool, optional
         Whether to enable verbose logging, by default False
     include_data : bool, optional
@@ -3191,7 +3786,7 @@ def build_mixture_thermodb_from_reference(
     thermodb_save : Optional[bool], optional
         Whether to save the built thermodb to a file, by default False
     thermodb_save_path : Optional[str], optional
-        Path to save the built thermodb file, by default None. If None, it will save to the current directory with the name `{thermodb_name}.pkl`.
+        Path to save the built thermodb file, by default None. If None, it will save to the current directory with the name `{thermodb_name}.ptdb`.
     verbose : Optional[bool], optional
         Whether to print verbose messages during the build process, by default False
     **kwargs
@@ -34,7 +34,7 @@ from .builder import CompBuilder
 from .config import DEFAULT_COMPONENT_STATES
 from .thermodb import ComponentThermoDB, MixtureThermoDB
 # ! deps
-from .config.deps import set_config, AppConfig
+from .config.deps import set_config, isolated_config, AppConfig
 
 # NOTE: logger
 logger = logging.getLogger(__name__)
@@ -134,6 +134,7 @@ class CustomReferenceSource:
 
 
 @measure_time
+@isolated_config
 def build_component_thermodb_from_reference_source(
         component: Component,
         reference_source: ReferenceContentSource,
@@ -175,7 +176,7 @@ def build_component_thermodb_from_reference_source(
     thermodb_save : Optional[bool], optional
         Whether to save the built thermodb to a file, by default False
     thermodb_save_path : Optional[str], optional
-        Path to save the built thermodb file, by default None. If None, it will save to the current directory with the name `{thermodb_name}.pkl`.
+        Path to save the built thermodb file, by default None. If None, it will save to the current directory with the name `{thermodb_name}.ptdb`.
     verbose : bool, optional
         Whether to enable verbose logging, by default False
     include_data : bool, optional
@@ -543,6 +544,7 @@ def build_component_thermodb_from_reference_source(
 
 
 @measure_time
+@isolated_config
 def check_and_build_component_thermodb(
     component: Component,
     reference_source: CustomReferenceSource,
@@ -578,7 +580,7 @@ def check_and_build_component_thermodb(
     thermodb_save : Optional[bool], optional
         Whether to save the built thermodb to a file, by default False
     thermodb_save_path : Optional[str], optional
-        Path to save the built thermodb file, by default None. If None, it will save to the current directory with the name `{thermodb_name}.pkl`.
+        Path to save the built thermodb file, by default None. If None, it will save to the current directory with the name `{thermodb_name}.ptdb`.
     verbose : Optional[bool], optional
         Whether to print verbose logs, by default False
     include_data : bool
@@ -1,34 +1,82 @@
-from .logger import log2Col
-from .utility import isNumber, uppercaseStringList, is_number
-from .result_generator import format_eq_data
-from .convertor import Convertor, is_str_number
-from .component_utils import (
-    set_component_id,
-    set_component_query,
-    validate_component_state,
-    create_binary_mixture_id,
-    create_mixture_ids,
-    create_binary_mixtures,
-    create_mixture_from_components
-)
-from .prop_utils import ignore_state_in_prop
-from .reference_utils import (
-    look_up_component_reference_config,
-    is_table_available,
-    is_databook_available,
-    look_up_binary_mixture_reference_config,
-    look_up_mixture_reference_config,
-    _normalize_constant_reference_config,
-    _normalize_constants_filter,
-    _constant_config_labels,
-    _is_constants_table_type,
-    _build_constant_sources
-)
-from .core_utils import has_prop_nested
-from .extractor import YAMLExtractor
-from .file_manager import check_file_path
-from .equation_parser import EquationParser
-from .component_data_extractor import filter_yaml_for_component
+from typing import TYPE_CHECKING
+from .lazy_import import lazy_exports
+from .numpy_math import NumpyMath, numpy_math
+
+if TYPE_CHECKING:
+    from .logger import log2Col
+    from .utility import (
+        isNumber,
+        uppercaseStringList,
+        is_number,
+    )
+    from .result_generator import format_eq_data
+    from .convertor import (
+        Convertor,
+        is_str_number,
+    )
+    from .component_utils import (
+        set_component_id,
+        set_component_query,
+        validate_component_state,
+        create_binary_mixture_id,
+        create_mixture_ids,
+        create_binary_mixtures,
+        create_mixture_from_components,
+    )
+    from .prop_utils import ignore_state_in_prop
+    from .reference_utils import (
+        look_up_component_reference_config,
+        is_table_available,
+        is_databook_available,
+        look_up_binary_mixture_reference_config,
+        look_up_mixture_reference_config,
+        _normalize_constant_reference_config,
+        _normalize_constants_filter,
+        _constant_config_labels,
+        _is_constants_table_type,
+        _build_constant_sources,
+    )
+    from .core_utils import has_prop_nested
+    from .extractor import YAMLExtractor
+    from .file_manager import check_file_path
+    from .equation_parser import EquationParser
+    from .component_data_extractor import filter_yaml_for_component
+
+# NOTE: exports, imported on first access
+_EXPORTS = {
+    'log2Col': '.logger',
+    'isNumber': '.utility',
+    'uppercaseStringList': '.utility',
+    'is_number': '.utility',
+    'format_eq_data': '.result_generator',
+    'Convertor': '.convertor',
+    'is_str_number': '.convertor',
+    'set_component_id': '.component_utils',
+    'set_component_query': '.component_utils',
+    'validate_component_state': '.component_utils',
+    'create_binary_mixture_id': '.component_utils',
+    'create_mixture_ids': '.component_utils',
+    'create_binary_mixtures': '.component_utils',
+    'create_mixture_from_components': '.component_utils',
+    'ignore_state_in_prop': '.prop_utils',
+    'look_up_component_reference_config': '.reference_utils',
+    'is_table_available': '.reference_utils',
+    'is_databook_available': '.reference_utils',
+    'look_up_binary_mixture_reference_config': '.reference_utils',
+    'look_up_mixture_reference_config': '.reference_utils',
+    '_normalize_constant_reference_config': '.reference_utils',
+    '_normalize_constants_filter': '.reference_utils',
+    '_constant_config_labels': '.reference_utils',
+    '_is_constants_table_type': '.reference_utils',
+    '_build_constant_sources': '.reference_utils',
+    'has_prop_nested': '.core_utils',
+    'YAMLExtractor': '.extractor',
+    'check_file_path': '.file_manager',
+    'EquationParser': '.equation_parser',
+    'filter_yaml_for_component': '.component_data_extractor',
+}
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
 
 __all__ = [
     "log2Col",
@@ -61,4 +109,6 @@ __all__ = [
     "EquationParser",
     "filter_yaml_for_component",
     "is_number",
+    "NumpyMath",
+    "numpy_math",
 ]
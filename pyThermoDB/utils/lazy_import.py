@@ -0,0 +1,77 @@
+# import packages/modules
+import importlib
+import sys
+from types import ModuleType
+from typing import Any, Callable, Dict, List, Tuple
+
+
+class LazyModule(ModuleType):
+    '''
+    Module imported on first attribute access.
+
+    Heavy dependencies used on a few paths only (e.g. pandas for DataFrames)
+    are bound as `pd = LazyModule('pandas')`, so importing pyThermoDB does not
+    import them. After the first access the module namespace is copied, the
+    next lookups are plain attribute lookups.
+    '''
+
+    def _load(self) -> ModuleType:
+        module = importlib.import_module(self.__name__)
+        self.__dict__.update(module.__dict__)
+        return module
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._load(), name)
+
+    @property
+    def loaded(self) -> bool:
+        '''Whether the module is already imported (by any module).'''
+        return self.__name__ in sys.modules
+
+    def __repr__(self) -> str:
+        return f"<lazy module '{self.__name__}'>"
+
+
+def lazy_exports(
+    package: str,
+    exports: Dict[str, str]
+) -> Tuple[Callable[[str], Any], Callable[[], List[str]]]:
+    '''
+    Module `__getattr__` and `__dir__` importing the exports of a package on
+    first access (PEP 562).
+
+    Parameters
+    ----------
+    package : str
+        package name (`__name__` of the package)
+    exports : dict
+        export name to the relative module defining it, e.g.
+        `{'ThermoDB': '.docs'}`
+
+    Returns
+    -------
+    __getattr__ : Callable
+        module `__getattr__`
+    __dir__ : Callable
+        module `__dir__`
+
+    Notes
+    -----
+    An export must not have the name of a submodule of the package, the
+    import system sets the submodule as the package attribute.
+    '''
+    def __getattr__(name: str) -> Any:
+        module = exports.get(name)
+        if module is None:
+            raise AttributeError(
+                f"module '{package}' has no attribute '{name}'")
+
+        value = getattr(importlib.import_module(module, package), name)
+        # NOTE: cache, next lookups skip __getattr__
+        setattr(sys.modules[package], name, value)
+        return value
+
+    def __dir__() -> List[str]:
+        return sorted(set(vars(sys.modules[package])) | set(exports))
+
+    return __getattr__, __dir__
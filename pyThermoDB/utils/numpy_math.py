@@ -0,0 +1,73 @@
+# import libs
+import math
+from typing import Any
+import numpy as np
+
+
+class NumpyMath:
+    """
+    Drop-in replacement for the `math` module inside equation bodies, where
+    `math.*` calls are mapped to numpy ufuncs so that a body can be evaluated
+    over whole arrays at once.
+
+    Notes
+    -----
+    Names that have no numpy counterpart fall back to the `math` module, so
+    scalar-only functions still raise on array input and the caller can fall
+    back to point-wise evaluation.
+    """
+
+    # NOTE: math functions mapped to numpy ufuncs
+    exp = staticmethod(np.exp)
+    expm1 = staticmethod(np.expm1)
+    log10 = staticmethod(np.log10)
+    log2 = staticmethod(np.log2)
+    log1p = staticmethod(np.log1p)
+    sqrt = staticmethod(np.sqrt)
+    cbrt = staticmethod(np.cbrt)
+    pow = staticmethod(np.power)
+    fabs = staticmethod(np.fabs)
+    floor = staticmethod(np.floor)
+    ceil = staticmethod(np.ceil)
+    trunc = staticmethod(np.trunc)
+    sin = staticmethod(np.sin)
+    cos = staticmethod(np.cos)
+    tan = staticmethod(np.tan)
+    asin = staticmethod(np.arcsin)
+    acos = staticmethod(np.arccos)
+    atan = staticmethod(np.arctan)
+    atan2 = staticmethod(np.arctan2)
+    sinh = staticmethod(np.sinh)
+    cosh = staticmethod(np.cosh)
+    tanh = staticmethod(np.tanh)
+    asinh = staticmethod(np.arcsinh)
+    acosh = staticmethod(np.arccosh)
+    atanh = staticmethod(np.arctanh)
+    hypot = staticmethod(np.hypot)
+    degrees = staticmethod(np.degrees)
+    radians = staticmethod(np.radians)
+    isnan = staticmethod(np.isnan)
+    isinf = staticmethod(np.isinf)
+    isfinite = staticmethod(np.isfinite)
+
+    # NOTE: constants
+    pi = math.pi
+    e = math.e
+    tau = math.tau
+    inf = math.inf
+    nan = math.nan
+
+    @staticmethod
+    def log(x: Any, base: Any = None):
+        '''Natural logarithm, or logarithm in the given base (as math.log).'''
+        if base is None:
+            return np.log(x)
+        return np.log(x) / np.log(base)
+
+    def __getattr__(self, name: str):
+        # ! fall back to the math module
+        return getattr(math, name)
+
+
+# NOTE: shared instance used as `math` in vectorized equation bodies
+numpy_math = NumpyMath()
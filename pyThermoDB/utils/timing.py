@@ -0,0 +1,40 @@
+# import packages/modules
+from functools import wraps
+from typing import Callable
+
+
+def measure_time(func: Callable) -> Callable:
+    '''
+    `pythermodb_settings.utils.measure_time`, imported on the first timed call.
+
+    Parameters
+    ----------
+    func : Callable
+        The function to be decorated.
+
+    Returns
+    -------
+    Callable
+        The wrapped function with time measurement (`mode` keyword argument).
+
+    Notes
+    -----
+    pythermodb_settings loads all of its models on import, calls in the
+    default 'silent' mode run the function directly and do not import it.
+    '''
+    timed = None
+
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        nonlocal timed
+        if kwargs.get('mode', 'silent') == 'silent':
+            kwargs.pop('mode', None)
+            return func(*args, **kwargs)
+
+        # NOTE: timed modes (log/attach)
+        if timed is None:
+            from pythermodb_settings.utils import measure_time as measure
+            timed = measure(func)
+        return timed(*args, **kwargs)
+
+    return wrapper
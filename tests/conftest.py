@@ -0,0 +1,7 @@
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def _cache_dir(tmp_path, monkeypatch):
+    # ! persisted caches (compiled references, component indexes) per test
+    monkeypatch.setenv('PYTHERMODB_CACHE_DIR', str(tmp_path / 'cache'))
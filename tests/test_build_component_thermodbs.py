@@ -0,0 +1,141 @@
+from pyThermoDB import (
+    CompBuilder,
+    build_component_thermodb,
+    build_component_thermodbs,
+)
+from pyThermoDB.manager import table_cache
+
+
+REFERENCE_CONTENT = """
+REFERENCES:
+  CUSTOM-REF-1:
+    DATABOOK-ID: 1
+    TABLES:
+      General-Data:
+        TABLE-ID: 1
+        DESCRIPTION: General component data.
+        DATA: []
+        STRUCTURE:
+          COLUMNS: [No., Name, Formula, State, Molecular-Weight]
+          SYMBOL: [None, None, None, None, MW]
+          UNIT: [None, None, None, None, g/mol]
+          CONVERSION: [None, None, None, None, 1]
+        VALUES:
+          - [1, carbon dioxide, CO2, g, 44.01]
+          - [2, methanol, CH3OH, l, 32.04]
+          - [3, water, H2O, l, 18.015]
+      Vapor-Pressure:
+        TABLE-ID: 2
+        DESCRIPTION: Vapor pressure.
+        EQUATIONS:
+          EQ-1:
+            BODY:
+              - res = math.exp(parms['A'] - parms['B']/args['T'])
+            ARGS:
+              temperature:
+                name: temperature
+                symbol: T
+                unit: K
+            PARMS:
+              A:
+                name: A
+                symbol: A
+                unit: None
+              B:
+                name: B
+                symbol: B
+                unit: None
+            RETURNS:
+              vapor-pressure:
+                name: vapor-pressure
+                symbol: VaPr
+                unit: Pa
+        STRUCTURE:
+          COLUMNS: [No., Name, Formula, State, A, B, Eq]
+          SYMBOL: [None, None, None, None, A, B, VaPr]
+          UNIT: [None, None, None, None, 1, 1, Pa]
+          CONVERSION: [None, None, None, None, 1, 1, 1]
+        VALUES:
+          - [1, methanol, CH3OH, l, 23.5, 3600.0, 1]
+          - [2, water, H2O, l, 23.2, 3800.0, 1]
+"""
+
+REFERENCE_CONFIG = {
+    'general': {'databook': 'CUSTOM-REF-1', 'table': 'General-Data'},
+    'vapor-pressure': {'databook': 'CUSTOM-REF-1', 'table': 'Vapor-Pressure'},
+}
+
+
+def test_build_component_thermodbs_matches_single_builds():
+    custom_reference = {'reference': [REFERENCE_CONTENT]}
+
+    thermodbs = build_component_thermodbs(
+        components=['water', 'carbon dioxide', 'methanol', 'argon'],
+        reference_config=REFERENCE_CONFIG,
+        custom_reference=custom_reference,
+        mode='silent',
+    )
+
+    assert list(thermodbs) == ['water', 'carbon dioxide', 'methanol']
+    assert list(thermodbs.errors) == ['argon']
+    assert 'No properties were built' in thermodbs.errors['argon']
+    assert all(isinstance(t, CompBuilder) for t in thermodbs.values())
+    assert set(thermodbs['carbon dioxide'].check_properties()) == {'general'}
+
+    single = build_component_thermodb(
+        component_name='methanol',
+        reference_config=REFERENCE_CONFIG,
+        custom_reference=custom_reference,
+        mode='silent',
+    )
+    batch = thermodbs['methanol']
+    assert set(batch.check_properties()) == set(single.check_properties())
+    assert (
+        batch.select('vapor-pressure').cal(T=300.0)['value'] ==
+        single.select('vapor-pressure').cal(T=300.0)['value']
+    )
+    assert (
+        batch.select('general').get_property('MW')['value'] ==
+        single.select('general').get_property('MW')['value']
+    )
+
+
+def test_build_component_thermodbs_loads_each_table_once():
+    table_cache.clear()
+
+    build_component_thermodbs(
+        components=['water', 'methanol'],
+        reference_config=REFERENCE_CONFIG,
+        custom_reference={'reference': [REFERENCE_CONTENT]},
+        mode='silent',
+    )
+
+    assert table_cache.cache_info()['misses'] == 2
+
+
+def test_build_component_thermodbs_with_workers_keeps_input_order(caplog):
+    thermodbs = build_component_thermodbs(
+        components=['methanol', 'argon', 'water', 'carbon dioxide'],
+        reference_config=REFERENCE_CONFIG,
+        custom_reference={'reference': [REFERENCE_CONTENT]},
+        include_data=False,
+        workers=2,
+        mode='silent',
+    )
+
+    serial = build_component_thermodbs(
+        components=['water'],
+        reference_config=REFERENCE_CONFIG,
+        custom_reference={'reference': [REFERENCE_CONTENT]},
+        include_data=False,
+        mode='silent',
+    )
+
+    assert list(thermodbs) == ['methanol', 'water', 'carbon dioxide']
+    assert list(thermodbs.errors) == ['argon']
+    assert 'No properties were built' in thermodbs.errors['argon']
+    assert serial.errors == {}
+    assert set(thermodbs['water'].check_properties()) == set(
+        serial['water'].check_properties())
+    assert thermodbs['water'].select('general').include_data is False
+    assert 'Building argon thermodb failed!' in caplog.text
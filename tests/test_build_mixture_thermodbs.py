@@ -0,0 +1,76 @@
+import pytest
+from pythermodb_settings.models import Component
+
+from pyThermoDB import build_mixture_thermodbs, check_and_build_mixture_thermodb
+
+
+MIXTURE_REFERENCE_CONTENT = """
+REFERENCES:
+  CUSTOM-REF-1:
+    DATABOOK-ID: 1
+    TABLES:
+      NRTL:
+        TABLE-ID: 1
+        DESCRIPTION: NRTL binary parameters.
+        MATRIX-SYMBOL:
+          - a
+          - alpha
+        STRUCTURE:
+          COLUMNS: [No.,Mixture,Name,Formula,State,a_i_1,a_i_2,alpha_i_1,alpha_i_2]
+          SYMBOL: [None,None,None,None,None,a_i_1,a_i_2,alpha_i_1,alpha_i_2]
+          UNIT: [None,None,None,None,None,1,1,1,1]
+        VALUES:
+          - [1,methanol|ethanol,methanol,CH3OH,l,0,1.5,0,0.3]
+          - [2,methanol|ethanol,ethanol,C2H5OH,l,2.5,0,0.3,0]
+          - [3,methanol|methane,methanol,CH3OH,l,0,0.4,0,0.2]
+          - [4,methanol|methane,methane,CH4,g,0.6,0,0.2,0]
+"""
+
+MIXTURE_REFERENCE_CONFIG = {
+    'nrtl': {
+        'databook': 'CUSTOM-REF-1',
+        'table': 'NRTL',
+        'symbols': {'a_i_j': 'a_i_j', 'alpha': 'alpha'},
+    },
+}
+
+methanol = Component(name='methanol', formula='CH3OH', state='l')
+ethanol = Component(name='ethanol', formula='C2H5OH', state='l')
+methane = Component(name='methane', formula='CH4', state='g')
+water = Component(name='water', formula='H2O', state='l')
+
+
+@pytest.mark.parametrize('workers', [None, 2])
+def test_build_mixture_thermodbs_keeps_order_and_reports_errors(workers):
+    thermodbs = build_mixture_thermodbs(
+        mixtures=[[methanol, ethanol], [ethanol, water], [methanol, methane]],
+        reference_config=MIXTURE_REFERENCE_CONFIG,
+        custom_reference={'reference': [MIXTURE_REFERENCE_CONTENT]},
+        workers=workers,
+        mode='silent',
+    )
+
+    assert list(thermodbs) == ['methanol | ethanol', 'methanol | methane']
+    assert list(thermodbs.errors) == ['ethanol | water']
+    assert thermodbs['methanol | methane'].select('nrtl').ij(
+        'a_methane_methanol')['value'] == 0.6
+
+    single = check_and_build_mixture_thermodb(
+        components=[methanol, ethanol],
+        reference_config=MIXTURE_REFERENCE_CONFIG,
+        custom_reference={'reference': [MIXTURE_REFERENCE_CONTENT]},
+        mode='silent',
+    )
+    assert (
+        thermodbs['methanol | ethanol'].select('nrtl').ij('a_ethanol_methanol') ==
+        single.select('nrtl').ij('a_ethanol_methanol')
+    )
+
+
+def test_build_mixture_thermodbs_checks_inputs():
+    with pytest.raises(Exception, match='list of Component'):
+        build_mixture_thermodbs(
+            mixtures=[['methanol', 'ethanol']],
+            reference_config=MIXTURE_REFERENCE_CONFIG,
+            mode='silent',
+        )
@@ -0,0 +1,167 @@
+import pickle
+import struct
+
+import numpy as np
+import pytest
+
+from pyThermoDB import build_component_thermodb, load_thermodb
+from pyThermoDB.builder import CompBuilder
+from pyThermoDB.builder.compstore import FORMAT_MAGIC, FORMAT_VERSION
+
+from test_build_component_thermodbs import REFERENCE_CONFIG, REFERENCE_CONTENT
+from test_compbuilder_constants import _constants
+from test_table_matrix_equation_cache import _equation
+
+
+def _thermodb() -> CompBuilder:
+    return build_component_thermodb(
+        component_name='methanol',
+        reference_config=REFERENCE_CONFIG,
+        custom_reference={'reference': [REFERENCE_CONTENT]},
+        mode='silent',
+    )
+
+
+def test_save_writes_versioned_format_and_load_restores_items(tmp_path):
+    thermodb = _thermodb()
+    build_date = thermodb.build_date
+
+    assert thermodb.save('methanol', file_path=str(tmp_path))
+    path = tmp_path / 'methanol.ptdb'
+    assert path.read_bytes().startswith(FORMAT_MAGIC)
+
+    loaded = load_thermodb(str(path), mode='silent')
+
+    assert loaded.thermodb_name == thermodb.thermodb_name
+    assert loaded.build_type == 'single'
+    assert loaded.component_name == 'methanol'
+    assert loaded.build_date == build_date
+    assert list(loaded.check_properties()) == ['general']
+    assert list(loaded.check_functions()) == ['vapor-pressure']
+
+    eq, eq_ = thermodb.select('vapor-pressure'), loaded.select('vapor-pressure')
+    assert eq_.trans_data == eq.trans_data
+    assert eq_.equations == eq.equations
+    assert eq_.cal(T=300.0)['value'] == eq.cal(T=300.0)['value']
+
+    data, data_ = thermodb.select('general'), loaded.select('general')
+    assert data_.trans_data == data.trans_data
+    assert data_.prop_data == data.prop_data
+    assert data_.table_values == data.table_values
+    assert data_.get_property('MW') == data.get_property('MW')
+
+
+def test_saved_file_is_smaller_than_pickle(tmp_path):
+    thermodb = _thermodb()
+
+    assert thermodb.save('methanol', file_path=str(tmp_path))
+
+    assert (
+        (tmp_path / 'methanol.ptdb').stat().st_size <
+        len(pickle.dumps(thermodb))
+    )
+
+
+def test_matrix_constants_and_dict_items_round_trip(tmp_path):
+    thermodb = CompBuilder(thermodb_name='mixture')
+    eq = _equation(['methanol', 'ethanol'])
+    assert thermodb.add_data('tau', eq)
+    assert thermodb.add_data('Physical Constants', _constants())
+    assert thermodb.add_data('dHf', {'dHf_IG': 152, 'shape': (1, 2)})
+
+    assert thermodb.save('mixture.ptdb', file_path=str(tmp_path))
+    loaded = CompBuilder.load(str(tmp_path / 'mixture.ptdb'))
+
+    tau = loaded.select('tau')
+    assert tau.matrix_table.equals(eq.matrix_table)
+    np.testing.assert_array_equal(
+        tau.cal(T=298.15)['value'], eq.cal(T=298.15)['value']
+    )
+    assert loaded.select_constant('Physical Constants').table_values == [
+        [1, 'Universal Gas Constant', 'R', 'g', 8.314, 'J/mol.K', ''],
+    ]
+    assert loaded.select('dHf') == {'dHf_IG': 152, 'shape': (1, 2)}
+
+
+def test_load_keeps_reading_pickled_thermodbs(tmp_path):
+    thermodb = _thermodb()
+    path = tmp_path / 'methanol.pkl'
+    path.write_bytes(pickle.dumps(thermodb))
+
+    loaded = CompBuilder.load(str(path))
+
+    assert (
+        loaded.select('vapor-pressure').cal(T=300.0)['value'] ==
+        thermodb.select('vapor-pressure').cal(T=300.0)['value']
+    )
+
+
+def test_pkl_names_resolve_to_the_saved_file(tmp_path):
+    thermodb = _thermodb()
+    assert thermodb.save('methanol', file_path=str(tmp_path))
+    assert thermodb.save('ethanol.pkl', file_path=str(tmp_path))
+
+    # ! never a non-pickle file under a pickle extension
+    assert sorted(p.name for p in tmp_path.iterdir()) == [
+        'ethanol.ptdb', 'methanol.ptdb']
+
+    for name in ('methanol.pkl', 'methanol', 'ethanol.pkl'):
+        loaded = load_thermodb(str(tmp_path / name))
+        assert loaded.retrieve('general | MW')['value'] == '32.04'
+    assert CompBuilder.load(str(tmp_path / 'methanol.pkl')).select('general')
+
+    with pytest.raises(Exception):
+        load_thermodb(str(tmp_path / 'water.pkl'))
+
+
+def test_load_rejects_newer_format_versions(tmp_path):
+    thermodb = _thermodb()
+    assert thermodb.save('methanol', file_path=str(tmp_path))
+    path = tmp_path / 'methanol.ptdb'
+
+    content = bytearray(path.read_bytes())
+    struct.pack_into('<H', content, len(FORMAT_MAGIC), FORMAT_VERSION + 1)
+    path.write_bytes(bytes(content))
+
+    with pytest.raises(Exception, match='not supported'):
+        CompBuilder.load(str(path))
+
+
+def test_dumps_raises_when_an_encoded_attribute_is_missing():
+    thermodb = _thermodb()
+    del vars(thermodb.select('vapor-pressure'))['_TableEquation__table_values']
+
+    with pytest.raises(AttributeError, match='_TableEquation__table_values'):
+        thermodb.dumps()
+
+
+def test_lazy_load_materializes_only_selected_items(tmp_path):
+    thermodb = _thermodb()
+    assert thermodb.add_data('tau', _equation(['methanol', 'ethanol']))
+    assert thermodb.save('methanol', file_path=str(tmp_path))
+
+    loaded = load_thermodb(
+        str(tmp_path / 'methanol.ptdb'), lazy=True, mode='silent')
+
+    assert list(loaded.check_properties()) == ['general']
+    assert list(loaded.check_functions()) == ['vapor-pressure', 'tau']
+    assert loaded.functions.pending() == ['vapor-pressure', 'tau']
+
+    assert (
+        loaded.select('vapor-pressure').cal(T=300.0)['value'] ==
+        thermodb.select('vapor-pressure').cal(T=300.0)['value']
+    )
+    assert loaded.functions.pending() == ['tau']
+    assert loaded.properties.pending() == ['general']
+
+    assert loaded.retrieve('general | MW')['value'] == '32.04'
+    assert loaded.properties.pending() == []
+    # ! added data and built items share the decoded object
+    assert loaded.list_data()['general'] is loaded.select('general')
+
+    # NOTE: pickling decodes the remaining items
+    restored = pickle.loads(pickle.dumps(loaded))
+    np.testing.assert_array_equal(
+        restored.select('tau').cal(T=298.15)['value'],
+        thermodb.select('tau').cal(T=298.15)['value']
+    )
@@ -0,0 +1,116 @@
+import os
+
+import pytest
+
+from pyThermoDB import compile_reference, init
+from pyThermoDB.docs import TableReference
+from pyThermoDB.loader import CustomRef
+from pyThermoDB.manager import CompiledReference, ManageData, reference_cache
+
+from test_reference_cache import REFERENCE_YML
+
+
+@pytest.fixture(autouse=True)
+def _clear_reference_cache():
+    reference_cache.clear()
+    yield
+    reference_cache.clear()
+
+
+def _write(path, mw: float) -> str:
+    path.write_text(REFERENCE_YML.format(mw=mw))
+    return str(path)
+
+
+def _custom_ref(path: str) -> CustomRef:
+    custom_ref = CustomRef({'reference': [path]})
+    assert custom_ref.init_ref()
+    return custom_ref
+
+
+def test_compiled_reference_matches_parsed_reference(tmp_path, monkeypatch):
+    path = _write(tmp_path / 'ref.yml', 32.04)
+    parsed = TableReference(custom_ref=_custom_ref(path))
+
+    compiled_path = compile_reference(path)
+    assert os.path.dirname(compiled_path) == str(tmp_path / 'cache')
+
+    # ! a new process loads the compiled file instead of parsing
+    reference_cache.clear()
+
+    def _fail(*args, **kwargs):
+        raise AssertionError('reference should not be parsed')
+
+    monkeypatch.setattr(ManageData, '_load_reference_state', _fail)
+    loaded = TableReference(custom_ref=_custom_ref(path))
+
+    assert loaded.reference == parsed.reference
+    assert loaded.databook_bulk == parsed.databook_bulk
+    assert loaded.symbols == parsed.symbols
+    assert loaded.reference_local_no == parsed.reference_local_no
+    assert 'CUSTOM-REF-1' in init(custom_reference=path).list_databooks(
+        res_format='list')
+
+
+def test_changed_source_is_parsed_again(tmp_path):
+    path = _write(tmp_path / 'ref.yml', 32.04)
+    first = compile_reference(path)
+
+    # same size and mtime, only the content differs
+    st = os.stat(path)
+    _write(tmp_path / 'ref.yml', 99.99)
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns))
+    reference_cache.clear()
+
+    assert compile_reference(path) != first
+    values = TableReference(custom_ref=_custom_ref(path)).reference[
+        'REFERENCES']['CUSTOM-REF-1']['TABLES']['general-data']['VALUES']
+    assert values[0][-1] == 99.99
+
+
+def test_invalid_compiled_file_falls_back_to_parsing(tmp_path):
+    path = _write(tmp_path / 'ref.yml', 32.04)
+    compiled_path = compile_reference(path)
+    with open(compiled_path, 'wb') as f:
+        f.write(b'corrupted')
+    reference_cache.clear()
+
+    custom_ref = _custom_ref(path)
+    state = CompiledReference.load(
+        custom_ref, lambda: {'parsed': True}, lambda *args: None)
+
+    assert state == {'parsed': True}
+    assert CompiledReference.read(
+        compiled_path, CompiledReference.source_digest(custom_ref)
+    ) == {'parsed': True}
+
+
+def test_in_memory_contents_are_compiled_only_on_request(tmp_path):
+    content = REFERENCE_YML.format(mw=32.04)
+    init(custom_reference={'reference': [content]})
+
+    cache = tmp_path / 'cache'
+    assert not cache.exists() or not list(cache.glob('reference-*.ref'))
+
+    compiled_path = compile_reference({'reference': [content]})
+    assert os.path.exists(compiled_path)
+
+
+def test_cache_directory_keeps_the_most_recently_used_files(
+    tmp_path, monkeypatch
+):
+    monkeypatch.setattr(CompiledReference, 'max_files', 2)
+    paths = [_write(tmp_path / f'ref-{i}.yml', 30.0 + i) for i in range(3)]
+
+    compiled = []
+    for i, path in enumerate(paths[:2]):
+        compiled.append(compile_reference(path))
+        os.utime(compiled[-1], ns=(i, i))
+
+    # NOTE: using the first one makes the second the oldest
+    reference_cache.clear()
+    TableReference(custom_ref=_custom_ref(paths[0]))
+    compiled.append(compile_reference(paths[2]))
+
+    assert sorted(os.listdir(tmp_path / 'cache')) == sorted(
+        os.path.basename(p) for p in (compiled[0], compiled[2]))
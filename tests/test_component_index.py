@@ -0,0 +1,117 @@
+import os
+
+import pytest
+
+from pyThermoDB import init
+from pyThermoDB.docs import TableReference
+from pyThermoDB.manager import ComponentIndex, reference_cache
+
+
+REFERENCE_CONTENT = """
+REFERENCES:
+  CUSTOM-REF-1:
+    DATABOOK-ID: 1
+    TABLES:
+      General-Data:
+        TABLE-ID: 1
+        DESCRIPTION: General component data.
+        DATA: []
+        STRUCTURE:
+          COLUMNS: [No., Name, Formula, State, Molecular-Weight]
+          SYMBOL: [None, None, None, None, MW]
+          UNIT: [None, None, None, None, g/mol]
+          CONVERSION: [None, None, None, None, 1]
+        VALUES:
+          - [1, argon, Ar, g, 39.95]
+          - [2, ethanol, C2H5OH, l, 46.07]
+"""
+
+
+@pytest.fixture(autouse=True)
+def _clear_reference_cache():
+    reference_cache.clear()
+    yield
+    reference_cache.clear()
+
+
+def test_search_databook_covers_custom_reference_tables():
+    thermodb = init(custom_reference={'reference': [REFERENCE_CONTENT]})
+
+    exact = thermodb.search_databook(['Argon'], res_format='list')
+    similar = thermodb.search_databook(
+        ['RGO'], res_format='list', search_mode='similar')
+    both = thermodb.search_databook(
+        ['ethanol', 'C2H5OH'], res_format='list')
+
+    for res in (exact, similar, both):
+        assert [r['table-name'] for r in res] == ['General-Data']
+        assert res[0]['databook-name'] == 'CUSTOM-REF-1'
+        assert res[0]['data-type'] == 'data'
+    assert thermodb.search_databook(['argon', 'CO2'], res_format='list') == []
+    assert 'ethanol' in thermodb.list_components(res_format='list')
+
+
+def test_component_index_is_persisted_and_reused(tmp_path, monkeypatch):
+    table_ref = TableReference()
+    index = table_ref.component_index()
+
+    files = os.listdir(tmp_path / 'cache')
+    assert len(files) == 1
+
+    # ! a new process reads the persisted index instead of loading tables
+    reference_cache.clear()
+
+    def _fail(*args, **kwargs):
+        raise AssertionError('tables should not be loaded')
+
+    monkeypatch.setattr(ComponentIndex, 'from_table_reference', _fail)
+    restored = TableReference().component_index()
+
+    assert restored is not index
+    assert restored.tables == index.tables
+    assert (
+        restored.search(['methanol'], 'exact', ['Name', 'Formula']) ==
+        index.search(['methanol'], 'exact', ['Name', 'Formula'])
+    )
+
+
+def test_fuzzy_search_ranks_typos_and_synonyms():
+    content = REFERENCE_CONTENT.replace(
+        'Name, Formula, State, Molecular-Weight',
+        'Name, Formula, State, Synonyms, Molecular-Weight'
+    ).replace(
+        'None, None, None, None,', 'None, None, None, None, None,'
+    ).replace(
+        'g, 39.95', 'g, noble gas, 39.95'
+    ).replace(
+        'l, 46.07', 'l, ethyl alcohol, 46.07'
+    )
+    thermodb = init(custom_reference={'reference': [content]})
+
+    typo = thermodb.search_databook(
+        ['methanl'], res_format='list', search_mode='fuzzy')
+    synonym = thermodb.search_databook(
+        ['ethyl alcohl'], res_format='list', search_mode='fuzzy', top_k=1)
+
+    assert typo[0]['matched-value'].lower() == 'methanol'
+    assert typo[0]['score'] >= 0.3
+    assert [r['score'] for r in typo] == sorted(
+        (r['score'] for r in typo), reverse=True)
+    assert len({r['matched-value'] for r in typo}) <= 10
+    assert synonym[0]['matched-value'] == 'ethyl alcohol'
+    assert synonym[0]['matched-column'] == 'Synonyms'
+    assert synonym[0]['table-name'] == 'General-Data'
+
+
+def test_fuzzy_search_threshold_and_top_k():
+    index = TableReference().component_index()
+
+    best = index.fuzzy_search(['methanl'], top_k=1)
+    loose = index.fuzzy_search(['methanl'], top_k=5, min_score=0.0)
+
+    assert len(best) == 1 and best[0]['value'].lower() == 'methanol'
+    assert 1 < len(loose) <= 5
+    assert loose[0] == best[0]
+    assert all(m['score'] >= 0.3 for m in index.fuzzy_search(['methanl']))
+    assert index.fuzzy_search(['methanl'], min_score=1.0) == []
+    assert index.fuzzy_search(['zzzz']) == []
@@ -0,0 +1,92 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from pyThermoDB import build_component_thermodb
+from pyThermoDB.config.deps import (
+    AppConfig,
+    config_scope,
+    get_config,
+    isolated_config,
+    set_config,
+)
+
+
+REFERENCE_CONTENT = """
+REFERENCES:
+  CUSTOM-REF-1:
+    DATABOOK-ID: 1
+    TABLES:
+      General-Data:
+        TABLE-ID: 1
+        DESCRIPTION: General component data.
+        DATA: []
+        STRUCTURE:
+          COLUMNS: [No., Name, Formula, State, Molecular-Weight]
+          SYMBOL: [None, None, None, None, MW]
+          UNIT: [None, None, None, None, g/mol]
+          CONVERSION: [None, None, None, None, 1]
+        VALUES:
+          - [1, carbon dioxide, CO2, g, 44.01]
+          - [2, methanol, CH3OH, l, 32.04]
+"""
+
+REFERENCE_CONFIG = {
+    'general': {'databook': 'CUSTOM-REF-1', 'table': 'General-Data'},
+}
+
+
+def test_config_scope_restores_previous_config():
+    assert get_config() == AppConfig()
+
+    with config_scope(AppConfig(include_data=False, component_name='water')):
+        assert get_config().include_data is False
+        assert get_config().component_name == 'water'
+
+    assert get_config() == AppConfig()
+
+
+def test_config_is_local_to_each_thread():
+    barrier = threading.Barrier(2)
+
+    def _read(include_data: bool) -> bool:
+        with config_scope(AppConfig(include_data=include_data)):
+            # ! both threads have set their config before reading it
+            barrier.wait()
+            return get_config().include_data
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        results = list(executor.map(_read, [True, False]))
+
+    assert results == [True, False]
+
+
+def test_isolated_config_does_not_leak_to_the_caller():
+    @isolated_config
+    def _build():
+        set_config(AppConfig(component_name='methanol'))
+        return get_config().component_name
+
+    assert _build() == 'methanol'
+    assert get_config().component_name is None
+
+
+def test_concurrent_builds_keep_their_own_config():
+    def _build(args):
+        component_name, include_data = args
+        thermodb = build_component_thermodb(
+            component_name=component_name,
+            reference_config=REFERENCE_CONFIG,
+            custom_reference={'reference': [REFERENCE_CONTENT]},
+            include_data=include_data,
+        )
+        return (
+            thermodb.build_details()['component_name'],
+            thermodb.select('general').include_data,
+        )
+
+    tasks = [('methanol', True), ('carbon dioxide', False)] * 4
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        results = list(executor.map(_build, tasks))
+
+    assert results == tasks
+    assert get_config() == AppConfig()
@@ -0,0 +1,94 @@
+import os
+import subprocess
+import sys
+
+import pytest
+
+import pyThermoDB
+from pyThermoDB.utils.lazy_import import LazyModule
+from pyThermoDB.utils.timing import measure_time
+
+from test_compbuilder_save_load import _thermodb
+
+ROOT = os.path.join(os.path.dirname(__file__), '..')
+
+# NOTE: dependencies only the reference/build paths need
+HEAVY_MODULES = ('pandas', 'pythermodb_settings')
+
+
+def _loaded_modules(code: str) -> dict:
+    # ! fresh interpreter, modules of the test session are already imported
+    script = (
+        f"{code}\n"
+        "import sys\n"
+        f"print([m in sys.modules for m in {HEAVY_MODULES!r}])\n"
+    )
+    env = dict(os.environ, PYTHONPATH=os.path.abspath(ROOT))
+    output = subprocess.run(
+        [sys.executable, '-c', script],
+        check=True, capture_output=True, text=True, env=env
+    ).stdout.strip().splitlines()[-1]
+    return dict(zip(HEAVY_MODULES, eval(output)))
+
+
+def test_import_does_not_load_heavy_dependencies():
+    assert _loaded_modules("import pyThermoDB") == {
+        'pandas': False, 'pythermodb_settings': False}
+
+
+def test_load_and_evaluate_thermodb_does_not_load_heavy_dependencies(tmp_path):
+    assert _thermodb().save('methanol', file_path=str(tmp_path))
+    path = str(tmp_path / 'methanol.ptdb')
+
+    loaded = _loaded_modules(
+        "import pyThermoDB as ptdb\n"
+        f"thermodb = ptdb.load_thermodb({path!r})\n"
+        "thermodb.select('vapor-pressure').cal(T=300.0)\n"
+    )
+    assert loaded == {'pandas': False, 'pythermodb_settings': False}
+
+
+def test_get_property_does_not_load_pandas(tmp_path):
+    assert _thermodb().save('methanol', file_path=str(tmp_path))
+    path = str(tmp_path / 'methanol.ptdb')
+
+    loaded = _loaded_modules(
+        "import pyThermoDB as ptdb\n"
+        f"thermodb = ptdb.load_thermodb({path!r})\n"
+        "general = thermodb.select('general')\n"
+        "assert general.get_property('mw')['value'] == '32.04'\n"
+        "assert general.get_property(1)['property_name']\n"
+        "thermodb.retrieve('general | MW')\n"
+    )
+    assert loaded['pandas'] is False
+
+
+def test_public_api_resolves_lazily():
+    assert set(pyThermoDB.__all__) <= set(dir(pyThermoDB))
+    assert pyThermoDB.load_thermodb is pyThermoDB.app.load_thermodb
+    assert pyThermoDB.ThermoDB.__name__ == 'ThermoDB'
+
+    with pytest.raises(AttributeError):
+        pyThermoDB.not_an_export
+
+
+def test_lazy_module_imports_on_first_access():
+    module = LazyModule('json')
+
+    assert module.dumps([1]) == '[1]'
+    assert 'dumps' in vars(module)
+    assert module.loaded
+
+
+def test_measure_time_modes():
+    @measure_time
+    def add(a, b):
+        return a + b
+
+    assert add(1, 2) == 3
+    assert add(1, 2, mode='log') == 3
+    result = add(1, 2, mode='attach')
+    assert result['result'] == 3 and 'computation_time' in result
+
+    with pytest.raises(ValueError):
+        add(1, 2, mode='unknown')
@@ -0,0 +1,93 @@
+import pickle
+
+import pytest
+import yaml
+
+from pyThermoDB import init
+from pyThermoDB.docs import TableReference
+from pyThermoDB.loader import CustomRef
+from pyThermoDB.loader.lazyref import LazyDict, outline_references
+from pyThermoDB.manager import reference_cache
+
+from test_build_component_thermodbs import REFERENCE_CONTENT
+
+
+@pytest.fixture(autouse=True)
+def _clear_reference_cache():
+    reference_cache.clear()
+    yield
+    reference_cache.clear()
+
+
+def _tables(table_ref: TableReference) -> dict:
+    return table_ref.reference['REFERENCES']['CUSTOM-REF-1']['TABLES']
+
+
+def _table_ref() -> TableReference:
+    custom_ref = CustomRef({'reference': [REFERENCE_CONTENT]})
+    assert custom_ref.init_ref()
+    return TableReference(custom_ref=custom_ref)
+
+
+def test_outline_matches_full_parse_and_defers_tables():
+    reference = outline_references(REFERENCE_CONTENT)
+    tables = reference['REFERENCES']['CUSTOM-REF-1']['TABLES']
+
+    assert all(
+        isinstance(tb, LazyDict) and tb.pending for tb in tables.values())
+    # ! outline fields and keys do not parse the table
+    assert tables['General-Data']['TABLE-ID'] == 1
+    assert 'VALUES' in tables['General-Data']
+    assert tables['General-Data'].get('EQUATIONS') is None
+    assert tables['General-Data'].pending
+
+    assert reference == yaml.load(REFERENCE_CONTENT, Loader=yaml.FullLoader)
+    assert not tables['General-Data'].pending
+    assert pickle.loads(pickle.dumps(tables['Vapor-Pressure'])) == \
+        tables['Vapor-Pressure']
+
+
+def test_tables_are_parsed_on_first_use():
+    table_ref = _table_ref()
+    tables = _tables(table_ref)
+
+    assert [tb['table'] for tb in table_ref.databook_bulk['CUSTOM-REF-1']] == [
+        'General-Data', 'Vapor-Pressure']
+    assert table_ref.list_tables('CUSTOM-REF-1', res_format='list') == [
+        ['General-Data', 'data', '[1]'],
+        ['Vapor-Pressure', 'equation', '[2]'],
+    ]
+    assert tables['General-Data'].pending and tables['Vapor-Pressure'].pending
+
+    tb = table_ref.get_table('CUSTOM-REF-1', 'Vapor-Pressure')
+
+    assert tb['table_type'] == 'equations'
+    assert tb['equations'][0]['RETURNS']['vapor-pressure']['symbol'] == 'VaPr'
+    assert not tables['Vapor-Pressure'].pending
+    assert tables['General-Data'].pending
+
+
+def test_compiled_reference_keeps_tables_lazy():
+    _table_ref()
+    reference_cache.clear()
+
+    table_ref = _table_ref()
+    tables = _tables(table_ref)
+
+    assert tables['General-Data'].pending and tables['Vapor-Pressure'].pending
+    thermodb = init(custom_reference={'reference': [REFERENCE_CONTENT]})
+    assert thermodb.table_data(
+        'CUSTOM-REF-1', 'General-Data')['Name'].tolist()[2:] == [
+        'carbon dioxide', 'methanol', 'water']
+    assert tables['Vapor-Pressure'].pending
+
+
+def test_unsupported_layouts_are_parsed_at_once():
+    content = REFERENCE_CONTENT.replace(
+        'DESCRIPTION: Vapor pressure.',
+        'DESCRIPTION: &desc Vapor pressure.'
+    )
+
+    assert outline_references(content) is None
+    assert CustomRef.load_yml(content, lazy=True) == yaml.load(
+        content, Loader=yaml.FullLoader)
@@ -0,0 +1,158 @@
+import os
+
+import pytest
+
+from pyThermoDB.loader import CustomRef
+from pyThermoDB.loader.markdownref import (
+    MarkdownReferenceError,
+    iter_markdown_reference,
+    parse_markdown_reference,
+)
+
+EXAMPLES = os.path.join(os.path.dirname(__file__), '..', 'examples')
+
+MARKDOWN_CONTENT = """# REFERENCES
+
+## CUSTOM-REF-1
+
+DATABOOK-ID: 1
+
+### General-Data
+
+TABLE-ID: 1
+
+DESCRIPTION: This table provides the general data of different chemical species
+
+DATA: []
+
+STRUCTURE:
+
+- COLUMNS: [No.,Name,Formula,State,Molecular-Weight]
+- SYMBOL: [None,None,None,None,MW]
+- UNIT: [None,None,None,None,g/mol]
+
+VALUES:
+
+- [1,'carbon dioxide','CO2','g',44.01]
+- [2,"methanol",'CH3OH','l',32.04]
+
+### Vapor-Pressure
+
+TABLE-ID: 2
+
+DESCRIPTION: This table provides the vapor pressure (P) in Pa.
+
+EQUATIONS:
+
+- EQ-1:
+  - BODY:
+    - parms['C1 | C1 | 1'] = parms['C1 | C1 | 1']/1
+    - res['vapor-pressure | VaPr | Pa'] = math.exp(parms['C1 | C1 | 1'])
+  - BODY-INTEGRAL:
+  - BODY-FIRST-DERIVATIVE:
+
+STRUCTURE:
+
+- COLUMNS: [No.,Name,Formula,State,C1,Tmin,Tmax,Eq]
+- SYMBOL: [None,None,None,None,C1,Tmin,Tmax,None]
+
+VALUES:
+
+- [1,'carbon dioxide','CO2','g',140.54,216.58,304.21,1]
+
+EXTERNAL-REFERENCES:
+
+- https://example.com/vapor-pressure
+"""
+
+
+def test_markdown_reference_tables():
+    reference = parse_markdown_reference(MARKDOWN_CONTENT)
+    databook = reference['REFERENCES']['CUSTOM-REF-1']
+
+    assert databook['DATABOOK-ID'] == '1'
+    assert list(databook['TABLES']) == ['General-Data', 'Vapor-Pressure']
+
+    general = databook['TABLES']['General-Data']
+    assert list(general) == [
+        'TABLE-ID', 'DESCRIPTION', 'DATA', 'STRUCTURE', 'VALUES']
+    assert general['TABLE-ID'] == '1'
+    assert general['DATA'] == []
+    assert general['STRUCTURE']['UNIT'] == [
+        'None', 'None', 'None', 'None', 'g/mol']
+    assert general['VALUES'] == [
+        ['1', 'carbon dioxide', 'CO2', 'g', '44.01'],
+        ['2', 'methanol', 'CH3OH', 'l', '32.04'],
+    ]
+
+    vapor = databook['TABLES']['Vapor-Pressure']
+    assert vapor['EQUATIONS'] == {
+        'EQ-1': {
+            'BODY': [
+                "parms['C1 | C1 | 1'] = parms['C1 | C1 | 1']/1",
+                "res['vapor-pressure | VaPr | Pa'] = "
+                "math.exp(parms['C1 | C1 | 1'])",
+            ],
+            'BODY-INTEGRAL': 'None',
+            # ! last part of the section
+            'BODY-FIRST-DERIVATIVE': 'None',
+        }
+    }
+    assert vapor['EXTERNAL-REFERENCES'] == [
+        'https://example.com/vapor-pressure']
+
+
+def test_markdown_reference_pattern_file():
+    custom_ref = CustomRef.__new__(CustomRef)
+    with open(os.path.join(EXAMPLES, 'external-ref-2', 'md-pattern.md'),
+              encoding='utf-8') as f:
+        reference = custom_ref.parse_markdown(f)
+
+    table = reference['REFERENCES']['content']['TABLES']['table-name-1']
+    assert table['MATRIX-SYMBOL'] == ['a', 'b', 'c', 'alpha']
+    assert list(table['EQUATIONS']) == ['EQ-1', 'EQ-2']
+    assert table['EQUATIONS']['EQ-2']['BODY-SECOND-DERIVATIVE'] == [
+        'content', 'content']
+    assert table['STRUCTURE']['CONVERSION'] == ['item1', 'item2']
+    assert table['ITEMS'] == [{'item1': [['item1', 'item2']]}]
+    assert table['EXTERNAL-REFERENCES'] == ['url1', 'url2']
+
+
+def test_markdown_reference_streams_tables():
+    read = []
+
+    def lines():
+        for i, line in enumerate(MARKDOWN_CONTENT.split('\n')):
+            read.append(i)
+            yield line
+
+    events = iter_markdown_reference(lines())
+    assert next(events) == ('DATABOOK', 'CUSTOM-REF-1', None)
+    assert next(events) == ('DATABOOK-ID', '1', None)
+
+    kind, name, _ = next(events)
+    assert (kind, name) == ('TABLE', 'General-Data')
+    # ! yielded at the next table heading, before the rest is read
+    assert len(read) < MARKDOWN_CONTENT.count('\n')
+
+
+def test_markdown_reference_line_endings():
+    assert parse_markdown_reference(MARKDOWN_CONTENT.replace('\n', '\r\n')) \
+        == parse_markdown_reference(MARKDOWN_CONTENT)
+
+
+def test_markdown_reference_errors_report_line():
+    with pytest.raises(MarkdownReferenceError) as e:
+        parse_markdown_reference("# REFERENCES\n\n### table\n\nTABLE-ID: 1\n")
+    assert e.value.line == 3
+
+    with pytest.raises(MarkdownReferenceError) as e:
+        parse_markdown_reference("# REFERENCES\n\nDATABOOK-ID: 1\n")
+    assert e.value.line == 4
+    assert str(e.value).startswith('line 4:')
+
+    # ! not wrapped by CustomRef
+    with pytest.raises(MarkdownReferenceError) as e:
+        CustomRef.__new__(CustomRef).parse_markdown(
+            "# REFERENCES\n\nDATABOOK-ID: 1\n")
+    assert e.value.line == 4
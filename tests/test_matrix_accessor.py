@@ -0,0 +1,53 @@
+import numpy as np
+
+from pyThermoDB.builder import CompBuilder
+from pyThermoDB.core.matrix_tensor import MatrixAccessor
+
+from test_table_matrix_data_tensor import _matrix_data, _pair_table, _square_table
+
+
+def test_accessor_returns_the_pair_value():
+    data = _matrix_data(_square_table())
+
+    alpha = data.accessor('Alpha | benzene | ethanol')
+
+    assert isinstance(alpha, MatrixAccessor)
+    assert alpha() == -0.916
+    assert data.accessor('Alpha_methanol_ethanol')() == 0.3
+    assert _matrix_data(_pair_table()).accessor('a_ethanol_methanol')() == -2.313
+
+
+def test_accessor_returns_matrix_copies_and_rebinds_on_a_new_table():
+    data = _matrix_data(_square_table())
+    alpha = data.accessor('Alpha', ['methanol', 'ethanol'])
+
+    res = alpha()
+    np.testing.assert_array_equal(res, [[0.0, 0.3], [0.3, 0.0]])
+    res[0, 1] = 10.0
+    assert alpha()[0, 1] == 0.3
+
+    # NOTE: bound once
+    data.mat = None
+    assert alpha()[1, 0] == 0.3
+    del data.mat
+
+    table = _square_table()
+    table.loc[2, 'Alpha_i_2'] = '0.5'
+    data.matrix_table = table
+
+    assert alpha()[0, 1] == 0.5
+
+
+def test_retrieve_matrix_sources():
+    thermodb = CompBuilder(thermodb_name='mixture')
+    assert thermodb.add_data('nrtl-data', _matrix_data(_square_table()))
+    thermodb.build()
+
+    for _ in range(2):
+        res = thermodb.retrieve('nrtl-data | Alpha_i_j | methanol | benzene')
+        assert res['value'] == -1.709
+        assert res['symbol'] == 'Alpha_methanol_benzene'
+
+    res = thermodb.retrieve(
+        ' nrtl-data|Alpha_benzene_methanol ', symbol_format='numeric')
+    assert res['value'] == 11.58 and res['symbol'] == 'Alpha_3_1'
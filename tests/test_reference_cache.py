@@ -0,0 +1,121 @@
+import os
+import threading
+
+import pytest
+
+from pyThermoDB.docs import TableReference
+from pyThermoDB.loader import CustomRef
+from pyThermoDB.manager import ReferenceCache, reference_cache
+
+
+REFERENCE_YML = """
+REFERENCES:
+  CUSTOM-REF-1:
+    DATABOOK-ID: 1
+    TABLES:
+      general-data:
+        TABLE-ID: 1
+        DESCRIPTION: general data
+        DATA: []
+        STRUCTURE:
+          COLUMNS: [No.,Name,Formula,State,MW]
+          SYMBOL: [None,None,None,None,MW]
+          UNIT: [None,None,None,None,g/mol]
+        VALUES:
+          - [1,'methanol','CH3OH','l',{mw}]
+"""
+
+
+def _custom_ref(path: str, mw: float) -> CustomRef:
+    with open(path, 'w') as f:
+        f.write(REFERENCE_YML.format(mw=mw))
+    custom_ref = CustomRef({'reference': [path]})
+    assert custom_ref.init_ref()
+    return custom_ref
+
+
+@pytest.fixture(autouse=True)
+def _clear_reference_cache():
+    reference_cache.clear()
+    yield
+    reference_cache.clear()
+
+
+def test_reference_is_parsed_once_per_source(tmp_path):
+    custom_ref = _custom_ref(str(tmp_path / 'ref.yml'), 32.04)
+
+    first = TableReference(custom_ref=custom_ref)
+    second = TableReference(custom_ref=custom_ref)
+
+    assert reference_cache.cache_info()['misses'] == 1
+    assert reference_cache.cache_info()['hits'] == 1
+    assert second.databook_bulk is first.databook_bulk
+    assert second.reference_local_no == first.reference_local_no
+    assert 'CUSTOM-REF-1' in second.databook
+
+
+def test_modified_reference_file_is_parsed_again(tmp_path):
+    path = str(tmp_path / 'ref.yml')
+    first = TableReference(custom_ref=_custom_ref(path, 32.04))
+
+    # ! force a new fingerprint
+    second_ref = _custom_ref(path, 100.5)
+    st = os.stat(path)
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 10**9))
+    second = TableReference(custom_ref=second_ref)
+
+    assert reference_cache.cache_info()['misses'] == 2
+    assert second.databook_bulk is not first.databook_bulk
+    values = second.reference['REFERENCES']['CUSTOM-REF-1'][
+        'TABLES']['general-data']['VALUES']
+    assert values[0][-1] == 100.5
+
+
+def test_invalidate_by_path_and_lru_bound(tmp_path):
+    path = str(tmp_path / 'ref.yml')
+    custom_ref = _custom_ref(path, 32.04)
+    TableReference(custom_ref=custom_ref)
+    TableReference()
+
+    assert reference_cache.invalidate(path) == 1
+    assert reference_cache.cache_info()['size'] == 1
+
+    cache = ReferenceCache(maxsize=2)
+    for i in range(3):
+        cache.get(cache.content_key(f"content-{i}"), lambda: i)
+    assert cache.cache_info()['size'] == 2
+    assert cache.get(cache.content_key("content-0"), lambda: 'reloaded') == 'reloaded'
+
+
+def test_loaders_run_outside_the_lock_and_load_a_key_once():
+    cache = ReferenceCache()
+    started, release = threading.Event(), threading.Event()
+    calls = []
+
+    def slow_loader():
+        calls.append('slow')
+        started.set()
+        release.wait(5)
+        return 'slow'
+
+    results = []
+
+    def get():
+        results.append(cache.get('a', slow_loader))
+
+    threads = [threading.Thread(target=get) for _ in range(2)]
+    threads[0].start()
+    assert started.wait(5)
+    threads[1].start()
+
+    # ! other keys are served while 'a' is loading
+    assert cache.get('b', lambda: 'fast') == 'fast'
+
+    release.set()
+    for thread in threads:
+        thread.join(5)
+
+    assert results == ['slow', 'slow'] and calls == ['slow']
+    assert cache.cache_info()['misses'] == 2
+    assert cache.cache_info()['hits'] == 1
+
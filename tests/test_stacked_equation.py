@@ -0,0 +1,88 @@
+import math
+
+import numpy as np
+import pytest
+
+from pyThermoDB.core import StackedEquation
+from pyThermoDB.handlers import TableEquationDefinitionError
+
+from test_table_equation_batch import _equation
+from test_compbuilder_save_load import _thermodb
+
+
+def _component(body: list[str], C1: float, C2: float):
+    eq = _equation(body)
+    eq.trans_data = {
+        **eq.trans_data,
+        'C1': {'value': C1, 'unit': 1, 'symbol': 'C1'},
+        'C2': {'value': C2, 'unit': 1, 'symbol': 'C2'},
+    }
+    return eq
+
+
+def test_stacked_evaluate_matches_per_component_evaluate():
+    body = [
+        "parms['C1'] = parms['C1']/1",
+        "res = math.exp(parms['C1'] + parms['C2']/args['T'])",
+    ]
+    equations = [
+        _component(body, 10.0, -1000.0),
+        _component(body, 12.0, -2500.0),
+        _component(body, 8.0, -500.0),
+    ]
+    T = np.linspace(250.0, 500.0, 11)
+
+    stacked = StackedEquation(equations)
+    res = stacked.evaluate(T=T)
+
+    assert len(stacked) == 3 and stacked.parms.shape == (3, 2)
+    assert res.shape == (3, 11)
+    for row, eq in zip(res, equations):
+        np.testing.assert_allclose(row, [eq.evaluate(T=t) for t in T])
+    assert stacked.evaluate(T=300.0).shape == (3,)
+    assert stacked.metadata['symbol'] == 'VaPr'
+
+
+def test_stacked_evaluate_falls_back_for_branching_bodies():
+    body = ["res = parms['C1'] if args['T'] > 300 else parms['C2']"]
+    stacked = StackedEquation([
+        _component(body, 1.0, 2.0),
+        _component(body, 3.0, 4.0),
+    ])
+
+    np.testing.assert_array_equal(
+        stacked.evaluate(T=[250.0, 350.0]), [[2.0, 1.0], [4.0, 3.0]]
+    )
+
+
+def test_stacked_evaluate_does_not_change_the_packed_parms():
+    body = ["c1 = parms['C1']", "c1 += 1", "res = c1"]
+    stacked = StackedEquation([
+        _component(body, 1.0, 2.0),
+        _component(body, 3.0, 4.0),
+    ])
+
+    for _ in range(2):
+        np.testing.assert_array_equal(stacked.evaluate(T=300.0), [2.0, 4.0])
+    np.testing.assert_array_equal(stacked.parms, [[1.0, 2.0], [3.0, 4.0]])
+    assert not stacked.parms.flags.writeable
+
+
+def test_stacked_equation_requires_a_shared_body():
+    with pytest.raises(TableEquationDefinitionError):
+        StackedEquation([
+            _component(["res = parms['C1']"], 1.0, 2.0),
+            _component(["res = parms['C2']"], 1.0, 2.0),
+        ])
+
+    with pytest.raises(ValueError):
+        StackedEquation([])
+
+
+def test_stacked_equation_from_thermodbs():
+    thermodbs = [_thermodb(), _thermodb()]
+
+    res = StackedEquation(thermodbs, 'vapor-pressure').evaluate(T=[300.0])
+
+    expected = thermodbs[0].select('vapor-pressure').evaluate(T=300.0)
+    assert math.isclose(res[1, 0], expected)
@@ -0,0 +1,123 @@
+import importlib
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from pyThermoDB.docs import TableReference
+from pyThermoDB.manager import TableCache, table_cache
+
+
+@pytest.fixture(autouse=True)
+def _clear_table_cache():
+    table_cache.clear()
+    yield
+    table_cache.clear()
+
+
+def test_local_table_is_read_once():
+    tb_ref = TableReference()
+
+    first = tb_ref.load_table(1, 2)
+    second = TableReference().load_table(1, 2)
+
+    info = table_cache.cache_info()
+    assert info['misses'] == 1
+    assert info['hits'] == 1
+    assert info['bytes'] > 0
+    pd.testing.assert_frame_equal(first, second)
+
+
+def test_returned_table_does_not_change_the_cache():
+    tb_ref = TableReference()
+    df = tb_ref.load_table(1, 2)
+    expected = df.copy()
+
+    df.iloc[2, 1] = 'changed'
+    df['extra'] = 1
+
+    pd.testing.assert_frame_equal(tb_ref.load_table(1, 2), expected)
+
+
+def test_view_is_shallow_under_copy_on_write(monkeypatch):
+    df = pd.DataFrame({'a': [1.0, 2.0]})
+
+    # ! the package attribute is the cache instance
+    module = importlib.import_module('pyThermoDB.manager.table_cache')
+
+    monkeypatch.setattr(module, '_copy_on_write', lambda: True)
+    assert np.shares_memory(
+        TableCache.view(df)['a'].to_numpy(), df['a'].to_numpy())
+
+    monkeypatch.setattr(module, '_copy_on_write', lambda: False)
+    assert not np.shares_memory(
+        TableCache.view(df)['a'].to_numpy(), df['a'].to_numpy())
+
+
+def test_search_table_uses_cached_table():
+    tb_ref = TableReference()
+
+    for _ in range(3):
+        res = tb_ref.search_table(1, 2, 'Name', 'methanol')
+
+    assert not res.empty
+    assert table_cache.cache_info()['misses'] == 1
+    # ! each search reads the table and its index (2 lookups)
+    assert table_cache.cache_info()['hits'] == 5
+
+
+def test_table_cache_memory_cap_and_invalidation(tmp_path):
+    cache = TableCache(maxsize=10, max_bytes=2000)
+    small = pd.DataFrame({'a': range(10)})
+    large = pd.DataFrame({'a': range(1000)})
+
+    cache.get(('db', 'small', ('content', '1')), lambda: small)
+    cache.get(('db', 'large', ('content', '2')), lambda: large)
+    assert cache.cache_info()['size'] == 1
+
+    path = str(tmp_path / 'table.csv')
+    small.to_csv(path, index=False)
+    cache.get(('db', 'csv', cache.file_key(path)), lambda: pd.read_csv(path))
+    assert cache.invalidate(os.path.abspath(path)) == 1
+    assert cache.cache_info()['size'] == 1
+    assert cache.cache_info()['bytes'] == small.memory_usage(deep=True).sum()
+
+
+@pytest.mark.parametrize(
+    'column_name, lookup',
+    [
+        ('Name', 'Methanol'),
+        ('Formula', 'co2'),
+        (['Name', 'State'], ['carbon monoxide', 'G']),
+        (['Formula', 'State'], ['H2O', 'g']),
+        (['Name', 'State'], ['methanol', 's']),
+    ]
+)
+def test_search_table_index_matches_column_filter(column_name, lookup):
+    tb_ref = TableReference()
+    df = tb_ref.load_table(1, 2)
+
+    columns = [column_name] if isinstance(column_name, str) else column_name
+    lookups = [lookup] if isinstance(lookup, str) else lookup
+    mask = pd.Series(True, index=df.index)
+    for col, value in zip(columns, lookups):
+        mask &= df[col].str.lower() == value.lower()
+
+    res = tb_ref.search_table(1, 2, column_name, lookup)
+
+    if mask.any():
+        pd.testing.assert_frame_equal(res, pd.concat([df.iloc[:2, :], df[mask]]))
+    else:
+        assert res.empty
+
+
+def test_table_index_is_built_once_per_column_set():
+    tb_ref = TableReference()
+
+    first = tb_ref.table_index(1, 2, ('Name', 'State'))
+    second = tb_ref.table_index(1, 2, ('Name', 'State'))
+
+    assert first is second
+    assert first[('methanol', 'g')] == [5]
+    assert tb_ref.table_index(1, 2, ('Missing',)) is None
@@ -0,0 +1,89 @@
+import math
+import pickle
+
+import pytest
+
+from pyThermoDB.core import TableData
+from pyThermoDB.handlers import TableLookupError
+
+
+def _table_data() -> TableData:
+    data = TableData('reference', 'general-data', {})
+    data.prop_data = {
+        'MW': {'symbol': 'MW', 'unit': 'g/mol', 'value': 32.04},
+        'Critical-Temperature': {'symbol': 'Tc', 'unit': 'K', 'value': 512},
+        'Acentric-Factor': {'symbol': ' w ', 'unit': 'None', 'value': None},
+        'tc': {'symbol': 'x', 'value': 1.0},
+        'data': {'symbol': 'data', 'value': 'excluded'},
+    }
+    return data
+
+
+def test_get_property_by_name_and_symbol_case_insensitive():
+    data = _table_data()
+
+    res = data.get_property(' mw ', message='MW')
+    assert res == {
+        'property_name': 'MW',
+        'symbol': 'MW',
+        'unit': 'g/mol',
+        'value': '32.04',
+        'message': 'MW',
+        'databook_name': 'reference',
+        'table_name': 'general-data',
+    }
+    assert data.get_property('W')['property_name'] == 'Acentric-Factor'
+    assert data.get_property('critical-temperature')['value'] == '512'
+
+    with pytest.raises(TableLookupError):
+        data.get_property('data')
+
+
+def test_get_property_names_before_symbols():
+    data = _table_data()
+
+    # ! 'tc' is a name and the symbol of Critical-Temperature
+    res = data.get_property('Tc')
+    assert res['property_name'] == 'tc' and res['value'] == '1.0'
+    assert data.get_property('x')['property_name'] == 'tc'
+
+
+def test_get_property_by_column_over_the_union_of_fields():
+    data = _table_data()
+
+    res = data.get_property(2)
+    assert res['property_name'] == 'Critical-Temperature'
+    # ! raw values in column lookups
+    assert res['value'] == 512 and res['unit'] == 'K'
+
+    res = data.get_property(4)
+    assert res['property_name'] == 'tc'
+    # field missing in the column
+    assert math.isnan(res['unit'])
+
+    with pytest.raises(IndexError):
+        data.get_property(5)
+
+
+def test_get_property_missing_values_are_nan():
+    data = _table_data()
+
+    assert math.isnan(data.get_property('Acentric-Factor')['value'])
+    assert math.isnan(data.get_property(3)['value'])
+    assert data.get_property('Acentric-Factor')['unit'] == 'None'
+
+
+def test_property_index_follows_prop_data():
+    data = _table_data()
+    assert data.get_property('MW')['value'] == '32.04'
+
+    data.prop_data = {
+        'Molecular-Weight': {'symbol': 'MW', 'unit': 'g/mol', 'value': 46.07},
+    }
+    assert data.get_property('mw')['property_name'] == 'Molecular-Weight'
+    with pytest.raises(TableLookupError):
+        data.get_property('Tc')
+
+    restored = pickle.loads(pickle.dumps(data))
+    restored._prop_index = None
+    assert restored.get_property(1)['value'] == 46.07
@@ -0,0 +1,77 @@
+import math
+
+import numpy as np
+
+from pyThermoDB.core import TableEquation
+
+
+def _equation(body: list[str]) -> TableEquation:
+    equations = [
+        {
+            'BODY': body,
+            'ARGS': {
+                'temperature': {'name': 'temperature', 'symbol': 'T', 'unit': 'K'},
+            },
+            'PARMS': {
+                'C1': {'name': 'C1', 'symbol': 'C1', 'unit': 1},
+                'C2': {'name': 'C2', 'symbol': 'C2', 'unit': 1},
+            },
+            'RETURNS': {
+                'vapor-pressure': {'name': 'vapor-pressure', 'symbol': 'VaPr', 'unit': 'Pa'},
+            },
+        }
+    ]
+    eq = TableEquation(
+        databook_name='reference',
+        table_name='vapor-pressure',
+        equations=equations,
+    )
+    eq.trans_data = {
+        'Name': {'value': 'water', 'unit': 'None', 'symbol': 'None'},
+        'C1': {'value': 10.0, 'unit': 1, 'symbol': 'C1'},
+        'C2': {'value': -1000.0, 'unit': 1, 'symbol': 'C2'},
+        'Eq': {'value': 1, 'unit': 'None', 'symbol': 'Eq'},
+    }
+    eq.eqSet()
+    return eq
+
+
+def test_cal_batch_matches_point_wise_cal():
+    eq = _equation([
+        "parms['C1'] = parms['C1']/1",
+        "res = math.exp(parms['C1'] + parms['C2']/args['T']) + math.log(args['T'], 10)",
+    ])
+    T = np.linspace(250.0, 500.0, 51)
+
+    res = eq.cal_batch(message='batch', T=T)
+
+    assert isinstance(res['value'], np.ndarray)
+    assert res['value'].shape == T.shape
+    assert res['symbol'] == 'VaPr'
+    assert res['message'] == 'batch'
+    expected = [
+        math.exp(10.0 - 1000.0 / t) + math.log(t, 10) for t in T
+    ]
+    np.testing.assert_allclose(res['value'], expected)
+
+
+def test_cal_batch_falls_back_for_branching_bodies():
+    eq = _equation([
+        "res = parms['C1'] if args['T'] > 300 else parms['C2']",
+    ])
+
+    res = eq.cal_batch(T=[200.0, 400.0])
+
+    np.testing.assert_array_equal(res['value'], [-1000.0, 10.0])
+
+
+def test_cal_range_uses_batch_evaluation():
+    eq = _equation([
+        "res = parms['C1']*args['T'] + parms['C2']",
+    ])
+
+    res = eq.cal_range('temperature', [300.0, 310.0, 320.0])
+
+    assert res['x'] == [300.0, 310.0, 320.0]
+    assert res['y'] == [2000.0, 2100.0, 2200.0]
+    assert res['symbol'] == 'VaPr'
@@ -0,0 +1,112 @@
+import math
+import pickle
+
+import pytest
+
+from pyThermoDB.core import TableEquation
+
+
+def _equation() -> TableEquation:
+    equations = [
+        {
+            'BODY': [
+                "parms['C1'] = parms['C1']/1",
+                "res = math.exp(parms['C1'] + parms['C2']/args['T'])",
+            ],
+            'ARGS': {
+                'temperature': {'name': 'temperature', 'symbol': 'T', 'unit': 'K'},
+            },
+            'PARMS': {
+                'C1': {'name': 'C1', 'symbol': 'C1', 'unit': 1},
+                'C2': {'name': 'C2', 'symbol': 'C2', 'unit': 1},
+            },
+            'RETURNS': {
+                'vapor-pressure': {'name': 'vapor-pressure', 'symbol': 'VaPr', 'unit': 'Pa'},
+            },
+            'BODY-INTEGRAL': [
+                "res = parms['C1']*(args['T2'] - args['T1'])",
+            ],
+            'BODY-FIRST-DERIVATIVE': None,
+            'BODY-SECOND-DERIVATIVE': None,
+            'CUSTOM-INTEGRAL': {
+                'C1T': ["res = parms['C1']*args['T']"],
+            },
+        }
+    ]
+    eq = TableEquation(
+        databook_name='reference',
+        table_name='vapor-pressure',
+        equations=equations,
+    )
+    eq.trans_data = {
+        'Name': {'value': 'water', 'unit': 'None', 'symbol': 'None'},
+        'C1': {'value': 10.0, 'unit': 1, 'symbol': 'C1'},
+        'C2': {'value': -1000.0, 'unit': 1, 'symbol': 'C2'},
+        'Eq': {'value': 1, 'unit': 'None', 'symbol': 'Eq'},
+    }
+    eq.eqSet()
+    return eq
+
+
+def test_eq_set_compiles_all_equation_bodies():
+    eq = _equation()
+
+    info = eq.cache_info()
+    assert info['size'] == 3
+    assert info['hits'] == 0
+    assert info['misses'] == 0
+
+
+def test_compiled_bodies_are_reused_across_calls():
+    eq = _equation()
+
+    for _ in range(5):
+        res = eq.cal(T=300.0)
+    assert res['value'] == round(math.exp(10.0 - 1000.0 / 300.0), 4)
+    assert eq.cal_integral(T1=300.0, T2=310.0) == 100.0
+    assert eq.cal_custom_integral('C1T', T=2.0) == 20.0
+
+    info = eq.cache_info()
+    assert info['hits'] == 7
+    assert info['misses'] == 0
+
+
+def test_compiled_bodies_survive_pickle_round_trip():
+    eq = _equation()
+    eq.cal(T=300.0)
+
+    restored = pickle.loads(pickle.dumps(eq))
+
+    assert restored.cache_info() == {'hits': 0, 'misses': 0, 'size': 3}
+    assert restored.cal(T=300.0)['value'] == eq.cal(T=300.0)['value']
+
+
+def test_parms_values_are_resolved_once_and_read_only():
+    eq = _equation()
+
+    calls = []
+    load_parms_v2 = eq.load_parms_v2
+
+    def _counting_load_parms_v2():
+        calls.append(1)
+        return load_parms_v2()
+
+    eq.load_parms_v2 = _counting_load_parms_v2
+    for _ in range(3):
+        eq.cal(T=300.0)
+
+    assert calls == []
+    assert dict(eq.parms_values) == {'C1': 10.0, 'C2': -1000.0}
+    with pytest.raises(TypeError):
+        eq.parms_values['C1'] = 0.0
+
+
+def test_setting_trans_data_invalidates_parms_values():
+    eq = _equation()
+    trans_data = dict(eq.trans_data)
+    trans_data['C1'] = {'value': 5.0, 'unit': 1, 'symbol': 'C1'}
+
+    eq.trans_data = trans_data
+
+    assert eq.cal_integral(T1=0.0, T2=1.0) == 5.0
+    assert dict(eq.parms_values) == {'C1': 5.0, 'C2': -1000.0}
@@ -0,0 +1,117 @@
+import math
+import pickle
+
+import numpy as np
+import pytest
+
+from pyThermoDB.core.equation_function import compile_equation_function
+from pyThermoDB.core.tableequation import TableEquationBodyError
+
+from test_table_equation_batch import _equation
+from test_table_matrix_equation_cache import _equation as _matrix_equation
+
+
+def test_evaluate_matches_cal_without_rounding():
+    eq = _equation([
+        "res = math.exp(parms['C1'] + parms['C2']/args['T'])",
+    ])
+
+    value = eq.evaluate(T=300.0)
+
+    assert value == math.exp(10.0 - 1000.0 / 300.0)
+    assert eq.cal(T=300.0)['value'] == round(value, 4)
+    assert dict(eq.metadata) == {
+        'name': 'vapor-pressure',
+        'symbol': 'VaPr',
+        'unit': 'Pa',
+        'databook_name': 'reference',
+        'table_name': 'vapor-pressure',
+    }
+
+
+def test_evaluate_does_not_leak_parms_updates_between_calls():
+    eq = _equation([
+        "parms['C1'] = parms['C1']/10",
+        "parms['C2'] += 1",
+        "res = parms['C1'] + parms['C2'] + args['T']",
+    ])
+
+    assert eq.evaluate(T=1.0) == eq.evaluate(T=1.0) == 1.0 - 999.0 + 1.0
+
+
+@pytest.mark.parametrize('body', [
+    ["parms.update({'C1': parms['C1']*2})", "res = parms['C1']"],
+    ["p = parms", "p['C1'] = p['C1']*2", "res = p['C1']"],
+    ["parms['C1'] = parms.pop('C1')*2", "res = parms['C1']"],
+    ["res = parms['C1']*2", "del parms['C1']"],
+    ["c1 = parms['C1']", "c1 *= 2", "res = c1"],
+])
+def test_evaluate_does_not_leak_parms_methods_aliases_and_del(body):
+    eq = _equation(body)
+
+    assert [eq.evaluate(T=300.0) for _ in range(3)] == [20.0, 20.0, 20.0]
+    assert eq.cal(T=300.0)['value'] == 20.0
+
+
+def test_evaluate_many_matches_cal_batch():
+    eq = _equation([
+        "res = math.exp(parms['C1'] + parms['C2']/args['T'])",
+    ])
+    T = np.linspace(250.0, 500.0, 11)
+
+    np.testing.assert_array_equal(
+        eq.evaluate_many(T=T), eq.cal_batch(T=T)['value']
+    )
+
+
+def test_evaluate_requires_a_body_and_survives_pickle():
+    eq = _equation(["res = parms['C1']*args['T']"])
+    assert pickle.loads(pickle.dumps(eq)).evaluate(T=2.0) == 20.0
+
+    eq.body = 'None'
+    with pytest.raises(TableEquationBodyError):
+        eq.evaluate(T=300.0)
+
+
+def test_parms_access_of_equation_functions():
+    def access(body):
+        return compile_equation_function(body, '<test>', {})[1]
+
+    assert access("res = parms['A']*args['T']") == 'read'
+    assert access(
+        "parms['A'] = parms['A']/1\nres = parms['A']*args['T']"
+    ) == 'assign'
+    # ! the bound item is returned, it must not be the cached value
+    assert access("res = parms['A']") == 'mutate'
+    assert access("parms['A'][0] = 1\nres = parms['A']") == 'mutate'
+    assert access("parms = {}\nres = 1") == 'mutate'
+    assert access("a = parms['A']\na += 1\nres = a") == 'mutate'
+    assert access("a, b = parms['A'], parms['B']\nres = a") == 'mutate'
+    assert access("for a in parms['A']:\n    a += 1\nres = 1") == 'mutate'
+    assert access("a = parms['A']*1\nres = a") == 'read'
+
+
+def test_matrix_evaluate_matches_cal_and_evaluate_many_stacks():
+    eq = _matrix_equation(['methanol', 'ethanol', 'benzene'])
+
+    res = eq.evaluate(T=298.15)
+    np.testing.assert_array_equal(
+        np.round(res, 4), eq.cal(T=298.15)['value'])
+
+    T = np.array([298.15, 310.0])
+    many = eq.evaluate_many(T=T)
+    assert many.shape == (2, 3, 3)
+    np.testing.assert_array_equal(many[1], eq.evaluate(T=310.0))
+    assert eq.metadata['symbol'] == 'tau_i_j'
+
+    # NOTE: aliased in-place updates do not leak into the parms matrices
+    eq.body = "a = parms['A_i_j']\na += 1\nres = a"
+    for _ in range(2):
+        assert eq.cal(T=300.0)['value'][0, 0] == 1.0
+        assert eq.evaluate(T=300.0)[0, 0] == 1.0
+    with pytest.raises(ValueError):
+        eq._bound_parms()['A_i_j'][0, 0] = 1.0
+
+    # NOTE: component order change rebinds parms
+    eq.trans_data_pack = {'methanol': {}, 'benzene': {}}
+    assert eq.evaluate(T=298.15).shape == (2, 2)
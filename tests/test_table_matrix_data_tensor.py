@@ -0,0 +1,143 @@
+import pickle
+
+import numpy as np
+import pandas as pd
+import pytest
+from pythermodb_settings.models import Component
+
+from pyThermoDB.core import TableMatrixData
+from pyThermoDB.handlers import TableMatrixDataLookupError
+
+
+def _square_table() -> pd.DataFrame:
+    columns = ['No.', 'Name', 'Formula', 'Alpha_i_1', 'Alpha_i_2', 'Alpha_i_3']
+    rows = [
+        ['-', '-', '-', 'Alpha_i_1', 'Alpha_i_2', 'Alpha_i_3'],
+        ['-', '-', '-', '1', '1', '1'],
+        ['1', 'methanol', 'CH3OH', '0', '0.3', '-1.709'],
+        ['2', 'ethanol', 'C2H5OH', '0.3', '0', 'None'],
+        ['3', 'benzene', 'C6H6', '11.58', '-0.916', '0'],
+    ]
+    return pd.DataFrame(rows, columns=columns)
+
+
+def _pair_table() -> pd.DataFrame:
+    columns = ['No.', 'Mixture', 'Name', 'Formula', 'a_i_1', 'a_i_2']
+    rows = [
+        ['-', '-', '-', '-', 'a_i_1', 'a_i_2'],
+        ['-', '-', '-', '-', '1', '1'],
+        ['1', 'methanol|ethanol', 'methanol', 'CH3OH', '0.1', '4.712'],
+        ['2', 'methanol|ethanol', 'ethanol', 'C2H5OH', '-2.313', '0.2'],
+        ['3', 'methanol|benzene', 'methanol', 'CH3OH', '0.7', '-1.709'],
+        ['4', 'methanol|benzene', 'benzene', 'C6H6', '11.58', '0.8'],
+    ]
+    return pd.DataFrame(rows, columns=columns)
+
+
+def _matrix_data(matrix_table: pd.DataFrame) -> TableMatrixData:
+    return TableMatrixData(
+        databook_name='reference',
+        table_name='matrix-data',
+        table_data={'MATRIX-SYMBOL': ['Alpha']},
+        matrix_table=matrix_table,
+    )
+
+
+def test_mat_indexes_the_compiled_square_table():
+    data = _matrix_data(_square_table())
+
+    np.testing.assert_array_equal(
+        data.mat('Alpha', ['benzene', 'methanol', 'ethanol']),
+        [[0.0, 11.58, -0.916], [-1.709, 0.0, 0.3], [-1.0, 0.3, 0.0]],
+    )
+    assert data.mat('alpha_i_j', ['methanol', 'ethanol'],
+                    symbol_format='alphabetic') == {
+        'methanol | methanol': 0.0,
+        'methanol | ethanol': 0.3,
+        'ethanol | methanol': 0.3,
+        'ethanol | ethanol': 0.0,
+    }
+    # missing property
+    np.testing.assert_array_equal(
+        data.mat('Beta', ['methanol', 'ethanol']), np.full((2, 2), -1.0))
+
+    with pytest.raises(TableMatrixDataLookupError):
+        data.mat('Alpha', ['water', 'acetone'])
+
+    # compiled once
+    data.get_matrix_rows = None
+    data.mat('Alpha', ['ethanol', 'benzene'])
+
+
+def test_mat_pair_table_diagonal_follows_the_selected_mixtures():
+    data = _matrix_data(_pair_table())
+
+    np.testing.assert_array_equal(
+        data.mat('a', ['methanol', 'ethanol']), [[0.1, 4.712], [-2.313, 0.2]])
+    np.testing.assert_array_equal(
+        data.mat('a', ['methanol', 'benzene']), [[0.7, -1.709], [11.58, 0.8]])
+    # ! last mixture row of methanol in table order
+    np.testing.assert_array_equal(
+        data.mat('a', ['ethanol', 'methanol', 'benzene']),
+        [[0.2, -2.313, 0.0], [4.712, 0.7, -1.709], [0.0, 11.58, 0.8]],
+    )
+
+
+def test_ij_uses_the_compiled_table_and_matches_the_table_scan():
+    for table, prop, mixture in (
+        (_square_table(), 'Alpha', None),
+        (_pair_table(), 'a', 'methanol | benzene'),
+    ):
+        data = _matrix_data(table)
+        scan = _matrix_data(table)
+        # ! table scan only
+        scan._ij_from_tensor = lambda *args, **kwargs: None
+        comp1, comp2 = 'methanol', 'benzene'
+
+        for symbol_format in ('alphabetic', 'numeric'):
+            expected = scan.get_matrix_property(
+                f"{prop}_i_j", [comp1, comp2],
+                symbol_format=symbol_format,
+                message='msg',
+                mixture_name=mixture,
+            )
+            assert data.get_matrix_property(
+                f"{prop}_i_j", [comp1, comp2],
+                symbol_format=symbol_format,
+                message='msg',
+            ) == expected
+            assert data.ij(
+                f"{prop}_{comp1}_{comp2}",
+                symbol_format=symbol_format,
+                message='msg',
+            ) == expected
+
+        assert data._ij_from_tensor(
+            prop, [comp1, comp2], 'numeric', 'msg',
+            f"{comp1} | {comp2}") is not None
+
+
+def test_setting_matrix_table_invalidates_the_compiled_table():
+    data = _matrix_data(_square_table())
+    assert data.mat('Alpha', ['methanol', 'ethanol'])[0, 1] == 0.3
+
+    table = _square_table()
+    table.loc[2, 'Alpha_i_2'] = '0.5'
+    data.matrix_table = table
+
+    assert data.mat('Alpha', ['methanol', 'ethanol'])[0, 1] == 0.5
+
+    restored = pickle.loads(pickle.dumps(data))
+    assert '_tensor' not in vars(restored)
+    assert restored.mat('Alpha', ['methanol', 'ethanol'])[0, 1] == 0.5
+
+
+def test_matx_uses_component_names():
+    data = _matrix_data(_square_table())
+    components = [
+        Component(name='ethanol', formula='C2H5OH', state='l'),
+        Component(name='methanol', formula='CH3OH', state='l'),
+    ]
+
+    np.testing.assert_array_equal(
+        data.matX('Alpha', components), [[0.0, 0.3], [0.3, 0.0]])
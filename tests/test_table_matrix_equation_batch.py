@@ -0,0 +1,37 @@
+import numpy as np
+
+from test_table_matrix_equation_cache import _equation
+
+
+def test_cal_batch_matches_point_wise_cal():
+    eq = _equation(['methanol', 'ethanol', 'benzene'])
+    T = np.linspace(300.0, 400.0, 25)
+
+    res = eq.cal_batch(message='tau', decimal_accuracy=4, T=T)
+
+    assert res['value'].shape == (25, 3, 3)
+    assert res['value'].flags.c_contiguous
+    assert res['symbol'] == 'tau_i_j' and res['message'] == 'tau'
+    for t, tau in zip(T, res['value']):
+        np.testing.assert_array_equal(tau, eq.cal(T=t)['value'])
+
+
+def test_cal_batch_filters_by_index_arrays():
+    eq = _equation(['methanol', 'ethanol', 'benzene'])
+    T = np.array([300.0, 350.0])
+
+    res = eq.cal_batch(T=T, filter_elements=['benzene', 'methanol'])['value']
+
+    full = eq.evaluate_many(T=T)
+    assert res.shape == (2, 2, 2)
+    np.testing.assert_array_equal(res, full[:, [2, 0]][:, :, [2, 0]])
+
+
+def test_evaluate_many_falls_back_for_branching_bodies():
+    eq = _equation(['methanol', 'ethanol'])
+    eq.body = "res = parms['A_i_j'] if args['T'] > 300 else parms['B_i_j']"
+
+    res = eq.evaluate_many(T=[250.0, 350.0])
+
+    np.testing.assert_array_equal(res[0], [[0.0, -1162.3], [483.8, 0.0]])
+    np.testing.assert_array_equal(res[1], [[0.0, 4.712], [-2.313, 0.0]])
@@ -0,0 +1,117 @@
+import pickle
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from pyThermoDB.core import TableMatrixEquation
+from pyThermoDB.handlers import TableEquationBodyError
+
+
+def _matrix_table() -> pd.DataFrame:
+    columns = ['No.', 'Name', 'Formula', 'A_i_1', 'A_i_2', 'A_i_3',
+               'B_i_1', 'B_i_2', 'B_i_3']
+    rows = [
+        ['-', '-', '-', 'A_i_1', 'A_i_2', 'A_i_3', 'B_i_1', 'B_i_2', 'B_i_3'],
+        ['-', '-', '-', '1', '1', '1', '1', '1', '1'],
+        ['1', 'methanol', 'CH3OH', '0', '4.712', '-1.709', '0', '-1162.3', '892.2'],
+        ['2', 'ethanol', 'C2H5OH', '-2.313', '0', '0.569', '483.8', '0', '-54.8'],
+        ['3', 'benzene', 'C6H6', '11.58', '-0.916', '0', '-3282.6', '822', '0'],
+    ]
+    return pd.DataFrame(rows, columns=columns)
+
+
+def _equation(components: list[str]) -> TableMatrixEquation:
+    equations = [
+        {
+            'BODY': ["res = parms['A_i_j'] + parms['B_i_j']*(args['T']**(-1))"],
+            'ARGS': {
+                'temperature': {'name': 'temperature', 'symbol': 'T', 'unit': 'K'},
+            },
+            'PARMS': {
+                'A_i_j': {'name': 'A_i_j', 'symbol': 'A_i_j', 'unit': 1},
+                'B_i_j': {'name': 'B_i_j', 'symbol': 'B_i_j', 'unit': 1},
+            },
+            'RETURNS': {
+                'tau_i_j': {'name': 'tau_i_j', 'symbol': 'tau_i_j', 'unit': 1},
+            },
+        }
+    ]
+    eq = TableMatrixEquation(
+        databook_name='NRTL',
+        table_name='tau',
+        equations=equations,
+        matrix_table=_matrix_table(),
+    )
+    eq.trans_data_pack = {name: {} for name in components}
+    eq.eqSet()
+    return eq
+
+
+def test_parms_matrices_are_built_once_per_component_order():
+    eq = _equation(['methanol', 'ethanol'])
+
+    eq.get_component_info = None  # any rebuild would fail
+    for _ in range(3):
+        parms = eq.load_parms()
+
+    np.testing.assert_array_equal(parms['A_i_j'], [[0.0, 4.712], [-2.313, 0.0]])
+    np.testing.assert_array_equal(parms['B_i_j'], [[0.0, -1162.3], [483.8, 0.0]])
+
+    # returned matrices are copies
+    parms['A_i_j'][0, 0] = 99.0
+    assert eq.load_parms()['A_i_j'][0, 0] == 0.0
+
+
+def test_setting_trans_data_pack_invalidates_parms_matrices():
+    eq = _equation(['methanol', 'ethanol'])
+
+    eq.trans_data_pack = {'methanol': {}, 'benzene': {}}
+
+    np.testing.assert_array_equal(
+        eq.load_parms()['A_i_j'], [[0.0, -1.709], [11.58, 0.0]]
+    )
+
+
+def test_cal_filters_by_index_and_builds_labels_only_for_alphabetic():
+    eq = _equation(['methanol', 'ethanol', 'benzene'])
+
+    res = eq.cal(T=298.15)['value']
+    filtered = eq.cal(T=298.15, filter_elements=['benzene', 'methanol'])['value']
+    labelled = eq.cal(
+        T=298.15,
+        filter_elements=['benzene', 'methanol'],
+        output_format='alphabetic',
+    )['value']
+
+    assert isinstance(res, np.ndarray) and res.shape == (3, 3)
+    np.testing.assert_array_equal(filtered, res[np.ix_([2, 0], [2, 0])])
+    assert list(labelled) == [
+        'benzene | benzene',
+        'benzene | methanol',
+        'methanol | benzene',
+        'methanol | methanol',
+    ]
+    assert labelled['benzene | methanol'] == res[2, 0]
+
+
+def test_matrix_equation_pickle_round_trip():
+    eq = _equation(['methanol', 'ethanol'])
+
+    restored = pickle.loads(pickle.dumps(eq))
+
+    np.testing.assert_array_equal(
+        restored.cal(T=300.0)['value'], eq.cal(T=300.0)['value']
+    )
+
+
+@pytest.mark.parametrize('method', ['cal', 'evaluate', 'evaluate_many'])
+def test_invalid_body_raises_typed_body_error(method):
+    eq = _equation(['methanol', 'ethanol'])
+    eq.body = "res = parms['A_i_j'] +"
+
+    with pytest.raises(TableEquationBodyError) as info:
+        getattr(eq, method)(T=298.15)
+
+    assert info.value.context['table_name'] == 'tau'
+    assert info.value.context['body'] == eq.body
@@ -0,0 +1,92 @@
+import pickle
+
+import numpy as np
+import pytest
+
+from pyThermoDB import (
+    build_component_thermodb,
+    load_thermodb_archive,
+    save_thermodb_archive,
+)
+from pyThermoDB.builder import CompBuilder, ThermoDBArchive
+
+from test_build_component_thermodbs import REFERENCE_CONFIG, REFERENCE_CONTENT
+from test_table_matrix_equation_cache import _equation
+
+
+def _thermodbs():
+    methanol = build_component_thermodb(
+        component_name='methanol',
+        reference_config=REFERENCE_CONFIG,
+        custom_reference={'reference': [REFERENCE_CONTENT]},
+        mode='silent',
+    )
+    mixture = CompBuilder(thermodb_name='mixture')
+    assert mixture.add_data('tau', _equation(['methanol', 'ethanol']))
+    return {'methanol': methanol, 'methanol-ethanol': mixture}
+
+
+def test_archive_round_trip_loads_components_lazily(tmp_path):
+    thermodbs = _thermodbs()
+
+    path = save_thermodb_archive(thermodbs, 'components', str(tmp_path))
+    assert path.endswith('components.ptdba')
+
+    with load_thermodb_archive(path) as archive:
+        assert len(archive) == 2
+        assert list(archive) == ['methanol', 'methanol-ethanol']
+        assert 'methanol' in archive and 'water' not in archive
+
+        methanol = archive['methanol']
+        assert archive['methanol'] is methanol
+        assert methanol.component_name == 'methanol'
+        assert (
+            methanol.select('vapor-pressure').cal(T=300.0)['value'] ==
+            thermodbs['methanol'].select('vapor-pressure').cal(T=300.0)['value']
+        )
+        # ! only the selected item is decoded
+        assert methanol.properties.pending() == ['general']
+
+        np.testing.assert_array_equal(
+            archive['methanol-ethanol'].select('tau').cal(T=298.15)['value'],
+            thermodbs['methanol-ethanol'].select('tau').cal(T=298.15)['value']
+        )
+
+        with pytest.raises(KeyError):
+            archive['water']
+
+
+def test_closed_archive_raises(tmp_path):
+    path = save_thermodb_archive(_thermodbs(), 'components', str(tmp_path))
+
+    with load_thermodb_archive(path) as archive:
+        methanol = archive['methanol']
+
+    with pytest.raises(ValueError, match='thermodb archive is closed'):
+        archive['methanol']
+    # ! opened thermodbs stay usable
+    assert methanol.retrieve('general | MW')['value'] == '32.04'
+
+    archive = load_thermodb_archive(path)
+    archive.close()
+    with pytest.raises(ValueError, match='thermodb archive is closed'):
+        archive['methanol-ethanol']
+
+
+def test_archive_pickles_by_filename(tmp_path):
+    path = save_thermodb_archive(_thermodbs(), 'components', str(tmp_path))
+    archive = load_thermodb_archive(path)
+
+    restored = pickle.loads(pickle.dumps(archive))
+
+    assert isinstance(restored, ThermoDBArchive)
+    assert restored.filename == archive.filename
+    assert restored['methanol'].retrieve('general | MW')['value'] == '32.04'
+
+
+def test_archive_rejects_other_files(tmp_path):
+    path = tmp_path / 'other.ptdba'
+    path.write_bytes(b'not an archive')
+
+    with pytest.raises(Exception, match='not a thermodb archive'):
+        load_thermodb_archive(str(path))